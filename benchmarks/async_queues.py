@@ -0,0 +1,130 @@
+"""
+Compares the asynchronous containers against `asyncio.Queue` and against a
+plain `Queue()` polled by the consumers with `asyncio.sleep()`, which is how
+coroutines had to share a `Queue()` before.
+
+The throughput is measured with N producer and M consumer coroutines passing
+items through a bounded container. The latency is measured with a producer
+putting one timestamp at a time, then sleeping for a while so that the
+consumer catches up and has to wait for the next item; the consumer records
+the time each timestamp spent in the container. The event loop wakes up its
+timers together, so the polling delay mostly shows in the tail latency.
+
+Usage: python -m benchmarks.async_queues [size]
+"""
+import asyncio
+import statistics
+import sys
+import time
+import timeit
+
+from extra.lists.queue import Queue
+from extra.lists.asynchronous import AsyncQueue, AsyncDeque, AsyncPriorityQueue
+
+
+CAPACITY = 1000
+POLL_INTERVAL = 0.001
+PRODUCER_INTERVAL = 0.00037
+STOP = object()
+
+
+class PolledQueue:
+    """Shares a `Queue()` between coroutines by polling it."""
+
+    def __init__(self, max_capacity=float("inf")):
+        self._queue = Queue(max_capacity)
+
+    async def put(self, item):
+        while self._queue.is_full():
+            await asyncio.sleep(POLL_INTERVAL)
+        self._queue.enqueue(item)
+
+    async def get(self):
+        while self._queue.is_empty():
+            await asyncio.sleep(POLL_INTERVAL)
+        return self._queue.dequeue()
+
+
+CONTAINERS = [
+    ("asyncio.Queue", asyncio.Queue),
+    ("polled Queue", PolledQueue),
+    ("AsyncQueue", AsyncQueue),
+    ("AsyncDeque", AsyncDeque),
+    ("AsyncPriorityQueue", AsyncPriorityQueue),
+]
+
+
+async def pass_through(create, producers, consumers, size):
+    container = create(CAPACITY)
+    per_producer = size // producers
+
+    async def produce():
+        for item in range(per_producer):
+            await container.put(item)
+
+    async def consume():
+        while await container.get() is not STOP:
+            pass
+
+    consumer_tasks = [
+        asyncio.create_task(consume()) for _ in range(consumers)
+    ]
+    await asyncio.gather(*(produce() for _ in range(producers)))
+    for _ in range(consumers):
+        await container.put(STOP)
+    await asyncio.gather(*consumer_tasks)
+
+
+async def latencies(create, size):
+    container = create()
+    delays = []
+
+    async def produce():
+        for _ in range(size):
+            await container.put(time.perf_counter())
+            await asyncio.sleep(PRODUCER_INTERVAL)
+        await container.put(STOP)
+
+    async def consume():
+        while True:
+            item = await container.get()
+            if item is STOP:
+                return
+            delays.append(time.perf_counter() - item)
+
+    await asyncio.gather(consume(), produce())
+    return delays
+
+
+def main(size):
+    print(
+        f"Passing {size:,} integers through a container of capacity "
+        + f"{CAPACITY:,} (best of 3 runs, items per second)"
+    )
+    print(f"{'container':>18}  {'1P/1C':>10}  {'4P/4C':>10}")
+    for name, create in CONTAINERS:
+        rates = [
+            size / min(timeit.repeat(
+                lambda: asyncio.run(pass_through(create, p, c, size)),
+                number=1,
+                repeat=3,
+            ))
+            for p, c in [(1, 1), (4, 4)]
+        ]
+        print(f"{name:>18}  {rates[0]:10,.0f}  {rates[1]:10,.0f}")
+
+    items = min(size, 2000)
+    print(
+        f"\nLatency of {items:,} items put one at a time (microseconds per "
+        + "item)"
+    )
+    print(f"{'container':>18}  {'median':>8}  {'p99':>8}")
+    for name, create in CONTAINERS:
+        delays = sorted(asyncio.run(latencies(create, items)))
+        median = statistics.median(delays) * 1e6
+        p99 = delays[int(len(delays) * 0.99)] * 1e6
+        print(f"{name:>18}  {median:8.1f}  {p99:8.1f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,96 @@
+"""
+Compares the batch methods of `Stack()`, `Queue()`, `Deque()` and
+`PriorityQueue()` against calling their single-item methods in a loop, by
+timing a fill-then-drain cycle in batches of a given size and reporting the
+time per item.
+
+Usage: python -m benchmarks.batch_ops [size] [batch]
+"""
+import sys
+import timeit
+
+from extra.lists.stack import Stack
+from extra.lists.queue import Queue
+from extra.lists.deque import Deque
+from extra.lists.priority_queue import PriorityQueue
+
+
+def single(create, push, pop, items, batch):
+    container = create()
+    push, pop = getattr(container, push), getattr(container, pop)
+    for start in range(0, len(items), batch):
+        # NOTE: the last chunk is shorter when `batch` doesn't divide the size
+        chunk = items[start:start + batch]
+        for item in chunk:
+            push(item)
+        for _ in range(len(chunk)):
+            pop()
+
+
+def batched(create, push, pop, items, batch):
+    container = create()
+    push, pop = getattr(container, push), getattr(container, pop)
+    for start in range(0, len(items), batch):
+        chunk = items[start:start + batch]
+        push(chunk)
+        pop(len(chunk))
+
+
+CASES = [
+    ("Stack", Stack, ("push", "pop"), ("push_many", "pop_many")),
+] + [
+    (
+        f"Queue, {backend}",
+        lambda backend=backend: Queue(backend=backend),
+        ("enqueue", "dequeue"),
+        ("enqueue_many", "dequeue_many"),
+    )
+    for backend in ("linked", "array")
+] + [
+    (
+        f"Deque, {backend}",
+        lambda backend=backend: Deque(backend=backend),
+        ("append_right", "pop_left"),
+        ("append_right_many", "pop_left_many"),
+    )
+    for backend in ("linked", "array")
+] + [
+    (
+        "PriorityQueue",
+        PriorityQueue,
+        ("enqueue", "dequeue"),
+        ("enqueue_many", "dequeue_many"),
+    ),
+]
+
+
+def main(size, batch=1_000):
+    items = [f"item {i}" for i in range(size)]
+    print(
+        f"Pushing and popping {size:,} strings in batches of {batch:,} "
+        + "(best of 3 runs)"
+    )
+    print(f"{'container':>15}  {'single':>10}  {'batch':>10}  speed-up")
+    for name, create, single_methods, batch_methods in CASES:
+        timings = [
+            min(timeit.repeat(
+                lambda: cycle(create, *methods, items, batch),
+                number=1,
+                repeat=3,
+            ))
+            for cycle, methods in (
+                (single, single_methods), (batched, batch_methods)
+            )
+        ]
+        print(
+            f"{name:>15}  {timings[0] / size * 1e9:7.0f} ns  "
+            + f"{timings[1] / size * 1e9:7.0f} ns  "
+            + f"{timings[0] / timings[1]:7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 200_000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 1_000,
+    )
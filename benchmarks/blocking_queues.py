@@ -0,0 +1,122 @@
+"""
+Compares the throughput of the blocking containers against their counterparts
+in the `queue` standard module when N producer threads put items into a
+bounded container while M consumer threads get them out and mark them as done.
+
+Every consumer stops when it gets a stop marker, which the main thread puts
+once all the producers are finished and the container was joined. The
+priority queues get random priorities, so `queue.PriorityQueue` receives
+`(priority, item)` tuples.
+
+Usage: python -m benchmarks.blocking_queues [size]
+"""
+import queue
+import random
+import sys
+import threading
+import timeit
+
+from extra.lists.blocking import (
+    BlockingStack,
+    BlockingQueue,
+    BlockingDeque,
+    BlockingPriorityQueue,
+)
+
+
+CAPACITY = 1000
+STOP = object()
+
+
+def stdlib_put(container, item):
+    container.put(item)
+
+
+def stdlib_priority_put(container, item):
+    container.put((random.random(), item))
+
+
+def extra_priority_put(container, item):
+    container.put(item, random.random())
+
+
+def run(create, put, producers, consumers, size):
+    container = create()
+    per_producer = size // producers
+
+    def produce():
+        for item in range(per_producer):
+            put(container, item)
+
+    def consume():
+        get, task_done = container.get, container.task_done
+        while True:
+            item = get()
+            task_done()
+            if item is STOP or type(item) is tuple and item[1] is STOP:
+                return
+
+    threads = [threading.Thread(target=consume) for _ in range(consumers)]
+    threads += [threading.Thread(target=produce) for _ in range(producers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads[consumers:]:
+        thread.join()
+    container.join()
+    # the container is empty by now, so the stop markers come last
+    for _ in range(consumers):
+        put(container, STOP)
+    for thread in threads[:consumers]:
+        thread.join()
+
+
+def main(size):
+    pairs = [
+        (
+            "LIFO",
+            (lambda: queue.LifoQueue(CAPACITY), stdlib_put),
+            (lambda: BlockingStack(CAPACITY), stdlib_put),
+        ),
+        (
+            "FIFO",
+            (lambda: queue.Queue(CAPACITY), stdlib_put),
+            (lambda: BlockingQueue(CAPACITY), stdlib_put),
+        ),
+        (
+            "FIFO deque",
+            (lambda: queue.Queue(CAPACITY), stdlib_put),
+            (lambda: BlockingDeque(CAPACITY), stdlib_put),
+        ),
+        (
+            "priority",
+            (lambda: queue.PriorityQueue(CAPACITY), stdlib_priority_put),
+            (lambda: BlockingPriorityQueue(CAPACITY), extra_priority_put),
+        ),
+    ]
+    print(
+        f"Passing {size:,} integers through a container of capacity "
+        + f"{CAPACITY:,} (best of 3 runs, items per second)"
+    )
+    print(
+        f"{'order':>10}  {'threads':>7}  {'queue module':>12}  "
+        + f"{'extra':>12}  ratio"
+    )
+    for name, stdlib, extra in pairs:
+        for producers, consumers in [(1, 1), (4, 1), (1, 4), (4, 4)]:
+            timings = [
+                min(timeit.repeat(
+                    lambda: run(create, put, producers, consumers, size),
+                    number=1,
+                    repeat=3,
+                ))
+                for create, put in (stdlib, extra)
+            ]
+            print(
+                f"{name:>10}  {producers}P/{consumers}C  "
+                + f"{size / timings[0]:12,.0f}  {size / timings[1]:12,.0f}  "
+                + f"{timings[0] / timings[1]:5.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,40 @@
+"""
+Compares building a `MinHeap()` / `MaxHeap()` using the bottom-up `heapify()`
+class method against inserting the same values one by one.
+
+Usage: python -m benchmarks.heapify [size]
+"""
+import sys
+import random
+import timeit
+
+from extra.trees.min_heap import MinHeap
+from extra.trees.max_heap import MaxHeap
+
+
+def build_by_insertion(heap_class, values):
+    heap = heap_class()
+    for value in values:
+        heap.insert(value)
+    return heap
+
+
+def main(size):
+    values = [random.randint(-size, size) for _ in range(size)]
+    print(f"Building heaps of {size:,} random integers (best of 3 runs)")
+    for heap_class in (MinHeap, MaxHeap):
+        insertion = min(timeit.repeat(
+            lambda: build_by_insertion(heap_class, values), number=1, repeat=3
+        ))
+        heapify = min(timeit.repeat(
+            lambda: heap_class.heapify(values), number=1, repeat=3
+        ))
+        print(
+            f"{heap_class.__name__:>17}  insert(): {insertion:8.3f}s  "
+            + f"heapify(): {heapify:8.3f}s  "
+            + f"speed-up: {insertion / heapify:5.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,47 @@
+"""
+Shows that building a `LinkedList()` or a `CircularLinkedList()` with
+`add_end()` takes linear time now that both keep a reference to their tail:
+the cost per append stays flat while the number of appends grows.
+
+Usage: python -m benchmarks.linked_list_append [size]
+"""
+import sys
+import timeit
+
+from extra.lists.linked_list import LinkedList
+from extra.lists.circular_linked_list import CircularLinkedList
+
+
+def build(list_class, size):
+    llist = list_class()
+    for item in range(size):
+        llist.add_end(item)
+    return llist
+
+
+def extend(list_class, size):
+    llist = list_class(range(size))
+    llist.extend(list_class(range(size)))
+
+
+def main(size):
+    print(f"Appending up to {size:,} integers (best of 3 runs)")
+    sizes = [size // 8, size // 4, size // 2, size]
+    for list_class in (LinkedList, CircularLinkedList):
+        print(list_class.__name__)
+        for n in sizes:
+            elapsed = min(timeit.repeat(
+                lambda: build(list_class, n), number=1, repeat=3
+            ))
+            print(
+                f"{n:>12,} appends: {elapsed:8.3f}s  "
+                + f"({elapsed / n * 1e6:5.2f} µs/append)"
+            )
+        elapsed = min(timeit.repeat(
+            lambda: extend(list_class, size // 2), number=1, repeat=3
+        ))
+        print(f"{'extend':>12} {size // 2:,} + {size // 2:,}: {elapsed:8.3f}s")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,86 @@
+"""
+Measures the memory taken by a single node of every structure now that the
+node classes use `__slots__`, against the previous layout where the same
+attributes lived in a per-instance `__dict__`.
+
+The previous layout is reproduced by a plain class that copies the very same
+attributes, in the same order, from a freshly created node in its `__init__`.
+
+Usage: python -m benchmarks.node_memory [size]
+"""
+import sys
+import tracemalloc
+
+from extra.lists.linked_list import Node
+from extra.lists.doubly_linked_list import DoublyNode
+from extra.lists.skip_list import SkipNode
+from extra.lists.priority_queue import PriorityNode
+from extra.trees.tree import TreeNode
+from extra.trees.binary_tree import BinaryTreeNode
+from extra.trees.bst import BSTNode
+from extra.trees.avl import AVLNode
+from extra.trees.red_black_tree import RedBlackNode
+from extra.trees.treap import TreapNode
+from extra.trees.trie import TrieNode
+
+
+# (structure, node class, arguments used to create a node)
+NODES = [
+    ("LinkedList", Node, (1,)),
+    ("DoublyLinkedList", DoublyNode, (1,)),
+    ("SkipList", SkipNode, (1,)),
+    ("PriorityQueue", PriorityNode, (1, 1)),
+    ("Tree", TreeNode, (1,)),
+    ("BinaryTree", BinaryTreeNode, (1,)),
+    ("BST", BSTNode, (1,)),
+    ("AVL", AVLNode, (1,)),
+    ("RedBlackTree", RedBlackNode, (1,)),
+    ("Treap", TreapNode, (1, 1)),
+    ("Trie", TrieNode, ("a",)),
+]
+
+
+def dict_node_class():
+    # a new class per structure, so instances share their dict keys the way
+    # instances of the same node class used to
+    class DictNode:
+        def __init__(self, node):
+            for name, value in slot_attributes(node):
+                setattr(self, name, value)
+
+    return DictNode
+
+
+def slot_attributes(node):
+    attributes = []
+    for cls in reversed(type(node).__mro__):
+        for name in cls.__dict__.get("__slots__", ()):
+            if hasattr(node, name):
+                attributes.append((name, getattr(node, name)))
+    return attributes
+
+
+def bytes_per_node(create, size):
+    tracemalloc.start()
+    nodes = [create() for _ in range(size)]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    # don't count the list holding the nodes
+    return (current - sys.getsizeof(nodes)) / size
+
+
+def main(size):
+    print(f"Bytes per node, averaged over {size:,} nodes")
+    print(f"{'structure':>17}  {'__dict__':>9}  {'__slots__':>9}  saved")
+    for structure, node_class, args in NODES:
+        DictNode = dict_node_class()
+        before = bytes_per_node(lambda: DictNode(node_class(*args)), size)
+        after = bytes_per_node(lambda: node_class(*args), size)
+        print(
+            f"{structure:>17}  {before:9.1f}  {after:9.1f}  "
+            + f"{1 - after / before:5.0%}"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,70 @@
+"""
+Compares the `"linked"` and `"array"` backends of `Queue()` and `Deque()` by
+timing a fill-then-drain cycle and by measuring the memory held per element.
+
+Usage: python -m benchmarks.queue_backends [size]
+"""
+import sys
+import timeit
+import tracemalloc
+
+from extra.lists.queue import Queue
+from extra.lists.deque import Deque
+
+
+def fill_and_drain_queue(backend, size):
+    q = Queue(backend=backend)
+    for item in range(size):
+        q.enqueue(item)
+    while not q.is_empty():
+        q.dequeue()
+
+
+def fill_and_drain_deque(backend, size):
+    dq = Deque(backend=backend)
+    for item in range(size):
+        dq.append_right(item)
+    while not dq.is_empty():
+        dq.pop_left()
+
+
+def bytes_per_element(queue_class, backend, size):
+    # the items are created beforehand, so only the container is measured
+    items = list(range(size))
+    tracemalloc.start()
+    q = queue_class(backend=backend)
+    for item in items:
+        q._push_left(item)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current / size
+
+
+def main(size):
+    print(f"Filling and draining {size:,} integers (best of 3 runs)")
+    for queue_class, cycle in (
+        (Queue, fill_and_drain_queue), (Deque, fill_and_drain_deque)
+    ):
+        timings = {
+            backend: min(timeit.repeat(
+                lambda: cycle(backend, size), number=1, repeat=3
+            ))
+            for backend in ("linked", "array")
+        }
+        print(
+            f"{queue_class.__name__:>15}  linked: {timings['linked']:8.3f}s  "
+            + f"array: {timings['array']:8.3f}s  "
+            + f"speed-up: {timings['linked'] / timings['array']:5.1f}x"
+        )
+    print("Memory held by the container")
+    for queue_class in (Queue, Deque):
+        linked = bytes_per_element(queue_class, "linked", size)
+        array = bytes_per_element(queue_class, "array", size)
+        print(
+            f"{queue_class.__name__:>15}  linked: {linked:6.1f} B/element  "
+            + f"array: {array:6.1f} B/element"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
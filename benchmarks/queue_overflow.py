@@ -0,0 +1,68 @@
+"""
+Compares the overflow policies of a bounded `Queue()` by enqueuing many more
+items than its maximum capacity, so nearly every `enqueue()` finds it full,
+and measures the memory allocated by the container while doing so.
+
+The `"warn"` policy goes through the `warnings` machinery on every overflow,
+while the other ones don't. The bounded `"array"` backend allocates its ring
+buffer once when it's created, so it shouldn't allocate anything afterwards.
+
+Usage: python -m benchmarks.queue_overflow [size]
+"""
+import sys
+import timeit
+import tracemalloc
+import warnings
+
+from extra.lists.queue import Queue
+
+
+CAPACITY = 1000
+
+
+def overflow(backend, policy, items):
+    q = Queue(CAPACITY, backend, overflow=policy)
+    for item in items:
+        q.enqueue(item)
+    return q
+
+
+def allocated_bytes(backend, policy, items):
+    q = Queue(CAPACITY, backend, overflow=policy)
+    # fill the queue first, so only the overflowing enqueues are measured
+    for item in items[:CAPACITY]:
+        q.enqueue(item)
+    tracemalloc.start()
+    for item in items[CAPACITY:]:
+        q.enqueue(item)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current
+
+
+def main(size):
+    # the items are created beforehand, so only the container is measured
+    items = list(range(CAPACITY + size))
+    print(
+        f"Enqueuing {size:,} integers to a full Queue({CAPACITY}) "
+        + "(best of 3 runs)"
+    )
+    print(f"{'policy':>12}  {'backend':>7}  {'time':>8}  allocated bytes")
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        for policy in ("warn", "drop_oldest", "drop_newest"):
+            for backend in ("linked", "array"):
+                elapsed = min(timeit.repeat(
+                    lambda: overflow(backend, policy, items),
+                    number=1,
+                    repeat=3,
+                ))
+                allocated = allocated_bytes(backend, policy, items)
+                print(
+                    f"{policy:>12}  {backend:>7}  {elapsed:7.3f}s  "
+                    + f"{allocated:15,}"
+                )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
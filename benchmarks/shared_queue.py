@@ -0,0 +1,96 @@
+"""
+Compares the throughput of `SharedQueue()`, which copies numbers in and out of
+shared memory, against `multiprocessing.Queue` and
+`multiprocessing.SimpleQueue`, which pickle every item and send it through a
+pipe, when N producer processes put numbers that M consumer processes get.
+
+Every consumer gets the same share of the numbers, so no stop marker is
+needed. The time includes starting the processes, which is the same for all
+the containers.
+
+Usage: python -m benchmarks.shared_queue [size]
+"""
+import multiprocessing
+import sys
+import timeit
+
+from extra.lists.shared_queue import SharedQueue
+
+
+CAPACITY = 1000
+
+
+def produce(container, items):
+    put = container.put
+    for item in items:
+        put(item)
+
+
+def consume(container, count):
+    get = container.get
+    for _ in range(count):
+        get()
+
+
+def run(container, context, producers, consumers, items):
+    per_producer = len(items) // producers
+    processes = [
+        context.Process(
+            target=consume,
+            args=(container, per_producer * producers // consumers),
+        )
+        for _ in range(consumers)
+    ] + [
+        context.Process(
+            target=produce,
+            args=(container, items[i * per_producer:(i + 1) * per_producer]),
+        )
+        for i in range(producers)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+
+
+def main(size):
+    context = multiprocessing.get_context()
+    containers = [
+        ("mp.Queue", lambda dtype: context.Queue(CAPACITY)),
+        ("mp.SimpleQueue", lambda dtype: context.SimpleQueue()),
+        (
+            "SharedQueue",
+            lambda dtype: SharedQueue(CAPACITY, dtype, context=context),
+        ),
+    ]
+    print(
+        f"Passing {size:,} numbers between processes through a container of "
+        + f"capacity {CAPACITY:,} (best of 3 runs, items per second)"
+    )
+    print(f"{'container':>14}  {'items':>5}  {'1P/1C':>10}  {'2P/2C':>10}")
+    for name, create in containers:
+        for dtype, items in [
+            ("int", list(range(size))),
+            ("float", [item / 3 for item in range(size)]),
+        ]:
+            rates = []
+            for producers, consumers in [(1, 1), (2, 2)]:
+                container = create(dtype)
+                rates.append(size / min(timeit.repeat(
+                    lambda: run(
+                        container, context, producers, consumers, items
+                    ),
+                    number=1,
+                    repeat=3,
+                )))
+                if isinstance(container, SharedQueue):
+                    container.close()
+                    container.unlink()
+            print(
+                f"{name:>14}  {dtype:>5}  {rates[0]:10,.0f}  "
+                + f"{rates[1]:10,.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
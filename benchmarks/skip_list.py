@@ -0,0 +1,160 @@
+"""
+Compares `SkipList()`, which stores every value once in a tower node holding
+a forward pointer per level, against the previous layout which kept one
+`LinkedList()` per level, copied a promoted value into a new node on every
+level it reached and decided each promotion with a coin flip.
+
+The previous layout is reproduced by `LevelListSkipList` below, which follows
+the very same steps as the old `SkipList.insert()`, `SkipList._search()` and
+`SkipList.__getitem__()`, the last one walking the lowest level.
+
+It also compares building a `SkipList()` from an iterable, which sorts the
+values then links the towers without searching, against inserting the values
+one by one.
+
+Usage: python -m benchmarks.skip_list [size]
+"""
+import random
+import sys
+import timeit
+import tracemalloc
+
+from extra.lists.linked_list import Node, LinkedList
+from extra.lists.skip_list import SkipList
+
+
+class DownNode(Node):
+    __slots__ = ("_down",)
+
+    def __init__(self, item):
+        super().__init__(item)
+        self._down = None
+
+
+class LevelListSkipList:
+    def __init__(self, iterable=()):
+        self._level_lists = [self._new_level()]
+        for item in iterable:
+            self.insert(item)
+
+    def _new_level(self):
+        llist = LinkedList()
+        llist._insert_node(llist._head, DownNode(float("-inf")))
+        return llist
+
+    def _search(self, value):
+        last_accessed_nodes = []
+        node = self._level_lists[-1]._head
+        while True:
+            next_node = node.get_next()
+            while next_node is not None and next_node.get_data() <= value:
+                node = next_node
+                next_node = node.get_next()
+            if node.get_data() == value or node._down is None:
+                return node, last_accessed_nodes[::-1]
+            last_accessed_nodes.append(node)
+            node = node._down
+
+    def __contains__(self, value):
+        return self._search(value)[0].get_data() == value
+
+    def __getitem__(self, idx):
+        return self._level_lists[0][idx + 1]
+
+    def insert(self, value):
+        found_node, last_accessed_nodes = self._search(value)
+        if found_node.get_data() == value:
+            return
+        curr_node = self._level_lists[0]._insert_node(
+            found_node, DownNode(value)
+        )
+        level = 0
+        while random.choice(["head", "tail"]) == "head":
+            if level >= len(self._level_lists) - 1:
+                top_list = self._new_level()
+                top_list._head._down = self._level_lists[-1]._head
+                self._level_lists.append(top_list)
+                upper_prev_node = top_list._head
+            else:
+                upper_prev_node = last_accessed_nodes[level]
+            upper_node = self._level_lists[level + 1]._insert_node(
+                upper_prev_node, DownNode(value)
+            )
+            upper_node._down = curr_node
+            curr_node = upper_node
+            level += 1
+
+
+def insert_all(skiplist, values):
+    for value in values:
+        skiplist.insert(value)
+    return skiplist
+
+
+def search_all(skiplist, values):
+    for value in values:
+        assert value in skiplist
+
+
+def get_all(skiplist, indices):
+    for idx in indices:
+        skiplist[idx]
+
+
+def bytes_per_element(create, size):
+    tracemalloc.start()
+    skiplist = create()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert skiplist is not None
+    return current / size
+
+
+def main(size):
+    random.seed(0)
+    values = random.sample(range(size * 10), size)
+    lookups = random.sample(values, len(values))
+    indices = [random.randrange(size) for _ in range(1000)]
+    layouts = [
+        ("level lists", lambda: LevelListSkipList(values)),
+        ("towers, p=1/2", lambda: insert_all(SkipList(seed=0), values)),
+        (
+            "towers, p=1/4",
+            lambda: insert_all(SkipList(p=0.25, seed=0), values),
+        ),
+    ]
+    print(
+        f"Inserting then searching {size:,} random integers (best of 3 runs)"
+    )
+    print(
+        f"{'layout':>14}  {'insert':>8}  {'search':>8}  "
+        + f"{'1k index':>8}  bytes/element"
+    )
+    for name, create in layouts:
+        insert = min(timeit.repeat(create, number=1, repeat=3))
+        skiplist = create()
+        search = min(timeit.repeat(
+            lambda: search_all(skiplist, lookups), number=1, repeat=3
+        ))
+        index = min(timeit.repeat(
+            lambda: get_all(skiplist, indices), number=1, repeat=3
+        ))
+        memory = bytes_per_element(create, size)
+        print(
+            f"{name:>14}  {insert:7.3f}s  {search:7.3f}s  {index:7.3f}s  "
+            + f"{memory:9.1f}"
+        )
+    print(f"\nBuilding a SkipList() of {size:,} integers (best of 3 runs)")
+    print(f"{'values':>14}  {'insert':>8}  {'build':>8}")
+    for name, data in [("shuffled", values), ("sorted", sorted(values))]:
+        insert = min(timeit.repeat(
+            lambda: insert_all(SkipList(seed=0), data), number=1, repeat=3
+        ))
+        build = min(timeit.repeat(
+            lambda: SkipList(data, seed=0), number=1, repeat=3
+        ))
+        print(f"{name:>14}  {insert:7.3f}s  {build:7.3f}s")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
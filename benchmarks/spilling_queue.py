@@ -0,0 +1,75 @@
+"""
+Measures the sustained throughput of `SpillingQueue()` while its backlog is
+spilled to disk, against an in-memory `Queue()` holding the same backlog, and
+the memory each of them allocates for it.
+
+The producer enqueues two items for every item the consumer dequeues, so the
+backlog keeps growing till the producer is done, then the consumer drains it.
+Every item is a small tuple, like a typical work item.
+
+Usage: python -m benchmarks.spilling_queue [size]
+"""
+import sys
+import timeit
+import tracemalloc
+
+from extra.lists.queue import Queue
+from extra.lists.spilling_queue import SpillingQueue
+
+
+MEMORY_CAPACITY = 10_000
+
+
+def stall(q, size):
+    # the consumer takes one item for every two the producer adds
+    for item in range(size):
+        q.enqueue((item, "payload"))
+        if item & 1:
+            q.dequeue()
+    while not q.is_empty():
+        q.dequeue()
+    return q
+
+
+def peak_bytes(create, size):
+    q = create()
+    tracemalloc.start()
+    for item in range(size):
+        q.enqueue((item, "payload"))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    q.clear()
+    return peak
+
+
+def main(size):
+    queues = [
+        ("Queue, linked", lambda: Queue()),
+        ("Queue, array", lambda: Queue(backend="array")),
+    ] + [
+        (
+            f"Spilling, {segment_size >> 20} MiB",
+            lambda segment_size=segment_size: SpillingQueue(
+                memory_capacity=MEMORY_CAPACITY, segment_size=segment_size
+            ),
+        )
+        for segment_size in (1 << 20, 1 << 22, 1 << 24)
+    ]
+    print(
+        f"Enqueuing {size:,} tuples while dequeuing half as many, then "
+        + f"draining the backlog (memory capacity of {MEMORY_CAPACITY:,}, "
+        + "best of 3 runs)"
+    )
+    print(f"{'queue':>18}  {'items/s':>10}  peak bytes of a full backlog")
+    for name, create in queues:
+        elapsed = min(timeit.repeat(
+            lambda: stall(create(), size), number=1, repeat=3
+        ))
+        print(
+            f"{name:>18}  {size / elapsed:10,.0f}  "
+            + f"{peak_bytes(create, size):13,}"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
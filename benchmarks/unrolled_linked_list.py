@@ -0,0 +1,67 @@
+"""
+Compares `UnrolledLinkedList()` against `LinkedList()` by timing a full
+iteration and a series of random index lookups, and by measuring the memory
+held per element.
+
+Usage: python -m benchmarks.unrolled_linked_list [size]
+"""
+import sys
+import random
+import timeit
+import tracemalloc
+
+from extra.lists.linked_list import LinkedList
+from extra.lists.unrolled_linked_list import UnrolledLinkedList
+
+
+LOOKUPS = 200
+
+
+def iterate(llist):
+    for _ in llist:
+        pass
+
+
+def random_access(llist, indices):
+    for idx in indices:
+        llist[idx]
+
+
+def bytes_per_element(list_class, size):
+    # the items are created beforehand, so only the container is measured
+    items = list(range(size))
+    tracemalloc.start()
+    llist = list_class(items)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del llist
+    return current / size
+
+
+def main(size):
+    random.seed(0)
+    indices = [random.randrange(size) for _ in range(LOOKUPS)]
+    lists = [
+        ("LinkedList", LinkedList(range(size))),
+        ("UnrolledLinkedList", UnrolledLinkedList(range(size))),
+    ]
+    print(f"{size:,} integers (best of 3 runs)")
+    for name, llist in lists:
+        iteration = min(timeit.repeat(
+            lambda: iterate(llist), number=1, repeat=3
+        ))
+        access = min(timeit.repeat(
+            lambda: random_access(llist, indices), number=1, repeat=3
+        ))
+        print(
+            f"{name:>20}  iteration: {iteration:8.3f}s  "
+            + f"{LOOKUPS} random lookups: {access:8.3f}s"
+        )
+    print("Memory held by the container")
+    for name, llist in lists:
+        memory = bytes_per_element(type(llist), size)
+        print(f"{name:>20}  {memory:6.1f} B/element")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,144 @@
+"""
+Measures the overhead of checking the given items for every data structure by
+timing the same workload in three fresh processes: with the default checks, in
+the trusted mode where `Extra.TRUSTED` is `True`, and in the trusted mode with
+the debugging assertions removed by running python with the `-O` flag.
+
+Usage: python -m benchmarks.validation_overhead [size]
+"""
+import sys
+import json
+import random
+import timeit
+import subprocess
+
+from extra.interface import Extra
+from extra.lists.stack import Stack
+from extra.lists.queue import Queue
+from extra.lists.deque import Deque
+from extra.lists.priority_queue import PriorityQueue
+from extra.lists.linked_list import LinkedList
+from extra.lists.skip_list import SkipList
+from extra.trees.bst import BST
+from extra.trees.red_black_tree import RedBlackTree
+from extra.trees.min_heap import MinHeap
+from extra.trees.trie import Trie
+
+
+def fill_and_drain(create, push, pop):
+    def workload(items):
+        container = create()
+        for item in items:
+            getattr(container, push)(item)
+        while not container.is_empty():
+            getattr(container, pop)()
+    return workload
+
+
+def insert_and_find(create):
+    def workload(items):
+        container = create()
+        for item in items:
+            container.insert(item)
+        for item in items:
+            item in container
+    return workload
+
+
+def fill_linked_list(items):
+    llist = LinkedList()
+    for item in items:
+        llist.add_front(item)
+    for item in items[:100]:
+        llist.remove(item)
+
+
+WORKLOADS = [
+    ("Stack", fill_and_drain(Stack, "push", "pop"), "strings"),
+    (
+        "Queue, linked",
+        fill_and_drain(lambda: Queue(), "enqueue", "dequeue"),
+        "strings",
+    ),
+    (
+        "Queue, array",
+        fill_and_drain(lambda: Queue(backend="array"), "enqueue", "dequeue"),
+        "strings",
+    ),
+    (
+        "Deque, array",
+        fill_and_drain(
+            lambda: Deque(backend="array"), "append_right", "pop_left"
+        ),
+        "strings",
+    ),
+    (
+        "PriorityQueue",
+        fill_and_drain(PriorityQueue, "enqueue", "dequeue"),
+        "strings",
+    ),
+    ("LinkedList", fill_linked_list, "strings"),
+    ("SkipList", insert_and_find(SkipList), "numbers"),
+    ("BST", insert_and_find(BST), "numbers"),
+    ("RedBlackTree", insert_and_find(RedBlackTree), "numbers"),
+    ("MinHeap", fill_and_drain(MinHeap, "insert", "remove_min"), "numbers"),
+    ("Trie", insert_and_find(Trie), "strings"),
+]
+
+
+def measure(size, trusted):
+    Extra.TRUSTED = trusted
+    rng = random.Random(0)
+    items = {
+        "numbers": [rng.random() for _ in range(size)],
+        "strings": [f"item {rng.random()}" for _ in range(size)],
+    }
+    return {
+        name: min(timeit.repeat(
+            lambda: workload(items[kind]), number=1, repeat=5
+        ))
+        for name, workload, kind in WORKLOADS
+    }
+
+
+def run(size, trusted, optimized):
+    # the assertions can only be removed when python starts, so every mode
+    # runs in a fresh process to be compared fairly
+    child = subprocess.run(
+        [sys.executable]
+        + (["-O"] if optimized else [])
+        + ["-m", "benchmarks.validation_overhead", str(size), "--json"]
+        + (["--trusted"] if trusted else []),
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    return json.loads(child.stdout)
+
+
+def main(size):
+    print(
+        f"Running every workload on {size:,} items with and without the "
+        + "checks (best of 5 runs)"
+    )
+    checked = run(size, trusted=False, optimized=False)
+    trusted = run(size, trusted=True, optimized=False)
+    optimized = run(size, trusted=True, optimized=True)
+    print(
+        f"{'structure':>15}  {'checked':>9}  {'trusted':>9}  "
+        + f"{'trusted -O':>10}  speed-up"
+    )
+    for name, _, _ in WORKLOADS:
+        print(
+            f"{name:>15}  {checked[name]:8.3f}s  {trusted[name]:8.3f}s  "
+            + f"{optimized[name]:9.3f}s  "
+            + f"{checked[name] / optimized[name]:7.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    if "--json" in sys.argv:
+        print(json.dumps(measure(size, "--trusted" in sys.argv)))
+    else:
+        main(size)
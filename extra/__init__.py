@@ -1,12 +1,30 @@
+# interface
+from extra.interface import Extra as Extra
+
+
 # lists
 from extra.lists.linked_list import LinkedList as LinkedList
 from extra.lists.doubly_linked_list import DoublyLinkedList as DoublyLinkedList
 from extra.lists.circular_linked_list import CircularLinkedList as CircularLinkedList
+from extra.lists.unrolled_linked_list import UnrolledLinkedList as UnrolledLinkedList
 from extra.lists.skip_list import SkipList as SkipList
 from extra.lists.stack import Stack as Stack
 from extra.lists.queue import Queue as Queue
 from extra.lists.deque import Deque as Deque
 from extra.lists.priority_queue import PriorityQueue as PriorityQueue
+from extra.lists.blocking import BlockingStack as BlockingStack
+from extra.lists.blocking import BlockingQueue as BlockingQueue
+from extra.lists.blocking import BlockingDeque as BlockingDeque
+from extra.lists.blocking import BlockingPriorityQueue as BlockingPriorityQueue
+from extra.lists.asynchronous import AsyncQueue as AsyncQueue
+from extra.lists.asynchronous import AsyncDeque as AsyncDeque
+from extra.lists.asynchronous import AsyncPriorityQueue as AsyncPriorityQueue
+try:
+    from extra.lists.shared_queue import SharedQueue as SharedQueue
+except ImportError:
+    # NOTE: `multiprocessing.shared_memory` was added in python 3.8
+    pass
+from extra.lists.spilling_queue import SpillingQueue as SpillingQueue
 
 
 # trees
@@ -20,6 +38,7 @@ from extra.trees.avl import AVL as AVL
 from extra.trees.red_black_tree import RedBlackTree as RedBlackTree
 from extra.trees.min_heap import MinHeap as MinHeap
 from extra.trees.max_heap import MaxHeap as MaxHeap
+from extra.trees.min_max_heap import MinMaxHeap as MinMaxHeap
 from extra.trees.treap import Treap as Treap
 from extra.trees.trie import Trie as Trie
 from extra.trees.radix_trie import RadixTrie as RadixTrie
@@ -3,9 +3,28 @@ class Extra:
     Extra is the package interface which means that all objects inherits
     from this class. So, each object in this pacakge is an Extra object in the
     fisrt place.
+
+    Every object checks the items given to it, which costs a few checks per
+    call. When the items are known to be valid, the trusted mode skips these
+    checks by setting `TRUSTED` to `True`, either for the whole package, for
+    one class (and its subclasses) or for one data structure:
+
+    >>> Extra.TRUSTED = True  # every object in the process
+    >>> Queue.TRUSTED = True  # every `Queue()` and its subclasses
+    >>> q = Queue()
+    >>> q.TRUSTED = True  # this queue only
+
+    Nodes don't have a `__dict__`, so they follow their class; a trusted data
+    structure still checks the items of the nodes it creates unless the class
+    of its nodes is trusted too. Invalid items given in the trusted mode
+    aren't detected and can corrupt the data structure. The debugging
+    assertions found in the private methods are removed separately by running
+    python with the `-O` flag.
     """
 
     __name__ = "extra.Extra()"
+    __slots__ = ()
+    TRUSTED = False
 
     def _validate_item(self, item):
         """
@@ -22,8 +41,14 @@ class Extra:
         -------
         ValueError: If `item` is `None`
         TypeError: If `item` is an `Extra` object.
+
+        Note
+        ----
+        Nothing is checked when the object is trusted.
         """
-        if item is None:
+        if self.TRUSTED:
+            return
+        elif item is None:
             raise ValueError(
                 f"Can't use `None` as an element within `{self.__name__}`!!"
             )
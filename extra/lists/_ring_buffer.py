@@ -0,0 +1,466 @@
+"""
+A ring buffer is a growable circular array that stores its items in a single
+python `list` and keeps track of the index of its left-most item. Items can be
+added or removed at both ends in amortized constant time without allocating a
+node per item, which makes it a compact container for queue-like structures.
+A ring buffer can also be given a fixed capacity, in which case all of its
+slots are allocated once when it's created and never resized afterwards.
+"""
+from extra.interface import Extra
+
+
+class RingBuffer(Extra):
+    """
+    A ring buffer is a growable circular array that supports adding and
+    removing items at both ends in amortized constant time. The capacity is
+    always a power of two; it doubles when the buffer gets full and halves when
+    the buffer gets three-quarters empty unless the buffer has a fixed
+    capacity.
+    """
+
+    __name__ = "extra.RingBuffer()"
+    _MIN_CAPACITY = 8
+
+    def __init__(self, capacity=None):
+        """
+        Creates an empty `RingBuffer()` object!!
+
+        Parameters
+        ----------
+        capacity: int, optional
+            The fixed number of items the `RingBuffer()` can hold. When given,
+            the slots are allocated once, here, and the buffer never resizes.
+            When `None`, the buffer grows and shrinks with its length
+            (Default: None).
+
+        Example
+        -------
+        >>> buffer = RingBuffer()
+        >>> len(buffer)
+        0
+        >>> buffer = RingBuffer(capacity=5)
+        >>> len(buffer._items)
+        8
+        """
+        self._capacity = capacity
+        if capacity is None:
+            size = self._MIN_CAPACITY
+        else:
+            # NOTE: the smallest power of two that fits `capacity` items
+            size = 1 << max(capacity - 1, 0).bit_length()
+        self._items = [None] * size
+        self._mask = size - 1
+        self._start = 0
+        self._length = 0
+
+    # =============================    LENGTH    ==============================
+    def __len__(self):
+        """
+        Gets the length of the `RingBuffer()` instance in constant time.
+
+        Returns
+        -------
+        int:
+            The number of items in the `RingBuffer()` instance.
+        """
+        return self._length
+
+    def is_empty(self):
+        """
+        Checks if the `RingBuffer()` instance is empty or not in constant time.
+
+        Returns
+        -------
+        bool:
+            `True` if the `RingBuffer()` instance is empty and `False`
+            otherwise.
+        """
+        return self._length == 0
+
+    # =============================     ITER     ==============================
+    def __iter__(self):
+        """
+        Iterates over the `RingBuffer()` instance from the left-most item to
+        the right-most one in linear time.
+
+        Yields
+        ------
+        object:
+            The item stored at each slot in the instance.
+
+        Example
+        -------
+        >>> buffer = RingBuffer()
+        >>> buffer.append_right(2)
+        >>> buffer.append_left(1)
+        >>> list(buffer)
+        [1, 2]
+        """
+        items, mask, start = self._items, self._mask, self._start
+        for offset in range(self._length):
+            yield items[(start + offset) & mask]
+
+    # =============================    RESIZE    ==============================
+    def __resize(self, new_capacity):
+        """
+        Moves the items of the `RingBuffer()` instance to a new list of the
+        given capacity in linear time, so that the left-most item lies at
+        index zero.
+
+        Parameters
+        ----------
+        new_capacity: int
+            A power of two that is at least the length of the instance.
+        """
+        items = list(self)
+        items.extend([None] * (new_capacity - self._length))
+        self._items = items
+        self._mask = new_capacity - 1
+        self._start = 0
+
+    def __grow_if_full(self, count=1):
+        """
+        Doubles the capacity of the `RingBuffer()` instance, as many times as
+        needed, when its free slots can't hold the given number of new items.
+
+        Parameters
+        ----------
+        count: int
+            The number of items about to be added (Default: 1).
+
+        Raises
+        ------
+        OverflowError:
+            If the `RingBuffer()` instance has a fixed capacity and the new
+            items don't fit.
+        """
+        if self._capacity is not None:
+            if self._length + count > self._capacity:
+                raise OverflowError(
+                    f"Can't add to a full `{self.__name__}`!!"
+                )
+        elif self._length + count > self._mask + 1:
+            capacity = self._mask + 1
+            while self._length + count > capacity:
+                capacity <<= 1
+            self.__resize(capacity)
+
+    def __shrink_if_sparse(self):
+        """
+        Halves the capacity of the `RingBuffer()` instance, as many times as
+        needed, while at most a quarter of it is used, so memory stays
+        proportional to the length. Buffers with a fixed capacity are never
+        shrunk.
+        """
+        if self._capacity is not None:
+            return
+        capacity = self._mask + 1
+        while capacity > self._MIN_CAPACITY and self._length <= capacity >> 2:
+            capacity >>= 1
+        if capacity != self._mask + 1:
+            self.__resize(capacity)
+
+    # =============================    APPEND    ==============================
+    def append_left(self, item):
+        """
+        Adds the given item to the left end of the `RingBuffer()` instance in
+        amortized constant time.
+
+        Parameters
+        ----------
+        item: object
+            The python object to be added.
+
+        Raises
+        ------
+        OverflowError:
+            If the `RingBuffer()` instance has a fixed capacity and it's full.
+        """
+        self.__grow_if_full()
+        self._start = (self._start - 1) & self._mask
+        self._items[self._start] = item
+        self._length += 1
+
+    def append_right(self, item):
+        """
+        Adds the given item to the right end of the `RingBuffer()` instance in
+        amortized constant time.
+
+        Parameters
+        ----------
+        item: object
+            The python object to be added.
+
+        Raises
+        ------
+        OverflowError:
+            If the `RingBuffer()` instance has a fixed capacity and it's full.
+        """
+        self.__grow_if_full()
+        self._items[(self._start + self._length) & self._mask] = item
+        self._length += 1
+
+    def __write(self, idx, items):
+        """
+        Writes the given items to consecutive slots starting at the given
+        index, wrapping around the end of the list.
+
+        Parameters
+        ----------
+        idx: int
+            The index of the slot of the first item.
+        items: list
+            The items to be written.
+        """
+        first = min(len(items), self._mask + 1 - idx)
+        self._items[idx:idx + first] = items[:first]
+        self._items[:len(items) - first] = items[first:]
+
+    def extend_left(self, items):
+        """
+        Adds the given items to the left end of the `RingBuffer()` instance,
+        one after the other, in linear time. Unlike calling `append_left()`
+        for every item, the buffer grows at most once.
+
+        Parameters
+        ----------
+        items: list
+            The python objects to be added. The last one ends up left-most.
+
+        Raises
+        ------
+        OverflowError:
+            If the `RingBuffer()` instance has a fixed capacity and the items
+            don't fit.
+
+        Example
+        -------
+        >>> buffer = RingBuffer()
+        >>> buffer.extend_left([1, 2, 3])
+        >>> list(buffer)
+        [3, 2, 1]
+        """
+        self.__grow_if_full(len(items))
+        self._start = (self._start - len(items)) & self._mask
+        self.__write(self._start, items[::-1])
+        self._length += len(items)
+
+    def extend_right(self, items):
+        """
+        Adds the given items to the right end of the `RingBuffer()` instance,
+        one after the other, in linear time. Unlike calling `append_right()`
+        for every item, the buffer grows at most once.
+
+        Parameters
+        ----------
+        items: list
+            The python objects to be added. The last one ends up right-most.
+
+        Raises
+        ------
+        OverflowError:
+            If the `RingBuffer()` instance has a fixed capacity and the items
+            don't fit.
+
+        Example
+        -------
+        >>> buffer = RingBuffer()
+        >>> buffer.extend_right([1, 2, 3])
+        >>> list(buffer)
+        [1, 2, 3]
+        """
+        self.__grow_if_full(len(items))
+        self.__write((self._start + self._length) & self._mask, items)
+        self._length += len(items)
+
+    # =============================      GET     ==============================
+    def get_left(self):
+        """
+        Returns the left-most item of the `RingBuffer()` instance in constant
+        time.
+
+        Returns
+        -------
+        object:
+            The left-most item.
+
+        Raises
+        ------
+        IndexError:
+            If the `RingBuffer()` instance is empty.
+        """
+        if self._length == 0:
+            raise IndexError(
+                f"Can't retrieve from an empty `{self.__name__}`!!"
+            )
+        return self._items[self._start]
+
+    def get_right(self):
+        """
+        Returns the right-most item of the `RingBuffer()` instance in constant
+        time.
+
+        Returns
+        -------
+        object:
+            The right-most item.
+
+        Raises
+        ------
+        IndexError:
+            If the `RingBuffer()` instance is empty.
+        """
+        if self._length == 0:
+            raise IndexError(
+                f"Can't retrieve from an empty `{self.__name__}`!!"
+            )
+        return self._items[(self._start + self._length - 1) & self._mask]
+
+    # =============================      POP     ==============================
+    def pop_left(self):
+        """
+        Removes and returns the left-most item of the `RingBuffer()` instance
+        in amortized constant time.
+
+        Returns
+        -------
+        object:
+            The left-most item.
+
+        Raises
+        ------
+        IndexError:
+            If the `RingBuffer()` instance is empty.
+        """
+        item = self.get_left()
+        # drop the reference so the item can be garbage-collected
+        self._items[self._start] = None
+        self._start = (self._start + 1) & self._mask
+        self._length -= 1
+        self.__shrink_if_sparse()
+        return item
+
+    def pop_right(self):
+        """
+        Removes and returns the right-most item of the `RingBuffer()` instance
+        in amortized constant time.
+
+        Returns
+        -------
+        object:
+            The right-most item.
+
+        Raises
+        ------
+        IndexError:
+            If the `RingBuffer()` instance is empty.
+        """
+        item = self.get_right()
+        self._length -= 1
+        self._items[(self._start + self._length) & self._mask] = None
+        self.__shrink_if_sparse()
+        return item
+
+    def __read(self, idx, count):
+        """
+        Reads and empties the given number of consecutive slots starting at
+        the given index, wrapping around the end of the list.
+
+        Parameters
+        ----------
+        idx: int
+            The index of the first slot.
+        count: int
+            The number of slots to be read.
+
+        Returns
+        -------
+        list:
+            The items stored in the slots from left to right.
+        """
+        items = self._items
+        first = min(count, self._mask + 1 - idx)
+        chunk = items[idx:idx + first] + items[:count - first]
+        # drop the references so the items can be garbage-collected
+        items[idx:idx + first] = [None] * first
+        items[:count - first] = [None] * (count - first)
+        return chunk
+
+    def pop_left_many(self, count):
+        """
+        Removes and returns the given number of items from the left end of the
+        `RingBuffer()` instance in linear time. Unlike calling `pop_left()`
+        for every item, the buffer shrinks at most once.
+
+        Parameters
+        ----------
+        count: int
+            The number of items to be removed, which can't be more than the
+            length of the instance.
+
+        Returns
+        -------
+        list:
+            The removed items in the order they were popped, the left-most
+            item first.
+
+        Example
+        -------
+        >>> buffer = RingBuffer()
+        >>> buffer.extend_right([1, 2, 3])
+        >>> buffer.pop_left_many(2)
+        [1, 2]
+        """
+        chunk = self.__read(self._start, count)
+        self._start = (self._start + count) & self._mask
+        self._length -= count
+        self.__shrink_if_sparse()
+        return chunk
+
+    def pop_right_many(self, count):
+        """
+        Removes and returns the given number of items from the right end of
+        the `RingBuffer()` instance in linear time. Unlike calling
+        `pop_right()` for every item, the buffer shrinks at most once.
+
+        Parameters
+        ----------
+        count: int
+            The number of items to be removed, which can't be more than the
+            length of the instance.
+
+        Returns
+        -------
+        list:
+            The removed items in the order they were popped, the right-most
+            item first.
+
+        Example
+        -------
+        >>> buffer = RingBuffer()
+        >>> buffer.extend_right([1, 2, 3])
+        >>> buffer.pop_right_many(2)
+        [3, 2]
+        """
+        self._length -= count
+        chunk = self.__read(
+            (self._start + self._length) & self._mask, count
+        )
+        self.__shrink_if_sparse()
+        return chunk[::-1]
+
+    # =============================     CLEAR    ==============================
+    def clear(self):
+        """
+        Removes all items within the `RingBuffer()` instance. It takes
+        constant time unless the buffer has a fixed capacity, in which case
+        the used slots are emptied in place in linear time.
+        """
+        if self._capacity is None:
+            self.__init__()
+            return
+        items, mask, start = self._items, self._mask, self._start
+        for offset in range(self._length):
+            items[(start + offset) & mask] = None
+        self._start = 0
+        self._length = 0
@@ -0,0 +1,391 @@
+"""
+A shared ring buffer is a fixed-capacity ring buffer whose slots live in a
+block of shared memory, so that several processes can add and remove numbers
+without pickling them. Every slot holds a C number, either a 64-bit signed
+integer or a 64-bit float, and the indices of the buffer are stored in a
+header at the start of the same block. The buffer doesn't lock anything by
+itself; its users have to hold a lock shared by all the processes.
+"""
+import weakref
+from multiprocessing.shared_memory import SharedMemory
+from extra.interface import Extra
+
+
+class SharedRingBuffer(Extra):
+    """
+    A shared ring buffer is a ring buffer of a fixed capacity that stores
+    numbers in shared memory. The header keeps the index of the left-most item
+    and the length of the buffer, followed by any number of counters reserved
+    for its users. Pickling it only sends the name of the shared memory block,
+    which the receiving process attaches to.
+    """
+
+    __name__ = "extra.SharedRingBuffer()"
+    _TYPECODES = {"int": "q", "float": "d"}
+    _SLOT_SIZE = 8
+
+    def __init__(self, capacity, dtype="float", counters=0):
+        """
+        Creates an empty `SharedRingBuffer()` object and allocates its shared
+        memory block!!
+
+        Parameters
+        ----------
+        capacity: int
+            The fixed number of items the `SharedRingBuffer()` can hold.
+        dtype: str
+            The type of the stored numbers, either `"int"` for 64-bit signed
+            integers or `"float"` for 64-bit floats (Default: "float").
+        counters: int
+            The number of 64-bit integer counters kept in the header for the
+            users of the buffer (Default: 0).
+
+        Example
+        -------
+        >>> buffer = SharedRingBuffer(capacity=5, dtype="int")
+        >>> len(buffer._slots)
+        8
+        >>> buffer.close()
+        >>> buffer.unlink()
+        """
+        self._capacity = capacity
+        self._dtype = dtype
+        self._n_counters = counters
+        # NOTE: the smallest power of two that fits `capacity` items
+        size = 1 << max(capacity - 1, 0).bit_length()
+        self._shm = SharedMemory(
+            create=True, size=(2 + counters + size) * self._SLOT_SIZE
+        )
+        self.__attach()
+        self._header[0] = 0
+        self._header[1] = 0
+
+    def __attach(self):
+        """
+        Creates the views of the header, the counters and the slots over the
+        shared memory block.
+        """
+        buf = self._shm.buf
+        header_size = (2 + self._n_counters) * self._SLOT_SIZE
+        self._header = buf[:header_size].cast("q")
+        self.counters = self._header[2:]
+        self._slots = buf[header_size:].cast(self._TYPECODES[self._dtype])
+        self._mask = len(self._slots) - 1
+        # NOTE: the views are released before the shared memory block is
+        # closed even if `close()` isn't called, e.g. by a process that got
+        # the buffer as an argument. Otherwise, the block complains about the
+        # views still exported from it when it's garbage-collected.
+        self._finalizer = weakref.finalize(
+            self,
+            self.__release,
+            self._shm,
+            self._slots,
+            self.counters,
+            self._header,
+        )
+
+    @staticmethod
+    def __release(shm, *views):
+        """
+        Releases the given views before closing the shared memory block they
+        were created from.
+
+        Parameters
+        ----------
+        shm: multiprocessing.shared_memory.SharedMemory
+            The shared memory block to be closed.
+        *views: memoryview
+            The views over the shared memory block.
+        """
+        for view in views:
+            view.release()
+        shm.close()
+
+    # =============================    PICKLE    ==============================
+    def __getstate__(self):
+        """
+        Gets what's needed to attach to the same shared memory block from
+        another process.
+
+        Returns
+        -------
+        dict:
+            The name of the shared memory block and the layout of the buffer.
+        """
+        return {
+            "name": self._shm.name,
+            "capacity": self._capacity,
+            "dtype": self._dtype,
+            "counters": self._n_counters,
+        }
+
+    def __setstate__(self, state):
+        """
+        Attaches the unpickled `SharedRingBuffer()` to the shared memory block
+        of the pickled one.
+
+        Parameters
+        ----------
+        state: dict
+            The state returned by `__getstate__()`.
+        """
+        self._capacity = state["capacity"]
+        self._dtype = state["dtype"]
+        self._n_counters = state["counters"]
+        self._shm = SharedMemory(name=state["name"])
+        self.__attach()
+
+    # =============================    RELEASE   ==============================
+    def close(self):
+        """
+        Detaches the `SharedRingBuffer()` instance from the shared memory
+        block. Every process using the buffer should close it once it's done.
+        """
+        self._finalizer()
+
+    def unlink(self):
+        """
+        Frees the shared memory block of the `SharedRingBuffer()` instance. It
+        has to be called once, by the process that created the buffer, after
+        all processes are done with it.
+        """
+        self._shm.unlink()
+
+    # =============================    LENGTH    ==============================
+    def __len__(self):
+        """
+        Gets the length of the `SharedRingBuffer()` instance in constant time.
+
+        Returns
+        -------
+        int:
+            The number of items in the `SharedRingBuffer()` instance.
+        """
+        return self._header[1]
+
+    def is_empty(self):
+        """
+        Checks if the `SharedRingBuffer()` instance is empty or not in
+        constant time.
+
+        Returns
+        -------
+        bool:
+            `True` if the `SharedRingBuffer()` instance is empty and `False`
+            otherwise.
+        """
+        return self._header[1] == 0
+
+    # =============================     ITER     ==============================
+    def __iter__(self):
+        """
+        Iterates over the `SharedRingBuffer()` instance from the left-most
+        item to the right-most one in linear time.
+
+        Yields
+        ------
+        int or float:
+            The number stored at each slot in the instance.
+        """
+        slots, mask = self._slots, self._mask
+        start, length = self._header[0], self._header[1]
+        for offset in range(length):
+            yield slots[(start + offset) & mask]
+
+    # =============================    APPEND    ==============================
+    def __check_room(self):
+        """
+        Makes sure the `SharedRingBuffer()` instance isn't full.
+
+        Raises
+        ------
+        OverflowError:
+            If the `SharedRingBuffer()` instance is full.
+        """
+        if self._header[1] == self._capacity:
+            raise OverflowError(f"Can't add to a full `{self.__name__}`!!")
+
+    def append_left(self, item):
+        """
+        Adds the given number to the left end of the `SharedRingBuffer()`
+        instance in constant time.
+
+        Parameters
+        ----------
+        item: int or float
+            The number to be added.
+
+        Raises
+        ------
+        OverflowError:
+            If the `SharedRingBuffer()` instance is full.
+        """
+        self.__check_room()
+        header = self._header
+        start = (header[0] - 1) & self._mask
+        self._slots[start] = item
+        header[0] = start
+        header[1] += 1
+
+    def append_right(self, item):
+        """
+        Adds the given number to the right end of the `SharedRingBuffer()`
+        instance in constant time.
+
+        Parameters
+        ----------
+        item: int or float
+            The number to be added.
+
+        Raises
+        ------
+        OverflowError:
+            If the `SharedRingBuffer()` instance is full.
+        """
+        self.__check_room()
+        header = self._header
+        self._slots[(header[0] + header[1]) & self._mask] = item
+        header[1] += 1
+
+    def extend_left(self, items):
+        """
+        Adds the given numbers to the left end of the `SharedRingBuffer()`
+        instance, one after the other, in linear time, checking the room only
+        once.
+
+        Parameters
+        ----------
+        items: list
+            The numbers to be added. The last one ends up left-most.
+
+        Raises
+        ------
+        OverflowError:
+            If the numbers don't fit in the `SharedRingBuffer()` instance.
+        """
+        header = self._header
+        if header[1] + len(items) > self._capacity:
+            raise OverflowError(f"Can't add to a full `{self.__name__}`!!")
+        slots, mask, start = self._slots, self._mask, header[0]
+        for item in items:
+            start = (start - 1) & mask
+            slots[start] = item
+        header[0] = start
+        header[1] += len(items)
+
+    # =============================      GET     ==============================
+    def get_left(self):
+        """
+        Returns the left-most number of the `SharedRingBuffer()` instance in
+        constant time.
+
+        Returns
+        -------
+        int or float:
+            The left-most number.
+
+        Raises
+        ------
+        IndexError:
+            If the `SharedRingBuffer()` instance is empty.
+        """
+        if self._header[1] == 0:
+            raise IndexError(
+                f"Can't retrieve from an empty `{self.__name__}`!!"
+            )
+        return self._slots[self._header[0]]
+
+    def get_right(self):
+        """
+        Returns the right-most number of the `SharedRingBuffer()` instance in
+        constant time.
+
+        Returns
+        -------
+        int or float:
+            The right-most number.
+
+        Raises
+        ------
+        IndexError:
+            If the `SharedRingBuffer()` instance is empty.
+        """
+        header = self._header
+        if header[1] == 0:
+            raise IndexError(
+                f"Can't retrieve from an empty `{self.__name__}`!!"
+            )
+        return self._slots[(header[0] + header[1] - 1) & self._mask]
+
+    # =============================      POP     ==============================
+    def pop_left(self):
+        """
+        Removes and returns the left-most number of the `SharedRingBuffer()`
+        instance in constant time.
+
+        Returns
+        -------
+        int or float:
+            The left-most number.
+
+        Raises
+        ------
+        IndexError:
+            If the `SharedRingBuffer()` instance is empty.
+        """
+        item = self.get_left()
+        header = self._header
+        header[0] = (header[0] + 1) & self._mask
+        header[1] -= 1
+        return item
+
+    def pop_right(self):
+        """
+        Removes and returns the right-most number of the `SharedRingBuffer()`
+        instance in constant time.
+
+        Returns
+        -------
+        int or float:
+            The right-most number.
+
+        Raises
+        ------
+        IndexError:
+            If the `SharedRingBuffer()` instance is empty.
+        """
+        item = self.get_right()
+        self._header[1] -= 1
+        return item
+
+    def pop_right_many(self, count):
+        """
+        Removes and returns the given number of numbers from the right end of
+        the `SharedRingBuffer()` instance in linear time.
+
+        Parameters
+        ----------
+        count: int
+            The number of numbers to be removed, which can't be more than the
+            length of the instance.
+
+        Returns
+        -------
+        list:
+            The removed numbers in the order they were popped, the right-most
+            number first.
+        """
+        header = self._header
+        slots, mask = self._slots, self._mask
+        end = header[0] + header[1] - 1
+        header[1] -= count
+        return [slots[(end - offset) & mask] for offset in range(count)]
+
+    # =============================     CLEAR    ==============================
+    def clear(self):
+        """
+        Removes all numbers within the `SharedRingBuffer()` instance in
+        constant time, as the slots hold no references.
+        """
+        self._header[0] = 0
+        self._header[1] = 0
@@ -0,0 +1,422 @@
+"""
+A spilling buffer is a first-in, first-out buffer whose size isn't bounded by
+the memory. It keeps a bounded number of its oldest items in a `RingBuffer()`
+and a bounded number of its newest items as pickled records; once the newest
+records fill up, they are appended to a segment file on disk. Segments are
+read back, in the order they were written, through a memory map once the
+oldest items run out, and each segment file is removed as soon as all of its
+items are read.
+"""
+import os
+import mmap
+import pickle
+import shutil
+import struct
+import tempfile
+import weakref
+from extra.interface import Extra
+from extra.lists._ring_buffer import RingBuffer
+
+
+_RECORD_HEADER = struct.Struct("<I")
+
+
+class Segment(Extra):
+    """
+    A segment is an append-only file of pickled records, each preceded by its
+    length. It's written through a file object and read through a memory map
+    once it's sealed, i.e. once nothing can be appended to it anymore.
+    """
+
+    __name__ = "extra.Segment()"
+    __slots__ = ("_path", "_file", "_map", "_offset", "_count", "_size")
+
+    def __init__(self, path):
+        """
+        Creates an empty segment file at the given path!!
+
+        Parameters
+        ----------
+        path: str
+            The path of the new segment file.
+        """
+        self._path = path
+        self._file = open(path, "wb")
+        self._map = None
+        self._offset = 0
+        self._count = 0
+        self._size = 0
+
+    def __len__(self):
+        """
+        Gets the number of unread records in the segment in constant time.
+
+        Returns
+        -------
+        int:
+            The number of records written and not read yet.
+        """
+        return self._count
+
+    def is_sealed(self):
+        """
+        Checks if the segment can't be appended to anymore.
+
+        Returns
+        -------
+        bool:
+            `True` if the segment is sealed and `False` otherwise.
+        """
+        return self._file is None
+
+    def write(self, records, count):
+        """
+        Appends the given records to the end of the segment file.
+
+        Parameters
+        ----------
+        records: list
+            The pickled records, each preceded by its length.
+        count: int
+            The number of the given records.
+
+        Returns
+        -------
+        int:
+            The size of the segment file in bytes after writing.
+        """
+        data = b"".join(records)
+        self._file.write(data)
+        self._count += count
+        self._size += len(data)
+        return self._size
+
+    def seal(self):
+        """
+        Closes the segment file for writing, so that it can be read.
+        """
+        self._file.close()
+        self._file = None
+
+    def read(self, count):
+        """
+        Reads the next records of the sealed segment through a memory map.
+
+        Parameters
+        ----------
+        count: int
+            The maximum number of records to read.
+
+        Yields
+        ------
+        object:
+            The unpickled items in the order they were written.
+        """
+        if self._map is None:
+            with open(self._path, "rb") as file:
+                self._map = mmap.mmap(
+                    file.fileno(), 0, access=mmap.ACCESS_READ
+                )
+        data, offset = self._map, self._offset
+        for _ in range(min(count, self._count)):
+            (length,) = _RECORD_HEADER.unpack_from(data, offset)
+            offset += _RECORD_HEADER.size
+            item = pickle.loads(data[offset:offset + length])
+            offset += length
+            self._offset = offset
+            self._count -= 1
+            yield item
+
+    def __iter__(self):
+        """
+        Iterates over the unread records of the segment without consuming
+        them.
+
+        Yields
+        ------
+        object:
+            The unpickled items in the order they were written.
+        """
+        if self._file is not None:
+            self._file.flush()
+        with open(self._path, "rb") as file:
+            file.seek(self._offset)
+            for _ in range(self._count):
+                (length,) = _RECORD_HEADER.unpack(
+                    file.read(_RECORD_HEADER.size)
+                )
+                yield pickle.loads(file.read(length))
+
+    def remove(self):
+        """
+        Closes the segment and deletes its file.
+        """
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        os.remove(self._path)
+
+
+class SpillingBuffer(Extra):
+    """
+    A spilling buffer is a first-in, first-out buffer that keeps its oldest
+    and newest items in memory and spills the ones in between to segment
+    files, so its length is only bounded by the disk space. Items are added
+    to the left end and removed from the right end, like a `RingBuffer()`
+    used by a `Queue()`.
+    """
+
+    __name__ = "extra.SpillingBuffer()"
+
+    def __init__(self, memory_capacity, segment_size, directory=None):
+        """
+        Creates an empty `SpillingBuffer()` object and a temporary directory
+        for its segment files!!
+
+        Parameters
+        ----------
+        memory_capacity: int
+            The maximum number of items kept in memory at each end.
+        segment_size: int
+            The number of bytes after which a segment file is sealed and a
+            new one is started.
+        directory: str, optional
+            The directory in which the temporary directory of the segment
+            files is created. `None` means the default temporary directory.
+        """
+        self._memory_capacity = memory_capacity
+        self._segment_size = segment_size
+        self._directory = tempfile.mkdtemp(prefix="extra-", dir=directory)
+        # NOTE: the segment files are removed even if `close()` isn't called
+        self._finalizer = weakref.finalize(
+            self, shutil.rmtree, self._directory, ignore_errors=True
+        )
+        self._head = RingBuffer()
+        self._tail = []
+        # NOTE: new segments are added to the left end and read from the
+        # right end, like the items of a `Queue()`
+        self._segments = RingBuffer()
+        self._spilled = 0
+        self._segment_id = 0
+
+    def close(self):
+        """
+        Removes the segment files and their directory. The instance can't be
+        used afterwards.
+        """
+        for segment in self._segments:
+            segment.remove()
+        self._segments = RingBuffer()
+        self._finalizer()
+
+    # =============================    LENGTH    ==============================
+    def __len__(self):
+        """
+        Gets the length of the `SpillingBuffer()` instance in constant time.
+
+        Returns
+        -------
+        int:
+            The number of items in memory and on disk.
+        """
+        return len(self._head) + self._spilled + len(self._tail)
+
+    def is_empty(self):
+        """
+        Checks if the `SpillingBuffer()` instance is empty or not in constant
+        time.
+
+        Returns
+        -------
+        bool:
+            `True` if the `SpillingBuffer()` instance is empty and `False`
+            otherwise.
+        """
+        return len(self) == 0
+
+    # =============================     ITER     ==============================
+    def __iter__(self):
+        """
+        Iterates over the `SpillingBuffer()` instance from the newest item to
+        the oldest one in linear time, reading the spilled items from disk.
+
+        Yields
+        ------
+        object:
+            The items from the left end to the right end.
+        """
+        for record in reversed(self._tail):
+            yield pickle.loads(record[_RECORD_HEADER.size:])
+        for segment in self._segments:
+            yield from reversed(list(segment))
+        yield from self._head
+
+    # =============================    APPEND    ==============================
+    def __spill(self):
+        """
+        Appends the newest items, which are already pickled, to the segment
+        file being written, then seals it if it got bigger than the segment
+        size.
+        """
+        if self._segments.is_empty() or self._segments.get_left().is_sealed():
+            self._segment_id += 1
+            path = os.path.join(
+                self._directory, f"{self._segment_id:08d}.segment"
+            )
+            self._segments.append_left(Segment(path))
+        segment = self._segments.get_left()
+        if segment.write(self._tail, len(self._tail)) >= self._segment_size:
+            segment.seal()
+        self._spilled += len(self._tail)
+        self._tail = []
+
+    def append_left(self, item):
+        """
+        Adds the given item to the left end of the `SpillingBuffer()`
+        instance in amortized constant time. It stays in memory while the
+        older items fit there, otherwise it's pickled to be spilled later.
+
+        Parameters
+        ----------
+        item: object
+            The python object to be added.
+
+        Raises
+        ------
+        TypeError:
+            If the item has to be spilled but it can't be pickled.
+        """
+        if (
+            not self._tail
+            and not self._spilled
+            and len(self._head) < self._memory_capacity
+        ):
+            self._head.append_left(item)
+            return
+        try:
+            data = pickle.dumps(item, pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError) as error:
+            raise TypeError(
+                f"Can't spill `{item!r}` to the disk of `{self.__name__}`!!"
+            ) from error
+        self._tail.append(_RECORD_HEADER.pack(len(data)) + data)
+        if len(self._tail) >= self._memory_capacity:
+            self.__spill()
+
+    def extend_left(self, items):
+        """
+        Adds the given items to the left end of the `SpillingBuffer()`
+        instance, one after the other, in linear time.
+
+        Parameters
+        ----------
+        items: list
+            The python objects to be added. The last one ends up left-most.
+
+        Raises
+        ------
+        TypeError:
+            If one of the items has to be spilled but it can't be pickled, in
+            which case the items before it are already added.
+        """
+        for item in items:
+            self.append_left(item)
+
+    # =============================      GET     ==============================
+    def __refill(self):
+        """
+        Moves the next oldest items into the empty head, reading them from the
+        oldest segment if any, otherwise from the newest records.
+        """
+        if self._spilled:
+            segment = self._segments.get_right()
+            if not segment.is_sealed():
+                segment.seal()
+            for item in segment.read(self._memory_capacity):
+                self._head.append_left(item)
+                self._spilled -= 1
+            if len(segment) == 0:
+                self._segments.pop_right().remove()
+        else:
+            for record in self._tail:
+                self._head.append_left(
+                    pickle.loads(record[_RECORD_HEADER.size:])
+                )
+            self._tail = []
+
+    def get_right(self):
+        """
+        Returns the oldest item of the `SpillingBuffer()` instance, reading
+        it from disk if needed.
+
+        Returns
+        -------
+        object:
+            The right-most item.
+
+        Raises
+        ------
+        IndexError:
+            If the `SpillingBuffer()` instance is empty.
+        """
+        if self._head.is_empty():
+            if len(self) == 0:
+                raise IndexError(
+                    f"Can't retrieve from an empty `{self.__name__}`!!"
+                )
+            self.__refill()
+        return self._head.get_right()
+
+    # =============================      POP     ==============================
+    def pop_right(self):
+        """
+        Removes and returns the oldest item of the `SpillingBuffer()`
+        instance in amortized constant time, reading it from disk if needed.
+
+        Returns
+        -------
+        object:
+            The right-most item.
+
+        Raises
+        ------
+        IndexError:
+            If the `SpillingBuffer()` instance is empty.
+        """
+        self.get_right()
+        return self._head.pop_right()
+
+    def pop_right_many(self, count):
+        """
+        Removes and returns the given number of the oldest items of the
+        `SpillingBuffer()` instance in linear time, reading them from disk if
+        needed.
+
+        Parameters
+        ----------
+        count: int
+            The number of items to be removed, which can't be more than the
+            length of the instance.
+
+        Returns
+        -------
+        list:
+            The removed items from the oldest to the newest.
+        """
+        return [self.pop_right() for _ in range(count)]
+
+    # =============================     CLEAR    ==============================
+    def clear(self):
+        """
+        Removes all items within the `SpillingBuffer()` instance and deletes
+        its segment files.
+        """
+        for segment in self._segments:
+            segment.remove()
+        self._head = RingBuffer()
+        self._tail = []
+        self._segments = RingBuffer()
+        self._spilled = 0
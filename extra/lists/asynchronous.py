@@ -0,0 +1,1671 @@
+"""
+The asynchronous containers are versions of `Queue()`, `Deque()` and
+`PriorityQueue()` meant to be shared between coroutines running in the same
+`asyncio` event loop. The `put()` & `get()` coroutines suspend the calling
+coroutine, without blocking the event loop, till there is room for the new
+item or an item to be removed. Like `asyncio.Queue`, each added item,
+whatever the method that added it, counts as an unfinished task that a
+consumer marks as done with `task_done()`, so that `join()` can wait for all
+the added items to be processed. These containers aren't thread-safe, use the
+blocking containers to share items between threads.
+"""
+import asyncio
+from collections import deque
+from extra.interface import Extra
+from extra.lists.queue import Queue
+from extra.lists.deque import Deque
+from extra.lists.priority_queue import PriorityQueue
+
+
+class _Asynchronous(Extra):
+    """
+    The shared machinery of the asynchronous containers. It expects the
+    container to be stored in `_container` and the maximum capacity in
+    `_max_capacity`, which is the case for `Queue()` and its subclasses.
+    """
+
+    __name__ = "extra._Asynchronous()"
+    # NOTE: waiting for a thread would block the whole event loop
+    _OVERFLOW_POLICIES = Queue._OVERFLOW_POLICIES - {"block"}
+
+    def _init_asynchronous(self):
+        """
+        Creates the waiting lists of the instance. It has to be called at the
+        end of the `__init__()` method of every asynchronous container.
+        """
+        # NOTE: the futures are created by the waiting coroutines, so that the
+        # instance isn't tied to an event loop when it's created
+        self._getters = deque()
+        self._putters = deque()
+        self._joiners = deque()
+        self._unfinished_tasks = 0
+
+    # =============================    NOTIFY    ==============================
+    @staticmethod
+    def _wake_up_next(waiters):
+        """
+        Wakes up the first coroutine in the given waiting list that is still
+        waiting.
+
+        Parameters
+        ----------
+        waiters: collections.deque
+            The futures of the coroutines waiting for items or room.
+        """
+        while waiters:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                break
+
+    def _notify_getters(self, all=False):
+        """
+        Wakes up coroutines waiting in `get()` after items were added.
+
+        Parameters
+        ----------
+        all: bool
+            A flag to wake up all the waiting coroutines instead of only one
+            of them (default: `False`).
+        """
+        while self._getters:
+            self._wake_up_next(self._getters)
+            if not all:
+                break
+
+    def _notify_putters(self, all=False):
+        """
+        Wakes up coroutines waiting in `put()` after items were removed.
+
+        Parameters
+        ----------
+        all: bool
+            A flag to wake up all the waiting coroutines instead of only one
+            of them (default: `False`).
+        """
+        while self._putters:
+            self._wake_up_next(self._putters)
+            if not all:
+                break
+
+    # =============================     WAIT     ==============================
+    async def __wait(self, waiters, is_ready):
+        """
+        Suspends the calling coroutine till it's woken up and the given
+        condition holds.
+
+        Parameters
+        ----------
+        waiters: collections.deque
+            The waiting list the calling coroutine joins.
+        is_ready: callable
+            A function checking if the coroutine can go on.
+
+        Raises
+        ------
+        asyncio.CancelledError:
+            If the waiting coroutine got cancelled.
+        """
+        # NOTE: `asyncio.get_running_loop()` was added in python 3.7, while
+        # this returns the running loop when it's called from a coroutine
+        loop = asyncio.get_event_loop()
+        while not is_ready():
+            waiter = loop.create_future()
+            waiters.append(waiter)
+            try:
+                await waiter
+            except BaseException:
+                waiter.cancel()
+                try:
+                    waiters.remove(waiter)
+                except ValueError:
+                    # it was woken up before getting cancelled, so it passes
+                    # the turn to the next waiting coroutine
+                    if is_ready():
+                        self._wake_up_next(waiters)
+                raise
+
+    def __has_items(self):
+        """
+        Checks if the instance has any item.
+
+        Returns
+        -------
+        bool:
+            `True` if the instance isn't empty and `False` otherwise.
+        """
+        return len(self._container) > 0
+
+    def __has_room(self):
+        """
+        Checks if the instance has room for a new item.
+
+        Returns
+        -------
+        bool:
+            `True` if the instance isn't full and `False` otherwise.
+        """
+        return len(self._container) < self._max_capacity
+
+    def __has_no_tasks(self):
+        """
+        Checks if every item added to the instance is marked as done.
+
+        Returns
+        -------
+        bool:
+            `True` if there is no unfinished task and `False` otherwise.
+        """
+        return self._unfinished_tasks == 0
+
+    async def _wait_for_room(self):
+        """
+        Suspends the calling coroutine till the instance isn't full. The
+        callers check that it's full beforehand, so that a coroutine isn't
+        created for every item.
+        """
+        await self.__wait(self._putters, self.__has_room)
+
+    async def _wait_for_items(self):
+        """
+        Suspends the calling coroutine till the instance isn't empty. The
+        callers check that it's empty beforehand, so that a coroutine isn't
+        created for every item.
+        """
+        await self.__wait(self._getters, self.__has_items)
+
+    async def _wait_for_tasks(self):
+        """
+        Suspends the calling coroutine till every item added to the instance
+        is marked as done.
+        """
+        await self.__wait(self._joiners, self.__has_no_tasks)
+
+    def _check_room(self):
+        """
+        Makes sure the instance isn't full before adding an item without
+        waiting.
+
+        Raises
+        ------
+        OverflowError:
+            If the instance is full.
+        """
+        if len(self._container) >= self._max_capacity:
+            raise OverflowError(f"Can't put into a full `{self.__name__}`!!")
+
+    def _check_items(self):
+        """
+        Makes sure the instance isn't empty before removing an item without
+        waiting.
+
+        Raises
+        ------
+        IndexError:
+            If the instance is empty.
+        """
+        if len(self._container) == 0:
+            raise IndexError(f"Can't get from an empty `{self.__name__}`!!")
+
+    # =============================     TASKS    ==============================
+    def _add_task(self):
+        """
+        Counts a new unfinished task after an item was put.
+        """
+        self._unfinished_tasks += 1
+
+    def _count_added(self, length):
+        """
+        Counts the items added since the instance had the given length as
+        unfinished tasks.
+
+        Parameters
+        ----------
+        length: int
+            The length of the container before the items were added.
+        """
+        self._unfinished_tasks += len(self._container) - length
+
+    def _drop_tasks(self, count):
+        """
+        Stops counting the given number of items, which were removed without
+        being taken, as unfinished tasks and wakes up the coroutines waiting
+        in `join()` when no unfinished task is left.
+
+        Parameters
+        ----------
+        count: int
+            The number of removed items.
+        """
+        self._unfinished_tasks -= count
+        if self._unfinished_tasks == 0:
+            while self._joiners:
+                self._wake_up_next(self._joiners)
+
+    def _task_done(self):
+        """
+        Marks a task as done and wakes up the coroutines waiting in `join()`
+        when no unfinished task is left.
+
+        Raises
+        ------
+        ValueError:
+            If it's called more times than the number of added items.
+        """
+        if self._unfinished_tasks <= 0:
+            raise ValueError(
+                f"`task_done()` called too many times on `{self.__name__}`!!"
+            )
+        self._drop_tasks(1)
+
+    def _add(self, item, push, drop_oldest):
+        """
+        Adds the given item like `Queue()._add()` does and counts it as an
+        unfinished task, while the item dropped by the overflow policy, if
+        any, isn't counted anymore.
+
+        Parameters
+        ----------
+        item: object
+            The python object to be added.
+        push: callable
+            The container method that adds the item to one of its ends.
+        drop_oldest: callable
+            The container method that removes the item at the other end.
+        """
+        def push_task(item):
+            push(item)
+            self._add_task()
+
+        def drop_task():
+            drop_oldest()
+            self._drop_tasks(1)
+
+        super()._add(item, push_task, drop_task)
+
+    def _add_many(self, items, push_many, drop_oldest_many):
+        """
+        Adds the given items like `Queue()._add_many()` does and counts them
+        as unfinished tasks, while the items dropped by the overflow policy
+        aren't counted anymore.
+
+        Parameters
+        ----------
+        items: list
+            The valid python objects to be added.
+        push_many: callable
+            The method that adds the items to one of the container's ends.
+        drop_oldest_many: callable
+            The method that removes a number of items from the other end.
+        """
+        def push_tasks(items):
+            push_many(items)
+            self._unfinished_tasks += len(items)
+
+        def drop_tasks(count):
+            drop_oldest_many(count)
+            self._drop_tasks(count)
+
+        super()._add_many(items, push_tasks, drop_tasks)
+
+
+class AsyncQueue(_Asynchronous, Queue):
+    """
+    A `Queue()` whose `put()` and `get()` coroutines suspend the calling
+    coroutine while the queue is full or empty, which makes it a first-in,
+    first-out (FIFO) queue that can be shared between the coroutines of an
+    `asyncio` event loop.
+    """
+
+    __name__ = "extra.AsyncQueue()"
+
+    def __init__(
+        self,
+        max_capacity=float("inf"),
+        backend="array",
+        overflow="warn",
+        empty="warn",
+        sentinel=None,
+    ):
+        """
+        Creates an `AsyncQueue()` object!!
+
+        Parameters
+        ----------
+        max_capacity: int
+            It's a positive integer representing the maximum number of elements
+            an `AsyncQueue()` should contain (Default: inf).
+        backend: str
+            The container used to store the elements, either `"linked"` or
+            `"array"` (Default: "array").
+        overflow: str
+            What `enqueue()` does when the `AsyncQueue()` is full, the same as
+            for `Queue()` except for `"block"` (Default: "warn").
+        empty: str
+            What `dequeue()` does when the `AsyncQueue()` is empty, the same
+            as for `Queue()` (Default: "warn").
+        sentinel: object
+            The object returned by `dequeue()` when the `AsyncQueue()` is
+            empty (Default: None).
+
+        Raises
+        ------
+        TypeError:
+            If the type of `max_capacity` isn't `int` or `float`.
+        ValueError: It can be raised in three cases
+            1. If the given value of `max_capacity` is less than zero.
+            2. If the given `backend` is neither `"linked"` nor `"array"`.
+            3. If the given `overflow` or `empty` isn't a known policy.
+
+        Example
+        -------
+        >>> q = AsyncQueue(10)
+        >>> type(q)
+        <class 'extra.lists.asynchronous.AsyncQueue'>
+        >>> q._max_capacity
+        10
+        """
+        super().__init__(max_capacity, backend, overflow, empty, sentinel)
+        self._init_asynchronous()
+
+    # =============================    ENQUEUE   ==============================
+    def enqueue(self, item):
+        """
+        Inserts the given `item` to end of the `AsyncQueue()` in constant
+        time, applying the overflow policy if it's full.
+
+        Parameters
+        ----------
+        item: object
+            The python object to be pushed to the `AsyncQueue()`.
+
+        Raises
+        ------
+        UserWarning:
+            If the `AsyncQueue()` instance was full and its overflow policy is
+            `"warn"`!!
+        OverflowError:
+            If the `AsyncQueue()` instance was full and its overflow policy is
+            `"raise"`.
+        ValueError:
+            If the given `item` is `None`.
+        TypeError:
+            If the given `item` is an instance of `Extra`.
+
+        Example
+        -------
+        >>> q = AsyncQueue()
+        >>> q.enqueue(10)
+        >>> q.enqueue(20)
+        >>> q
+        ─┬────┬────┬─
+        ⟶│ 20 │ 10 │⟶
+        ─┴────┴────┴─
+        """
+        super().enqueue(item)
+        self._notify_getters()
+
+    def enqueue_many(self, items):
+        """
+        Inserts the given items to the end of the `AsyncQueue()`, one after the
+        other, in linear time without waiting.
+
+        Parameters
+        ----------
+        items: iterable
+            The python objects to be pushed to the `AsyncQueue()`.
+
+        Raises
+        ------
+        UserWarning:
+            If the items don't fit in the `AsyncQueue()` instance and its
+            overflow policy is `"warn"`!! It's raised only once.
+        OverflowError:
+            If the items don't fit in the `AsyncQueue()` instance and its
+            overflow policy is `"raise"`, in which case none of them is
+            inserted.
+        ValueError:
+            If one of the given items is `None`.
+        TypeError:
+            If one of the given items is an instance of `Extra`.
+        """
+        super().enqueue_many(items)
+        self._notify_getters(all=True)
+
+    def put_nowait(self, item):
+        """
+        Inserts the given `item` to end of the `AsyncQueue()` in constant
+        time without waiting.
+
+        Parameters
+        ----------
+        item: object
+            The python object to be pushed to the `AsyncQueue()`.
+
+        Raises
+        ------
+        OverflowError:
+            If the `AsyncQueue()` instance is full.
+        ValueError:
+            If the given `item` is `None`.
+        TypeError:
+            If the given `item` is an instance of `Extra`.
+
+        Example
+        -------
+        >>> q = AsyncQueue(max_capacity=1)
+        >>> q.put_nowait(10)
+        >>> q.put_nowait(20)
+        OverflowError: Can't put into a full `extra.AsyncQueue()`!!
+        """
+        super()._validate_item(item)
+        self._check_room()
+        self._push_left(item)
+        self._add_task()
+        self._notify_getters()
+
+    async def put(self, item):
+        """
+        Inserts the given `item` to end of the `AsyncQueue()` in constant
+        time, suspending the calling coroutine while the queue is full.
+
+        Parameters
+        ----------
+        item: object
+            The python object to be pushed to the `AsyncQueue()`.
+
+        Raises
+        ------
+        ValueError:
+            If the given `item` is `None`.
+        TypeError:
+            If the given `item` is an instance of `Extra`.
+
+        Example
+        -------
+        >>> q = AsyncQueue(max_capacity=1)
+        >>> await q.put(10)
+        >>> await asyncio.wait_for(q.put(20), timeout=0.1)
+        asyncio.TimeoutError
+        """
+        super()._validate_item(item)
+        if len(self._container) >= self._max_capacity:
+            await self._wait_for_room()
+        self._push_left(item)
+        self._add_task()
+        self._notify_getters()
+
+    # =============================    DEQUEUE   ==============================
+    def dequeue(self):
+        """
+        Pops the first inserted item from the `AsyncQueue()` in constant
+        time, applying the empty policy if it's empty.
+
+        Returns
+        -------
+        object:
+            The `AsyncQueue()` instance's first item or its sentinel if it's
+            empty and its empty policy isn't `"raise"`.
+
+        Raises
+        ------
+        UserWarning:
+            If the `AsyncQueue()` instance is empty and its empty policy is
+            `"warn"`!!
+        IndexError:
+            If the `AsyncQueue()` instance is empty and its empty policy is
+            `"raise"`!!
+
+        Example
+        -------
+        >>> q = AsyncQueue()
+        >>> q.enqueue(10)
+        >>> q.dequeue()
+        10
+        >>> q.dequeue()
+        UserWarning: Dequeuing from an empty `extra.AsyncQueue()`!!
+        """
+        item = super().dequeue()
+        self._notify_putters()
+        return item
+
+    def dequeue_many(self, count):
+        """
+        Pops the given number of the first inserted items from the
+        `AsyncQueue()` without waiting.
+
+        Parameters
+        ----------
+        count: int
+            The number of items to be popped.
+
+        Returns
+        -------
+        list:
+            The popped items in the order they were popped.
+
+        Raises
+        ------
+        UserWarning:
+            If the `AsyncQueue()` instance has fewer items than `count`
+            and its empty policy is `"warn"`!!
+        IndexError:
+            If the `AsyncQueue()` instance has fewer items than `count`
+            and its empty policy is `"raise"`, in which case nothing is
+            popped!!
+        TypeError:
+            If the given `count` isn't an integer.
+        ValueError:
+            If the given `count` is negative.
+        """
+        items = super().dequeue_many(count)
+        self._notify_putters(all=True)
+        return items
+
+    def get_nowait(self):
+        """
+        Pops the first inserted item from the `AsyncQueue()` in constant
+        time without waiting.
+
+        Returns
+        -------
+        object:
+            The `AsyncQueue()` instance's first item.
+
+        Raises
+        ------
+        IndexError:
+            If the `AsyncQueue()` instance is empty.
+
+        Example
+        -------
+        >>> q = AsyncQueue()
+        >>> q.put_nowait(10)
+        >>> q.get_nowait()
+        10
+        >>> q.get_nowait()
+        IndexError: Can't get from an empty `extra.AsyncQueue()`!!
+        """
+        self._check_items()
+        item = self._pop_right()
+        self._notify_putters()
+        return item
+
+    async def get(self):
+        """
+        Pops the first inserted item from the `AsyncQueue()` in constant
+        time, suspending the calling coroutine while the queue is empty.
+
+        Returns
+        -------
+        object:
+            The `AsyncQueue()` instance's first item.
+
+        Example
+        -------
+        >>> q = AsyncQueue()
+        >>> await q.put(10)
+        >>> await q.put(20)
+        >>> await q.get()
+        10
+        >>> await q.get()
+        20
+        """
+        if len(self._container) == 0:
+            await self._wait_for_items()
+        item = self._pop_right()
+        self._notify_putters()
+        return item
+
+    def clear(self):
+        """
+        Removes all objects within the `AsyncQueue()` instance, waking up the
+        coroutines waiting to put items.
+
+        Example
+        -------
+        >>> q = AsyncQueue()
+        >>> q.put_nowait(1)
+        >>> q.put_nowait(2)
+        >>> q.clear()
+        >>> len(q)
+        0
+        """
+        # NOTE: the removed items won't be taken, so they aren't tasks
+        self._drop_tasks(len(self._container))
+        super().clear()
+        self._notify_putters(all=True)
+
+    # =============================     TASKS    ==============================
+    def task_done(self):
+        """
+        Marks an item taken by `get()` as processed, so that `join()` returns
+        once every added item was processed.
+
+        Raises
+        ------
+        ValueError:
+            If it's called more times than the number of added items.
+
+        Example
+        -------
+        >>> q = AsyncQueue()
+        >>> await q.put(10)
+        >>> await q.get()
+        10
+        >>> q.task_done()
+        >>> q.task_done()
+        ValueError: `task_done()` called too many times on \
+            `extra.AsyncQueue()`!!
+        """
+        self._task_done()
+
+    async def join(self):
+        """
+        Suspends the calling coroutine till every item added to the
+        `AsyncQueue()` instance is taken and marked as processed by
+        `task_done()`.
+
+        Example
+        -------
+        >>> q = AsyncQueue()
+        >>> await q.put(10)
+        >>> await q.get()
+        10
+        >>> q.task_done()
+        >>> await q.join()  # returns right away
+        """
+        await self._wait_for_tasks()
+
+
+class AsyncDeque(_Asynchronous, Deque):
+    """
+    A `Deque()` whose `put()` and `get()` coroutines suspend the calling
+    coroutine while the deque is full or empty. `put()` appends to the right
+    end and `get()` pops from the left end, so they behave like a first-in,
+    first-out (FIFO) queue, while the other methods can reach both ends.
+    """
+
+    __name__ = "extra.AsyncDeque()"
+
+    def __init__(
+        self,
+        max_capacity=float("inf"),
+        backend="array",
+        overflow="warn",
+        empty="warn",
+        sentinel=None,
+    ):
+        """
+        Creates an `AsyncDeque()` object!!
+
+        Parameters
+        ----------
+        max_capacity: int
+            It's a positive integer representing the maximum number of elements
+            an `AsyncDeque()` should contain (Default: inf).
+        backend: str
+            The container used to store the elements, either `"linked"` or
+            `"array"` (Default: "array").
+        overflow: str
+            What the `append_*()` methods do when the `AsyncDeque()` is full,
+            the same as for `Deque()` except for `"block"` (Default: "warn").
+        empty: str
+            What the `pop_*()` methods do when the `AsyncDeque()` is empty,
+            the same as for `Deque()` (Default: "warn").
+        sentinel: object
+            The object returned by the `pop_*()` methods when the
+            `AsyncDeque()` is empty (Default: None).
+
+        Raises
+        ------
+        TypeError:
+            If the type of `max_capacity` isn't `int` or `float`.
+        ValueError: It can be raised in three cases
+            1. If the given value of `max_capacity` is less than zero.
+            2. If the given `backend` is neither `"linked"` nor `"array"`.
+            3. If the given `overflow` or `empty` isn't a known policy.
+
+        Example
+        -------
+        >>> dq = AsyncDeque(10)
+        >>> type(dq)
+        <class 'extra.lists.asynchronous.AsyncDeque'>
+        >>> dq._max_capacity
+        10
+        """
+        super().__init__(max_capacity, backend, overflow, empty, sentinel)
+        self._init_asynchronous()
+
+    # =============================    APPEND    ==============================
+    def enqueue(self, item):
+        """
+        Inserts the given `item` to the left-side of the `AsyncDeque()` in
+        constant time, applying the overflow policy if it's full.
+
+        Parameters
+        ----------
+        item: object
+            The python object to be pushed to the `AsyncDeque()`.
+
+        Raises
+        ------
+        UserWarning:
+            If the `AsyncDeque()` instance was full and its overflow policy is
+            `"warn"`!!
+        OverflowError:
+            If the `AsyncDeque()` instance was full and its overflow policy is
+            `"raise"`.
+        ValueError:
+            If the given `item` is `None`.
+        TypeError:
+            If the given `item` is an instance of `Extra`.
+
+        Note
+        ----
+        This method does the same job as `AsyncDeque().append_left`.
+        """
+        super().enqueue(item)
+        self._notify_getters()
+
+    def enqueue_many(self, items):
+        """
+        Inserts the given items to the left-side of the `AsyncDeque()`, one
+        after the other, in linear time without waiting.
+
+        Parameters
+        ----------
+        items: iterable
+            The python objects to be pushed to the `AsyncDeque()`.
+
+        Raises
+        ------
+        UserWarning:
+            If the items don't fit in the `AsyncDeque()` instance and its
+            overflow policy is `"warn"`!! It's raised only once.
+        OverflowError:
+            If the items don't fit in the `AsyncDeque()` instance and its
+            overflow policy is `"raise"`, in which case none of them is
+            inserted.
+        ValueError:
+            If one of the given items is `None`.
+        TypeError:
+            If one of the given items is an instance of `Extra`.
+        """
+        super().enqueue_many(items)
+        self._notify_getters(all=True)
+
+    def append_left(self, item):
+        """
+        Inserts the given `item` to the left-side of the `AsyncDeque()` in
+        constant time, applying the overflow policy if it's full.
+
+        Parameters
+        ----------
+        item: object
+            The python object to be pushed to the `AsyncDeque()`.
+
+        Raises
+        ------
+        UserWarning:
+            If the `AsyncDeque()` instance was full and its overflow policy is
+            `"warn"`!!
+        OverflowError:
+            If the `AsyncDeque()` instance was full and its overflow policy is
+            `"raise"`.
+        ValueError:
+            If the given `item` is `None`.
+        TypeError:
+            If the given `item` is an instance of `Extra`.
+
+        Example
+        -------
+        >>> dq = AsyncDeque()
+        >>> dq.append_left(1)
+        >>> dq.append_left(2)
+        >>> dq
+        ─┬───┬───┬─
+        ⟷│ 2 │ 1 │⟷
+        ─┴───┴───┴─
+        """
+        super().append_left(item)
+        self._notify_getters()
+
+    def append_left_many(self, items):
+        """
+        Inserts the given items to the left-side of the `AsyncDeque()`, one
+        after the other, in linear time without waiting.
+
+        Parameters
+        ----------
+        items: iterable
+            The python objects to be pushed to the `AsyncDeque()`.
+
+        Raises
+        ------
+        UserWarning:
+            If the items don't fit in the `AsyncDeque()` instance and its
+            overflow policy is `"warn"`!! It's raised only once.
+        OverflowError:
+            If the items don't fit in the `AsyncDeque()` instance and its
+            overflow policy is `"raise"`, in which case none of them is
+            inserted.
+        ValueError:
+            If one of the given items is `None`.
+        TypeError:
+            If one of the given items is an instance of `Extra`.
+        """
+        super().append_left_many(items)
+        self._notify_getters(all=True)
+
+    def append_right(self, item):
+        """
+        Inserts the given `item` to the right-side of the `AsyncDeque()` in
+        constant time, applying the overflow policy if it's full.
+
+        Parameters
+        ----------
+        item: object
+            The python object to be pushed to the `AsyncDeque()`.
+
+        Raises
+        ------
+        UserWarning:
+            If the `AsyncDeque()` instance was full and its overflow policy is
+            `"warn"`!!
+        OverflowError:
+            If the `AsyncDeque()` instance was full and its overflow policy is
+            `"raise"`.
+        ValueError:
+            If the given `item` is `None`.
+        TypeError:
+            If the given `item` is an instance of `Extra`.
+
+        Example
+        -------
+        >>> dq = AsyncDeque()
+        >>> dq.append_right(1)
+        >>> dq.append_right(2)
+        >>> dq
+        ─┬───┬───┬─
+        ⟷│ 1 │ 2 │⟷
+        ─┴───┴───┴─
+        """
+        super().append_right(item)
+        self._notify_getters()
+
+    def append_right_many(self, items):
+        """
+        Inserts the given items to the right-side of the `AsyncDeque()`, one
+        after the other, in linear time without waiting.
+
+        Parameters
+        ----------
+        items: iterable
+            The python objects to be pushed to the `AsyncDeque()`.
+
+        Raises
+        ------
+        UserWarning:
+            If the items don't fit in the `AsyncDeque()` instance and its
+            overflow policy is `"warn"`!! It's raised only once.
+        OverflowError:
+            If the items don't fit in the `AsyncDeque()` instance and its
+            overflow policy is `"raise"`, in which case none of them is
+            inserted.
+        ValueError:
+            If one of the given items is `None`.
+        TypeError:
+            If one of the given items is an instance of `Extra`.
+        """
+        super().append_right_many(items)
+        self._notify_getters(all=True)
+
+    def put_nowait(self, item):
+        """
+        Inserts the given `item` to the right-side of the `AsyncDeque()` in
+        constant time without waiting.
+
+        Parameters
+        ----------
+        item: object
+            The python object to be pushed to the `AsyncDeque()`.
+
+        Raises
+        ------
+        OverflowError:
+            If the `AsyncDeque()` instance is full.
+        ValueError:
+            If the given `item` is `None`.
+        TypeError:
+            If the given `item` is an instance of `Extra`.
+
+        Example
+        -------
+        >>> dq = AsyncDeque(max_capacity=1)
+        >>> dq.put_nowait(10)
+        >>> dq.put_nowait(20)
+        OverflowError: Can't put into a full `extra.AsyncDeque()`!!
+        """
+        super()._validate_item(item)
+        self._check_room()
+        self._push_right(item)
+        self._add_task()
+        self._notify_getters()
+
+    async def put(self, item):
+        """
+        Inserts the given `item` to the right-side of the `AsyncDeque()` in
+        constant time, suspending the calling coroutine while the deque is
+        full.
+
+        Parameters
+        ----------
+        item: object
+            The python object to be pushed to the `AsyncDeque()`.
+
+        Raises
+        ------
+        ValueError:
+            If the given `item` is `None`.
+        TypeError:
+            If the given `item` is an instance of `Extra`.
+
+        Example
+        -------
+        >>> dq = AsyncDeque()
+        >>> await dq.put(10)
+        >>> await dq.put(20)
+        >>> dq
+        ─┬────┬────┬─
+        ⟷│ 10 │ 20 │⟷
+        ─┴────┴────┴─
+        """
+        super()._validate_item(item)
+        if len(self._container) >= self._max_capacity:
+            await self._wait_for_room()
+        self._push_right(item)
+        self._add_task()
+        self._notify_getters()
+
+    # =============================      POP     ==============================
+    def dequeue(self):
+        """
+        Pops the right-most item from the `AsyncDeque()` in constant time,
+        applying the empty policy if it's empty.
+
+        Returns
+        -------
+        object:
+            The `AsyncDeque()` instance's right-most item or its sentinel if
+            it's empty and its empty policy isn't `"raise"`.
+
+        Raises
+        ------
+        UserWarning:
+            If the `AsyncDeque()` instance is empty and its empty policy is
+            `"warn"`!!
+        IndexError:
+            If the `AsyncDeque()` instance is empty and its empty policy is
+            `"raise"`!!
+
+        Note
+        ----
+        This method does the same job as `AsyncDeque().pop_right`.
+        """
+        item = super().dequeue()
+        self._notify_putters()
+        return item
+
+    def dequeue_many(self, count):
+        """
+        Pops the given number of the right-most items from the `AsyncDeque()`
+        without waiting.
+
+        Parameters
+        ----------
+        count: int
+            The number of items to be popped.
+
+        Returns
+        -------
+        list:
+            The popped items in the order they were popped.
+
+        Raises
+        ------
+        UserWarning:
+            If the `AsyncDeque()` instance has fewer items than `count`
+            and its empty policy is `"warn"`!!
+        IndexError:
+            If the `AsyncDeque()` instance has fewer items than `count`
+            and its empty policy is `"raise"`, in which case nothing is
+            popped!!
+        TypeError:
+            If the given `count` isn't an integer.
+        ValueError:
+            If the given `count` is negative.
+        """
+        items = super().dequeue_many(count)
+        self._notify_putters(all=True)
+        return items
+
+    def pop_left(self):
+        """
+        Pops the left-most item from the `AsyncDeque()` in constant time,
+        applying the empty policy if it's empty.
+
+        Returns
+        -------
+        object:
+            The `AsyncDeque()` instance's left-most item or its sentinel if
+            it's empty and its empty policy isn't `"raise"`.
+
+        Raises
+        ------
+        UserWarning:
+            If the `AsyncDeque()` instance is empty and its empty policy is
+            `"warn"`!!
+        IndexError:
+            If the `AsyncDeque()` instance is empty and its empty policy is
+            `"raise"`!!
+
+        Example
+        -------
+        >>> dq = AsyncDeque()
+        >>> dq.put_nowait(10)
+        >>> dq.put_nowait(20)
+        >>> dq.pop_left()
+        10
+        """
+        item = super().pop_left()
+        self._notify_putters()
+        return item
+
+    def pop_left_many(self, count):
+        """
+        Pops the given number of the left-most items from the `AsyncDeque()`
+        without waiting.
+
+        Parameters
+        ----------
+        count: int
+            The number of items to be popped.
+
+        Returns
+        -------
+        list:
+            The popped items in the order they were popped.
+
+        Raises
+        ------
+        UserWarning:
+            If the `AsyncDeque()` instance has fewer items than `count`
+            and its empty policy is `"warn"`!!
+        IndexError:
+            If the `AsyncDeque()` instance has fewer items than `count`
+            and its empty policy is `"raise"`, in which case nothing is
+            popped!!
+        TypeError:
+            If the given `count` isn't an integer.
+        ValueError:
+            If the given `count` is negative.
+        """
+        items = super().pop_left_many(count)
+        self._notify_putters(all=True)
+        return items
+
+    def pop_right(self):
+        """
+        Pops the right-most item from the `AsyncDeque()` in constant time,
+        applying the empty policy if it's empty.
+
+        Returns
+        -------
+        object:
+            The `AsyncDeque()` instance's right-most item or its sentinel if
+            it's empty and its empty policy isn't `"raise"`.
+
+        Raises
+        ------
+        UserWarning:
+            If the `AsyncDeque()` instance is empty and its empty policy is
+            `"warn"`!!
+        IndexError:
+            If the `AsyncDeque()` instance is empty and its empty policy is
+            `"raise"`!!
+
+        Example
+        -------
+        >>> dq = AsyncDeque()
+        >>> dq.put_nowait(10)
+        >>> dq.put_nowait(20)
+        >>> dq.pop_right()
+        20
+        """
+        item = super().pop_right()
+        self._notify_putters()
+        return item
+
+    def pop_right_many(self, count):
+        """
+        Pops the given number of the right-most items from the `AsyncDeque()`
+        without waiting.
+
+        Parameters
+        ----------
+        count: int
+            The number of items to be popped.
+
+        Returns
+        -------
+        list:
+            The popped items in the order they were popped.
+
+        Raises
+        ------
+        UserWarning:
+            If the `AsyncDeque()` instance has fewer items than `count`
+            and its empty policy is `"warn"`!!
+        IndexError:
+            If the `AsyncDeque()` instance has fewer items than `count`
+            and its empty policy is `"raise"`, in which case nothing is
+            popped!!
+        TypeError:
+            If the given `count` isn't an integer.
+        ValueError:
+            If the given `count` is negative.
+        """
+        items = super().pop_right_many(count)
+        self._notify_putters(all=True)
+        return items
+
+    def get_nowait(self):
+        """
+        Pops the left-most item from the `AsyncDeque()` in constant time
+        without waiting.
+
+        Returns
+        -------
+        object:
+            The `AsyncDeque()` instance's left-most item.
+
+        Raises
+        ------
+        IndexError:
+            If the `AsyncDeque()` instance is empty.
+
+        Example
+        -------
+        >>> dq = AsyncDeque()
+        >>> dq.put_nowait(10)
+        >>> dq.get_nowait()
+        10
+        >>> dq.get_nowait()
+        IndexError: Can't get from an empty `extra.AsyncDeque()`!!
+        """
+        self._check_items()
+        item = self._pop_left()
+        self._notify_putters()
+        return item
+
+    async def get(self):
+        """
+        Pops the left-most item from the `AsyncDeque()` in constant time,
+        suspending the calling coroutine while the deque is empty.
+
+        Returns
+        -------
+        object:
+            The `AsyncDeque()` instance's left-most item.
+
+        Example
+        -------
+        >>> dq = AsyncDeque()
+        >>> await dq.put(10)
+        >>> await dq.put(20)
+        >>> await dq.get()
+        10
+        >>> await dq.get()
+        20
+        """
+        if len(self._container) == 0:
+            await self._wait_for_items()
+        item = self._pop_left()
+        self._notify_putters()
+        return item
+
+    def clear(self):
+        """
+        Removes all objects within the `AsyncDeque()` instance, waking up the
+        coroutines waiting to put items.
+
+        Example
+        -------
+        >>> dq = AsyncDeque()
+        >>> dq.put_nowait(1)
+        >>> dq.put_nowait(2)
+        >>> dq.clear()
+        >>> len(dq)
+        0
+        """
+        # NOTE: the removed items won't be taken, so they aren't tasks
+        self._drop_tasks(len(self._container))
+        super().clear()
+        self._notify_putters(all=True)
+
+    # =============================     TASKS    ==============================
+    def task_done(self):
+        """
+        Marks an item taken by `get()` as processed, so that `join()` returns
+        once every added item was processed.
+
+        Raises
+        ------
+        ValueError:
+            If it's called more times than the number of added items.
+
+        Example
+        -------
+        >>> dq = AsyncDeque()
+        >>> await dq.put(10)
+        >>> await dq.get()
+        10
+        >>> dq.task_done()
+        >>> dq.task_done()
+        ValueError: `task_done()` called too many times on \
+            `extra.AsyncDeque()`!!
+        """
+        self._task_done()
+
+    async def join(self):
+        """
+        Suspends the calling coroutine till every item added to the
+        `AsyncDeque()` instance is taken and marked as processed by
+        `task_done()`.
+
+        Example
+        -------
+        >>> dq = AsyncDeque()
+        >>> await dq.put(10)
+        >>> await dq.get()
+        10
+        >>> dq.task_done()
+        >>> await dq.join()  # returns right away
+        """
+        await self._wait_for_tasks()
+
+
+class AsyncPriorityQueue(_Asynchronous, PriorityQueue):
+    """
+    A `PriorityQueue()` whose `put()` and `get()` coroutines suspend the
+    calling coroutine while the queue is full or empty. `get()` pops the item
+    with the highest priority, or the lowest one if asked to.
+    """
+
+    __name__ = "extra.AsyncPriorityQueue()"
+
+    def __init__(self, max_capacity=float("inf"), seed=None):
+        """
+        Creates an `AsyncPriorityQueue()` object!!
+
+        Parameters
+        ----------
+        max_capacity: int
+            It's a positive integer representing the maximum number of elements
+            an `AsyncPriorityQueue()` should contain. (default: inf)
+        seed: int, optional
+            The seed of the random priorities given to the items enqueued
+            without a priority.
+
+        Raises
+        ------
+        TypeError:
+            If the type of `max_capacity` isn't `int` or `float`.
+        ValueError:
+            If the given value of `max_capacity` is less than zero.
+
+        Example
+        -------
+        >>> pq = AsyncPriorityQueue(10)
+        >>> type(pq)
+        <class 'extra.lists.asynchronous.AsyncPriorityQueue'>
+        >>> pq._max_capacity
+        10
+        """
+        super().__init__(max_capacity, seed)
+        self._init_asynchronous()
+
+    # =============================    ENQUEUE   ==============================
+    def enqueue(self, item, priority=None):
+        """
+        Inserts the given `item` to the end of the `AsyncPriorityQueue()` in
+        time-complexity of O(log(n)) without waiting, where **n** is the
+        number of elements in the instance.
+
+        Parameters
+        ----------
+        item: object
+            The python object to be pushed to the `AsyncPriorityQueue()`.
+        priority: int or float
+            The priority of the item. If `priority=None`, then a random
+            integer number will be assigned.
+
+        Raises
+        ------
+        UserWarning:
+            If the `AsyncPriorityQueue()` instance was full!!
+        ValueError:
+            If the given `item` is `None`.
+        TypeError:
+            It can be raised due to one of the following reasons:
+                1. If the given `item` is an instance of `Extra`.
+                2. If the given `priority` isn't a number.
+        """
+        length = len(self._container)
+        super().enqueue(item, priority)
+        # NOTE: the "warn" policy drops the oldest item to make room
+        self._count_added(length)
+        self._notify_getters()
+
+    def enqueue_many(self, items, priorities=None):
+        """
+        Inserts the given items to the end of the `AsyncPriorityQueue()`, one
+        after the other, in linear time without waiting.
+
+        Parameters
+        ----------
+        items: iterable
+            The python objects to be pushed to the `AsyncPriorityQueue()`.
+        priorities: iterable, optional
+            The priorities of the given items in the same order. If
+            `priorities=None`, then random integer numbers will be assigned.
+
+        Raises
+        ------
+        UserWarning:
+            If the items don't fit in the `AsyncPriorityQueue()`
+            instance!! It's raised only once.
+        ValueError:
+            If one of the given items is `None`, or if the number of the
+            given priorities isn't the same as the number of items.
+        TypeError:
+            If one of the given items is an instance of `Extra` or one of
+            the given priorities isn't a number.
+        """
+        length = len(self._container)
+        super().enqueue_many(items, priorities)
+        self._count_added(length)
+        self._notify_getters(all=True)
+
+    def put_nowait(self, item, priority=None):
+        """
+        Inserts the given `item` to the end of the `AsyncPriorityQueue()` in
+        time-complexity of O(log(n)) without waiting, where **n** is the
+        number of elements in the instance.
+
+        Parameters
+        ----------
+        item: object
+            The python object to be pushed to the `AsyncPriorityQueue()`.
+        priority: int or float
+            The priority of the item. If `priority=None`, then a random
+            integer number will be assigned.
+
+        Raises
+        ------
+        OverflowError:
+            If the `AsyncPriorityQueue()` instance is full.
+        ValueError:
+            If the given `item` is `None`.
+        TypeError:
+            It can be raised due to one of the following reasons:
+                1. If the given `item` is an instance of `Extra`.
+                2. If the given `priority` isn't a number.
+
+        Example
+        -------
+        >>> pq = AsyncPriorityQueue(max_capacity=1)
+        >>> pq.put_nowait(10, priority=1)
+        >>> pq.put_nowait(20, priority=2)
+        OverflowError: Can't put into a full `extra.AsyncPriorityQueue()`!!
+        """
+        self._check_room()
+        super().enqueue(item, priority)
+        self._add_task()
+        self._notify_getters()
+
+    async def put(self, item, priority=None):
+        """
+        Inserts the given `item` to the end of the `AsyncPriorityQueue()` in
+        time-complexity of O(log(n)), where **n** is the number of elements in
+        the instance, suspending the calling coroutine while the queue is
+        full.
+
+        Parameters
+        ----------
+        item: object
+            The python object to be pushed to the `AsyncPriorityQueue()`.
+        priority: int or float
+            The priority of the item. If `priority=None`, then a random
+            integer number will be assigned.
+
+        Raises
+        ------
+        ValueError:
+            If the given `item` is `None`.
+        TypeError:
+            It can be raised due to one of the following reasons:
+                1. If the given `item` is an instance of `Extra`.
+                2. If the given `priority` isn't a number.
+
+        Example
+        -------
+        >>> pq = AsyncPriorityQueue()
+        >>> await pq.put(10, priority=1)
+        >>> await pq.put(20, priority=5)
+        >>> pq
+        ─┬────┬────┬─
+        ⟶│ 20 │ 10 │⟶
+        ─┴────┴────┴─
+        """
+        if len(self._container) >= self._max_capacity:
+            await self._wait_for_room()
+        super().enqueue(item, priority)
+        self._add_task()
+        self._notify_getters()
+
+    # =============================    DEQUEUE   ==============================
+    def dequeue(self, lowest_priority=False):
+        """
+        Pops the item that has the highest priority from the
+        `AsyncPriorityQueue()` instance in time-complexity of O(log(n))
+        without waiting, where **n** is the number of elements in the
+        instance.
+
+        Parameters
+        ----------
+        lowest_priority: bool
+            A flag to pop the item that has the lowest priority instead of the
+            highest one (default: `False`).
+
+        Returns
+        -------
+        object:
+            The item that has the highest priority in the
+            `AsyncPriorityQueue()`.
+
+        Raises
+        ------
+        UserWarning:
+            If the `AsyncPriorityQueue()` instance is empty!!
+        """
+        item = super().dequeue(lowest_priority)
+        self._notify_putters()
+        return item
+
+    def dequeue_many(self, count, lowest_priority=False):
+        """
+        Pops the given number of items that have the highest priorities from
+        the `AsyncPriorityQueue()` without waiting.
+
+        Parameters
+        ----------
+        count: int
+            The number of items to be popped.
+        lowest_priority: bool
+            A flag to pop the items that have the lowest priorities instead of
+            the highest ones (default: `False`).
+
+        Returns
+        -------
+        list:
+            The popped items in the order they were popped.
+
+        Raises
+        ------
+        UserWarning:
+            If the `AsyncPriorityQueue()` instance has fewer items than
+            `count`!!
+        TypeError:
+            If the given `count` isn't an integer.
+        ValueError:
+            If the given `count` is negative.
+        """
+        items = super().dequeue_many(count, lowest_priority)
+        self._notify_putters(all=True)
+        return items
+
+    def get_nowait(self, lowest_priority=False):
+        """
+        Pops the item that has the highest priority from the
+        `AsyncPriorityQueue()` instance in time-complexity of O(log(n))
+        without waiting, where **n** is the number of elements in the
+        instance.
+
+        Parameters
+        ----------
+        lowest_priority: bool
+            A flag to pop the item that has the lowest priority instead of the
+            highest one (default: `False`).
+
+        Returns
+        -------
+        object:
+            The item that has the highest priority in the
+            `AsyncPriorityQueue()`.
+
+        Raises
+        ------
+        IndexError:
+            If the `AsyncPriorityQueue()` instance is empty.
+
+        Example
+        -------
+        >>> pq = AsyncPriorityQueue()
+        >>> pq.put_nowait(10, priority=1)
+        >>> pq.get_nowait()
+        10
+        >>> pq.get_nowait()
+        IndexError: Can't get from an empty `extra.AsyncPriorityQueue()`!!
+        """
+        self._check_items()
+        item = super().dequeue(lowest_priority)
+        self._notify_putters()
+        return item
+
+    async def get(self, lowest_priority=False):
+        """
+        Pops the item that has the highest priority from the
+        `AsyncPriorityQueue()` instance in time-complexity of O(log(n)), where
+        **n** is the number of elements in the instance, suspending the
+        calling coroutine while the queue is empty.
+
+        Parameters
+        ----------
+        lowest_priority: bool
+            A flag to pop the item that has the lowest priority instead of the
+            highest one (default: `False`).
+
+        Returns
+        -------
+        object:
+            The item that has the highest priority in the
+            `AsyncPriorityQueue()`.
+
+        Example
+        -------
+        >>> pq = AsyncPriorityQueue()
+        >>> await pq.put(10, priority=1)
+        >>> await pq.put(20, priority=5)
+        >>> await pq.put(30, priority=3)
+        >>> await pq.get()
+        20
+        >>> await pq.get(lowest_priority=True)
+        10
+        """
+        if len(self._container) == 0:
+            await self._wait_for_items()
+        item = super().dequeue(lowest_priority)
+        self._notify_putters()
+        return item
+
+    def clear(self):
+        """
+        Removes all objects within the `AsyncPriorityQueue()` instance, waking
+        up the coroutines waiting to put items.
+
+        Example
+        -------
+        >>> pq = AsyncPriorityQueue()
+        >>> pq.put_nowait(1)
+        >>> pq.put_nowait(2)
+        >>> pq.clear()
+        >>> len(pq)
+        0
+        """
+        # NOTE: the removed items won't be taken, so they aren't tasks
+        self._drop_tasks(len(self._container))
+        super().clear()
+        self._notify_putters(all=True)
+
+    # =============================     TASKS    ==============================
+    def task_done(self):
+        """
+        Marks an item taken by `get()` as processed, so that `join()` returns
+        once every added item was processed.
+
+        Raises
+        ------
+        ValueError:
+            If it's called more times than the number of added items.
+
+        Example
+        -------
+        >>> pq = AsyncPriorityQueue()
+        >>> await pq.put(10)
+        >>> await pq.get()
+        10
+        >>> pq.task_done()
+        >>> pq.task_done()
+        ValueError: `task_done()` called too many times on \
+            `extra.AsyncPriorityQueue()`!!
+        """
+        self._task_done()
+
+    async def join(self):
+        """
+        Suspends the calling coroutine till every item added to the
+        `AsyncPriorityQueue()` instance is taken and marked as processed by
+        `task_done()`.
+
+        Example
+        -------
+        >>> pq = AsyncPriorityQueue()
+        >>> await pq.put(10)
+        >>> await pq.get()
+        10
+        >>> pq.task_done()
+        >>> await pq.join()  # returns right away
+        """
+        await self._wait_for_tasks()
@@ -0,0 +1,2211 @@
+"""
+The blocking containers are thread-safe versions of `Stack()`, `Queue()`,
+`Deque()` and `PriorityQueue()` that can be shared between producer and
+consumer threads. Every method runs while holding a lock of the instance, and
+the `put()` & `get()` methods block the calling thread till there is room for
+the new item or an item to be removed, optionally giving up after a timeout.
+Like the `queue` standard module, each added item, whatever the method that
+added it, counts as an unfinished task that a consumer marks as done with
+`task_done()`, so that `join()` can wait for all the added items to be
+processed.
+"""
+import threading
+from extra.interface import Extra
+from extra.lists.stack import Stack
+from extra.lists.queue import Queue
+from extra.lists.deque import Deque
+from extra.lists.priority_queue import PriorityQueue
+
+
+class _Blocking(Extra):
+    """
+    The shared machinery of the blocking containers. It expects the container
+    to be stored in `_container` and the maximum capacity in `_max_capacity`,
+    which is the case for `Stack()`, `Queue()` and its subclasses.
+    """
+
+    __name__ = "extra._Blocking()"
+
+    def _init_blocking(self):
+        """
+        Creates the lock and the condition variables of the instance. It has
+        to be called at the end of the `__init__()` method of every blocking
+        container.
+        """
+        # NOTE: the lock is re-entrant, so the locked methods can call each
+        # other safely
+        self._mutex = threading.RLock()
+        self._has_items = threading.Condition(self._mutex)
+        self._has_room = threading.Condition(self._mutex)
+        self._all_tasks_done = threading.Condition(self._mutex)
+        self._waiting_getters = 0
+        self._waiting_putters = 0
+        self._unfinished_tasks = 0
+
+    # =============================    NOTIFY    ==============================
+    def _notify_getters(self, all=False):
+        """
+        Wakes up threads waiting in `get()` after items were added. The caller
+        has to hold the lock of the instance.
+
+        Parameters
+        ----------
+        all: bool
+            A flag to wake up all the waiting threads instead of only one of
+            them (default: `False`).
+        """
+        # NOTE: notifying nobody is still costly, so the waiters are counted
+        if self._waiting_getters:
+            if all:
+                self._has_items.notify_all()
+            else:
+                self._has_items.notify()
+
+    def _notify_putters(self, all=False):
+        """
+        Wakes up threads waiting in `put()` after items were removed. The
+        caller has to hold the lock of the instance.
+
+        Parameters
+        ----------
+        all: bool
+            A flag to wake up all the waiting threads instead of only one of
+            them (default: `False`).
+        """
+        if self._waiting_putters:
+            if all:
+                self._has_room.notify_all()
+            else:
+                self._has_room.notify()
+
+    # =============================     WAIT     ==============================
+    def __has_items(self):
+        """
+        Checks if the instance has any item without taking its lock.
+
+        Returns
+        -------
+        bool:
+            `True` if the instance isn't empty and `False` otherwise.
+        """
+        return len(self._container) > 0
+
+    def __has_room(self):
+        """
+        Checks if the instance has room for a new item without taking its
+        lock.
+
+        Returns
+        -------
+        bool:
+            `True` if the instance isn't full and `False` otherwise.
+        """
+        return len(self._container) < self._max_capacity
+
+    def _wait_for_room(self, block, timeout):
+        """
+        Waits till the instance isn't full. The caller has to hold the lock of
+        the instance, which gets released while waiting.
+
+        Parameters
+        ----------
+        block: bool
+            A flag to wait if the instance is full instead of raising.
+        timeout: int or float
+            The maximum number of seconds to wait. `None` means waiting
+            forever.
+
+        Raises
+        ------
+        OverflowError:
+            If the instance is still full after `timeout` seconds, or if it's
+            full and `block` is `False`.
+        """
+        if len(self._container) < self._max_capacity:
+            return
+        elif not block:
+            raise OverflowError(f"Can't put into a full `{self.__name__}`!!")
+        self._waiting_putters += 1
+        try:
+            if not self._has_room.wait_for(self.__has_room, timeout):
+                raise OverflowError(
+                    f"Timed out putting into a full `{self.__name__}`!!"
+                )
+        finally:
+            self._waiting_putters -= 1
+
+    def _wait_for_items(self, block, timeout):
+        """
+        Waits till the instance isn't empty. The caller has to hold the lock
+        of the instance, which gets released while waiting.
+
+        Parameters
+        ----------
+        block: bool
+            A flag to wait if the instance is empty instead of raising.
+        timeout: int or float
+            The maximum number of seconds to wait. `None` means waiting
+            forever.
+
+        Raises
+        ------
+        IndexError:
+            If the instance is still empty after `timeout` seconds, or if
+            it's empty and `block` is `False`.
+        """
+        if len(self._container) > 0:
+            return
+        elif not block:
+            raise IndexError(f"Can't get from an empty `{self.__name__}`!!")
+        self._waiting_getters += 1
+        try:
+            if not self._has_items.wait_for(self.__has_items, timeout):
+                raise IndexError(
+                    f"Timed out getting from an empty `{self.__name__}`!!"
+                )
+        finally:
+            self._waiting_getters -= 1
+
+    @staticmethod
+    def _validate_timeout(timeout):
+        """
+        Checks the validity of the given timeout.
+
+        Parameters
+        ----------
+        timeout: int or float
+            The number of seconds to be validated or `None`.
+
+        Raises
+        ------
+        TypeError:
+            If the given `timeout` is neither `None` nor a number.
+        ValueError:
+            If the given `timeout` is negative.
+        """
+        if timeout is None:
+            return
+        elif type(timeout) not in {int, float}:
+            raise TypeError("Timeout has to be a number!!")
+        elif timeout < 0:
+            raise ValueError("Timeout has to be >= 0!!")
+
+    # =============================     TASKS    ==============================
+    def _task_done(self):
+        """
+        Marks a task as done and wakes up the threads waiting in `join()`
+        when no unfinished task is left.
+
+        Raises
+        ------
+        ValueError:
+            If it's called more times than the number of added items.
+        """
+        with self._mutex:
+            if self._unfinished_tasks <= 0:
+                raise ValueError(
+                    f"`task_done()` called too many times on `{self.__name__}`"
+                    + "!!"
+                )
+            self._unfinished_tasks -= 1
+            if self._unfinished_tasks == 0:
+                self._all_tasks_done.notify_all()
+
+    def _join(self):
+        """
+        Blocks the calling thread till every added item has been marked as done
+        by calling `task_done()`.
+        """
+        with self._all_tasks_done:
+            while self._unfinished_tasks:
+                self._all_tasks_done.wait()
+
+    def _count_added(self, length):
+        """
+        Counts the items added since the instance had the given length as
+        unfinished tasks. The caller has to hold the lock of the instance and
+        mustn't release it while adding the items.
+
+        Parameters
+        ----------
+        length: int
+            The length of the container before the items were added.
+        """
+        self._unfinished_tasks += len(self._container) - length
+
+    def _drop_tasks(self, count):
+        """
+        Stops counting the given number of items, which were removed without
+        being taken, as unfinished tasks. The caller has to hold the lock of
+        the instance.
+
+        Parameters
+        ----------
+        count: int
+            The number of removed items.
+        """
+        self._unfinished_tasks -= count
+        if self._unfinished_tasks == 0:
+            self._all_tasks_done.notify_all()
+
+    def _add(self, item, push, drop_oldest):
+        """
+        Adds the given item like `Queue()._add()` does and counts it as an
+        unfinished task, while the item dropped by the overflow policy, if
+        any, isn't counted anymore.
+
+        Parameters
+        ----------
+        item: object
+            The python object to be added.
+        push: callable
+            The container method that adds the item to one of its ends.
+        drop_oldest: callable
+            The container method that removes the item at the other end.
+        """
+        def push_task(item):
+            push(item)
+            self._unfinished_tasks += 1
+
+        def drop_task():
+            drop_oldest()
+            self._drop_tasks(1)
+
+        super()._add(item, push_task, drop_task)
+
+    def _add_many(self, items, push_many, drop_oldest_many):
+        """
+        Adds the given items like `Queue()._add_many()` does and counts them
+        as unfinished tasks, while the items dropped by the overflow policy
+        aren't counted anymore.
+
+        Parameters
+        ----------
+        items: list
+            The valid python objects to be added.
+        push_many: callable
+            The method that adds the items to one of the container's ends.
+        drop_oldest_many: callable
+            The method that removes a number of items from the other end.
+        """
+        def push_tasks(items):
+            push_many(items)
+            self._unfinished_tasks += len(items)
+
+        def drop_tasks(count):
+            drop_oldest_many(count)
+            self._drop_tasks(count)
+
+        super()._add_many(items, push_tasks, drop_tasks)
+
+
+class BlockingStack(_Blocking, Stack):
+    """
+    A thread-safe `Stack()` where `put()` blocks while the stack is full and
+    `get()` blocks while it's empty, which makes it a last-in, first-out
+    (LIFO) queue that can be shared between producer and consumer threads.
+    """
+
+    __name__ = "extra.BlockingStack()"
+
+    def __init__(self, max_capacity=float("inf")):
+        """
+        Creates a `BlockingStack()` object!!
+
+        Parameters
+        ----------
+        max_capacity: int
+            It's a positive integer representing the maximum number of elements
+            a `BlockingStack()` should contain (Default: inf).
+
+        Raises
+        ------
+        TypeError:
+            If the type of `max_capacity` isn't `int` or `float`.
+        ValueError:
+            If the given value of `max_capacity` is less than zero.
+
+        Example
+        -------
+        >>> s = BlockingStack(10)
+        >>> type(s)
+        <class 'extra.lists.blocking.BlockingStack'>
+        >>> s._max_capacity
+        10
+        """
+        super().__init__(max_capacity)
+        self._init_blocking()
+
+    # =============================    PRINT     ==============================
+    def __repr__(self):
+        """
+        Represents the `BlockingStack()` instance as a string.
+
+        Returns
+        -------
+        str:
+            The string-representation of the `BlockingStack()` instance.
+
+        Example
+        -------
+        >>> s = BlockingStack()
+        >>> s.put(10)
+        >>> s.put(20)
+        >>> s
+        ┌────┬────┬─
+        │ 10 │ 20 │
+        └────┴────┴─
+        """
+        with self._mutex:
+            return super().__repr__()
+
+    # =============================     PUSH     ==============================
+    def push(self, item):
+        """
+        Pushs the given `item` to the `BlockingStack()` in constant time
+        without blocking.
+
+        Parameters
+        ----------
+        item: object
+            The python object to be pushed to the `BlockingStack()`.
+
+        Raises
+        ------
+        OverflowError:
+            If the `BlockingStack()` instance was full!!
+        ValueError:
+            If the given `item` is `None`.
+        TypeError:
+            If the given `item` is an `Extra` object.
+
+        Example
+        -------
+        >>> s = BlockingStack(max_capacity=1)
+        >>> s.push(1)
+        >>> s.push(2)
+        OverflowError: Stackoverflow! Can't push into a full \
+            `extra.BlockingStack()`!!
+        """
+        with self._mutex:
+            super().push(item)
+            self._unfinished_tasks += 1
+            self._notify_getters()
+
+    def push_many(self, items):
+        """
+        Pushes the given items to the `BlockingStack()`, one after the other,
+        in linear time without blocking.
+
+        Parameters
+        ----------
+        items: iterable
+            The python objects to be pushed to the `BlockingStack()`.
+
+        Raises
+        ------
+        OverflowError:
+            If the items don't fit in the `BlockingStack()` instance, in which
+            case none of them is pushed!!
+        ValueError:
+            If one of the given items is `None`.
+        TypeError:
+            If one of the given items is an `Extra` object.
+        """
+        with self._mutex:
+            length = len(self._container)
+            super().push_many(items)
+            self._count_added(length)
+            self._notify_getters(all=True)
+
+    def put(self, item, block=True, timeout=None):
+        """
+        Pushs the given `item` to the `BlockingStack()` in constant time,
+        waiting for another thread to remove an item if it's full.
+
+        Parameters
+        ----------
+        item: object
+            The python object to be pushed to the `BlockingStack()`.
+        block: bool
+            A flag to wait while the `BlockingStack()` is full instead of
+            raising an `OverflowError` right away (default: `True`).
+        timeout: int or float, optional
+            The maximum number of seconds to wait. `None` means waiting
+            forever (default: `None`).
+
+        Raises
+        ------
+        OverflowError:
+            If the `BlockingStack()` is still full after `timeout` seconds or
+            if it's full and `block` is `False`.
+        ValueError:
+            If the given `item` is `None` or `timeout` is negative.
+        TypeError:
+            If the given `item` is an `Extra` object or `timeout` isn't a
+            number.
+
+        Example
+        -------
+        >>> s = BlockingStack(max_capacity=1)
+        >>> s.put(1)
+        >>> s.put(2, timeout=0.1)
+        OverflowError: Timed out putting into a full `extra.BlockingStack()`!!
+        """
+        if timeout is not None:
+            self._validate_timeout(timeout)
+        with self._mutex:
+            self._wait_for_room(block, timeout)
+            super().push(item)
+            self._unfinished_tasks += 1
+            self._notify_getters()
+
+    # =============================     PEEK     ==============================
+    def peek(self):
+        """
+        Returns the top item of the `BlockingStack()` instance in constant
+        time.
+
+        Returns
+        -------
+        object:
+            The `BlockingStack()` instance's top item.
+
+        Raises
+        ------
+        IndexError:
+            If the `BlockingStack()` instance is empty!!
+
+        Example
+        -------
+        >>> s = BlockingStack()
+        >>> s.put(10)
+        >>> s.put(20)
+        >>> s.peek()
+        20
+        """
+        with self._mutex:
+            return super().peek()
+
+    # =============================    REMOVE    ==============================
+    def pop(self):
+        """
+        Pops the top item from the `BlockingStack()` in constant time without
+        blocking.
+
+        Returns
+        -------
+        object:
+            The `BlockingStack()` instance's top item.
+
+        Raises
+        ------
+        UserWarning:
+            If the `BlockingStack()` instance is empty!!
+
+        Example
+        -------
+        >>> s = BlockingStack()
+        >>> s.pop()
+        UserWarning: Popping from empty `extra.BlockingStack()`!!
+        >>> s.put(10)
+        >>> s.pop()
+        10
+        """
+        with self._mutex:
+            item = super().pop()
+            self._notify_putters()
+            return item
+
+    def pop_many(self, count):
+        """
+        Pops the given number of the top items from the `BlockingStack()`
+        without blocking.
+
+        Parameters
+        ----------
+        count: int
+            The number of items to be popped.
+
+        Returns
+        -------
+        list:
+            The popped items in the order they were popped.
+
+        Raises
+        ------
+        UserWarning:
+            If the `BlockingStack()` instance has fewer items than
+            `count`!!
+        TypeError:
+            If the given `count` isn't an integer.
+        ValueError:
+            If the given `count` is negative.
+        """
+        with self._mutex:
+            items = super().pop_many(count)
+            self._notify_putters(all=True)
+            return items
+
+    def get(self, block=True, timeout=None):
+        """
+        Pops the top item from the `BlockingStack()` in constant time, waiting
+        for another thread to add an item if it's empty.
+
+        Parameters
+        ----------
+        block: bool
+            A flag to wait while the `BlockingStack()` is empty instead of
+            raising an `IndexError` right away (default: `True`).
+        timeout: int or float, optional
+            The maximum number of seconds to wait. `None` means waiting
+            forever (default: `None`).
+
+        Returns
+        -------
+        object:
+            The `BlockingStack()` instance's top item.
+
+        Raises
+        ------
+        IndexError:
+            If the `BlockingStack()` is still empty after `timeout` seconds or
+            if it's empty and `block` is `False`.
+        TypeError:
+            If the given `timeout` isn't a number.
+        ValueError:
+            If the given `timeout` is negative.
+
+        Example
+        -------
+        >>> s = BlockingStack()
+        >>> s.put(10)
+        >>> s.put(20)
+        >>> s.get()
+        20
+        >>> s.get()
+        10
+        >>> s.get(block=False)
+        IndexError: Can't get from an empty `extra.BlockingStack()`!!
+        """
+        if timeout is not None:
+            self._validate_timeout(timeout)
+        with self._mutex:
+            self._wait_for_items(block, timeout)
+            item = self._container.pop()
+            self._notify_putters()
+            return item
+
+    def clear(self):
+        """
+        Removes all objects within the `BlockingStack()` instance in constant
+        time, waking up the threads waiting to put items.
+
+        Example
+        -------
+        >>> s = BlockingStack()
+        >>> s.put(1)
+        >>> s.put(2)
+        >>> s.clear()
+        >>> len(s)
+        0
+        """
+        # NOTE: `Stack().clear()` calls `__init__()` which would replace the
+        # lock other threads might be waiting on
+        with self._mutex:
+            # NOTE: the removed items won't be taken, so they aren't tasks
+            self._drop_tasks(len(self._container))
+            self._container.clear()
+            self._notify_putters(all=True)
+
+    # =============================     TASKS    ==============================
+    def task_done(self):
+        """
+        Marks an item taken by `get()` as processed, so that `join()` returns
+        once every added item was processed.
+
+        Raises
+        ------
+        ValueError:
+            If it's called more times than the number of added items.
+
+        Example
+        -------
+        >>> s = BlockingStack()
+        >>> s.put(10)
+        >>> s.get()
+        10
+        >>> s.task_done()
+        >>> s.task_done()
+        ValueError: `task_done()` called too many times on \
+            `extra.BlockingStack()`!!
+        """
+        self._task_done()
+
+    def join(self):
+        """
+        Blocks the calling thread till every item added to the
+        `BlockingStack()` instance is taken and marked as processed by
+        `task_done()`.
+
+        Example
+        -------
+        >>> s = BlockingStack()
+        >>> s.put(10)
+        >>> s.get()
+        10
+        >>> s.task_done()
+        >>> s.join()  # returns right away
+        """
+        self._join()
+
+
+class BlockingQueue(_Blocking, Queue):
+    """
+    A thread-safe `Queue()` where `put()` blocks while the queue is full and
+    `get()` blocks while it's empty, which makes it a first-in, first-out
+    (FIFO) queue that can be shared between producer and consumer threads.
+    """
+
+    __name__ = "extra.BlockingQueue()"
+
+    def __init__(
+        self,
+        max_capacity=float("inf"),
+        backend="array",
+        overflow="warn",
+        empty="warn",
+        sentinel=None,
+        timeout=None,
+    ):
+        """
+        Creates a `BlockingQueue()` object!!
+
+        Parameters
+        ----------
+        max_capacity: int
+            It's a positive integer representing the maximum number of elements
+            a `BlockingQueue()` should contain (Default: inf).
+        backend: str
+            The container used to store the elements, either `"linked"` or
+            `"array"` (Default: "array").
+        overflow: str
+            What `enqueue()` does when the `BlockingQueue()` is full, the same
+            as for `Queue()` (Default: "warn").
+        empty: str
+            What `dequeue()` does when the `BlockingQueue()` is empty, the same
+            as for `Queue()` (Default: "warn").
+        sentinel: object
+            The object returned by `dequeue()` when the `BlockingQueue()` is
+            empty (Default: None).
+        timeout: int or float, optional
+            The maximum number of seconds the `"block"` overflow policy of
+            `enqueue()` waits (Default: None).
+
+        Raises
+        ------
+        TypeError: It can be raised in two cases
+            1. If the type of `max_capacity` isn't `int` or `float`.
+            2. If the given `timeout` is neither `None` nor a number.
+        ValueError: It can be raised in four cases
+            1. If the given value of `max_capacity` is less than zero.
+            2. If the given `backend` is neither `"linked"` nor `"array"`.
+            3. If the given `overflow` or `empty` isn't a known policy.
+            4. If the given `timeout` is negative.
+
+        Example
+        -------
+        >>> q = BlockingQueue(10)
+        >>> type(q)
+        <class 'extra.lists.blocking.BlockingQueue'>
+        >>> q._max_capacity
+        10
+        """
+        super().__init__(
+            max_capacity, backend, overflow, empty, sentinel, timeout
+        )
+        self._init_blocking()
+        # NOTE: the "block" overflow policy waits in `_make_room()` below, so
+        # the base class mustn't lock by itself
+        self._not_full = None
+
+    # =============================    POLICY    ==============================
+    def _make_room(self, drop_oldest):
+        """
+        Applies the overflow policy of the full `BlockingQueue()` instance
+        before a new item gets added. The `"block"` policy waits for another
+        thread to remove an item like `put()` does.
+
+        Parameters
+        ----------
+        drop_oldest: callable
+            The container method that removes the item at the opposite end to
+            where the new item is going to be added.
+
+        Returns
+        -------
+        bool:
+            `True` if the new item should be added and `False` if it should be
+            discarded.
+        """
+        if self._overflow == "block":
+            # NOTE: a batch may fill the instance midway, so the items added
+            # so far are handed over before waiting
+            self._notify_getters(all=True)
+            self._wait_for_room(True, self._timeout)
+            return True
+        return super()._make_room(drop_oldest)
+
+    # =============================     PRINT    ==============================
+    def __repr__(self):
+        """
+        Represents the `BlockingQueue()` instance as a string.
+
+        Returns
+        -------
+        str:
+            The string-representation of the `BlockingQueue()` instance.
+
+        Example
+        -------
+        >>> q = BlockingQueue()
+        >>> q.put(10)
+        >>> q.put(20)
+        >>> q
+        ─┬────┬────┬─
+        ⟶│ 20 │ 10 │⟶
+        ─┴────┴────┴─
+        """
+        with self._mutex:
+            return super().__repr__()
+
+    # =============================    ENQUEUE   ==============================
+    def enqueue(self, item):
+        """
+        Inserts the given `item` to end of the `BlockingQueue()` in constant
+        time, applying the overflow policy if it's full.
+
+        Parameters
+        ----------
+        item: object
+            The python object to be pushed to the `BlockingQueue()`.
+
+        Raises
+        ------
+        UserWarning:
+            If the `BlockingQueue()` instance was full and its overflow policy
+            is `"warn"`!!
+        OverflowError:
+            If the `BlockingQueue()` instance was full and its overflow policy
+            is either `"raise"` or `"block"` which timed out.
+        ValueError:
+            If the given `item` is `None`.
+        TypeError:
+            If the given `item` is an instance of `Extra`.
+
+        Example
+        -------
+        >>> q = BlockingQueue(max_capacity=2)
+        >>> q.enqueue(1)
+        >>> q.enqueue(2)
+        >>> q.enqueue(3)
+        UserWarning: Enqueuing to a full `extra.BlockingQueue()` could lead \
+            to missing values!!
+        >>> q
+        ─┬───┬───┬─
+        ⟶│ 3 │ 2 │⟶
+        ─┴───┴───┴─
+        """
+        with self._mutex:
+            super().enqueue(item)
+            self._notify_getters()
+
+    def enqueue_many(self, items):
+        """
+        Inserts the given items to the end of the `BlockingQueue()`, one after
+        the other, in linear time, applying the overflow policy once if they
+        don't fit.
+
+        Parameters
+        ----------
+        items: iterable
+            The python objects to be pushed to the `BlockingQueue()`.
+
+        Raises
+        ------
+        UserWarning:
+            If the items don't fit in the `BlockingQueue()` instance and its
+            overflow policy is `"warn"`!! It's raised only once.
+        OverflowError:
+            If the items don't fit in the `BlockingQueue()` instance and its
+            overflow policy is either `"raise"`, in which case none of them is
+            inserted, or `"block"` which timed out.
+        ValueError:
+            If one of the given items is `None`.
+        TypeError:
+            If one of the given items is an instance of `Extra`.
+        """
+        with self._mutex:
+            super().enqueue_many(items)
+            self._notify_getters(all=True)
+
+    def put(self, item, block=True, timeout=None):
+        """
+        Inserts the given `item` to end of the `BlockingQueue()` in constant
+        time, waiting for another thread to remove an item if it's full.
+
+        Parameters
+        ----------
+        item: object
+            The python object to be pushed to the `BlockingQueue()`.
+        block: bool
+            A flag to wait while the `BlockingQueue()` is full instead of
+            raising an `OverflowError` right away (default: `True`).
+        timeout: int or float, optional
+            The maximum number of seconds to wait. `None` means waiting
+            forever (default: `None`).
+
+        Raises
+        ------
+        OverflowError:
+            If the `BlockingQueue()` is still full after `timeout` seconds or
+            if it's full and `block` is `False`.
+        ValueError:
+            If the given `item` is `None` or `timeout` is negative.
+        TypeError:
+            If the given `item` is an `Extra` object or `timeout` isn't a
+            number.
+
+        Example
+        -------
+        >>> q = BlockingQueue(max_capacity=1)
+        >>> q.put(1)
+        >>> q.put(2, block=False)
+        OverflowError: Can't put into a full `extra.BlockingQueue()`!!
+        """
+        super()._validate_item(item)
+        if timeout is not None:
+            self._validate_timeout(timeout)
+        with self._mutex:
+            self._wait_for_room(block, timeout)
+            # NOTE: there is room, so the item is added without the policies
+            self._push_left(item)
+            self._unfinished_tasks += 1
+            self._notify_getters()
+
+    # =============================      TOP     ==============================
+    def top(self):
+        """
+        Returns the first item inserted to the `BlockingQueue()` instance in
+        constant time.
+
+        Returns
+        -------
+        object:
+            The `BlockingQueue()` instance's first inserted item.
+
+        Raises
+        ------
+        IndexError:
+            If the `BlockingQueue()` instance is empty!!
+
+        Example
+        -------
+        >>> q = BlockingQueue()
+        >>> q.put(10)
+        >>> q.put(20)
+        >>> q.top()
+        10
+        """
+        with self._mutex:
+            return super().top()
+
+    # =============================    DEQUEUE   ==============================
+    def dequeue(self):
+        """
+        Pops the first inserted item from the `BlockingQueue()` in constant
+        time, applying the empty policy if it's empty.
+
+        Returns
+        -------
+        object:
+            The `BlockingQueue()` instance's first item or its sentinel if
+            it's empty and its empty policy isn't `"raise"`.
+
+        Raises
+        ------
+        UserWarning:
+            If the `BlockingQueue()` instance is empty and its empty policy is
+            `"warn"`!!
+        IndexError:
+            If the `BlockingQueue()` instance is empty and its empty policy is
+            `"raise"`!!
+
+        Example
+        -------
+        >>> q = BlockingQueue()
+        >>> q.dequeue()
+        UserWarning: Dequeuing from an empty `extra.BlockingQueue()`!!
+        >>> q.put(10)
+        >>> q.dequeue()
+        10
+        """
+        with self._mutex:
+            item = super().dequeue()
+            self._notify_putters()
+            return item
+
+    def dequeue_many(self, count):
+        """
+        Pops the given number of the first inserted items from the
+        `BlockingQueue()` without blocking.
+
+        Parameters
+        ----------
+        count: int
+            The number of items to be popped.
+
+        Returns
+        -------
+        list:
+            The popped items in the order they were popped.
+
+        Raises
+        ------
+        UserWarning:
+            If the `BlockingQueue()` instance has fewer items than `count`
+            and its empty policy is `"warn"`!!
+        IndexError:
+            If the `BlockingQueue()` instance has fewer items than `count`
+            and its empty policy is `"raise"`, in which case nothing is
+            popped!!
+        TypeError:
+            If the given `count` isn't an integer.
+        ValueError:
+            If the given `count` is negative.
+        """
+        with self._mutex:
+            items = super().dequeue_many(count)
+            self._notify_putters(all=True)
+            return items
+
+    def get(self, block=True, timeout=None):
+        """
+        Pops the first inserted item from the `BlockingQueue()` in constant
+        time, waiting for another thread to add an item if it's empty.
+
+        Parameters
+        ----------
+        block: bool
+            A flag to wait while the `BlockingQueue()` is empty instead of
+            raising an `IndexError` right away (default: `True`).
+        timeout: int or float, optional
+            The maximum number of seconds to wait. `None` means waiting
+            forever (default: `None`).
+
+        Returns
+        -------
+        object:
+            The `BlockingQueue()` instance's first item.
+
+        Raises
+        ------
+        IndexError:
+            If the `BlockingQueue()` is still empty after `timeout` seconds or
+            if it's empty and `block` is `False`.
+        TypeError:
+            If the given `timeout` isn't a number.
+        ValueError:
+            If the given `timeout` is negative.
+
+        Example
+        -------
+        >>> q = BlockingQueue()
+        >>> q.put(10)
+        >>> q.put(20)
+        >>> q.get()
+        10
+        >>> q.get()
+        20
+        >>> q.get(timeout=0.1)
+        IndexError: Timed out getting from an empty `extra.BlockingQueue()`!!
+        """
+        if timeout is not None:
+            self._validate_timeout(timeout)
+        with self._mutex:
+            self._wait_for_items(block, timeout)
+            item = self._pop_right()
+            self._notify_putters()
+            return item
+
+    def clear(self):
+        """
+        Removes all objects within the `BlockingQueue()` instance, waking up
+        the threads waiting to put items.
+
+        Example
+        -------
+        >>> q = BlockingQueue()
+        >>> q.put(1)
+        >>> q.put(2)
+        >>> q.clear()
+        >>> len(q)
+        0
+        """
+        with self._mutex:
+            # NOTE: the removed items won't be taken, so they aren't tasks
+            self._drop_tasks(len(self._container))
+            super().clear()
+            self._notify_putters(all=True)
+
+    # =============================     TASKS    ==============================
+    def task_done(self):
+        """
+        Marks an item taken by `get()` as processed, so that `join()` returns
+        once every added item was processed.
+
+        Raises
+        ------
+        ValueError:
+            If it's called more times than the number of added items.
+
+        Example
+        -------
+        >>> q = BlockingQueue()
+        >>> q.put(10)
+        >>> q.get()
+        10
+        >>> q.task_done()
+        >>> q.task_done()
+        ValueError: `task_done()` called too many times on \
+            `extra.BlockingQueue()`!!
+        """
+        self._task_done()
+
+    def join(self):
+        """
+        Blocks the calling thread till every item added to the
+        `BlockingQueue()` instance is taken and marked as processed by
+        `task_done()`.
+
+        Example
+        -------
+        >>> q = BlockingQueue()
+        >>> q.put(10)
+        >>> q.get()
+        10
+        >>> q.task_done()
+        >>> q.join()  # returns right away
+        """
+        self._join()
+
+
+class BlockingDeque(_Blocking, Deque):
+    """
+    A thread-safe `Deque()` where `put()` blocks while the deque is full and
+    `get()` blocks while it's empty. `put()` appends to the right end and
+    `get()` pops from the left end, so they behave like a first-in, first-out
+    (FIFO) queue, while the other methods can reach both ends.
+    """
+
+    __name__ = "extra.BlockingDeque()"
+
+    def __init__(
+        self,
+        max_capacity=float("inf"),
+        backend="array",
+        overflow="warn",
+        empty="warn",
+        sentinel=None,
+        timeout=None,
+    ):
+        """
+        Creates a `BlockingDeque()` object!!
+
+        Parameters
+        ----------
+        max_capacity: int
+            It's a positive integer representing the maximum number of elements
+            a `BlockingDeque()` should contain (Default: inf).
+        backend: str
+            The container used to store the elements, either `"linked"` or
+            `"array"` (Default: "array").
+        overflow: str
+            What the `append_*()` methods do when the `BlockingDeque()` is
+            full, the same as for `Deque()` (Default: "warn").
+        empty: str
+            What the `pop_*()` methods do when the `BlockingDeque()` is empty,
+            the same as for `Deque()` (Default: "warn").
+        sentinel: object
+            The object returned by the `pop_*()` methods when the
+            `BlockingDeque()` is empty (Default: None).
+        timeout: int or float, optional
+            The maximum number of seconds the `"block"` overflow policy of the
+            `append_*()` methods waits (Default: None).
+
+        Raises
+        ------
+        TypeError: It can be raised in two cases
+            1. If the type of `max_capacity` isn't `int` or `float`.
+            2. If the given `timeout` is neither `None` nor a number.
+        ValueError: It can be raised in four cases
+            1. If the given value of `max_capacity` is less than zero.
+            2. If the given `backend` is neither `"linked"` nor `"array"`.
+            3. If the given `overflow` or `empty` isn't a known policy.
+            4. If the given `timeout` is negative.
+
+        Example
+        -------
+        >>> dq = BlockingDeque(10)
+        >>> type(dq)
+        <class 'extra.lists.blocking.BlockingDeque'>
+        >>> dq._max_capacity
+        10
+        """
+        super().__init__(
+            max_capacity, backend, overflow, empty, sentinel, timeout
+        )
+        self._init_blocking()
+        # NOTE: the "block" overflow policy waits in `_make_room()` below, so
+        # the base class mustn't lock by itself
+        self._not_full = None
+
+    # =============================    POLICY    ==============================
+    def _make_room(self, drop_oldest):
+        """
+        Applies the overflow policy of the full `BlockingDeque()` instance
+        before a new item gets added. The `"block"` policy waits for another
+        thread to remove an item like `put()` does.
+
+        Parameters
+        ----------
+        drop_oldest: callable
+            The container method that removes the item at the opposite end to
+            where the new item is going to be added.
+
+        Returns
+        -------
+        bool:
+            `True` if the new item should be added and `False` if it should be
+            discarded.
+        """
+        if self._overflow == "block":
+            # NOTE: a batch may fill the instance midway, so the items added
+            # so far are handed over before waiting
+            self._notify_getters(all=True)
+            self._wait_for_room(True, self._timeout)
+            return True
+        return super()._make_room(drop_oldest)
+
+    # =============================     PRINT    ==============================
+    def __repr__(self):
+        """
+        Represents the `BlockingDeque()` instance as a string.
+
+        Returns
+        -------
+        str:
+            The string-representation of the `BlockingDeque()` instance.
+
+        Example
+        -------
+        >>> dq = BlockingDeque()
+        >>> dq.put(10)
+        >>> dq.put(20)
+        >>> dq
+        ─┬────┬────┬─
+        ⟷│ 10 │ 20 │⟷
+        ─┴────┴────┴─
+        """
+        with self._mutex:
+            return super().__repr__()
+
+    # =============================    APPEND    ==============================
+    def enqueue(self, item):
+        """
+        Inserts the given `item` to the left-side of the `BlockingDeque()` in
+        constant time, applying the overflow policy if it's full.
+
+        Parameters
+        ----------
+        item: object
+            The python object to be pushed to the `BlockingDeque()`.
+
+        Raises
+        ------
+        UserWarning:
+            If the `BlockingDeque()` instance was full and its overflow policy
+            is `"warn"`!!
+        OverflowError:
+            If the `BlockingDeque()` instance was full and its overflow policy
+            is either `"raise"` or `"block"` which timed out.
+        ValueError:
+            If the given `item` is `None`.
+        TypeError:
+            If the given `item` is an instance of `Extra`.
+
+        Note
+        ----
+        This method does the same job as `BlockingDeque().append_left`.
+        """
+        with self._mutex:
+            super().enqueue(item)
+            self._notify_getters()
+
+    def enqueue_many(self, items):
+        """
+        Inserts the given items to the left-side of the `BlockingDeque()`, one
+        after the other, in linear time, applying the overflow policy once if
+        they don't fit.
+
+        Parameters
+        ----------
+        items: iterable
+            The python objects to be pushed to the `BlockingDeque()`.
+
+        Raises
+        ------
+        UserWarning:
+            If the items don't fit in the `BlockingDeque()` instance and its
+            overflow policy is `"warn"`!! It's raised only once.
+        OverflowError:
+            If the items don't fit in the `BlockingDeque()` instance and its
+            overflow policy is either `"raise"`, in which case none of them is
+            inserted, or `"block"` which timed out.
+        ValueError:
+            If one of the given items is `None`.
+        TypeError:
+            If one of the given items is an instance of `Extra`.
+        """
+        with self._mutex:
+            super().enqueue_many(items)
+            self._notify_getters(all=True)
+
+    def append_left(self, item):
+        """
+        Inserts the given `item` to the left-side of the `BlockingDeque()` in
+        constant time, applying the overflow policy if it's full.
+
+        Parameters
+        ----------
+        item: object
+            The python object to be pushed to the `BlockingDeque()`.
+
+        Raises
+        ------
+        UserWarning:
+            If the `BlockingDeque()` instance was full and its overflow policy
+            is `"warn"`!!
+        OverflowError:
+            If the `BlockingDeque()` instance was full and its overflow policy
+            is either `"raise"` or `"block"` which timed out.
+        ValueError:
+            If the given `item` is `None`.
+        TypeError:
+            If the given `item` is an instance of `Extra`.
+
+        Example
+        -------
+        >>> dq = BlockingDeque()
+        >>> dq.append_left(1)
+        >>> dq.append_left(2)
+        >>> dq
+        ─┬───┬───┬─
+        ⟷│ 2 │ 1 │⟷
+        ─┴───┴───┴─
+        """
+        with self._mutex:
+            super().append_left(item)
+            self._notify_getters()
+
+    def append_left_many(self, items):
+        """
+        Inserts the given items to the left-side of the `BlockingDeque()`, one
+        after the other, in linear time, applying the overflow policy once if
+        they don't fit.
+
+        Parameters
+        ----------
+        items: iterable
+            The python objects to be pushed to the `BlockingDeque()`.
+
+        Raises
+        ------
+        UserWarning:
+            If the items don't fit in the `BlockingDeque()` instance and its
+            overflow policy is `"warn"`!! It's raised only once.
+        OverflowError:
+            If the items don't fit in the `BlockingDeque()` instance and its
+            overflow policy is either `"raise"`, in which case none of them is
+            inserted, or `"block"` which timed out.
+        ValueError:
+            If one of the given items is `None`.
+        TypeError:
+            If one of the given items is an instance of `Extra`.
+        """
+        with self._mutex:
+            super().append_left_many(items)
+            self._notify_getters(all=True)
+
+    def append_right(self, item):
+        """
+        Inserts the given `item` to the right-side of the `BlockingDeque()` in
+        constant time, applying the overflow policy if it's full.
+
+        Parameters
+        ----------
+        item: object
+            The python object to be pushed to the `BlockingDeque()`.
+
+        Raises
+        ------
+        UserWarning:
+            If the `BlockingDeque()` instance was full and its overflow policy
+            is `"warn"`!!
+        OverflowError:
+            If the `BlockingDeque()` instance was full and its overflow policy
+            is either `"raise"` or `"block"` which timed out.
+        ValueError:
+            If the given `item` is `None`.
+        TypeError:
+            If the given `item` is an instance of `Extra`.
+
+        Example
+        -------
+        >>> dq = BlockingDeque()
+        >>> dq.append_right(1)
+        >>> dq.append_right(2)
+        >>> dq
+        ─┬───┬───┬─
+        ⟷│ 1 │ 2 │⟷
+        ─┴───┴───┴─
+        """
+        with self._mutex:
+            super().append_right(item)
+            self._notify_getters()
+
+    def append_right_many(self, items):
+        """
+        Inserts the given items to the right-side of the `BlockingDeque()`, one
+        after the other, in linear time, applying the overflow policy once if
+        they don't fit.
+
+        Parameters
+        ----------
+        items: iterable
+            The python objects to be pushed to the `BlockingDeque()`.
+
+        Raises
+        ------
+        UserWarning:
+            If the items don't fit in the `BlockingDeque()` instance and its
+            overflow policy is `"warn"`!! It's raised only once.
+        OverflowError:
+            If the items don't fit in the `BlockingDeque()` instance and its
+            overflow policy is either `"raise"`, in which case none of them is
+            inserted, or `"block"` which timed out.
+        ValueError:
+            If one of the given items is `None`.
+        TypeError:
+            If one of the given items is an instance of `Extra`.
+        """
+        with self._mutex:
+            super().append_right_many(items)
+            self._notify_getters(all=True)
+
+    def put(self, item, block=True, timeout=None):
+        """
+        Inserts the given `item` to the right-side of the `BlockingDeque()` in
+        constant time, waiting for another thread to remove an item if it's
+        full.
+
+        Parameters
+        ----------
+        item: object
+            The python object to be pushed to the `BlockingDeque()`.
+        block: bool
+            A flag to wait while the `BlockingDeque()` is full instead of
+            raising an `OverflowError` right away (default: `True`).
+        timeout: int or float, optional
+            The maximum number of seconds to wait. `None` means waiting
+            forever (default: `None`).
+
+        Raises
+        ------
+        OverflowError:
+            If the `BlockingDeque()` is still full after `timeout` seconds or
+            if it's full and `block` is `False`.
+        ValueError:
+            If the given `item` is `None` or `timeout` is negative.
+        TypeError:
+            If the given `item` is an `Extra` object or `timeout` isn't a
+            number.
+
+        Example
+        -------
+        >>> dq = BlockingDeque(max_capacity=1)
+        >>> dq.put(1)
+        >>> dq.put(2, block=False)
+        OverflowError: Can't put into a full `extra.BlockingDeque()`!!
+        """
+        super()._validate_item(item)
+        if timeout is not None:
+            self._validate_timeout(timeout)
+        with self._mutex:
+            self._wait_for_room(block, timeout)
+            # NOTE: there is room, so the item is added without the policies
+            self._push_right(item)
+            self._unfinished_tasks += 1
+            self._notify_getters()
+
+    # =============================      GET     ==============================
+    def top(self):
+        """
+        Returns the right-most item of the `BlockingDeque()` instance in
+        constant time.
+
+        Returns
+        -------
+        object:
+            The `BlockingDeque()` instance's right-most item.
+
+        Raises
+        ------
+        IndexError:
+            If the `BlockingDeque()` instance is empty!!
+        """
+        with self._mutex:
+            return super().top()
+
+    def get_left(self):
+        """
+        Returns the left-most item of the `BlockingDeque()` instance in
+        constant time without removing it.
+
+        Returns
+        -------
+        object:
+            The `BlockingDeque()` instance's left-most item.
+
+        Raises
+        ------
+        IndexError:
+            If the `BlockingDeque()` instance is empty!!
+
+        Example
+        -------
+        >>> dq = BlockingDeque()
+        >>> dq.put(10)
+        >>> dq.put(20)
+        >>> dq.get_left()
+        10
+        """
+        with self._mutex:
+            return super().get_left()
+
+    def get_right(self):
+        """
+        Returns the right-most item of the `BlockingDeque()` instance in
+        constant time without removing it.
+
+        Returns
+        -------
+        object:
+            The `BlockingDeque()` instance's right-most item.
+
+        Raises
+        ------
+        IndexError:
+            If the `BlockingDeque()` instance is empty!!
+
+        Example
+        -------
+        >>> dq = BlockingDeque()
+        >>> dq.put(10)
+        >>> dq.put(20)
+        >>> dq.get_right()
+        20
+        """
+        with self._mutex:
+            return super().get_right()
+
+    # =============================      POP     ==============================
+    def dequeue(self):
+        """
+        Pops the right-most item from the `BlockingDeque()` in constant time,
+        applying the empty policy if it's empty.
+
+        Returns
+        -------
+        object:
+            The `BlockingDeque()` instance's right-most item or its sentinel
+            if it's empty and its empty policy isn't `"raise"`.
+
+        Raises
+        ------
+        UserWarning:
+            If the `BlockingDeque()` instance is empty and its empty policy is
+            `"warn"`!!
+        IndexError:
+            If the `BlockingDeque()` instance is empty and its empty policy is
+            `"raise"`!!
+
+        Note
+        ----
+        This method does the same job as `BlockingDeque().pop_right`.
+        """
+        with self._mutex:
+            item = super().dequeue()
+            self._notify_putters()
+            return item
+
+    def dequeue_many(self, count):
+        """
+        Pops the given number of the right-most items from the
+        `BlockingDeque()` without blocking.
+
+        Parameters
+        ----------
+        count: int
+            The number of items to be popped.
+
+        Returns
+        -------
+        list:
+            The popped items in the order they were popped.
+
+        Raises
+        ------
+        UserWarning:
+            If the `BlockingDeque()` instance has fewer items than `count`
+            and its empty policy is `"warn"`!!
+        IndexError:
+            If the `BlockingDeque()` instance has fewer items than `count`
+            and its empty policy is `"raise"`, in which case nothing is
+            popped!!
+        TypeError:
+            If the given `count` isn't an integer.
+        ValueError:
+            If the given `count` is negative.
+        """
+        with self._mutex:
+            items = super().dequeue_many(count)
+            self._notify_putters(all=True)
+            return items
+
+    def pop_left(self):
+        """
+        Pops the left-most item from the `BlockingDeque()` in constant time,
+        applying the empty policy if it's empty.
+
+        Returns
+        -------
+        object:
+            The `BlockingDeque()` instance's left-most item or its sentinel if
+            it's empty and its empty policy isn't `"raise"`.
+
+        Raises
+        ------
+        UserWarning:
+            If the `BlockingDeque()` instance is empty and its empty policy is
+            `"warn"`!!
+        IndexError:
+            If the `BlockingDeque()` instance is empty and its empty policy is
+            `"raise"`!!
+
+        Example
+        -------
+        >>> dq = BlockingDeque()
+        >>> dq.put(10)
+        >>> dq.put(20)
+        >>> dq.pop_left()
+        10
+        """
+        with self._mutex:
+            item = super().pop_left()
+            self._notify_putters()
+            return item
+
+    def pop_left_many(self, count):
+        """
+        Pops the given number of the left-most items from the `BlockingDeque()`
+        without blocking.
+
+        Parameters
+        ----------
+        count: int
+            The number of items to be popped.
+
+        Returns
+        -------
+        list:
+            The popped items in the order they were popped.
+
+        Raises
+        ------
+        UserWarning:
+            If the `BlockingDeque()` instance has fewer items than `count`
+            and its empty policy is `"warn"`!!
+        IndexError:
+            If the `BlockingDeque()` instance has fewer items than `count`
+            and its empty policy is `"raise"`, in which case nothing is
+            popped!!
+        TypeError:
+            If the given `count` isn't an integer.
+        ValueError:
+            If the given `count` is negative.
+        """
+        with self._mutex:
+            items = super().pop_left_many(count)
+            self._notify_putters(all=True)
+            return items
+
+    def pop_right(self):
+        """
+        Pops the right-most item from the `BlockingDeque()` in constant time,
+        applying the empty policy if it's empty.
+
+        Returns
+        -------
+        object:
+            The `BlockingDeque()` instance's right-most item or its sentinel
+            if it's empty and its empty policy isn't `"raise"`.
+
+        Raises
+        ------
+        UserWarning:
+            If the `BlockingDeque()` instance is empty and its empty policy is
+            `"warn"`!!
+        IndexError:
+            If the `BlockingDeque()` instance is empty and its empty policy is
+            `"raise"`!!
+
+        Example
+        -------
+        >>> dq = BlockingDeque()
+        >>> dq.put(10)
+        >>> dq.put(20)
+        >>> dq.pop_right()
+        20
+        """
+        with self._mutex:
+            item = super().pop_right()
+            self._notify_putters()
+            return item
+
+    def pop_right_many(self, count):
+        """
+        Pops the given number of the right-most items from the
+        `BlockingDeque()` without blocking.
+
+        Parameters
+        ----------
+        count: int
+            The number of items to be popped.
+
+        Returns
+        -------
+        list:
+            The popped items in the order they were popped.
+
+        Raises
+        ------
+        UserWarning:
+            If the `BlockingDeque()` instance has fewer items than `count`
+            and its empty policy is `"warn"`!!
+        IndexError:
+            If the `BlockingDeque()` instance has fewer items than `count`
+            and its empty policy is `"raise"`, in which case nothing is
+            popped!!
+        TypeError:
+            If the given `count` isn't an integer.
+        ValueError:
+            If the given `count` is negative.
+        """
+        with self._mutex:
+            items = super().pop_right_many(count)
+            self._notify_putters(all=True)
+            return items
+
+    def get(self, block=True, timeout=None):
+        """
+        Pops the left-most item from the `BlockingDeque()` in constant time,
+        waiting for another thread to add an item if it's empty.
+
+        Parameters
+        ----------
+        block: bool
+            A flag to wait while the `BlockingDeque()` is empty instead of
+            raising an `IndexError` right away (default: `True`).
+        timeout: int or float, optional
+            The maximum number of seconds to wait. `None` means waiting
+            forever (default: `None`).
+
+        Returns
+        -------
+        object:
+            The `BlockingDeque()` instance's left-most item.
+
+        Raises
+        ------
+        IndexError:
+            If the `BlockingDeque()` is still empty after `timeout` seconds or
+            if it's empty and `block` is `False`.
+        TypeError:
+            If the given `timeout` isn't a number.
+        ValueError:
+            If the given `timeout` is negative.
+
+        Example
+        -------
+        >>> dq = BlockingDeque()
+        >>> dq.put(10)
+        >>> dq.put(20)
+        >>> dq.get()
+        10
+        >>> dq.get()
+        20
+        >>> dq.get(block=False)
+        IndexError: Can't get from an empty `extra.BlockingDeque()`!!
+        """
+        if timeout is not None:
+            self._validate_timeout(timeout)
+        with self._mutex:
+            self._wait_for_items(block, timeout)
+            item = self._pop_left()
+            self._notify_putters()
+            return item
+
+    def clear(self):
+        """
+        Removes all objects within the `BlockingDeque()` instance, waking up
+        the threads waiting to put items.
+
+        Example
+        -------
+        >>> dq = BlockingDeque()
+        >>> dq.put(1)
+        >>> dq.put(2)
+        >>> dq.clear()
+        >>> len(dq)
+        0
+        """
+        with self._mutex:
+            # NOTE: the removed items won't be taken, so they aren't tasks
+            self._drop_tasks(len(self._container))
+            super().clear()
+            self._notify_putters(all=True)
+
+    # =============================     TASKS    ==============================
+    def task_done(self):
+        """
+        Marks an item taken by `get()` as processed, so that `join()` returns
+        once every added item was processed.
+
+        Raises
+        ------
+        ValueError:
+            If it's called more times than the number of added items.
+
+        Example
+        -------
+        >>> dq = BlockingDeque()
+        >>> dq.put(10)
+        >>> dq.get()
+        10
+        >>> dq.task_done()
+        >>> dq.task_done()
+        ValueError: `task_done()` called too many times on \
+            `extra.BlockingDeque()`!!
+        """
+        self._task_done()
+
+    def join(self):
+        """
+        Blocks the calling thread till every item added to the
+        `BlockingDeque()` instance is taken and marked as processed by
+        `task_done()`.
+
+        Example
+        -------
+        >>> dq = BlockingDeque()
+        >>> dq.put(10)
+        >>> dq.get()
+        10
+        >>> dq.task_done()
+        >>> dq.join()  # returns right away
+        """
+        self._join()
+
+
+class BlockingPriorityQueue(_Blocking, PriorityQueue):
+    """
+    A thread-safe `PriorityQueue()` where `put()` blocks while the queue is
+    full and `get()` blocks while it's empty. `get()` pops the item with the
+    highest priority, or the lowest one if asked to.
+    """
+
+    __name__ = "extra.BlockingPriorityQueue()"
+
+    def __init__(self, max_capacity=float("inf"), seed=None):
+        """
+        Creates a `BlockingPriorityQueue()` object!!
+
+        Parameters
+        ----------
+        max_capacity: int
+            It's a positive integer representing the maximum number of elements
+            a `BlockingPriorityQueue()` should contain. (default: inf)
+        seed: int, optional
+            The seed of the random priorities given to the items enqueued
+            without a priority.
+
+        Raises
+        ------
+        TypeError:
+            If the type of `max_capacity` isn't `int` or `float`.
+        ValueError:
+            If the given value of `max_capacity` is less than zero.
+
+        Example
+        -------
+        >>> pq = BlockingPriorityQueue(10)
+        >>> type(pq)
+        <class 'extra.lists.blocking.BlockingPriorityQueue'>
+        >>> pq._max_capacity
+        10
+        """
+        super().__init__(max_capacity, seed)
+        self._init_blocking()
+
+    # =============================     PRINT    ==============================
+    def __repr__(self):
+        """
+        Represents the `BlockingPriorityQueue()` instance as a string.
+
+        Returns
+        -------
+        str:
+            The string-representation of the `BlockingPriorityQueue()`
+            instance.
+
+        Example
+        -------
+        >>> pq = BlockingPriorityQueue()
+        >>> pq.put(10, priority=1)
+        >>> pq.put(20, priority=5)
+        >>> pq
+        ─┬────┬────┬─
+        ⟶│ 20 │ 10 │⟶
+        ─┴────┴────┴─
+        """
+        with self._mutex:
+            return super().__repr__()
+
+    # =============================    ENQUEUE   ==============================
+    def enqueue(self, item, priority=None):
+        """
+        Inserts the given `item` to the end of the `BlockingPriorityQueue()`
+        in time-complexity of O(log(n)) without blocking, where **n** is the
+        number of elements in the instance.
+
+        Parameters
+        ----------
+        item: object
+            The python object to be pushed to the `BlockingPriorityQueue()`.
+        priority: int or float
+            The priority of the item. If `priority=None`, then a random
+            integer number will be assigned.
+
+        Raises
+        ------
+        UserWarning:
+            If the `BlockingPriorityQueue()` instance was full!!
+        ValueError:
+            If the given `item` is `None`.
+        TypeError:
+            It can be raised due to one of the following reasons:
+                1. If the given `item` is an instance of `Extra`.
+                2. If the given `priority` isn't a number.
+        """
+        with self._mutex:
+            length = len(self._container)
+            super().enqueue(item, priority)
+            self._count_added(length)
+            self._notify_getters()
+
+    def enqueue_many(self, items, priorities=None):
+        """
+        Inserts the given items to the end of the `BlockingPriorityQueue()`,
+        one after the other, in linear time without blocking.
+
+        Parameters
+        ----------
+        items: iterable
+            The python objects to be pushed to the `BlockingPriorityQueue()`.
+        priorities: iterable, optional
+            The priorities of the given items in the same order. If
+            `priorities=None`, then random integer numbers will be assigned.
+
+        Raises
+        ------
+        UserWarning:
+            If the items don't fit in the `BlockingPriorityQueue()`
+            instance!! It's raised only once.
+        ValueError:
+            If one of the given items is `None`, or if the number of the
+            given priorities isn't the same as the number of items.
+        TypeError:
+            If one of the given items is an instance of `Extra` or one of
+            the given priorities isn't a number.
+        """
+        with self._mutex:
+            length = len(self._container)
+            super().enqueue_many(items, priorities)
+            self._count_added(length)
+            self._notify_getters(all=True)
+
+    def put(self, item, priority=None, block=True, timeout=None):
+        """
+        Inserts the given `item` to the end of the `BlockingPriorityQueue()`
+        in time-complexity of O(log(n)), where **n** is the number of elements
+        in the instance, waiting for another thread to remove an item if it's
+        full.
+
+        Parameters
+        ----------
+        item: object
+            The python object to be pushed to the `BlockingPriorityQueue()`.
+        priority: int or float
+            The priority of the item. If `priority=None`, then a random
+            integer number will be assigned.
+        block: bool
+            A flag to wait while the `BlockingPriorityQueue()` is full instead
+            of raising an `OverflowError` right away (default: `True`).
+        timeout: int or float, optional
+            The maximum number of seconds to wait. `None` means waiting
+            forever (default: `None`).
+
+        Raises
+        ------
+        OverflowError:
+            If the `BlockingPriorityQueue()` is still full after `timeout`
+            seconds or if it's full and `block` is `False`.
+        ValueError:
+            If the given `item` is `None` or `timeout` is negative.
+        TypeError:
+            If the given `item` is an `Extra` object or `priority` or
+            `timeout` isn't a number.
+
+        Example
+        -------
+        >>> pq = BlockingPriorityQueue(max_capacity=1)
+        >>> pq.put(1, priority=3)
+        >>> pq.put(2, priority=5, timeout=0.1)
+        OverflowError: Timed out putting into a full \
+            `extra.BlockingPriorityQueue()`!!
+        """
+        if timeout is not None:
+            self._validate_timeout(timeout)
+        with self._mutex:
+            self._wait_for_room(block, timeout)
+            super().enqueue(item, priority)
+            self._unfinished_tasks += 1
+            self._notify_getters()
+
+    # =============================      TOP     ==============================
+    def top(self):
+        """
+        Returns the first item inserted to the `BlockingPriorityQueue()`
+        instance in constant time.
+
+        Returns
+        -------
+        object:
+            The `BlockingPriorityQueue()` instance's first inserted item.
+
+        Raises
+        ------
+        IndexError:
+            If the `BlockingPriorityQueue()` instance is empty!!
+        """
+        with self._mutex:
+            return super().top()
+
+    # =============================    DEQUEUE   ==============================
+    def dequeue(self, lowest_priority=False):
+        """
+        Pops the item that has the highest priority from the
+        `BlockingPriorityQueue()` instance in time-complexity of O(log(n))
+        without blocking, where **n** is the number of elements in the
+        instance.
+
+        Parameters
+        ----------
+        lowest_priority: bool
+            A flag to pop the item that has the lowest priority instead of the
+            highest one (default: `False`).
+
+        Returns
+        -------
+        object:
+            The item that has the highest priority in the
+            `BlockingPriorityQueue()`.
+
+        Raises
+        ------
+        UserWarning:
+            If the `BlockingPriorityQueue()` instance is empty!!
+        """
+        with self._mutex:
+            item = super().dequeue(lowest_priority)
+            self._notify_putters()
+            return item
+
+    def dequeue_many(self, count, lowest_priority=False):
+        """
+        Pops the given number of items that have the highest priorities from
+        the `BlockingPriorityQueue()` without blocking.
+
+        Parameters
+        ----------
+        count: int
+            The number of items to be popped.
+        lowest_priority: bool
+            A flag to pop the items that have the lowest priorities instead of
+            the highest ones (default: `False`).
+
+        Returns
+        -------
+        list:
+            The popped items in the order they were popped.
+
+        Raises
+        ------
+        UserWarning:
+            If the `BlockingPriorityQueue()` instance has fewer items than
+            `count`!!
+        TypeError:
+            If the given `count` isn't an integer.
+        ValueError:
+            If the given `count` is negative.
+        """
+        with self._mutex:
+            items = super().dequeue_many(count, lowest_priority)
+            self._notify_putters(all=True)
+            return items
+
+    def get(self, block=True, timeout=None, lowest_priority=False):
+        """
+        Pops the item that has the highest priority from the
+        `BlockingPriorityQueue()` instance in time-complexity of O(log(n)),
+        where **n** is the number of elements in the instance, waiting for
+        another thread to add an item if it's empty.
+
+        Parameters
+        ----------
+        block: bool
+            A flag to wait while the `BlockingPriorityQueue()` is empty
+            instead of raising an `IndexError` right away (default: `True`).
+        timeout: int or float, optional
+            The maximum number of seconds to wait. `None` means waiting
+            forever (default: `None`).
+        lowest_priority: bool
+            A flag to pop the item that has the lowest priority instead of the
+            highest one (default: `False`).
+
+        Returns
+        -------
+        object:
+            The item that has the highest priority in the
+            `BlockingPriorityQueue()`.
+
+        Raises
+        ------
+        IndexError:
+            If the `BlockingPriorityQueue()` is still empty after `timeout`
+            seconds or if it's empty and `block` is `False`.
+        TypeError:
+            If the given `timeout` isn't a number.
+        ValueError:
+            If the given `timeout` is negative.
+
+        Example
+        -------
+        >>> pq = BlockingPriorityQueue()
+        >>> pq.put(10, priority=1)
+        >>> pq.put(20, priority=5)
+        >>> pq.put(30, priority=3)
+        >>> pq.get()
+        20
+        >>> pq.get(lowest_priority=True)
+        10
+        """
+        if timeout is not None:
+            self._validate_timeout(timeout)
+        with self._mutex:
+            self._wait_for_items(block, timeout)
+            item = super().dequeue(lowest_priority)
+            self._notify_putters()
+            return item
+
+    def clear(self):
+        """
+        Removes all objects within the `BlockingPriorityQueue()` instance,
+        waking up the threads waiting to put items.
+
+        Example
+        -------
+        >>> pq = BlockingPriorityQueue()
+        >>> pq.put(1)
+        >>> pq.put(2)
+        >>> pq.clear()
+        >>> len(pq)
+        0
+        """
+        with self._mutex:
+            # NOTE: the removed items won't be taken, so they aren't tasks
+            self._drop_tasks(len(self._container))
+            super().clear()
+            self._notify_putters(all=True)
+
+    # =============================     TASKS    ==============================
+    def task_done(self):
+        """
+        Marks an item taken by `get()` as processed, so that `join()` returns
+        once every added item was processed.
+
+        Raises
+        ------
+        ValueError:
+            If it's called more times than the number of added items.
+
+        Example
+        -------
+        >>> pq = BlockingPriorityQueue()
+        >>> pq.put(10)
+        >>> pq.get()
+        10
+        >>> pq.task_done()
+        >>> pq.task_done()
+        ValueError: `task_done()` called too many times on \
+            `extra.BlockingPriorityQueue()`!!
+        """
+        self._task_done()
+
+    def join(self):
+        """
+        Blocks the calling thread till every item added to the
+        `BlockingPriorityQueue()` instance is taken and marked as processed by
+        `task_done()`.
+
+        Example
+        -------
+        >>> pq = BlockingPriorityQueue()
+        >>> pq.put(10)
+        >>> pq.get()
+        10
+        >>> pq.task_done()
+        >>> pq.join()  # returns right away
+        """
+        self._join()
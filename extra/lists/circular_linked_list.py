@@ -656,6 +656,124 @@ class CircularLinkedList(LinkedList):
         idx = idx % self._length if self._length != 0 else 0
         return super().__getitem__(idx)
 
+    def view(self, start=None, stop=None, step=None):
+        """
+        Lazily iterates over the values of the `CircularLinkedList()` instance
+        between the given indices without creating a new
+        `CircularLinkedList()`. The arguments follow the same rules as
+        slicing a normal `list`, so the iteration covers one round at most.
+
+        Parameters
+        ----------
+        start: int, optional
+            The index of the first value, default is the first index for
+            positive steps and the last one for negative steps.
+        stop: int, optional
+            The index at which the iteration stops (exclusive), default is the
+            end of the `CircularLinkedList()` in the direction of `step`.
+        step: int, optional
+            The distance between two consecutive values, default 1.
+
+        Returns
+        -------
+        generator:
+            A generator that yields the wanted values.
+
+        Raises
+        ------
+        TypeError:
+            If one of the given arguments isn't an integer.
+        ValueError:
+            If `step` is zero.
+        RuntimeError:
+            If the `CircularLinkedList()` is structurally changed while
+            iterating over the view.
+
+        Example
+        -------
+        >>> cll = CircularLinkedList([1, 2, 3, 4, 5])
+        >>> list(cll.view(1, 4))
+        [2, 3, 4]
+        >>> list(cll.view(step=-2))
+        [5, 3, 1]
+        """
+        return super().view(start, stop, step)
+
+    # =============================    CURSOR    ==============================
+    def iter_cursor(self):
+        """
+        Returns a cursor pointing at the first item of the
+        `CircularLinkedList()` instance in constant time. The cursor can move
+        forward and edit the `CircularLinkedList()` around the item it points
+        at in constant time. Since the list is circular, the cursor wraps
+        around to the head after passing the tail and it gets exhausted only
+        when the list becomes empty.
+
+        Returns
+        -------
+        Cursor():
+            A cursor pointing at the head of the `CircularLinkedList()`. If
+            the instance is empty, the cursor will be exhausted.
+
+        Example
+        -------
+        >>> cll = CircularLinkedList([1, 2, 3, 4])
+        >>> cursor = cll.iter_cursor()
+        >>> for _ in range(len(cll)):
+        ...     if cursor.get_data() % 2 == 0:
+        ...         cursor.remove()
+        ...     else:
+        ...         cursor.advance()
+        >>> cll
+        ┌───┐ ┌───┐
+        │ 1 │⟶│ 3 │⟶ ┐
+        └───┘ └───┘  │
+          ↑          │
+          └──────────┘
+
+        Note
+        ----
+        Changing the `CircularLinkedList()` by any means other than the cursor
+        itself makes the cursor stale. Using a stale cursor raises
+        `RuntimeError`.
+        """
+        return super().iter_cursor()
+
+    def find(self, value):
+        """
+        Searches the `CircularLinkedList()` for the given value in
+        time-complexity of O(n) where **n** is the number of elements in the
+        `CircularLinkedList()` and returns a cursor pointing at the first item
+        equal to it.
+
+        Parameters
+        ----------
+        value: object
+            The value to be searched for.
+
+        Returns
+        -------
+        Cursor() or None:
+            A cursor pointing at the first match or `None` if the value
+            doesn't exist in the `CircularLinkedList()` instance.
+
+        Example
+        -------
+        >>> cll = CircularLinkedList([1, 2, 3])
+        >>> cll.find(2)
+        Cursor(data: 2)
+        >>> cll.find(2).insert_after(5)
+        >>> cll
+        ┌───┐ ┌───┐ ┌───┐ ┌───┐
+        │ 1 │⟶│ 2 │⟶│ 5 │⟶│ 3 │⟶ ┐
+        └───┘ └───┘ └───┘ └───┘  │
+          ↑                      │
+          └──────────────────────┘
+        >>> cll.find(10) is None
+        True
+        """
+        return super().find(value)
+
     # =============================    INSERT    ==============================
     def _insert_node(self, prev_node, new_node):
         """
@@ -691,19 +809,24 @@ class CircularLinkedList(LinkedList):
         assert prev_node is None or isinstance(prev_node, self._basic_node)
         assert isinstance(new_node, self._basic_node)
 
+        self._version += 1
         # start inserting the node
         if self._length == 0:
             new_node.set_next(new_node)
-            self._head = new_node
+            self._head = self._tail = new_node
         elif prev_node is None:
             new_node.set_next(self._head.get_next())
             self._head.set_next(new_node)
             # swap data between new_node and self._head
             new_node._data, self._head._data = self._head._data, new_node._data
+            if self._length == 1:
+                self._tail = new_node
             new_node = self._head  # to be returned
         else:
             new_node.set_next(prev_node.get_next())
             prev_node.set_next(new_node)
+            if prev_node is self._tail:
+                self._tail = new_node
         self._length += 1
         return new_node
 
@@ -740,8 +863,7 @@ class CircularLinkedList(LinkedList):
     def add_end(self, item):
         """
         Adds the given value at the tail of the `CircularLinkedList()` instance
-        in time-complexity of O(n) where **n** is the number of elements in the
-        instance.
+        in constant time.
 
         Parameters
         ----------
@@ -826,8 +948,7 @@ class CircularLinkedList(LinkedList):
         """
         Extends the current `CircularLinkedList()` instance by appending the
         elements of the other `CircularLinkedList()` instance in time-
-        complexity of O(n+m) where **n** is the number of elements in the
-        original instance and **m** is the number of elements in the other
+        complexity of O(m) where **m** is the number of elements in the other
         instance.
 
         Parameters
@@ -867,12 +988,7 @@ class CircularLinkedList(LinkedList):
                 + f"Can't extend `{self.__name__}` with `{type(other)}`!!"
             )
         if not other.is_empty():
-            counter = 0
-            curr_node = self._head if not self.is_empty() else None
-            while counter < self._length - 1:
-                counter += 1
-                curr_node = curr_node.get_next()
-            prev_node = curr_node
+            prev_node = self._tail if not self.is_empty() else None
             # now, let's add the new values
             for item in other:
                 new_node = self._basic_node(item)
@@ -975,6 +1091,7 @@ class CircularLinkedList(LinkedList):
         assert prev_node is None or isinstance(prev_node, self._basic_node)
         assert isinstance(node_to_be_removed, self._basic_node)
 
+        self._version += 1
         # if node to be removed is the first
         if prev_node is None:
             if self._length == 1:
@@ -983,8 +1100,12 @@ class CircularLinkedList(LinkedList):
                 next_to_head = self._head.get_next()
                 self._head.set_data(next_to_head.get_data())
                 self._head.set_next(next_to_head.get_next())
+                if next_to_head is self._tail:
+                    self._tail = self._head
         else:
             prev_node.set_next(node_to_be_removed.get_next())
+            if node_to_be_removed is self._tail:
+                self._tail = prev_node
         self._length -= 1
 
     def __delitem__(self, idx):
@@ -1317,6 +1438,116 @@ class CircularLinkedList(LinkedList):
         """
         return super().rotate_right(distance, inplace)
 
+    # =============================     SORT     ==============================
+    def _set_chain(self, head, tail, length):
+        """
+        Makes the `CircularLinkedList()` instance hold the given chain of
+        nodes. The chain is assumed to be linked from `head` to `tail` through
+        the `next` pointers.
+
+        Parameters
+        ----------
+        head: Node() or None
+            The first node of the chain.
+        tail: Node() or None
+            The last node of the chain.
+        length: int
+            The number of nodes in the chain.
+        """
+        super()._set_chain(head, tail, length)
+        if tail is not None:
+            tail.set_next(head)
+
+    def sort(self, key=None, reverse=False):
+        """
+        Sorts the `CircularLinkedList()` instance in-place in time-complexity
+        of O(n log(n)) where **n** is the number of elements in the
+        `CircularLinkedList()`. It uses a bottom-up merge sort that relinks the
+        existing nodes, so no nodes are created and the sort is stable.
+
+        Parameters
+        ----------
+        key: callable, optional
+            A function of one argument that extracts the comparison key from
+            each value, default `None` which compares the values directly.
+        reverse: bool, optional
+            A flag to sort the values in descending order, default `False`.
+
+        Raises
+        ------
+        TypeError:
+            If `key` isn't callable, `reverse` isn't boolean or the values
+            can't be compared.
+
+        Example
+        -------
+        >>> cll = CircularLinkedList([3, 1, 20, 2])
+        >>> cll.sort()
+        >>> cll
+        ┌───┐ ┌───┐ ┌───┐ ┌────┐
+        │ 1 │⟶│ 2 │⟶│ 3 │⟶│ 20 │⟶ ┐
+        └───┘ └───┘ └───┘ └────┘  │
+          ↑                       │
+          └───────────────────────┘
+        >>> cll.sort(key=str, reverse=True)
+        >>> cll
+        ┌───┐ ┌────┐ ┌───┐ ┌───┐
+        │ 3 │⟶│ 20 │⟶│ 2 │⟶│ 1 │⟶ ┐
+        └───┘ └────┘ └───┘ └───┘  │
+          ↑                       │
+          └───────────────────────┘
+        """
+        super().sort(key, reverse)
+
+    def merge_sorted(self, other, key=None, reverse=False):
+        """
+        Merges the nodes of another sorted `CircularLinkedList()` into the
+        current sorted one in time-complexity of O(n+m) where **n** and **m**
+        are the number of elements in the current and the other
+        `CircularLinkedList()` respectively. The nodes are relinked without
+        creating new ones, so the other `CircularLinkedList()` becomes empty
+        afterwards.
+
+        Parameters
+        ----------
+        other: CircularLinkedList()
+            A sorted `CircularLinkedList()` instance whose nodes will be
+            merged.
+        key: callable, optional
+            The function that both instances are sorted by, default `None`.
+        reverse: bool, optional
+            A flag showing that both instances are sorted in descending order,
+            default `False`.
+
+        Raises
+        ------
+        TypeError:
+            If the given object isn't a `CircularLinkedList()` instance, `key`
+            isn't callable or `reverse` isn't boolean.
+        ValueError:
+            If the given object is the current instance itself.
+
+        Example
+        -------
+        >>> cll_1 = CircularLinkedList([1, 4, 6])
+        >>> cll_2 = CircularLinkedList([2, 3, 7])
+        >>> cll_1.merge_sorted(cll_2)
+        >>> cll_1
+        ┌───┐ ┌───┐ ┌───┐ ┌───┐ ┌───┐ ┌───┐
+        │ 1 │⟶│ 2 │⟶│ 3 │⟶│ 4 │⟶│ 6 │⟶│ 7 │⟶ ┐
+        └───┘ └───┘ └───┘ └───┘ └───┘ └───┘  │
+          ↑                                  │
+          └──────────────────────────────────┘
+        >>> cll_2.is_empty()
+        True
+
+        Note
+        ----
+        Both instances must be sorted in the same order, otherwise the order
+        of the merged values isn't defined.
+        """
+        super().merge_sorted(other, key, reverse)
+
     # =============================     MISC     ==============================
     def reverse(self):
         """
@@ -4,7 +4,6 @@ that supports insertion and deletion at both the front and the back of the
 queue. Deque is a short for "double-ended queue". The deque is more general
 than both the stack and the queue.
 """
-import warnings
 from extra.lists.queue import Queue
 
 
@@ -18,7 +17,15 @@ class Deque(Queue):
 
     __name__ = "extra.Deque()"
 
-    def __init__(self, max_capacity=float("inf")):
+    def __init__(
+        self,
+        max_capacity=float("inf"),
+        backend="linked",
+        overflow="warn",
+        empty="warn",
+        sentinel=None,
+        timeout=None,
+    ):
         """
         Creates a `Deque()` object!!
 
@@ -27,13 +34,47 @@ class Deque(Queue):
         max_capacity: int
             It'dq a positive integer representing the maximum number of
             elements a `Deque()` should contain (Default: inf).
+        backend: str
+            The container used to store the elements (Default: "linked").
+            `"linked"` stores every element in a `DoublyNode()` of a
+            `DoublyLinkedList()`, while `"array"` stores them in a growable
+            ring buffer which takes a fraction of the memory and is faster.
+            When `max_capacity` is finite, the ring buffer has a fixed size
+            and it's allocated once, here, so appending never allocates.
+        overflow: str
+            What happens when an item is added to a full `Deque()`
+            (Default: "warn"). It can be one of the following:
+                1. `"warn"`: warns then drops the item at the other end.
+                2. `"drop_oldest"`: drops the item at the other end silently.
+                3. `"drop_newest"`: discards the new item silently.
+                4. `"raise"`: raises an `OverflowError`.
+                5. `"block"`: waits for another thread to remove an item.
+        empty: str
+            What happens when an item is removed from an empty `Deque()`
+            (Default: "warn"). It can be one of the following:
+                1. `"warn"`: warns then returns `sentinel`.
+                2. `"sentinel"`: returns `sentinel` silently.
+                3. `"raise"`: raises an `IndexError`.
+        sentinel: object
+            The object returned when removing from an empty `Deque()`
+            (Default: None).
+        timeout: int or float, optional
+            The maximum number of seconds the `"block"` overflow policy waits
+            before raising an `OverflowError`. `None` means waiting forever
+            (Default: None).
 
         Raises
         ------
         TypeError:
-            If the type of `max_capacity` isn't `int` or `float`.
+            It can be raised in two cases
+                1. If the type of `max_capacity` isn't `int` or `float`.
+                2. If the given `timeout` is neither `None` nor a number.
         ValueError:
-            If the given value of `max_capacity` is less than zero.
+            It can be raised in four cases
+                1. If the given value of `max_capacity` is less than zero.
+                2. If the given `backend` is neither `"linked"` nor `"array"`.
+                3. If the given `overflow` or `empty` isn't a known policy.
+                4. If the given `timeout` is negative.
 
         Example
         -------
@@ -51,6 +92,10 @@ class Deque(Queue):
 
         Note
         ----
+        A bounded `Deque()` only avoids allocating per element with the
+        `"array"` backend, e.g. `Deque(1000, backend="array")`. The default
+        `"linked"` backend creates a new node for every element it stores.
+
         If you passed a `float` number as the maximum capacity, then the value
         that get assigned is the rounding of that number:
 
@@ -58,7 +103,9 @@ class Deque(Queue):
         >>> dq._max_capacity
         11
         """
-        super().__init__(max_capacity)
+        super().__init__(
+            max_capacity, backend, overflow, empty, sentinel, timeout
+        )
 
     # =============================     PRINT    ==============================
     def __repr__(self):
@@ -167,8 +214,12 @@ class Deque(Queue):
         Raises
         ------
         UserWarning:
-            If the `Deque()` instance was full!! By "full", I mean the number
-            of items in the `Deque()` equals to the assigned maximum capacity.
+            If the `Deque()` instance was full and its overflow policy is
+            `"warn"`!! By "full", I mean the number of items in the `Deque()`
+            equals to the assigned maximum capacity.
+        OverflowError:
+            If the `Deque()` instance was full and its overflow policy is
+            either `"raise"` or `"block"` which timed out.
         ValueError:
             If the given `item` is `None`.
         TypeError:
@@ -214,8 +265,12 @@ class Deque(Queue):
         Raises
         ------
         UserWarning:
-            If the `Deque()` instance was full!! By "full", I mean the number
-            of items in the `Deque()` equals to the assigned maximum capacity.
+            If the `Deque()` instance was full and its overflow policy is
+            `"warn"`!! By "full", I mean the number of items in the `Deque()`
+            equals to the assigned maximum capacity.
+        OverflowError:
+            If the `Deque()` instance was full and its overflow policy is
+            either `"raise"` or `"block"` which timed out.
         ValueError:
             If the given `item` is `None`.
         TypeError:
@@ -243,15 +298,85 @@ class Deque(Queue):
         ─┴───┴───┴─
         """
         super()._validate_item(item)
-        if self.is_full():
-            warnings.warn(
-                f"Enqueuing to a full `{self.__name__}` "
-                + "could lead to missing values!!",
-                UserWarning,
-            )
-            self._container.remove_front()
-        if self._max_capacity > 0:
-            self._container._insert(len(self), item)
+        self._add(item, self._push_right, self._pop_left)
+
+    def append_left_many(self, items):
+        """
+        Inserts the given items to the left-side of the `Deque()`, one after
+        the other, in linear time. The items are validated and the capacity
+        is checked once, before any of them is inserted.
+
+        Parameters
+        ----------
+        items: iterable
+            The python objects to be pushed to the `Deque()`.
+
+        Raises
+        ------
+        UserWarning:
+            If the items don't fit in the `Deque()` instance and its overflow
+            policy is `"warn"`!! It's raised only once.
+        OverflowError:
+            If the items don't fit in the `Deque()` instance and its overflow
+            policy is either `"raise"`, in which case none of them is
+            inserted, or `"block"` which timed out.
+        ValueError:
+            If one of the given items is `None`.
+        TypeError:
+            If one of the given items is an instance of `Extra`.
+
+        Example
+        -------
+        >>> dq = Deque()
+        >>> dq.append_left_many([1, 2, 3])
+        >>> dq
+        ─┬───┬───┬───┬─
+        ⟷│ 3 │ 2 │ 1 │⟷
+        ─┴───┴───┴───┴─
+        """
+        super().enqueue_many(items)
+
+    def append_right_many(self, items):
+        """
+        Inserts the given items to the right-side of the `Deque()`, one after
+        the other, in linear time. The items are validated and the capacity
+        is checked once, before any of them is inserted.
+
+        Parameters
+        ----------
+        items: iterable
+            The python objects to be pushed to the `Deque()`.
+
+        Raises
+        ------
+        UserWarning:
+            If the items don't fit in the `Deque()` instance and its overflow
+            policy is `"warn"`!! It's raised only once.
+        OverflowError:
+            If the items don't fit in the `Deque()` instance and its overflow
+            policy is either `"raise"`, in which case none of them is
+            inserted, or `"block"` which timed out.
+        ValueError:
+            If one of the given items is `None`.
+        TypeError:
+            If one of the given items is an instance of `Extra`.
+
+        Example
+        -------
+        >>> dq = Deque(max_capacity=2)
+        >>> dq.append_right_many([1, 2, 3])
+        UserWarning: Enqueuing to a full `extra.Deque()` could lead to \
+            missing values!!
+        >>> dq
+        ─┬───┬───┬─
+        ⟷│ 2 │ 3 │⟷
+        ─┴───┴───┴─
+        """
+        items = list(items)
+        if not self.TRUSTED:
+            for item in items:
+                super()._validate_item(item)
+        self._add_many(items, self._push_many_right, self._pop_many_left)
 
     # =============================      GET     ==============================
     def get_left(self):
@@ -286,7 +411,7 @@ class Deque(Queue):
             raise IndexError(
                 f"Can't retrieve from an empty `{self.__name__}`!!"
             )
-        return self._container._head.get_data()
+        return self._peek_left()
 
     def get_right(self):
         """
@@ -331,7 +456,11 @@ class Deque(Queue):
         Raises
         ------
         UserWarning:
-            If the `Deque()` instance is empty!!
+            If the `Deque()` instance is empty and its empty policy is
+            `"warn"`!!
+        IndexError:
+            If the `Deque()` instance is empty and its empty policy is
+            `"raise"`!!
 
         Example
         -------
@@ -351,13 +480,7 @@ class Deque(Queue):
         ⟷│ 10 │⟷
         ─┴────┴─
         """
-        if self.is_empty():
-            warnings.warn(f"Dequeuing from an empty `{self.__name__}`!!")
-            return
-        else:
-            head_value = self._container._head.get_data()
-            self._container.remove_front()
-            return head_value
+        return self._remove(self._pop_left)
 
     def pop_right(self):
         """
@@ -371,7 +494,11 @@ class Deque(Queue):
         Raises
         ------
         UserWarning:
-            If the `Deque()` instance is empty!!
+            If the `Deque()` instance is empty and its empty policy is
+            `"warn"`!!
+        IndexError:
+            If the `Deque()` instance is empty and its empty policy is
+            `"raise"`!!
 
         Example
         -------
@@ -393,6 +520,84 @@ class Deque(Queue):
         """
         return super().dequeue()
 
+    def pop_left_many(self, count):
+        """
+        Pops the given number of the left-most items from the `Deque()` in
+        linear time.
+
+        Parameters
+        ----------
+        count: int
+            The number of items to be popped.
+
+        Returns
+        -------
+        list:
+            The popped items, the left-most one first. It holds fewer items
+            than `count` if the `Deque()` instance doesn't have enough of them
+            and its empty policy isn't `"raise"`.
+
+        Raises
+        ------
+        UserWarning:
+            If the `Deque()` instance has fewer items than `count` and its
+            empty policy is `"warn"`!!
+        IndexError:
+            If the `Deque()` instance has fewer items than `count` and its
+            empty policy is `"raise"`, in which case nothing is popped!!
+        TypeError:
+            If the given `count` isn't an integer.
+        ValueError:
+            If the given `count` is negative.
+
+        Example
+        -------
+        >>> dq = Deque()
+        >>> dq.append_right_many([10, 20, 30])
+        >>> dq.pop_left_many(2)
+        [10, 20]
+        """
+        return self._remove_many(count, self._pop_many_left)
+
+    def pop_right_many(self, count):
+        """
+        Pops the given number of the right-most items from the `Deque()` in
+        linear time.
+
+        Parameters
+        ----------
+        count: int
+            The number of items to be popped.
+
+        Returns
+        -------
+        list:
+            The popped items, the right-most one first. It holds fewer items
+            than `count` if the `Deque()` instance doesn't have enough of them
+            and its empty policy isn't `"raise"`.
+
+        Raises
+        ------
+        UserWarning:
+            If the `Deque()` instance has fewer items than `count` and its
+            empty policy is `"warn"`!!
+        IndexError:
+            If the `Deque()` instance has fewer items than `count` and its
+            empty policy is `"raise"`, in which case nothing is popped!!
+        TypeError:
+            If the given `count` isn't an integer.
+        ValueError:
+            If the given `count` is negative.
+
+        Example
+        -------
+        >>> dq = Deque()
+        >>> dq.append_right_many([10, 20, 30])
+        >>> dq.pop_right_many(2)
+        [30, 20]
+        """
+        return super().dequeue_many(count)
+
     def clear(self):
         """
         Removes all objects within the `Deque()` instance in constant time.
@@ -17,6 +17,7 @@ class DoublyNode(Node):
     """A doubly node is the basic unit for building doubly linked lists."""
 
     __name__ = "extra.DoublyNode()"
+    __slots__ = ("_prev",)
 
     def __init__(self, item):
         """
@@ -201,6 +202,8 @@ class DoublyLinkedList(LinkedList):
         ⟷│ 2 │⟷│ 5 │⟷
          └───┘ └───┘
         """
+        # counts the structural changes to detect stale cursors
+        self._version = 0
         if iterable is None:
             self._head = None
             self._tail = None
@@ -744,12 +747,50 @@ class DoublyLinkedList(LinkedList):
             curr_node = prev_node.get_next()
             return prev_node, curr_node
 
+    def _iter_slice(self, indices):
+        """
+        Yields the values at the given indices while walking over the
+        `DoublyLinkedList()` instance only once. The walk starts from the
+        nearest end to the first index, so negative-step slices start from
+        the tail and follow the `prev` pointers without storing any values.
+
+        Parameters
+        ----------
+        indices: range
+            The wanted indices, all of them are within the boundaries.
+
+        Raises
+        ------
+        RuntimeError:
+            If the `DoublyLinkedList()` was changed while iterating.
+
+        Example
+        -------
+        >>> dll = DoublyLinkedList([1, 2, 3, 4, 5])
+        >>> list(dll._iter_slice(range(4, -1, -2)))
+        [5, 3, 1]
+        """
+        if not indices:
+            return
+        elif indices.step > 0:
+            yield from super()._iter_slice(indices)
+            return
+        version = self._version
+        _, curr_node = self._get_node(indices[0])
+        for _ in range(len(indices) - 1):
+            yield curr_node.get_data()
+            self._validate_version(version)
+            for _ in range(-indices.step):
+                curr_node = curr_node.get_prev()
+        yield curr_node.get_data()
+
     def __getitem__(self, idx):
         """
         Retrieves the element at the given index. The given index could be a
         zero-based `int` or a `slice` object. This method supports negative
         indexing. This method does that in time-complexity of O(k) where **k**
-        is the given index.
+        is the given index. Slices walk over the `DoublyLinkedList()` only
+        once starting from the nearest end.
 
         Parameters
         ----------
@@ -786,11 +827,128 @@ class DoublyLinkedList(LinkedList):
          ┌───┐ ┌───┐ ┌───┐
         ⟷│ 1 │⟷│ 3 │⟷│ 5 │⟷
          └───┘ └───┘ └───┘
+        >>> dll[::-2]
+         ┌───┐ ┌───┐ ┌───┐
+        ⟷│ 5 │⟷│ 3 │⟷│ 1 │⟷
+         └───┘ └───┘ └───┘
         >>> dll[10]
         IndexError: Given index is out of the boundaries!!
         """
         return super().__getitem__(idx)
 
+    def view(self, start=None, stop=None, step=None):
+        """
+        Lazily iterates over the values of the `DoublyLinkedList()` instance
+        that `DoublyLinkedList()[start:stop:step]` would return without
+        creating a new `DoublyLinkedList()`. The arguments follow the same
+        rules as slicing and negative steps walk backwards from the tail.
+
+        Parameters
+        ----------
+        start: int, optional
+            The index of the first value, default is the first index for
+            positive steps and the last one for negative steps.
+        stop: int, optional
+            The index at which the iteration stops (exclusive), default is the
+            end of the `DoublyLinkedList()` in the direction of `step`.
+        step: int, optional
+            The distance between two consecutive values, default 1.
+
+        Returns
+        -------
+        generator:
+            A generator that yields the wanted values.
+
+        Raises
+        ------
+        TypeError:
+            If one of the given arguments isn't an integer.
+        ValueError:
+            If `step` is zero.
+        RuntimeError:
+            If the `DoublyLinkedList()` is structurally changed while
+            iterating over the view.
+
+        Example
+        -------
+        >>> dll = DoublyLinkedList([1, 2, 3, 4, 5])
+        >>> list(dll.view(1, 4))
+        [2, 3, 4]
+        >>> list(dll.view(step=-2))
+        [5, 3, 1]
+        >>> next(dll.view(-2))
+        4
+        """
+        return super().view(start, stop, step)
+
+    # =============================    CURSOR    ==============================
+    def iter_cursor(self):
+        """
+        Returns a cursor pointing at the first item of the `DoublyLinkedList()`
+        instance in constant time. The cursor can move forward and edit the
+        `DoublyLinkedList()` around the item it points at in constant time.
+
+        Returns
+        -------
+        Cursor():
+            A cursor pointing at the head of the `DoublyLinkedList()`. If the
+            instance is empty, the cursor will be exhausted.
+
+        Example
+        -------
+        >>> dll = DoublyLinkedList([1, 2, 3, 4])
+        >>> cursor = dll.iter_cursor()
+        >>> while not cursor.is_exhausted():
+        ...     if cursor.get_data() % 2 == 0:
+        ...         cursor.remove()
+        ...     else:
+        ...         cursor.advance()
+        >>> dll
+         ┌───┐ ┌───┐
+        ⟷│ 1 │⟷│ 3 │⟷
+         └───┘ └───┘
+
+        Note
+        ----
+        Changing the `DoublyLinkedList()` by any means other than the cursor
+        itself makes the cursor stale. Using a stale cursor raises
+        `RuntimeError`.
+        """
+        return super().iter_cursor()
+
+    def find(self, value):
+        """
+        Searches the `DoublyLinkedList()` for the given value in
+        time-complexity of O(n) where **n** is the number of elements in the
+        `DoublyLinkedList()` and returns a cursor pointing at the first item
+        equal to it.
+
+        Parameters
+        ----------
+        value: object
+            The value to be searched for.
+
+        Returns
+        -------
+        Cursor() or None:
+            A cursor pointing at the first match or `None` if the value
+            doesn't exist in the `DoublyLinkedList()` instance.
+
+        Example
+        -------
+        >>> dll = DoublyLinkedList([1, 2, 3])
+        >>> dll.find(2)
+        Cursor(data: 2)
+        >>> dll.find(2).insert_after(5)
+        >>> dll
+         ┌───┐ ┌───┐ ┌───┐ ┌───┐
+        ⟷│ 1 │⟷│ 2 │⟷│ 5 │⟷│ 3 │⟷
+         └───┘ └───┘ └───┘ └───┘
+        >>> dll.find(10) is None
+        True
+        """
+        return super().find(value)
+
     # =============================    INSERT    ==============================
     def _insert_node(self, prev_node, item):
         """
@@ -831,6 +989,7 @@ class DoublyLinkedList(LinkedList):
         else:
             assert item is not None
             new_node = self._basic_node(item)
+        self._version += 1
         # start inserting the node
         if self._length == 0:
             self._head = self._tail = new_node
@@ -995,10 +1154,12 @@ class DoublyLinkedList(LinkedList):
             self._head = other._head
             self._tail = other._tail
             self._length += other._length
+            self._version += 1
         else:
             self._tail.set_next(other._head)
             self._tail = other._tail
             self._length += other._length
+            self._version += 1
 
     # =============================      SET     ==============================
     def __setitem__(self, idx, item):
@@ -1087,11 +1248,11 @@ class DoublyLinkedList(LinkedList):
         assert prev_node is None or isinstance(prev_node, self._basic_node)
         assert node_to_be_removed is not None, "Can't remove `None`!!"
 
+        self._version += 1
         next_node = node_to_be_removed.get_next()
         # if node to be removed is the first
         if self._length == 1:
-            # NOTE: don't use set_data() here
-            self._head.data = self._tail.data = None
+            self._head = self._tail = None
             self._length -= 1
         elif self._length == 2:
             if prev_node is None:
@@ -1106,6 +1267,12 @@ class DoublyLinkedList(LinkedList):
                 prev_node.set_next(next_node)
                 self._tail = prev_node
                 self._length -= 1
+            elif prev_node is None:
+                # NOTE: relink instead of copying the next node's data into the
+                # head, so references to the remaining nodes stay valid.
+                next_node.set_prev(None)
+                self._head = next_node
+                self._length -= 1
             else:
                 super()._remove_node(prev_node, node_to_be_removed)
 
@@ -1359,6 +1526,7 @@ class DoublyLinkedList(LinkedList):
             return rotated
         self._head = rotated._head
         self._tail = rotated._tail
+        self._version += 1
 
     def rotate_right(self, distance, inplace=True):
         """
@@ -1409,6 +1577,110 @@ class DoublyLinkedList(LinkedList):
             return rotated
         self._head = rotated._head
         self._tail = rotated._tail
+        self._version += 1
+
+    # =============================     SORT     ==============================
+    def _set_chain(self, head, tail, length):
+        """
+        Makes the `DoublyLinkedList()` instance hold the given chain of nodes.
+        The chain is assumed to be linked from `head` to `tail` through the
+        `next` pointers.
+
+        Parameters
+        ----------
+        head: DoublyNode() or None
+            The first node of the chain.
+        tail: DoublyNode() or None
+            The last node of the chain.
+        length: int
+            The number of nodes in the chain.
+        """
+        super()._set_chain(head, tail, length)
+        if head is not None:
+            head.set_prev(None)
+
+    def sort(self, key=None, reverse=False):
+        """
+        Sorts the `DoublyLinkedList()` instance in-place in time-complexity of
+        O(n log(n)) where **n** is the number of elements in the
+        `DoublyLinkedList()`. It uses a bottom-up merge sort that relinks the
+        existing nodes, so no nodes are created and the sort is stable.
+
+        Parameters
+        ----------
+        key: callable, optional
+            A function of one argument that extracts the comparison key from
+            each value, default `None` which compares the values directly.
+        reverse: bool, optional
+            A flag to sort the values in descending order, default `False`.
+
+        Raises
+        ------
+        TypeError:
+            If `key` isn't callable, `reverse` isn't boolean or the values
+            can't be compared.
+
+        Example
+        -------
+        >>> dll = DoublyLinkedList([3, 1, 20, 2])
+        >>> dll.sort()
+        >>> dll
+         ┌───┐ ┌───┐ ┌───┐ ┌────┐
+        ⟷│ 1 │⟷│ 2 │⟷│ 3 │⟷│ 20 │⟷
+         └───┘ └───┘ └───┘ └────┘
+        >>> dll.sort(key=str, reverse=True)
+        >>> dll
+         ┌───┐ ┌────┐ ┌───┐ ┌───┐
+        ⟷│ 3 │⟷│ 20 │⟷│ 2 │⟷│ 1 │⟷
+         └───┘ └────┘ └───┘ └───┘
+        """
+        super().sort(key, reverse)
+
+    def merge_sorted(self, other, key=None, reverse=False):
+        """
+        Merges the nodes of another sorted `DoublyLinkedList()` into the
+        current sorted one in time-complexity of O(n+m) where **n** and **m**
+        are the number of elements in the current and the other
+        `DoublyLinkedList()` respectively. The nodes are relinked without
+        creating new ones, so the other `DoublyLinkedList()` becomes empty
+        afterwards.
+
+        Parameters
+        ----------
+        other: DoublyLinkedList()
+            A sorted `DoublyLinkedList()` instance whose nodes will be merged.
+        key: callable, optional
+            The function that both instances are sorted by, default `None`.
+        reverse: bool, optional
+            A flag showing that both instances are sorted in descending order,
+            default `False`.
+
+        Raises
+        ------
+        TypeError:
+            If the given object isn't a `DoublyLinkedList()` instance, `key`
+            isn't callable or `reverse` isn't boolean.
+        ValueError:
+            If the given object is the current instance itself.
+
+        Example
+        -------
+        >>> dll_1 = DoublyLinkedList([1, 4, 6])
+        >>> dll_2 = DoublyLinkedList([2, 3, 7])
+        >>> dll_1.merge_sorted(dll_2)
+        >>> dll_1
+         ┌───┐ ┌───┐ ┌───┐ ┌───┐ ┌───┐ ┌───┐
+        ⟷│ 1 │⟷│ 2 │⟷│ 3 │⟷│ 4 │⟷│ 6 │⟷│ 7 │⟷
+         └───┘ └───┘ └───┘ └───┘ └───┘ └───┘
+        >>> dll_2.is_empty()
+        True
+
+        Note
+        ----
+        Both instances must be sorted in the same order, otherwise the order
+        of the merged values isn't defined.
+        """
+        super().merge_sorted(other, key, reverse)
 
     # =============================     MISC     ==============================
     def reverse(self):
@@ -18,6 +18,7 @@ class Node(Extra):
     """A node is the basic unit for building linked lists."""
 
     __name__ = "extra.Node()"
+    __slots__ = ("_data", "_next")
 
     def __init__(self, item):
         """
@@ -142,6 +143,344 @@ class Node(Extra):
         return str(self._data)
 
 
+class Cursor(Extra):
+    """
+    A cursor points at a certain item of a linked list and remembers the node
+    before it, so the list can be edited around that item in constant time
+    without walking from the head again. Cursors are obtained from the
+    `iter_cursor()` and `find()` methods of the linked lists.
+    """
+
+    __name__ = "extra.Cursor()"
+    __slots__ = ("_list", "_prev", "_node", "_version")
+
+    def __init__(self, llist, prev_node, node):
+        """
+        Creates a `Cursor()` object pointing at the given `node` of the given
+        linked list!!
+
+        Parameters
+        ----------
+        llist: LinkedList()
+            The linked list over which the cursor moves.
+        prev_node: Node() or None
+            The node before `node` or `None` if `node` is the head.
+        node: Node() or None
+            The node the cursor points at or `None` if the cursor is past the
+            end of the linked list.
+        """
+        assert isinstance(llist, LinkedList)
+        self._list = llist
+        self._prev = prev_node
+        self._node = node
+        self._version = llist._version
+
+    def __repr__(self):
+        """
+        Represents the `Cursor()` object as a string.
+
+        Returns
+        -------
+        str:
+            A string representing the `Cursor()` instance.
+
+        Example
+        -------
+        >>> ll = LinkedList([1, 2, 3])
+        >>> ll.iter_cursor()
+        Cursor(data: 1)
+        """
+        if self._node is None:
+            return "Cursor(exhausted)"
+        return f"Cursor(data: {self._node.get_data()})"
+
+    def __validate(self):
+        """
+        Makes sure the linked list wasn't structurally changed by anything but
+        this cursor since the cursor was created.
+
+        Raises
+        ------
+        RuntimeError:
+            If the linked list was changed elsewhere.
+        """
+        if self._version != self._list._version:
+            raise RuntimeError(
+                f"`{self._list.__name__}` was changed after creating this "
+                + "cursor!!"
+            )
+
+    def __validate_position(self):
+        """
+        Makes sure the cursor is still valid and points at an item.
+
+        Raises
+        ------
+        RuntimeError:
+            If the linked list was changed elsewhere.
+        IndexError:
+            If the cursor is past the end of the linked list.
+        """
+        self.__validate()
+        if self._node is None:
+            raise IndexError("The cursor is past the end of the list!!")
+
+    def __get_prev(self):
+        """
+        Returns the node before the current one in the way the linked list
+        expects it, i.e. `None` when the current node is the head.
+
+        Returns
+        -------
+        Node() or None:
+            The node before the current one.
+        """
+        return None if self._node is self._list._head else self._prev
+
+    def is_exhausted(self):
+        """
+        Checks if the cursor went past the end of the linked list in constant
+        time.
+
+        Returns
+        -------
+        bool:
+            `True` if the cursor doesn't point at any item and `False`
+            otherwise.
+
+        Raises
+        ------
+        RuntimeError:
+            If the linked list was changed elsewhere.
+
+        Example
+        -------
+        >>> ll = LinkedList([1])
+        >>> cursor = ll.iter_cursor()
+        >>> cursor.is_exhausted()
+        False
+        >>> cursor.advance()
+        >>> cursor.is_exhausted()
+        True
+        """
+        self.__validate()
+        return self._node is None
+
+    def get_data(self):
+        """
+        Returns the item the cursor points at in constant time.
+
+        Returns
+        -------
+        object:
+            The item the cursor points at.
+
+        Raises
+        ------
+        RuntimeError:
+            If the linked list was changed elsewhere.
+        IndexError:
+            If the cursor is past the end of the linked list.
+
+        Example
+        -------
+        >>> ll = LinkedList([1, 2, 3])
+        >>> ll.iter_cursor().get_data()
+        1
+        """
+        self.__validate_position()
+        return self._node.get_data()
+
+    def advance(self, steps=1):
+        """
+        Moves the cursor forward by the given number of items in O(k) time
+        where **k** is the number of steps. Moving past the tail of a
+        `CircularLinkedList()` wraps around to its head.
+
+        Parameters
+        ----------
+        steps: int
+            The number of items to move forward, default 1.
+
+        Raises
+        ------
+        TypeError:
+            If `steps` isn't an integer.
+        ValueError:
+            If `steps` is negative.
+        RuntimeError:
+            If the linked list was changed elsewhere.
+        IndexError:
+            If the cursor is past the end of the linked list.
+
+        Example
+        -------
+        >>> ll = LinkedList([1, 2, 3])
+        >>> cursor = ll.iter_cursor()
+        >>> cursor.advance(2)
+        >>> cursor.get_data()
+        3
+        """
+        if type(steps) != int:
+            raise TypeError("`steps` must be an integer!!")
+        elif steps < 0:
+            raise ValueError("A cursor can't move backwards!!")
+        for _ in range(steps):
+            self.__validate_position()
+            self._prev, self._node = self._node, self._node.get_next()
+
+    def replace(self, item):
+        """
+        Replaces the item the cursor points at with the given one in constant
+        time.
+
+        Parameters
+        ----------
+        item: object
+            The new item.
+
+        Raises
+        ------
+        TypeError:
+            If the given item is an `Extra` object.
+        ValueError:
+            If the given item is `None`.
+        RuntimeError:
+            If the linked list was changed elsewhere.
+        IndexError:
+            If the cursor is past the end of the linked list.
+
+        Example
+        -------
+        >>> ll = LinkedList([1, 2, 3])
+        >>> cursor = ll.find(2)
+        >>> cursor.replace(20)
+        >>> ll
+        ┌───┐ ┌────┐ ┌───┐
+        │ 1 │⟶│ 20 │⟶│ 3 │⟶
+        └───┘ └────┘ └───┘
+        """
+        self.__validate_position()
+        self._list._validate_item(item)
+        self._node.set_data(item)
+
+    def insert_after(self, item):
+        """
+        Inserts the given item right after the one the cursor points at in
+        constant time. The cursor keeps pointing at the same item.
+
+        Parameters
+        ----------
+        item: object
+            The item to be inserted.
+
+        Raises
+        ------
+        TypeError:
+            If the given item is an `Extra` object.
+        ValueError:
+            If the given item is `None`.
+        RuntimeError:
+            If the linked list was changed elsewhere.
+        IndexError:
+            If the cursor is past the end of the linked list.
+
+        Example
+        -------
+        >>> ll = LinkedList([1, 2, 3])
+        >>> cursor = ll.find(2)
+        >>> cursor.insert_after(10)
+        >>> ll
+        ┌───┐ ┌───┐ ┌────┐ ┌───┐
+        │ 1 │⟶│ 2 │⟶│ 10 │⟶│ 3 │⟶
+        └───┘ └───┘ └────┘ └───┘
+        """
+        self.__validate_position()
+        self._list._validate_item(item)
+        self._list._insert_value(self._node, item)
+        self._version = self._list._version
+
+    def insert_before(self, item):
+        """
+        Inserts the given item right before the one the cursor points at in
+        constant time. The cursor keeps pointing at the same item.
+
+        Parameters
+        ----------
+        item: object
+            The item to be inserted.
+
+        Raises
+        ------
+        TypeError:
+            If the given item is an `Extra` object.
+        ValueError:
+            If the given item is `None`.
+        RuntimeError:
+            If the linked list was changed elsewhere.
+        IndexError:
+            If the cursor is past the end of the linked list.
+
+        Example
+        -------
+        >>> ll = LinkedList([1, 2, 3])
+        >>> cursor = ll.find(2)
+        >>> cursor.insert_before(10)
+        >>> ll
+        ┌───┐ ┌────┐ ┌───┐ ┌───┐
+        │ 1 │⟶│ 10 │⟶│ 2 │⟶│ 3 │⟶
+        └───┘ └────┘ └───┘ └───┘
+        >>> cursor.get_data()
+        2
+        """
+        self.__validate_position()
+        self._list._validate_item(item)
+        new_node = self._list._insert_value(self.__get_prev(), item)
+        if new_node is self._node:
+            # the list kept its head node and moved the current item to the
+            # node after it, see `CircularLinkedList._insert_node()`
+            self._prev, self._node = new_node, new_node.get_next()
+        else:
+            self._prev = new_node
+        self._version = self._list._version
+
+    def remove(self):
+        """
+        Removes the item the cursor points at in constant time. The cursor
+        moves to the item that followed the removed one.
+
+        Raises
+        ------
+        RuntimeError:
+            If the linked list was changed elsewhere.
+        IndexError:
+            If the cursor is past the end of the linked list.
+
+        Example
+        -------
+        >>> ll = LinkedList([1, 2, 3])
+        >>> cursor = ll.find(2)
+        >>> cursor.remove()
+        >>> ll
+        ┌───┐ ┌───┐
+        │ 1 │⟶│ 3 │⟶
+        └───┘ └───┘
+        >>> cursor.get_data()
+        3
+        """
+        self.__validate_position()
+        prev_node = self.__get_prev()
+        self._list._remove_node(prev_node, self._node)
+        if self._list.is_empty():
+            self._node = None
+        elif prev_node is None:
+            # the head is either relinked or it takes the next item's data
+            self._node = self._list._head
+        else:
+            self._node = prev_node.get_next()
+        self._version = self._list._version
+
+
 class LinkedList(Extra):
     """
     A linked list is a simple linear data structure where objects are linked
@@ -217,17 +556,20 @@ class LinkedList(Extra):
         │ 2 │⟶│ 5 │⟶
         └───┘ └───┘
         """
+        # counts the structural changes to detect stale cursors
+        self._version = 0
         if iterable is None:
-            self._head = None
+            self._head = self._tail = None
             self._length = 0
         elif not hasattr(iterable, "__iter__"):
             raise TypeError("The given object isn't iterable!!")
         elif isinstance(iterable, self.__class__):
             # in case the given iterable is alread a LinkedList()
             self._head = iterable._head
+            self._tail = iterable._tail
             self._length = iterable._length
         else:
-            self._head = None
+            self._head = self._tail = None
             self._length = 0
             prev_node = None
             for item in iterable:
@@ -1063,12 +1405,71 @@ class LinkedList(Extra):
         elif idx < -self._length or idx > self._length:
             raise IndexError("Given index is out of the boundaries!!")
 
+    def _validate_version(self, version):
+        """
+        Makes sure the `LinkedList()` instance wasn't structurally changed
+        since the given version was recorded.
+
+        Parameters
+        ----------
+        version: int
+            The value of `_version` recorded before iterating.
+
+        Raises
+        ------
+        RuntimeError:
+            If the `LinkedList()` instance was changed.
+        """
+        if self._version != version:
+            raise RuntimeError(
+                f"`{self.__name__}` was changed during iteration!!"
+            )
+
+    def _iter_slice(self, indices):
+        """
+        Yields the values at the given indices while walking over the
+        `LinkedList()` instance only once in time-complexity of O(k) where
+        **k** is the greatest index. Since the nodes can't be walked backwards,
+        the values of a negative-step slice are collected from left to right
+        then yielded in reverse.
+
+        Parameters
+        ----------
+        indices: range
+            The wanted indices, all of them are within the boundaries.
+
+        Raises
+        ------
+        RuntimeError:
+            If the `LinkedList()` was changed while iterating.
+
+        Example
+        -------
+        >>> ll = LinkedList([1, 2, 3, 4, 5])
+        >>> list(ll._iter_slice(range(4, -1, -2)))
+        [5, 3, 1]
+        """
+        if not indices:
+            return
+        elif indices.step < 0:
+            yield from reversed(list(self._iter_slice(indices[::-1])))
+            return
+        version = self._version
+        _, curr_node = self._get_node(indices[0])
+        for _ in range(len(indices) - 1):
+            yield curr_node.get_data()
+            self._validate_version(version)
+            for _ in range(indices.step):
+                curr_node = curr_node.get_next()
+        yield curr_node.get_data()
+
     def __getitem__(self, idx):
         """
         Retrieves the element at the given index. The given index could be a
         zero-based `int` or a `slice` object. This method supports negative
         indexing as well. This method does that in time-complexity of O(k)
-        where **k** is the given index.
+        where **k** is the given index. Slices walk over the `LinkedList()`
+        only once up to their greatest index.
 
         Parameters
         ----------
@@ -1105,6 +1506,10 @@ class LinkedList(Extra):
         ┌───┐ ┌───┐ ┌───┐
         │ 1 │⟶│ 3 │⟶│ 5 │⟶
         └───┘ └───┘ └───┘
+        >>> ll[::-2]
+        ┌───┐ ┌───┐ ┌───┐
+        │ 5 │⟶│ 3 │⟶│ 1 │⟶
+        └───┘ └───┘ └───┘
         >>> ll[10]
         IndexError: Given index is out of the boundaries!!
         """
@@ -1112,19 +1517,10 @@ class LinkedList(Extra):
         self._validate_index(idx, accept_negative=True, accept_slice=True)
         if isinstance(idx, slice):
             indices = range(*idx.indices(self._length))
-            max_idx = indices[-1] if indices else -1
-            indices = set(indices)
-            # start getting wanted nodes
-            counter = 0
             prev_node = None
-            curr_node = self._head
             out_llist = self._create_instance()
-            while counter <= max_idx:
-                if counter in indices:
-                    prev_node = out_llist._insert_value(prev_node,
-                                                        curr_node.get_data())
-                curr_node = curr_node.get_next()
-                counter += 1
+            for item in self._iter_slice(indices):
+                prev_node = out_llist._insert_value(prev_node, item)
             return out_llist
         else:
             if idx == self._length:
@@ -1136,6 +1532,135 @@ class LinkedList(Extra):
             _, node = self._get_node(idx)
             return node.get_data()
 
+    def view(self, start=None, stop=None, step=None):
+        """
+        Lazily iterates over the values of the `LinkedList()` instance that
+        `LinkedList()[start:stop:step]` would return without creating a new
+        `LinkedList()`. The arguments follow the same rules as slicing and the
+        values are produced while walking over the `LinkedList()` only once.
+
+        Parameters
+        ----------
+        start: int, optional
+            The index of the first value, default is the first index for
+            positive steps and the last one for negative steps.
+        stop: int, optional
+            The index at which the iteration stops (exclusive), default is the
+            end of the `LinkedList()` in the direction of `step`.
+        step: int, optional
+            The distance between two consecutive values, default 1.
+
+        Returns
+        -------
+        generator:
+            A generator that yields the wanted values.
+
+        Raises
+        ------
+        TypeError:
+            If one of the given arguments isn't an integer.
+        ValueError:
+            If `step` is zero.
+        RuntimeError:
+            If the `LinkedList()` is structurally changed while iterating
+            over the view.
+
+        Example
+        -------
+        >>> ll = LinkedList([1, 2, 3, 4, 5])
+        >>> list(ll.view(1, 4))
+        [2, 3, 4]
+        >>> list(ll.view(step=2))
+        [1, 3, 5]
+        >>> list(ll.view(step=-1))
+        [5, 4, 3, 2, 1]
+        >>> next(ll.view(-2))
+        4
+        """
+        for arg in (start, stop, step):
+            if arg is not None and type(arg) != int:
+                raise TypeError("Slice indices must be integers or `None`!!")
+        if step == 0:
+            raise ValueError("Slice step can't be zero!!")
+        indices = range(*slice(start, stop, step).indices(self._length))
+        return self._iter_slice(indices)
+
+    # =============================    CURSOR    ==============================
+    def iter_cursor(self):
+        """
+        Returns a cursor pointing at the first item of the `LinkedList()`
+        instance in constant time. The cursor can move forward and edit the
+        `LinkedList()` around the item it points at in constant time.
+
+        Returns
+        -------
+        Cursor():
+            A cursor pointing at the head of the `LinkedList()`. If the
+            instance is empty, the cursor will be exhausted.
+
+        Example
+        -------
+        >>> ll = LinkedList([1, 2, 3, 4])
+        >>> cursor = ll.iter_cursor()
+        >>> while not cursor.is_exhausted():
+        ...     if cursor.get_data() % 2 == 0:
+        ...         cursor.remove()
+        ...     else:
+        ...         cursor.advance()
+        >>> ll
+        ┌───┐ ┌───┐
+        │ 1 │⟶│ 3 │⟶
+        └───┘ └───┘
+
+        Note
+        ----
+        Changing the `LinkedList()` by any means other than the cursor itself
+        makes the cursor stale. Using a stale cursor raises `RuntimeError`.
+        """
+        if self.is_empty():
+            # an emptied instance may still keep its old head node
+            return Cursor(self, None, None)
+        return Cursor(self, None, self._head)
+
+    def find(self, value):
+        """
+        Searches the `LinkedList()` for the given value in time-complexity of
+        O(n) where **n** is the number of elements in the `LinkedList()` and
+        returns a cursor pointing at the first item equal to it.
+
+        Parameters
+        ----------
+        value: object
+            The value to be searched for.
+
+        Returns
+        -------
+        Cursor() or None:
+            A cursor pointing at the first match or `None` if the value
+            doesn't exist in the `LinkedList()` instance.
+
+        Example
+        -------
+        >>> ll = LinkedList([1, 2, 3])
+        >>> ll.find(2)
+        Cursor(data: 2)
+        >>> ll.find(2).insert_after(5)
+        >>> ll
+        ┌───┐ ┌───┐ ┌───┐ ┌───┐
+        │ 1 │⟶│ 2 │⟶│ 5 │⟶│ 3 │⟶
+        └───┘ └───┘ └───┘ └───┘
+        >>> ll.find(10) is None
+        True
+        """
+        if value is None:
+            return None
+        prev_node, curr_node = None, self._head
+        for _ in range(self._length):
+            if curr_node.get_data() == value:
+                return Cursor(self, prev_node, curr_node)
+            prev_node, curr_node = curr_node, curr_node.get_next()
+        return None
+
     # =============================    INSERT    ==============================
     def _insert_node(self, prev_node, new_node):
         """
@@ -1173,16 +1698,19 @@ class LinkedList(Extra):
         assert isinstance(new_node, self._basic_node)
         assert new_node.get_data() is not None
 
+        self._version += 1
         # start inserting the node
         if self._length == 0:
             new_node.set_next(None)
-            self._head = new_node
+            self._head = self._tail = new_node
         elif prev_node is None:
             new_node.set_next(self._head)
             self._head = new_node
         else:
             new_node.set_next(prev_node.get_next())
             prev_node.set_next(new_node)
+            if prev_node is self._tail:
+                self._tail = new_node
         self._length += 1
         return new_node
 
@@ -1254,7 +1782,11 @@ class LinkedList(Extra):
         Node(data: 10, next: 2)
         """
         assert 0 <= idx or idx <= self._length
-        prev_node, _ = self._get_node(idx)
+        if idx == self._length and idx > 0:
+            # appending doesn't need to walk the instance
+            prev_node = self._tail
+        else:
+            prev_node, _ = self._get_node(idx)
         if isinstance(item, Node):  # Keep it generic
             assert item.get_data() is not None
             return self._insert_node(prev_node, item)
@@ -1294,7 +1826,7 @@ class LinkedList(Extra):
     def add_end(self, item):
         """
         Adds the given value at the tail of the `LinkedList()` instance in
-        linear time.
+        constant time.
 
         Parameters
         ----------
@@ -1368,8 +1900,8 @@ class LinkedList(Extra):
     def extend(self, other):
         """
         Extends the current `LinkedList()` instance by appending the elements
-        of the other `LinkedList()` instance in time-complexity of O(n) where
-        **n** is the lengh of the current instance.
+        of the other `LinkedList()` instance in constant time. The nodes of
+        the other instance are linked after the tail of the current one.
 
         Parameters
         ----------
@@ -1407,11 +1939,14 @@ class LinkedList(Extra):
             pass  # do nothing
         elif self.is_empty():
             self._head = other._head
+            self._tail = other._tail
             self._length = other._length
+            self._version += 1
         else:
-            last_node, _ = self._get_node(self._length)
-            last_node.set_next(other._head)
+            self._tail.set_next(other._head)
+            self._tail = other._tail
             self._length += other._length
+            self._version += 1
 
     # =============================     SET      ==============================
     def _replace_value(self, idx, new_value):
@@ -1525,6 +2060,7 @@ class LinkedList(Extra):
         assert prev_node is None or isinstance(prev_node, self._basic_node)
         assert isinstance(node_to_be_removed, self._basic_node)
 
+        self._version += 1
         next_node = node_to_be_removed.get_next()
         # if node to be removed is the first
         if prev_node is None:
@@ -1534,8 +2070,12 @@ class LinkedList(Extra):
             else:
                 self._head.set_next(next_node.get_next())
                 self._head.set_data(next_node.get_data())
+                if next_node is self._tail:
+                    self._tail = self._head
         else:
             prev_node.set_next(next_node)
+            if node_to_be_removed is self._tail:
+                self._tail = prev_node
         self._length -= 1
 
     def _remove_idx(self, idx):
@@ -1779,7 +2319,9 @@ class LinkedList(Extra):
         │
         └─
         """
+        version = self._version
         self.__init__()
+        self._version = version + 1
 
     # =============================    SPLIT     ==============================
     def _split(self, idx):
@@ -2068,6 +2610,8 @@ class LinkedList(Extra):
         if not inplace:
             return rotated
         self._head = rotated._head
+        self._tail = rotated._tail
+        self._version += 1
 
     def rotate_right(self, distance, inplace=True):
         """
@@ -2115,6 +2659,277 @@ class LinkedList(Extra):
         if not inplace:
             return rotated
         self._head = rotated._head
+        self._tail = rotated._tail
+        self._version += 1
+
+    # =============================     SORT     ==============================
+    def _set_chain(self, head, tail, length):
+        """
+        Makes the `LinkedList()` instance hold the given chain of nodes. The
+        chain is assumed to be linked from `head` to `tail` through the `next`
+        pointers.
+
+        Parameters
+        ----------
+        head: Node() or None
+            The first node of the chain.
+        tail: Node() or None
+            The last node of the chain.
+        length: int
+            The number of nodes in the chain.
+        """
+        if tail is not None:
+            tail.set_next(None)
+        self._head = head
+        self._tail = tail
+        self._length = length
+        self._version += 1
+
+    def __cut_chain(self, node, length):
+        """
+        Cuts the chain of nodes starting at the given node after `length`
+        nodes.
+
+        Parameters
+        ----------
+        node: Node() or None
+            The first node of the chain.
+        length: int
+            The number of nodes to keep in the chain starting at `node`.
+
+        Returns
+        -------
+        Node() or None:
+            The first node after the cut or `None` if the chain has `length`
+            nodes or less.
+        """
+        for _ in range(length - 1):
+            if node is None:
+                return None
+            node = node.get_next()
+        if node is None:
+            return None
+        rest = node.get_next()
+        node.set_next(None)
+        return rest
+
+    def __merge_chains(self, tail, left, right, key, reverse):
+        """
+        Merges two sorted chains of nodes by relinking them one after another
+        starting from the given `tail` node. The merge is stable, so equal
+        values coming from the `left` chain come first. If comparing the
+        values fails, the remaining nodes are still linked before the error is
+        raised.
+
+        Parameters
+        ----------
+        tail: Node()
+            The node after which the merged chain will be linked.
+        left: Node() or None
+            The first node of the left chain.
+        right: Node() or None
+            The first node of the right chain.
+        key: callable
+            A function that extracts the comparison key from the values.
+        reverse: bool
+            A flag to merge chains sorted in descending order.
+
+        Returns
+        -------
+        Node():
+            The last node of the merged chain.
+        """
+        try:
+            if left is not None and right is not None:
+                left_key = key(left.get_data())
+                right_key = key(right.get_data())
+                while True:
+                    if reverse:
+                        take_right = left_key < right_key
+                    else:
+                        take_right = right_key < left_key
+                    if take_right:
+                        tail.set_next(right)
+                        tail, right = right, right.get_next()
+                        if right is None:
+                            break
+                        right_key = key(right.get_data())
+                    else:
+                        tail.set_next(left)
+                        tail, left = left, left.get_next()
+                        if left is None:
+                            break
+                        left_key = key(left.get_data())
+        finally:
+            # link the remaining nodes of both chains
+            for rest in (left, right):
+                tail.set_next(rest)
+                while tail.get_next() is not None:
+                    tail = tail.get_next()
+        return tail
+
+    def __validate_sort_args(self, key, reverse):
+        """
+        Checks the validity of the arguments of `sort()` and `merge_sorted()`.
+
+        Parameters
+        ----------
+        key: callable or None
+            A function that extracts the comparison key from the values.
+        reverse: bool
+            A flag to sort in descending order.
+
+        Returns
+        -------
+        callable:
+            The function to be used to extract the comparison keys.
+
+        Raises
+        ------
+        TypeError:
+            If `key` isn't callable or `reverse` isn't boolean.
+        """
+        if key is not None and not callable(key):
+            raise TypeError("`key` must be a callable or `None`!!")
+        if type(reverse) != bool:
+            raise TypeError("`reverse` is a boolean flag (False by default)!!")
+        return key if key is not None else (lambda value: value)
+
+    def sort(self, key=None, reverse=False):
+        """
+        Sorts the `LinkedList()` instance in-place in time-complexity of
+        O(n log(n)) where **n** is the number of elements in the
+        `LinkedList()`. It uses a bottom-up merge sort that relinks the
+        existing nodes, so no nodes are created and the sort is stable.
+
+        Parameters
+        ----------
+        key: callable, optional
+            A function of one argument that extracts the comparison key from
+            each value, default `None` which compares the values directly.
+        reverse: bool, optional
+            A flag to sort the values in descending order, default `False`.
+
+        Raises
+        ------
+        TypeError:
+            If `key` isn't callable, `reverse` isn't boolean or the values
+            can't be compared.
+
+        Example
+        -------
+        >>> ll = LinkedList([3, 1, 20, 2])
+        >>> ll.sort()
+        >>> ll
+        ┌───┐ ┌───┐ ┌───┐ ┌────┐
+        │ 1 │⟶│ 2 │⟶│ 3 │⟶│ 20 │⟶
+        └───┘ └───┘ └───┘ └────┘
+        >>> ll.sort(key=str, reverse=True)
+        >>> ll
+        ┌───┐ ┌────┐ ┌───┐ ┌───┐
+        │ 3 │⟶│ 20 │⟶│ 2 │⟶│ 1 │⟶
+        └───┘ └────┘ └───┘ └───┘
+        """
+        key = self.__validate_sort_args(key, reverse)
+        if self._length < 2:
+            return
+        # the merged chains are linked after a placeholder node
+        sentinel = self._basic_node(0)
+        curr_node = self._head
+        self._tail.set_next(None)
+        width = 1
+        try:
+            while width < self._length:
+                tail = sentinel
+                while curr_node is not None:
+                    left = curr_node
+                    right = self.__cut_chain(left, width)
+                    curr_node = self.__cut_chain(right, width)
+                    tail = self.__merge_chains(tail, left, right, key, reverse)
+                curr_node = sentinel.get_next()
+                width *= 2
+        except Exception:
+            # keep all nodes within the list before raising the error
+            while tail.get_next() is not None:
+                tail = tail.get_next()
+            tail.set_next(curr_node)
+            while tail.get_next() is not None:
+                tail = tail.get_next()
+            self._set_chain(sentinel.get_next(), tail, self._length)
+            raise
+        self._set_chain(curr_node, tail, self._length)
+
+    def merge_sorted(self, other, key=None, reverse=False):
+        """
+        Merges the nodes of another sorted `LinkedList()` into the current
+        sorted one in time-complexity of O(n+m) where **n** and **m** are the
+        number of elements in the current and the other `LinkedList()`
+        respectively. The nodes are relinked without creating new ones, so the
+        other `LinkedList()` becomes empty afterwards.
+
+        Parameters
+        ----------
+        other: LinkedList()
+            A sorted `LinkedList()` instance whose nodes will be merged.
+        key: callable, optional
+            The function that both instances are sorted by, default `None`.
+        reverse: bool, optional
+            A flag showing that both instances are sorted in descending order,
+            default `False`.
+
+        Raises
+        ------
+        TypeError:
+            If the given object isn't a `LinkedList()` instance, `key` isn't
+            callable or `reverse` isn't boolean.
+        ValueError:
+            If the given object is the current instance itself.
+
+        Example
+        -------
+        >>> ll_1 = LinkedList([1, 4, 6])
+        >>> ll_2 = LinkedList([2, 3, 7])
+        >>> ll_1.merge_sorted(ll_2)
+        >>> ll_1
+        ┌───┐ ┌───┐ ┌───┐ ┌───┐ ┌───┐ ┌───┐
+        │ 1 │⟶│ 2 │⟶│ 3 │⟶│ 4 │⟶│ 6 │⟶│ 7 │⟶
+        └───┘ └───┘ └───┘ └───┘ └───┘ └───┘
+        >>> ll_2.is_empty()
+        True
+
+        Note
+        ----
+        Both instances must be sorted in the same order, otherwise the order
+        of the merged values isn't defined.
+        """
+        if type(other) is not type(self):
+            raise TypeError(
+                "Type Mismatch! "
+                + f"Can't merge `{self.__name__}` with `{type(other)}`!!"
+            )
+        elif other is self:
+            raise ValueError(f"Can't merge `{self.__name__}` with itself!!")
+        key = self.__validate_sort_args(key, reverse)
+        if other.is_empty():
+            return
+        length = self._length + other._length
+        # an emptied instance may still keep its old head node
+        head = None if self.is_empty() else self._head
+        if head is not None:
+            self._tail.set_next(None)
+        other._tail.set_next(None)
+        # the merged chain is linked after a placeholder node
+        sentinel = tail = self._basic_node(0)
+        try:
+            tail = self.__merge_chains(
+                sentinel, head, other._head, key, reverse
+            )
+        finally:
+            # the nodes are kept linked even if comparing the values failed
+            while tail.get_next() is not None:
+                tail = tail.get_next()
+            self._set_chain(sentinel.get_next(), tail, length)
+            other.clear()
 
     # =============================     MISC     ==============================
     def reverse(self):
@@ -30,6 +30,7 @@ class PriorityNode(DoublyNode):
     """A priority node is the basic unit for building priority queues."""
 
     __name__ = "extra.DoublyNode()"
+    __slots__ = ("_priority", "_order", "_min_idx", "_max_idx")
 
     def __init__(self, item, priority=None):
         """
@@ -51,13 +52,23 @@ class PriorityNode(DoublyNode):
         ValueError: If the given item is `None`.
         TypeError: If the given item is an `Extra` object.
         """
-        if priority is not None and type(priority) not in {int, float}:
+        if (
+            not self.TRUSTED
+            and priority is not None
+            and type(priority) not in {int, float}
+        ):
             raise TypeError("Given priority has to be a number!!")
         super()._validate_item(item)
         super().__init__(item)
         self._priority = (
             random.randint(0, 100) if priority is None else priority
         )
+        # NOTE: the following are maintained by `PriorityQueue()`. `_order` is
+        # the insertion order used to break ties, and `_min_idx`, `_max_idx`
+        # are the positions of the node within the two underlying heaps.
+        self._order = 0
+        self._min_idx = None
+        self._max_idx = None
 
     def get_priority(self):
         """
@@ -193,6 +204,11 @@ class PriorityQueue(Queue):
         super().__init__(max_capacity)
         self._min_priority = float("inf")
         self._max_priority = float("-inf")
+        # two binary heaps of the same nodes: one ordered by the lowest
+        # priority and the other by the highest one.
+        self._min_heap = []
+        self._max_heap = []
+        self._counter = 0
 
     # =============================     PRINT    ==============================
     def __repr__(self):
@@ -314,13 +330,19 @@ class PriorityQueue(Queue):
         TypeError:
             If the given priority value isn't a number.
         """
-        if new_priority is not None and type(new_priority) not in {int, float}:
+        if self.TRUSTED:
+            return
+        elif (
+            new_priority is not None
+            and type(new_priority) not in {int, float}
+        ):
             raise TypeError("Given priority has to be a number!!")
 
     def enqueue(self, item, priority=None):
         """
         Inserts the given `item` to the end of the `PriorityQueue()`, it does
-        that in constant time.
+        that in time-complexity of O(log(n)) where **n** is the number of
+        elements in the `PriorityQueue()` instance.
 
         Parameters
         ----------
@@ -368,10 +390,116 @@ class PriorityQueue(Queue):
         """
         super()._validate_item(item)
         self.__validate_priority(priority)
-        node = PriorityNode(item, priority)
-        self._min_priority = min(self._min_priority, node.get_priority())
-        self._max_priority = max(self._max_priority, node.get_priority())
-        super()._enqueue(node)
+        if self.is_full():
+            warnings.warn(
+                f"Enqueuing to a full `{self.__name__}` "
+                + "could lead to missing values!!",
+                UserWarning,
+            )
+            if not self.is_empty():
+                # drop the first inserted item
+                self._remove_node(self._container._tail)
+        if self._max_capacity > 0:
+            node = PriorityNode(item, priority)
+            node._order = self._counter
+            self._counter += 1
+            self._container._insert_node(None, node)
+            self.__heap_push(node, is_min_heap=True)
+            self.__heap_push(node, is_min_heap=False)
+        self._update_min_priority()
+        self._update_max_priority()
+
+    def enqueue_many(self, items, priorities=None):
+        """
+        Inserts the given items to the end of the `PriorityQueue()`, one after
+        the other. The items and their priorities are validated and the
+        capacity is checked once, before any of them is inserted. When the
+        items are at least as many as the ones already in the instance, both
+        heaps are rebuilt bottom-up in linear time, otherwise each item is
+        pushed in time-complexity of O(log(n)).
+
+        Parameters
+        ----------
+        items: iterable
+            The python objects to be pushed to the `PriorityQueue()`.
+        priorities: iterable, optional
+            The priorities of the given items in the same order. If
+            `priorities=None`, then a random integer number will be assigned
+            to each item.
+
+        Raises
+        ------
+        UserWarning:
+            If the items don't fit in the `PriorityQueue()` instance!! It's
+            raised only once, then the first inserted items are dropped.
+        ValueError:
+            If one of the given items is `None`, or if the number of the
+            given priorities isn't the same as the number of items.
+        TypeError:
+            It can be raised due to one of the following reasons:
+                1. If one of the given items is an instance of `Extra`.
+                2. If one of the given priorities isn't a number.
+
+        Example
+        -------
+        >>> pq = PriorityQueue()
+        >>> pq.enqueue_many([10, 20, 30], priorities=[1, 3, 2])
+        >>> PriorityQueue.SHOW_PRIORITY = True
+        >>> pq
+        ─┬────────┬────────┬────────┬─
+        ⟶│ 30|P:2 │ 20|P:3 │ 10|P:1 │⟶
+        ─┴────────┴────────┴────────┴─
+        >>> pq.dequeue()
+        20
+        """
+        items = list(items)
+        if priorities is None:
+            priorities = [None] * len(items)
+        else:
+            priorities = list(priorities)
+            if len(priorities) != len(items):
+                raise ValueError(
+                    "Given priorities have to be as many as the items!!"
+                )
+        if not self.TRUSTED:
+            for item, priority in zip(items, priorities):
+                super()._validate_item(item)
+                self.__validate_priority(priority)
+        overflow = len(self) + len(items) - self._max_capacity
+        if overflow > 0:
+            warnings.warn(
+                f"Enqueuing to a full `{self.__name__}` "
+                + "could lead to missing values!!",
+                UserWarning,
+            )
+            if len(items) >= self._max_capacity:
+                # only the newest items that fit are kept
+                start = len(items) - self._max_capacity
+                items, priorities = items[start:], priorities[start:]
+                self.clear()
+            else:
+                for _ in range(overflow):
+                    # drop the first inserted item
+                    self._remove_node(self._container._tail)
+        rebuild = len(items) >= len(self)
+        for item, priority in zip(items, priorities):
+            node = PriorityNode(item, priority)
+            node._order = self._counter
+            self._counter += 1
+            self._container._insert_node(None, node)
+            if rebuild:
+                node._min_idx = len(self._min_heap)
+                node._max_idx = len(self._max_heap)
+                self._min_heap.append(node)
+                self._max_heap.append(node)
+            else:
+                self.__heap_push(node, is_min_heap=True)
+                self.__heap_push(node, is_min_heap=False)
+        if rebuild:
+            self.__heapify(is_min_heap=True)
+            self.__heapify(is_min_heap=False)
+        self._update_min_priority()
+        self._update_max_priority()
 
     # =============================      TOP     ==============================
     def top(self):
@@ -405,41 +533,220 @@ class PriorityQueue(Queue):
         """
         return super().top()
 
+    # =============================     HEAP     ==============================
+    def __is_before(self, node, other_node, is_min_heap):
+        """
+        Checks if `node` should be closer to the root of the heap than
+        `other_node`. Ties between equal priorities are broken by the
+        insertion order, so the first inserted node comes first.
+
+        Parameters
+        ----------
+        node: PriorityNode()
+            The first node to be compared.
+        other_node: PriorityNode()
+            The second node to be compared.
+        is_min_heap: bool
+            A flag to tell which heap is being used. `True` for the heap of
+            the lowest priority and `False` for the heap of the highest one.
+
+        Returns
+        -------
+        bool:
+            `True` if `node` comes before `other_node` and `False` otherwise.
+        """
+        priority = node._priority
+        other_priority = other_node._priority
+        if priority == other_priority:
+            return node._order < other_node._order
+        elif is_min_heap:
+            return priority < other_priority
+        else:
+            return priority > other_priority
+
+    def __set_heap_idx(self, node, idx, is_min_heap):
+        """
+        Stores the position of the given node within one of the two heaps.
+
+        Parameters
+        ----------
+        node: PriorityNode()
+            The node whose position will be stored.
+        idx: int or None
+            The index of the node inside the heap, or `None` when the node
+            isn't part of the heap anymore.
+        is_min_heap: bool
+            A flag to tell which heap is being used.
+        """
+        if is_min_heap:
+            node._min_idx = idx
+        else:
+            node._max_idx = idx
+
+    def __sift_up(self, heap, idx, is_min_heap):
+        """
+        Moves the node at the given index up the given heap till the
+        heap-order property is satisfied.
+
+        Parameters
+        ----------
+        heap: list
+            Either `_min_heap` or `_max_heap`.
+        idx: int
+            The index of the node to be moved.
+        is_min_heap: bool
+            A flag to tell which heap is being used.
+        """
+        node = heap[idx]
+        while idx > 0:
+            parent_idx = (idx - 1) // 2
+            parent = heap[parent_idx]
+            if not self.__is_before(node, parent, is_min_heap):
+                break
+            heap[idx] = parent
+            self.__set_heap_idx(parent, idx, is_min_heap)
+            idx = parent_idx
+        heap[idx] = node
+        self.__set_heap_idx(node, idx, is_min_heap)
+
+    def __sift_down(self, heap, idx, is_min_heap):
+        """
+        Moves the node at the given index down the given heap till the
+        heap-order property is satisfied.
+
+        Parameters
+        ----------
+        heap: list
+            Either `_min_heap` or `_max_heap`.
+        idx: int
+            The index of the node to be moved.
+        is_min_heap: bool
+            A flag to tell which heap is being used.
+        """
+        length = len(heap)
+        node = heap[idx]
+        while True:
+            child_idx = (idx * 2) + 1
+            if child_idx >= length:
+                break
+            r_child_idx = child_idx + 1
+            if r_child_idx < length and self.__is_before(
+                heap[r_child_idx], heap[child_idx], is_min_heap
+            ):
+                child_idx = r_child_idx
+            child = heap[child_idx]
+            if not self.__is_before(child, node, is_min_heap):
+                break
+            heap[idx] = child
+            self.__set_heap_idx(child, idx, is_min_heap)
+            idx = child_idx
+        heap[idx] = node
+        self.__set_heap_idx(node, idx, is_min_heap)
+
+    def __heap_push(self, node, is_min_heap):
+        """
+        Pushes the given node to one of the two heaps in time-complexity of
+        O(log(n)).
+
+        Parameters
+        ----------
+        node: PriorityNode()
+            The node to be pushed.
+        is_min_heap: bool
+            A flag to tell which heap is being used.
+        """
+        heap = self._min_heap if is_min_heap else self._max_heap
+        heap.append(node)
+        self.__sift_up(heap, len(heap) - 1, is_min_heap)
+
+    def __heapify(self, is_min_heap):
+        """
+        Restores the heap-order property of one of the two heaps in linear
+        time by sifting down every parent node, starting from the last one.
+
+        Parameters
+        ----------
+        is_min_heap: bool
+            A flag to tell which heap is being used.
+        """
+        heap = self._min_heap if is_min_heap else self._max_heap
+        for idx in reversed(range(len(heap) // 2)):
+            self.__sift_down(heap, idx, is_min_heap)
+
+    def __heap_remove(self, node, is_min_heap):
+        """
+        Removes the given node from one of the two heaps in time-complexity of
+        O(log(n)) using the position stored within the node.
+
+        Parameters
+        ----------
+        node: PriorityNode()
+            The node to be removed.
+        is_min_heap: bool
+            A flag to tell which heap is being used.
+        """
+        heap = self._min_heap if is_min_heap else self._max_heap
+        idx = node._min_idx if is_min_heap else node._max_idx
+        last_node = heap.pop()
+        self.__set_heap_idx(node, None, is_min_heap)
+        if last_node is not node:
+            heap[idx] = last_node
+            self.__sift_down(heap, idx, is_min_heap)
+            self.__sift_up(heap, last_node._min_idx if is_min_heap
+                           else last_node._max_idx, is_min_heap)
+
+    def _remove_node(self, node):
+        """
+        Removes the given node from the `PriorityQueue()` instance in
+        time-complexity of O(log(n)) where **n** is the number of elements in
+        the instance.
+
+        Parameters
+        ----------
+        node: PriorityNode()
+            The node to be removed.
+        """
+        self._container._remove_node(node.get_prev(), node)
+        self.__heap_remove(node, is_min_heap=True)
+        self.__heap_remove(node, is_min_heap=False)
+
     # =============================    DEQUEUE   ==============================
     def _update_min_priority(self):
         """
-        Updates the value of `_min_priority` member variable by iterating over
-        the `PriorityQueue()` instance and assigns it to the lowest priority.
-        If the `PriorityQueue()` is empty, then the value of `_min_priority`
-        will be `inf`.
+        Updates the value of `_min_priority` member variable in constant time
+        by reading the root of the lowest-priority heap. If the
+        `PriorityQueue()` is empty, then the value of `_min_priority` will be
+        `inf`.
         """
-        self._min_priority = float("inf")
-        if not self.is_empty():
-            curr_node = self._container._head
-            while curr_node is not None:
-                self._min_priority = min(curr_node.get_priority(),
-                                         self._min_priority)
-                curr_node = curr_node.get_next()
+        self._min_priority = (
+            self._min_heap[0].get_priority() if self._min_heap
+            else float("inf")
+        )
 
     def _update_max_priority(self):
         """
-        Updates the value of `_max_priority` member variable by iterating over
-        the `PriorityQueue()` instance and assigns it to the highest priority.
-        If the `PriorityQueue()` is empty, then the value of `_max_priority`
-        will be `-inf`.
+        Updates the value of `_max_priority` member variable in constant time
+        by reading the root of the highest-priority heap. If the
+        `PriorityQueue()` is empty, then the value of `_max_priority` will be
+        `-inf`.
         """
-        self._max_priority = float("-inf")
-        if not self.is_empty():
-            curr_node = self._container._head
-            while curr_node is not None:
-                self._max_priority = max(curr_node.get_priority(),
-                                         self._max_priority)
-                curr_node = curr_node.get_next()
+        self._max_priority = (
+            self._max_heap[0].get_priority() if self._max_heap
+            else float("-inf")
+        )
 
     def dequeue(self, lowest_priority=False):
         """
         Pops the item that has the highest priority from the `PriorityQueue()`
-        instance in constant time.
+        instance in time-complexity of O(log(n)) where **n** is the number of
+        elements in the `PriorityQueue()` instance. When more than one item
+        share the same priority, the first inserted one is popped first.
+
+        Parameters
+        ----------
+        lowest_priority: bool
+            A flag to pop the item that has the lowest priority instead of the
+            highest one (default: `False`).
 
         Returns
         -------
@@ -475,25 +782,74 @@ class PriorityQueue(Queue):
                 f"Dequeuing from an empty `{self.__name__}`!!", UserWarning
             )
             return
+        if lowest_priority:
+            node = self._min_heap[0]
         else:
-            curr_node = self._container._head
-            while curr_node is not None:
-                if lowest_priority:
-                    if curr_node.get_priority() == self._min_priority:
-                        node_data = curr_node.get_data()
-                        self._container._remove_node(curr_node.get_prev(),
-                                                     curr_node)
-                        self._update_min_priority()
-                        break
-                else:
-                    if curr_node.get_priority() == self._max_priority:
-                        node_data = curr_node.get_data()
-                        self._container._remove_node(curr_node.get_prev(),
-                                                     curr_node)
-                        self._update_max_priority()
-                        break
-                curr_node = curr_node.get_next()
-        return node_data
+            node = self._max_heap[0]
+        self._remove_node(node)
+        self._update_min_priority()
+        self._update_max_priority()
+        return node.get_data()
+
+    def dequeue_many(self, count, lowest_priority=False):
+        """
+        Pops the given number of items that have the highest priorities from
+        the `PriorityQueue()` instance in time-complexity of O(k*log(n))
+        where **k** is the given `count` and **n** is the number of elements
+        in the `PriorityQueue()` instance.
+
+        Parameters
+        ----------
+        count: int
+            The number of items to be popped.
+        lowest_priority: bool
+            A flag to pop the items that have the lowest priorities instead of
+            the highest ones (default: `False`).
+
+        Returns
+        -------
+        list:
+            The popped items in the order `dequeue()` would have popped them.
+            It holds fewer items than `count` if the `PriorityQueue()`
+            instance doesn't have enough of them.
+
+        Raises
+        ------
+        UserWarning:
+            If the `PriorityQueue()` instance has fewer items than `count`!!
+        TypeError:
+            If the given `count` isn't an integer.
+        ValueError:
+            If the given `count` is negative.
+
+        Example
+        -------
+        >>> pq = PriorityQueue()
+        >>> pq.enqueue_many([10, 20, 30], priorities=[1, 3, 2])
+        >>> pq.dequeue_many(2)
+        [20, 30]
+        >>> pq.dequeue_many(2)
+        UserWarning: Dequeuing 2 items from `extra.PriorityQueue()` of only \
+            1 items!!
+        [10]
+        """
+        self._validate_count(count)
+        if count > len(self):
+            warnings.warn(
+                f"Dequeuing {count} items from `{self.__name__}` of only "
+                + f"{len(self)} items!!",
+                UserWarning,
+            )
+            count = len(self)
+        heap = self._min_heap if lowest_priority else self._max_heap
+        items = []
+        for _ in range(count):
+            node = heap[0]
+            self._remove_node(node)
+            items.append(node.get_data())
+        self._update_min_priority()
+        self._update_max_priority()
+        return items
 
     def clear(self):
         """
@@ -526,3 +882,8 @@ class PriorityQueue(Queue):
         the cleared instance remains the same as the one before.
         """
         super().clear()
+        self._min_heap = []
+        self._max_heap = []
+        self._counter = 0
+        self._update_min_priority()
+        self._update_max_priority()
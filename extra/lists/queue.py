@@ -6,9 +6,11 @@ but only the element that has been in the queue the longest can be next
 removed. We usually say that elements enter a queue at the back and are removed
 from the front.
 """
+import threading
 import warnings
 from extra.interface import Extra
-from extra.lists.doubly_linked_list import DoublyLinkedList
+from extra.lists.doubly_linked_list import DoublyNode, DoublyLinkedList
+from extra.lists._ring_buffer import RingBuffer
 
 
 class Queue(Extra):
@@ -22,8 +24,20 @@ class Queue(Extra):
     """
 
     __name__ = "extra.Queue()"
+    _OVERFLOW_POLICIES = {
+        "warn", "drop_oldest", "drop_newest", "raise", "block"
+    }
+    _EMPTY_POLICIES = {"warn", "sentinel", "raise"}
 
-    def __init__(self, max_capacity=float("inf")):
+    def __init__(
+        self,
+        max_capacity=float("inf"),
+        backend="linked",
+        overflow="warn",
+        empty="warn",
+        sentinel=None,
+        timeout=None,
+    ):
         """
         Creates a `Queue()` object!!
 
@@ -32,11 +46,45 @@ class Queue(Extra):
         max_capacity: int
             It's a positive integer representing the maximum number of elements
             a `Queue()` should contain (Default: inf).
+        backend: str
+            The container used to store the elements (Default: "linked").
+            `"linked"` stores every element in a `DoublyNode()` of a
+            `DoublyLinkedList()`, while `"array"` stores them in a growable
+            ring buffer which takes a fraction of the memory and is faster.
+            When `max_capacity` is finite, the ring buffer has a fixed size
+            and it's allocated once, here, so enqueuing never allocates.
+        overflow: str
+            What happens when an item is added to a full `Queue()`
+            (Default: "warn"). It can be one of the following:
+                1. `"warn"`: warns then drops the oldest item.
+                2. `"drop_oldest"`: drops the oldest item silently.
+                3. `"drop_newest"`: discards the new item silently.
+                4. `"raise"`: raises an `OverflowError`.
+                5. `"block"`: waits for another thread to remove an item.
+        empty: str
+            What happens when an item is removed from an empty `Queue()`
+            (Default: "warn"). It can be one of the following:
+                1. `"warn"`: warns then returns `sentinel`.
+                2. `"sentinel"`: returns `sentinel` silently.
+                3. `"raise"`: raises an `IndexError`.
+        sentinel: object
+            The object returned when removing from an empty `Queue()`
+            (Default: None).
+        timeout: int or float, optional
+            The maximum number of seconds the `"block"` overflow policy waits
+            before raising an `OverflowError`. `None` means waiting forever
+            (Default: None).
 
         Raises
         ------
-        TypeError: If the type of `max_capacity` isn't `int` or `float`.
-        ValueError: If the given value of `max_capacity` is less than zero.
+        TypeError: It can be raised in two cases
+            1. If the type of `max_capacity` isn't `int` or `float`.
+            2. If the given `timeout` is neither `None` nor a number.
+        ValueError: It can be raised in four cases
+            1. If the given value of `max_capacity` is less than zero.
+            2. If the given `backend` is neither `"linked"` nor `"array"`.
+            3. If the given `overflow` or `empty` isn't a known policy.
+            4. If the given `timeout` is negative.
 
         Example
         -------
@@ -52,8 +100,28 @@ class Queue(Extra):
         >>> q._max_capacity
         10
 
+        And you can store the elements in a ring buffer instead of linked
+        nodes:
+
+        >>> q = Queue(backend="array")
+        >>> q._backend
+        'array'
+
+        And you can choose what happens when the queue is full or empty:
+
+        >>> q = Queue(1, overflow="raise", empty="sentinel", sentinel=-1)
+        >>> q.dequeue()
+        -1
+        >>> q.enqueue(10)
+        >>> q.enqueue(20)
+        OverflowError: Can't enqueue to a full `extra.Queue()`!!
+
         Note
         ----
+        A bounded `Queue()` only avoids allocating per element with the
+        `"array"` backend, e.g. `Queue(1000, backend="array")`. The default
+        `"linked"` backend creates a new node for every element it stores.
+
         If you passed a `float` number as the maximum capacity, then the value
         that get assigned is the rounding of that number:
 
@@ -69,12 +137,565 @@ class Queue(Extra):
             raise ValueError(
                 f"Max capacity of `{self.__name__}` has to be >= 0"
             )
-        self._container = DoublyLinkedList()
+        elif backend not in {"linked", "array"}:
+            raise ValueError(
+                f"Backend of `{self.__name__}` has to be either `linked` or "
+                + "`array`!!"
+            )
+        elif overflow not in self._OVERFLOW_POLICIES:
+            raise ValueError(
+                f"Overflow policy of `{self.__name__}` has to be one of "
+                + f"{sorted(self._OVERFLOW_POLICIES)}!!"
+            )
+        elif empty not in self._EMPTY_POLICIES:
+            raise ValueError(
+                f"Empty policy of `{self.__name__}` has to be one of "
+                + f"{sorted(self._EMPTY_POLICIES)}!!"
+            )
+        elif timeout is not None and type(timeout) not in {int, float}:
+            raise TypeError(
+                f"Timeout of `{self.__name__}` has to be a number!!"
+            )
+        elif timeout is not None and timeout < 0:
+            raise ValueError(f"Timeout of `{self.__name__}` has to be >= 0")
         self._max_capacity = (
           round(max_capacity) if max_capacity != float("inf") else max_capacity
         )
+        self._backend = backend
+        self._container = self._create_container()
+        self._overflow = overflow
+        self._empty = empty
+        self._sentinel = sentinel
+        self._timeout = timeout
+        # only the "block" policy needs other threads to wake up the enqueuers
+        self._not_full = threading.Condition() if overflow == "block" else None
+
+    # =============================   CONTAINER  ==============================
+    def _create_container(self):
+        """
+        Creates the empty container storing the elements of the instance
+        according to its backend and maximum capacity.
+
+        Returns
+        -------
+        DoublyLinkedList or RingBuffer:
+            A `DoublyLinkedList()` for the `"linked"` backend, otherwise a
+            `RingBuffer()` whose capacity is fixed if the maximum capacity is
+            finite.
+        """
+        if self._backend == "linked":
+            return DoublyLinkedList()
+        elif self._max_capacity == float("inf"):
+            return RingBuffer()
+        return RingBuffer(self._max_capacity)
+
+    def _push_left(self, item):
+        """
+        Adds the given item to the left end of the container in constant time.
+
+        Parameters
+        ----------
+        item: object
+            The python object to be added.
+        """
+        if self._backend == "array":
+            self._container.append_left(item)
+        else:
+            self._container._insert(0, item)
+
+    def _push_right(self, item):
+        """
+        Adds the given item to the right end of the container in constant
+        time.
+
+        Parameters
+        ----------
+        item: object
+            The python object to be added.
+        """
+        if self._backend == "array":
+            self._container.append_right(item)
+        else:
+            self._container._insert(len(self), item)
+
+    def _peek_left(self):
+        """
+        Returns the left-most item of the non-empty container in constant
+        time.
+
+        Returns
+        -------
+        object:
+            The left-most item which is the last enqueued one.
+        """
+        if self._backend == "array":
+            return self._container.get_left()
+        return self._container._head.get_data()
+
+    def _peek_right(self):
+        """
+        Returns the right-most item of the non-empty container in constant
+        time.
+
+        Returns
+        -------
+        object:
+            The right-most item which is the first enqueued one.
+        """
+        if self._backend == "array":
+            return self._container.get_right()
+        return self._container._tail.get_data()
+
+    def _pop_left(self):
+        """
+        Removes and returns the left-most item of the non-empty container in
+        constant time.
+
+        Returns
+        -------
+        object:
+            The left-most item which is the last enqueued one.
+        """
+        if self._backend == "array":
+            return self._container.pop_left()
+        head_value = self._container._head.get_data()
+        self._container.remove_front()
+        return head_value
+
+    def _pop_right(self):
+        """
+        Removes and returns the right-most item of the non-empty container in
+        constant time.
+
+        Returns
+        -------
+        object:
+            The right-most item which is the first enqueued one.
+        """
+        if self._backend == "array":
+            return self._container.pop_right()
+        tail_value = self._container._tail.get_data()
+        self._container.remove_end()
+        return tail_value
+
+    def _push_many_left(self, items):
+        """
+        Adds the given items to the left end of the container, one after the
+        other, in linear time. The linked nodes are chained together and
+        attached to the container once.
+
+        Parameters
+        ----------
+        items: list
+            The valid python objects to be added. The last one ends up
+            left-most.
+        """
+        if self._backend == "array":
+            self._container.extend_left(items)
+            return
+        container = self._container
+        head, tail = container._head, container._tail
+        for item in items:
+            node = DoublyNode(item)
+            if head is None:
+                tail = node
+            else:
+                node.set_next(head)
+            head = node
+        container._set_chain(head, tail, container._length + len(items))
+
+    def _push_many_right(self, items):
+        """
+        Adds the given items to the right end of the container, one after the
+        other, in linear time. The linked nodes are chained together and
+        attached to the container once.
+
+        Parameters
+        ----------
+        items: list
+            The valid python objects to be added. The last one ends up
+            right-most.
+        """
+        if self._backend == "array":
+            self._container.extend_right(items)
+            return
+        container = self._container
+        head, tail = container._head, container._tail
+        for item in items:
+            node = DoublyNode(item)
+            if tail is None:
+                head = node
+            else:
+                tail.set_next(node)
+            tail = node
+        container._set_chain(head, tail, container._length + len(items))
+
+    def _pop_many_left(self, count):
+        """
+        Removes and returns the given number of items from the left end of
+        the container in linear time.
+
+        Parameters
+        ----------
+        count: int
+            The number of items to be removed, which can't be more than the
+            length of the container.
+
+        Returns
+        -------
+        list:
+            The removed items, the left-most one first.
+        """
+        if self._backend == "array":
+            return self._container.pop_left_many(count)
+        container = self._container
+        items = []
+        node = container._head
+        for _ in range(count):
+            items.append(node.get_data())
+            node = node.get_next()
+        container._set_chain(
+            node,
+            None if node is None else container._tail,
+            container._length - count,
+        )
+        return items
+
+    def _pop_many_right(self, count):
+        """
+        Removes and returns the given number of items from the right end of
+        the container in linear time.
+
+        Parameters
+        ----------
+        count: int
+            The number of items to be removed, which can't be more than the
+            length of the container.
+
+        Returns
+        -------
+        list:
+            The removed items, the right-most one first.
+        """
+        if self._backend == "array":
+            return self._container.pop_right_many(count)
+        container = self._container
+        items = []
+        node = container._tail
+        for _ in range(count):
+            items.append(node.get_data())
+            node = node.get_prev()
+        container._set_chain(
+            None if node is None else container._head,
+            node,
+            container._length - count,
+        )
+        return items
+
+    # =============================    POLICY    ==============================
+    def _make_room(self, drop_oldest):
+        """
+        Applies the overflow policy of the full `Queue()` instance before a
+        new item gets added. Only the `"warn"` policy warns, so the other ones
+        stay cheap when the instance is full most of the time.
+
+        Parameters
+        ----------
+        drop_oldest: callable
+            The container method that removes the item at the opposite end to
+            where the new item is going to be added.
+
+        Returns
+        -------
+        bool:
+            `True` if the new item should be added and `False` if it should be
+            discarded.
+
+        Raises
+        ------
+        UserWarning:
+            If the overflow policy is `"warn"`.
+        OverflowError:
+            If the overflow policy is `"raise"`, or if it's `"block"` and no
+            item was removed within the timeout.
+        """
+        if self._overflow == "block":
+            # NOTE: the caller holds `self._not_full` which `wait_for` releases
+            # till another thread removes an item
+            if not self._not_full.wait_for(
+                lambda: not self.is_full(), self._timeout
+            ):
+                raise OverflowError(
+                    f"Timed out enqueuing to a full `{self.__name__}`!!"
+                )
+            return True
+        elif self._overflow == "raise":
+            raise OverflowError(f"Can't enqueue to a full `{self.__name__}`!!")
+        elif self._overflow == "drop_newest":
+            return False
+        elif self._overflow == "warn":
+            warnings.warn(
+                f"Enqueuing to a full `{self.__name__}` "
+                + "could lead to missing values!!",
+                UserWarning,
+            )
+        if self.is_empty():
+            # a `Queue()` whose maximum capacity is zero
+            return False
+        drop_oldest()
+        return True
+
+    def _add(self, item, push, drop_oldest):
+        """
+        Adds the given item to the container in constant time after applying
+        the overflow policy if the `Queue()` instance is full.
+
+        Parameters
+        ----------
+        item: object
+            The python object to be added.
+        push: callable
+            The container method that adds the item to one of its ends.
+        drop_oldest: callable
+            The container method that removes the item at the other end.
+        """
+        if self._not_full is None:
+            if not self.is_full() or self._make_room(drop_oldest):
+                push(item)
+            return
+        with self._not_full:
+            if not self.is_full() or self._make_room(drop_oldest):
+                push(item)
+
+    def _add_many(self, items, push_many, drop_oldest_many):
+        """
+        Adds the given items to the container in linear time after applying
+        the overflow policy once if they don't fit in the `Queue()` instance.
+        The result is the same as adding them one by one, except that the
+        `"warn"` policy warns once and the `"raise"` policy adds none of them.
+
+        Parameters
+        ----------
+        items: list
+            The valid python objects to be added.
+        push_many: callable
+            The method that adds the items to one of the container's ends.
+        drop_oldest_many: callable
+            The method that removes a number of items from the other end.
+
+        Raises
+        ------
+        UserWarning:
+            If the items don't fit and the overflow policy is `"warn"`.
+        OverflowError:
+            If the items don't fit and the overflow policy is `"raise"`, or if
+            it's `"block"` and no item was removed within the timeout.
+        """
+        if self._not_full is None:
+            self.__add_many(items, push_many, drop_oldest_many)
+            return
+        with self._not_full:
+            self.__add_many(items, push_many, drop_oldest_many)
+
+    def __add_many(self, items, push_many, drop_oldest_many):
+        """
+        Does the job of `_add_many()` while holding the lock, if any.
+        """
+        room = self._max_capacity - len(self)
+        if len(items) <= room:
+            push_many(items)
+        elif self._overflow == "block":
+            while items:
+                if self.is_full():
+                    # NOTE: the "block" policy never drops an item
+                    self._make_room(None)
+                room = self._max_capacity - len(self)
+                push_many(items[:room])
+                items = items[room:]
+        elif self._overflow == "raise":
+            raise OverflowError(
+                f"Can't enqueue {len(items)} items to `{self.__name__}` "
+                + f"with room for {room}!!"
+            )
+        elif self._overflow == "drop_newest":
+            push_many(items[:room])
+        else:
+            if self._overflow == "warn":
+                warnings.warn(
+                    f"Enqueuing to a full `{self.__name__}` "
+                    + "could lead to missing values!!",
+                    UserWarning,
+                )
+            # only the newest items that fit are kept
+            items = items[max(len(items) - self._max_capacity, 0):]
+            drop_oldest_many(len(self) + len(items) - self._max_capacity)
+            push_many(items)
+
+    def _handle_empty(self):
+        """
+        Applies the empty policy of the empty `Queue()` instance when an item
+        is requested.
+
+        Returns
+        -------
+        object:
+            The sentinel of the `Queue()` instance.
+
+        Raises
+        ------
+        UserWarning:
+            If the empty policy is `"warn"`.
+        IndexError:
+            If the empty policy is `"raise"`.
+        """
+        if self._empty == "raise":
+            raise IndexError(
+                f"Can't dequeue from an empty `{self.__name__}`!!"
+            )
+        elif self._empty == "warn":
+            warnings.warn(
+                f"Dequeuing from an empty `{self.__name__}`!!", UserWarning
+            )
+        return self._sentinel
+
+    def _remove(self, pop):
+        """
+        Removes an item from the container in constant time or applies the
+        empty policy if the `Queue()` instance is empty.
+
+        Parameters
+        ----------
+        pop: callable
+            The container method that removes the item from one of its ends.
+
+        Returns
+        -------
+        object:
+            The removed item or the sentinel of the `Queue()` instance.
+        """
+        if self._not_full is None:
+            return self._handle_empty() if self.is_empty() else pop()
+        with self._not_full:
+            if self.is_empty():
+                return self._handle_empty()
+            item = pop()
+            self._not_full.notify()
+            return item
+
+    def _validate_count(self, count):
+        """
+        Checks the validity of the given number of items to be removed at
+        once.
+
+        Parameters
+        ----------
+        count: int
+            The number of items to be verified.
+
+        Raises
+        ------
+        TypeError:
+            If the given `count` isn't an integer.
+        ValueError:
+            If the given `count` is negative.
+        """
+        if type(count) is not int:
+            raise TypeError(
+                f"Number of items to remove from `{self.__name__}` has to be "
+                + "an integer!!"
+            )
+        elif count < 0:
+            raise ValueError(
+                f"Number of items to remove from `{self.__name__}` has to be "
+                + ">= 0!!"
+            )
+
+    def _remove_many(self, count, pop_many):
+        """
+        Removes the given number of items from the container in linear time,
+        applying the empty policy once if the `Queue()` instance has fewer
+        items, in which case all of them are removed.
+
+        Parameters
+        ----------
+        count: int
+            The number of items to be removed.
+        pop_many: callable
+            The method that removes a number of items from one of the
+            container's ends.
+
+        Returns
+        -------
+        list:
+            The removed items in the order they were removed.
+
+        Raises
+        ------
+        UserWarning:
+            If there are fewer items than `count` and the empty policy is
+            `"warn"`.
+        IndexError:
+            If there are fewer items than `count` and the empty policy is
+            `"raise"`, in which case nothing is removed.
+        """
+        self._validate_count(count)
+        if self._not_full is None:
+            return pop_many(self.__count_available(count))
+        with self._not_full:
+            items = pop_many(self.__count_available(count))
+            self._not_full.notify_all()
+            return items
+
+    def __count_available(self, count):
+        """
+        Applies the empty policy if the `Queue()` instance has fewer items
+        than the given number.
+
+        Parameters
+        ----------
+        count: int
+            The number of items requested.
+
+        Returns
+        -------
+        int:
+            The number of items that can be removed.
+        """
+        if count <= len(self):
+            return count
+        elif self._empty == "raise":
+            raise IndexError(
+                f"Can't dequeue {count} items from `{self.__name__}` of "
+                + f"{len(self)} items!!"
+            )
+        elif self._empty == "warn":
+            warnings.warn(
+                f"Dequeuing {count} items from `{self.__name__}` of only "
+                + f"{len(self)} items!!",
+                UserWarning,
+            )
+        return len(self)
 
     # =============================     PRINT    ==============================
+    def __iter_representations(self):
+        """
+        Iterates over the container from left to right and yields the
+        representation of every element in linear time.
+
+        Yields
+        ------
+        str:
+            The string representing each element.
+        """
+        if self._backend == "array":
+            for item in self._container:
+                yield str(item)
+        else:
+            curr_node = self._container._head
+            while curr_node is not None:
+                yield curr_node._represent()
+                curr_node = curr_node.get_next()
+
     def _print_queue(self, direction_char=" "):
         """
         Represents the `Queue()` instance as a string.
@@ -110,14 +731,12 @@ class Queue(Extra):
         top_border = "─┬"
         middle_border = direction_char + "│"
         down_border = "─┴"
-        curr_node = self._container._head
-        while curr_node is not None:
-            # NOTE: +2 for a space before & after `curr_node`
-            width = len(curr_node._represent()) + 2
+        for representation in self.__iter_representations():
+            # NOTE: +2 for a space before & after the representation
+            width = len(representation) + 2
             top_border += ("─" * width) + "┬"
-            middle_border += f" {curr_node._represent()} │"
+            middle_border += f" {representation} │"
             down_border += ("─" * width) + "┴"
-            curr_node = curr_node.get_next()
         # add extension
         if not self.is_empty():
             top_border += "─"
@@ -231,8 +850,12 @@ class Queue(Extra):
         Raises
         ------
         UserWarning:
-            If the `Queue()` instance was full!! By "full", I mean the number
-            of items in the `Queue()` equals to the assigned maximum capacity.
+            If the `Queue()` instance was full and its overflow policy is
+            `"warn"`!! By "full", I mean the number of items in the `Queue()`
+            equals to the assigned maximum capacity.
+        OverflowError:
+            If the `Queue()` instance was full and its overflow policy is
+            either `"raise"` or `"block"` which timed out.
         AssertionError:
             If the given `item` is `None`
 
@@ -258,15 +881,7 @@ class Queue(Extra):
         ─┴───┴───┴─
         """
         assert item is not None
-        if self.is_full():
-            warnings.warn(
-                f"Enqueuing to a full `{self.__name__}` "
-                + "could lead to missing values!!",
-                UserWarning,
-            )
-            self._container.remove_end()
-        if self._max_capacity > 0:
-            self._container._insert(0, item)
+        self._add(item, self._push_left, self._pop_right)
 
     def enqueue(self, item):
         """
@@ -281,8 +896,12 @@ class Queue(Extra):
         Raises
         ------
         UserWarning:
-            If the Queue() instance was full!! By "full", I mean the number of
-            items in the Queue() equals to the assigned maximum capacity.
+            If the `Queue()` instance was full and its overflow policy is
+            `"warn"`!! By "full", I mean the number of items in the `Queue()`
+            equals to the assigned maximum capacity.
+        OverflowError:
+            If the `Queue()` instance was full and its overflow policy is
+            either `"raise"` or `"block"` which timed out.
         ValueError:
             If the given `item` is `None`.
         TypeError:
@@ -312,6 +931,53 @@ class Queue(Extra):
         super()._validate_item(item)
         self._enqueue(item)
 
+    def enqueue_many(self, items):
+        """
+        Inserts the given items to the end of the `Queue()`, one after the
+        other, in linear time. The items are validated and the capacity is
+        checked once, before any of them is inserted.
+
+        Parameters
+        ----------
+        items: iterable
+            The python objects to be pushed to the `Queue()`.
+
+        Raises
+        ------
+        UserWarning:
+            If the items don't fit in the `Queue()` instance and its overflow
+            policy is `"warn"`!! It's raised only once.
+        OverflowError:
+            If the items don't fit in the `Queue()` instance and its overflow
+            policy is either `"raise"`, in which case none of them is
+            inserted, or `"block"` which timed out.
+        ValueError:
+            If one of the given items is `None`.
+        TypeError:
+            If one of the given items is an instance of `Extra`.
+
+        Example
+        -------
+        >>> q = Queue(max_capacity=3)
+        >>> q.enqueue_many([1, 2])
+        >>> q
+        ─┬───┬───┬─
+        ⟶│ 2 │ 1 │⟶
+        ─┴───┴───┴─
+        >>> q.enqueue_many([3, 4])
+        UserWarning: Enqueuing to a full `extra.Queue()` could lead to \
+            missing values!!
+        >>> q
+        ─┬───┬───┬───┬─
+        ⟶│ 4 │ 3 │ 2 │⟶
+        ─┴───┴───┴───┴─
+        """
+        items = list(items)
+        if not self.TRUSTED:
+            for item in items:
+                super()._validate_item(item)
+        self._add_many(items, self._push_many_left, self._pop_many_right)
+
     # =============================      TOP     ==============================
     def top(self):
         """
@@ -346,7 +1012,7 @@ class Queue(Extra):
             raise IndexError(
                 f"Can't retrieve from an empty `{self.__name__}`!!"
             )
-        return self._container._tail.get_data()
+        return self._peek_right()
 
     # =============================    DEQUEUE   ==============================
     def dequeue(self):
@@ -356,12 +1022,17 @@ class Queue(Extra):
         Returns
         -------
         object:
-            The `Queue()` instance's first item.
+            The `Queue()` instance's first item or its sentinel if it's empty
+            and its empty policy isn't `"raise"`.
 
         Raises
         ------
         UserWarning:
-            If the `Queue()` instance is empty!!
+            If the `Queue()` instance is empty and its empty policy is
+            `"warn"`!!
+        IndexError:
+            If the `Queue()` instance is empty and its empty policy is
+            `"raise"`!!
 
         Example
         -------
@@ -381,15 +1052,49 @@ class Queue(Extra):
         ⟶│ 20 │⟶
         ─┴────┴─
         """
-        if self.is_empty():
-            warnings.warn(
-                f"Dequeuing from an empty `{self.__name__}`!!", UserWarning
-            )
-            return
-        else:
-            tail_value = self._container._tail.get_data()
-            self._container.remove_end()
-            return tail_value
+        return self._remove(self._pop_right)
+
+    def dequeue_many(self, count):
+        """
+        Pops the given number of the first inserted items from the `Queue()`
+        in linear time.
+
+        Parameters
+        ----------
+        count: int
+            The number of items to be popped.
+
+        Returns
+        -------
+        list:
+            The popped items, the first inserted one first. It holds fewer
+            items than `count` if the `Queue()` instance doesn't have enough
+            of them and its empty policy isn't `"raise"`.
+
+        Raises
+        ------
+        UserWarning:
+            If the `Queue()` instance has fewer items than `count` and its
+            empty policy is `"warn"`!!
+        IndexError:
+            If the `Queue()` instance has fewer items than `count` and its
+            empty policy is `"raise"`, in which case nothing is popped!!
+        TypeError:
+            If the given `count` isn't an integer.
+        ValueError:
+            If the given `count` is negative.
+
+        Example
+        -------
+        >>> q = Queue()
+        >>> q.enqueue_many([10, 20, 30])
+        >>> q.dequeue_many(2)
+        [10, 20]
+        >>> q.dequeue_many(2)
+        UserWarning: Dequeuing 2 items from `extra.Queue()` of only 1 items!!
+        [30]
+        """
+        return self._remove_many(count, self._pop_many_right)
 
     def clear(self):
         """
@@ -420,4 +1125,9 @@ class Queue(Extra):
         When you clear the `Queue()` instance, the `max_capacity` of the
         cleared instance remains the same as the one before.
         """
-        self.__init__(max_capacity=self._max_capacity)
+        if self._not_full is None:
+            self._container.clear()
+            return
+        with self._not_full:
+            self._container.clear()
+            self._not_full.notify_all()
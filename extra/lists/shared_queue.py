@@ -0,0 +1,339 @@
+"""
+A shared queue is a `BlockingQueue()` of numbers that can be shared between
+processes. Its items are stored as C numbers in a ring buffer living in a
+block of shared memory, so producers and consumers running in different
+processes exchange numbers without pickling them, and its lock & condition
+variables come from the `multiprocessing` module. Like other `multiprocessing`
+synchronization primitives, a `SharedQueue()` has to be handed to the other
+processes when they are started, e.g. as an argument of
+`multiprocessing.Process()` or as `initargs` of a `ProcessPoolExecutor()`.
+The shared queue needs python 3.8 or later, where `multiprocessing` gained the
+`shared_memory` module; on older versions `extra` is still importable but it
+doesn't export `SharedQueue`.
+"""
+import multiprocessing
+from extra.lists.blocking import BlockingQueue
+from extra.lists._shared_ring_buffer import SharedRingBuffer
+
+
+class SharedQueue(BlockingQueue):
+    """
+    A shared queue is a first-in, first-out (FIFO) queue of integers or floats
+    whose items are stored in shared memory, so that producer and consumer
+    processes exchange them without pickling. Its capacity is fixed when it's
+    created, and every method runs while holding a lock shared by all the
+    processes.
+    """
+
+    __name__ = "extra.SharedQueue()"
+    _INT64_RANGE = range(-(1 << 63), 1 << 63)
+
+    def __init__(
+        self,
+        max_capacity,
+        dtype="float",
+        overflow="warn",
+        empty="warn",
+        sentinel=None,
+        timeout=None,
+        context=None,
+    ):
+        """
+        Creates a `SharedQueue()` object and allocates its shared memory!!
+
+        Parameters
+        ----------
+        max_capacity: int
+            It's a positive integer representing the maximum number of elements
+            a `SharedQueue()` can contain. Its shared memory is allocated once,
+            here, so it has to be finite.
+        dtype: str
+            The type of the stored numbers, either `"int"` for 64-bit signed
+            integers or `"float"` for 64-bit floats (Default: "float").
+        overflow: str
+            What `enqueue()` does when the `SharedQueue()` is full, the same
+            as for `Queue()` (Default: "warn").
+        empty: str
+            What `dequeue()` does when the `SharedQueue()` is empty, the same
+            as for `Queue()` (Default: "warn").
+        sentinel: object
+            The object returned by `dequeue()` when the `SharedQueue()` is
+            empty (Default: None).
+        timeout: int or float, optional
+            The maximum number of seconds the `"block"` overflow policy of
+            `enqueue()` waits (Default: None).
+        context: multiprocessing.context.BaseContext, optional
+            The `multiprocessing` context creating the lock and the condition
+            variables, which has to be the one starting the processes sharing
+            the `SharedQueue()`. `None` means the default context
+            (Default: None).
+
+        Raises
+        ------
+        TypeError: It can be raised in two cases
+            1. If the type of `max_capacity` isn't `int` or `float`.
+            2. If the given `timeout` is neither `None` nor a number.
+        ValueError: It can be raised in four cases
+            1. If the given value of `max_capacity` isn't finite or it's less
+            than one.
+            2. If the given `dtype` is neither `"int"` nor `"float"`.
+            3. If the given `overflow` or `empty` isn't a known policy.
+            4. If the given `timeout` is negative.
+
+        Example
+        -------
+        >>> q = SharedQueue(10, dtype="int")
+        >>> type(q)
+        <class 'extra.lists.shared_queue.SharedQueue'>
+        >>> q._max_capacity
+        10
+
+        Note
+        ----
+        The process that created the `SharedQueue()` has to free its shared
+        memory by calling `unlink()` once all processes are done with it.
+        """
+        if type(max_capacity) in {int, float} and not (
+            1 <= max_capacity < float("inf")
+        ):
+            raise ValueError(
+                f"Max capacity of `{self.__name__}` has to be a finite number "
+                + ">= 1!!"
+            )
+        elif dtype not in SharedRingBuffer._TYPECODES:
+            raise ValueError(
+                f"Type of `{self.__name__}` items has to be either `int` or "
+                + "`float`!!"
+            )
+        self._dtype = dtype
+        self._context = (
+            multiprocessing.get_context() if context is None else context
+        )
+        super().__init__(
+            max_capacity, "array", overflow, empty, sentinel, timeout
+        )
+
+    def _create_container(self):
+        """
+        Creates the ring buffer in shared memory storing the elements of the
+        instance. Its header keeps the counters of the waiting processes and
+        the unfinished tasks as well.
+
+        Returns
+        -------
+        SharedRingBuffer:
+            An empty ring buffer in shared memory of a fixed capacity.
+        """
+        return SharedRingBuffer(self._max_capacity, self._dtype, counters=3)
+
+    def _init_blocking(self):
+        """
+        Creates the lock and the condition variables shared by all the
+        processes.
+        """
+        self._mutex = self._context.RLock()
+        self._has_items = self._context.Condition(self._mutex)
+        self._has_room = self._context.Condition(self._mutex)
+        self._all_tasks_done = self._context.Condition(self._mutex)
+        self._waiting_getters = 0
+        self._waiting_putters = 0
+        self._unfinished_tasks = 0
+
+    # =============================   COUNTERS   ==============================
+    @property
+    def _waiting_getters(self):
+        """The number of processes waiting in `get()`."""
+        return self._container.counters[0]
+
+    @_waiting_getters.setter
+    def _waiting_getters(self, value):
+        self._container.counters[0] = value
+
+    @property
+    def _waiting_putters(self):
+        """The number of processes waiting in `put()`."""
+        return self._container.counters[1]
+
+    @_waiting_putters.setter
+    def _waiting_putters(self, value):
+        self._container.counters[1] = value
+
+    @property
+    def _unfinished_tasks(self):
+        """The number of put items not marked as done yet."""
+        return self._container.counters[2]
+
+    @_unfinished_tasks.setter
+    def _unfinished_tasks(self, value):
+        self._container.counters[2] = value
+
+    def _validate_item(self, item):
+        """
+        Checks the validity of the given item. It raises the appropriate error
+        when the item isn't valid and it returns nothing if the item is valid.
+
+        Parameters
+        ----------
+        item: object
+            The object that should be verified.
+
+        Raises
+        ------
+        ValueError:
+            If the given item is `None` or an integer out of the 64-bit range.
+        TypeError:
+            If the given item is not a number, or not an integer when the
+            `dtype` of the `SharedQueue()` is `"int"`.
+        """
+        if self.TRUSTED:
+            return
+        super()._validate_item(item)
+        if self._dtype == "float":
+            if type(item) not in {int, float}:
+                raise TypeError(f"`{self.__name__}` supports only numbers!!")
+        elif type(item) is not int:
+            raise TypeError(f"`{self.__name__}` supports only integers!!")
+        elif item not in self._INT64_RANGE:
+            raise ValueError(
+                f"`{self.__name__}` supports only 64-bit integers!!"
+            )
+
+    # =============================    RELEASE   ==============================
+    def close(self):
+        """
+        Detaches the `SharedQueue()` instance from its shared memory. Every
+        process using the queue should close it once it's done, after which
+        the instance can't be used anymore.
+        """
+        self._container.close()
+
+    def unlink(self):
+        """
+        Frees the shared memory of the `SharedQueue()` instance. It has to be
+        called once, by the process that created the queue, after all
+        processes are done with it.
+
+        Example
+        -------
+        >>> q = SharedQueue(10)
+        >>> q.close()
+        >>> q.unlink()
+        """
+        self._container.unlink()
+
+    # =============================    ENQUEUE   ==============================
+    def enqueue(self, item):
+        """
+        Inserts the given number to end of the `SharedQueue()` in constant
+        time, applying the overflow policy if it's full.
+
+        Parameters
+        ----------
+        item: int or float
+            The number to be pushed to the `SharedQueue()`.
+
+        Raises
+        ------
+        UserWarning:
+            If the `SharedQueue()` instance was full and its overflow policy
+            is `"warn"`!!
+        OverflowError:
+            If the `SharedQueue()` instance was full and its overflow policy
+            is either `"raise"` or `"block"` which timed out.
+        ValueError:
+            If the given `item` is `None` or an integer out of the 64-bit
+            range.
+        TypeError:
+            If the given `item` isn't a number, or isn't an integer when the
+            `dtype` is `"int"`.
+
+        Example
+        -------
+        >>> q = SharedQueue(max_capacity=2)
+        >>> q.enqueue(1)
+        >>> q.enqueue(2.5)
+        >>> q
+        ─┬─────┬─────┬─
+        ⟶│ 2.5 │ 1.0 │⟶
+        ─┴─────┴─────┴─
+        """
+        self._validate_item(item)
+        super().enqueue(item)
+
+    def enqueue_many(self, items):
+        """
+        Inserts the given numbers to end of the `SharedQueue()`, one after
+        the other, in linear time, applying the overflow policy once if they
+        don't fit. The numbers are validated before any of them is inserted.
+
+        Parameters
+        ----------
+        items: iterable
+            The numbers to be pushed to the `SharedQueue()`.
+
+        Raises
+        ------
+        UserWarning:
+            If the numbers don't fit in the `SharedQueue()` instance and its
+            overflow policy is `"warn"`!! It's raised only once.
+        OverflowError:
+            If the numbers don't fit in the `SharedQueue()` instance and its
+            overflow policy is either `"raise"`, in which case none of them is
+            inserted, or `"block"` which timed out.
+        ValueError:
+            If one of the given numbers is `None` or an integer out of the
+            64-bit range.
+        TypeError:
+            If one of the given items isn't a number, or isn't an integer
+            when the `dtype` is `"int"`.
+
+        Example
+        -------
+        >>> q = SharedQueue(max_capacity=3, dtype="int")
+        >>> q.enqueue_many([1, 2, 3])
+        >>> q.dequeue_many(2)
+        [1, 2]
+        """
+        items = list(items)
+        if not self.TRUSTED:
+            for item in items:
+                self._validate_item(item)
+        super().enqueue_many(items)
+
+    def put(self, item, block=True, timeout=None):
+        """
+        Inserts the given number to end of the `SharedQueue()` in constant
+        time, waiting for another process to remove an item if it's full.
+
+        Parameters
+        ----------
+        item: int or float
+            The number to be pushed to the `SharedQueue()`.
+        block: bool
+            A flag to wait while the `SharedQueue()` is full instead of
+            raising an `OverflowError` right away (default: `True`).
+        timeout: int or float, optional
+            The maximum number of seconds to wait. `None` means waiting
+            forever (default: `None`).
+
+        Raises
+        ------
+        OverflowError:
+            If the `SharedQueue()` is still full after `timeout` seconds or
+            if it's full and `block` is `False`.
+        ValueError:
+            If the given `item` is `None` or an integer out of the 64-bit
+            range, or if `timeout` is negative.
+        TypeError:
+            If the given `item` isn't a number, or isn't an integer when the
+            `dtype` is `"int"`, or if `timeout` isn't a number.
+
+        Example
+        -------
+        >>> q = SharedQueue(max_capacity=1, dtype="int")
+        >>> q.put(1)
+        >>> q.put(2, block=False)
+        OverflowError: Can't put into a full `extra.SharedQueue()`!!
+        """
+        self._validate_item(item)
+        super().put(item, block, timeout)
@@ -1,10 +1,10 @@
 """
 A skip list is an awesome linear data structures which consists of a series of
-**Linked List** objects, each linked list stores a subset of items sorted by
-increasing values plus one setntinel value denoted by -∞ which is smaller than
-every possible value that can be inserted. The really interesting part about
-skip list is that it supports searching for values in time-complexity of
-**O(log(n))** which is considered faster than most linear data structures.
+sorted levels, each level links a subset of items sorted by increasing values
+plus one setntinel value denoted by -∞ which is smaller than every possible
+value that can be inserted. The really interesting part about skip list is
+that it supports searching for values in time-complexity of **O(log(n))**
+which is considered faster than most linear data structures.
 
 The following is a simple skip list containing the first seven number from the
 Fibbonacci series which are: [0, 1, 1, 2, 3, 5, 8]
@@ -21,97 +21,45 @@ Fibbonacci series which are: [0, 1, 1, 2, 3, 5, 8]
 
 In the above skip list, you can see the following properties:
 
-- The skip list consists of multiple levels or Linked List objects. The \
-    number of levels is called "**height**". So, the height of this skip \
-    list is `3`.
+- The skip list consists of multiple levels. The number of levels is called \
+    "**height**". So, the height of this skip list is `3`.
 - The first number in the skip list is our -∞ setntinel value.
 - All values are numbers and they are sorted in ascending-manner.
 - There are no repeated values.
-- There are some numbers that are stored once and there are some numbers that \
-    are stored multiple time.
-
-Intuitively, the lists are set up so that the lower linked lists contain more
-items of the higher ones. Inserting an item in more than one linked list is
-chosen randomly with probability 1/2. That is, like, we "**flip a coin**"
-for each item in the skip list. Thus, we expect the lowest linked list, at
-`height=0` to have **n** items. And the linked list at `height=2` to have about
-**n/2** items, and the one above it to have about **n/4** items. In other
-words, we expect the height of the skip list to be about **log(n)**.
+- Every value is stored once inside a "**tower**" node which holds one \
+    forward pointer per level the value reaches. So, the `8` above is one \
+    node of height `3` and the `2` is one node of height `1`.
+
+Intuitively, the levels are set up so that the lower levels contain more
+items of the higher ones. The height of a new tower is chosen randomly: a
+tower reaches the next level with a probability **p** which is 1/2 by default.
+Thus, we expect the lowest level, at `height=0` to have **n** items. And the
+level at `height=1` to have about **n/2** items, and the one above it to have
+about **n/4** items. In other words, we expect the height of the skip list to
+be about **log(n)**.
 
 The -∞ setntinel value is put in the SkipList() as a convention. So, it doesn't
 count as an element in the SkipList(). In other words, the zeroths element in
 the above skip list is `0` not `-∞`.
 """
+import math
 import random
 from extra.interface import Extra
-from extra.lists.linked_list import Node, LinkedList
-
-
-# helper functions
-# random.seed(1)
-def flip_coin():
-    """
-    A helper function to mimic the action of flipping a coin. The result is
-    totally random,
-
-    Returns
-    -------
-    str:
-        Either "head" or "tail".
-
-    Example
-    -------
-    >>> flip_coin()
-    'tail'
-    >>> flip_coin()
-    'head'
-    >>> flip_coin()
-    'head'
-    """
-    return random.choice(["head", "tail"])
+from extra.lists.linked_list import Node
 
 
-def search_sorted(prev_node, start_node, value):
+class SkipNode(Node):
     """
-    A helper function to search the `SkipList()` instance starting from a
-    given node declared as `start_node` and searching for the given `value`.
-
-    Parameters
-    ----------
-    prev_node: SkipNode()
-        A reference to the node that is previous to the `start_node`.
-    start_node: SkipNode()
-        A reference to the node at which the searching starts.
-    value: int or float
-        The number for which we started searching.
-
-    Returns
-    -------
-    SkipNode()
-        A reference to the node previus to the node containing the value if the
-        value was found. If the value wasn't found, then this will be either
-        `None` or the second last node in the skiplist.
-    SkipNode()
-        A reference to the node containg the value if the value was found. If
-        the value wasn't found, then this will be the last node in the
-        skiplist.
+    A skip node is the basic unit for building skip lists. It is a tower that
+    holds one value and one forward pointer for each level it reaches. Every
+    forward pointer is annotated with its width which is the number of nodes
+    of the lowest level it skips over.
     """
-    # search a sorted linked list and return the last accessed node.
-    curr_node = start_node
-    next_node = curr_node.get_next()
-    while next_node is not None and next_node.get_data() <= value:
-        prev_node = curr_node
-        curr_node = next_node
-        next_node = curr_node.get_next()
-    return prev_node, curr_node
-
-
-class SkipNode(Node):
-    """A skip node is the basic unit for building skip lists."""
 
     __name__ = "extra.SkipNode()"
+    __slots__ = ("_forward",)
 
-    def __init__(self, item):
+    def __init__(self, item, height=1):
         """
         Creates a `SkipNode()` object used mainly with SkipList() objects!!
 
@@ -119,73 +67,161 @@ class SkipNode(Node):
         ----------
         item: object
             The value to be saved within the `SkipNode()` instance
+        height: int, optional
+            The number of levels the `SkipNode()` reaches, default 1.
 
         Raises
         ------
         ValueError:
-            If the given item is `None`.
+            It can be raised in two cases:
+                1. If the given item is `None`.
+                2. If the given height is less than one.
         TypeError:
-            If the given item isn't a number.
+            It can be raised in two cases:
+                1. If the given item isn't a number.
+                2. If the given height isn't an integer.
         """
         super()._validate_item(item)
-        if type(item) not in {int, float}:
+        if not self.TRUSTED and type(item) not in {int, float}:
             raise TypeError(f"`{self.__name__}` contains numbers only!!")
-        super().__init__(item)
-        self._down = None
+        if type(height) != int:
+            raise TypeError("The height of a node must be an integer!!")
+        elif height < 1:
+            raise ValueError("The height of a node must be at least one!!")
+        self._data = item
+        self._next = None
+        # NOTE: `_next` is the pointer of the lowest level whose width is
+        #  always one. `_forward` holds the pointers of the upper levels, each
+        #  followed by its width, so the (i)th level is at `_forward[2*i-2]`.
+        #  Most nodes reach the lowest level only, so they share the same
+        #  empty tuple instead of a list.
+        self._forward = [None, 0] * (height - 1) if height > 1 else ()
 
-    def get_down(self):
+    def __repr__(self):
         """
-        Returns the down `SkipNode()` instance of the current one.
+        Represents `SkipNode()` object as a string.
 
         Returns
         -------
-        Node():
-            The `SkipNode()` instance that is below the current `SkipNode()`
-            or `None` if there weren't any.
+        str:
+            A string representing the `SkipNode()` instance.
+
+        Example
+        -------
+        >>> x = SkipNode(10, height=2)
+        >>> x
+        SkipNode(data: 10, height: 2, next: None)
         """
-        return self._down
+        nxt = self._next._represent() if self._next is not None else None
+        return (
+            f"SkipNode(data: {self._represent()}, height: {self.get_height()}"
+            + f", next: {nxt})"
+        )
+
+    def get_height(self):
+        """
+        Returns the number of levels the `SkipNode()` reaches.
+
+        Returns
+        -------
+        int:
+            A positive integer representing the height of the node.
+        """
+        return len(self._forward) // 2 + 1
 
-    def set_down(self, other_node):
+    def get_next(self, level=0):
         """
-        Sets the down pointer of the current `SkipNode()` to the given node.
+        Returns the next `SkipNode()` instance of the current one at the given
+        level.
 
         Parameters
         ----------
-        other_node: SkipNode()
-            The `SkipNode()` that will follow the current `SkipNode()`.
+        level: int, optional
+            A zero-indexed level less than the node's height, default 0.
+
+        Returns
+        -------
+        SkipNode():
+            The `SkipNode()` instance that follows the current `SkipNode()`
+            at the given level or `None` if there weren't any.
 
         Raises
         ------
-        TypeError:
-            If the given item is not an `SkipNode()` object.
+        IndexError:
+            If the node doesn't reach the given level.
         """
-        if not isinstance(other_node, SkipNode):
-            raise TypeError(f"Given object has to be `{self.__name__}`!!")
-        self._down = other_node
+        self.__validate_level(level)
+        return self._next if level == 0 else self._forward[2 * level - 2]
 
-    def __repr__(self):
+    def get_width(self, level=0):
         """
-        Represents `SkipNode()` object as a string.
+        Returns the width of the forward pointer of the current `SkipNode()`
+        at the given level. The width is the number of steps the pointer
+        takes at the lowest level to reach the next `SkipNode()`.
+
+        Parameters
+        ----------
+        level: int, optional
+            A zero-indexed level less than the node's height, default 0.
 
         Returns
         -------
-        str:
-            A string representing the `SkipNode()` instance.
+        int:
+            The width of the pointer. When there is no next node, the pointer
+            reaches one step past the last node of the `SkipList()`.
 
-        Example
-        -------
-        >>> x = SkipNode(10)
-        >>> x
-        SkipNode(data: 10, next:None)
+        Raises
+        ------
+        IndexError:
+            If the node doesn't reach the given level.
         """
-        if self._data == float("-inf"):
-            data = "-∞"
-        elif self._data == float("inf"):
-            data = "∞"
+        self.__validate_level(level)
+        return 1 if level == 0 else self._forward[2 * level - 1]
+
+    def set_next(self, next_node, level=0):
+        """
+        Sets the next pointer of the current `SkipNode()` at the given level
+        to the given node.
+
+        Parameters
+        ----------
+        next_node: SkipNode()
+            The `SkipNode()` that will follow the current `SkipNode()`. The
+            width of the pointer is left unchanged.
+        level: int, optional
+            A zero-indexed level less than the node's height, default 0.
+
+        Raises
+        ------
+        TypeError:
+            If the given item is neither `None` nor a `SkipNode()` object.
+        IndexError:
+            If the node doesn't reach the given level.
+        """
+        if next_node is not None and not isinstance(next_node, SkipNode):
+            raise TypeError(f"Given object has to be `{self.__name__}`!!")
+        self.__validate_level(level)
+        if level == 0:
+            self._next = next_node
         else:
-            data = self._data
-        nxt = self._next.get_data() if self._next is not None else None
-        return f"SkipNode(data: {data}, next: {nxt})"
+            self._forward[2 * level - 2] = next_node
+
+    def __validate_level(self, level):
+        """
+        Checks that the given level is reached by the `SkipNode()`.
+
+        Parameters
+        ----------
+        level: int
+            The level to be checked.
+
+        Raises
+        ------
+        IndexError:
+            If the node doesn't reach the given level.
+        """
+        if type(level) != int or not 0 <= level < self.get_height():
+            raise IndexError(f"`{self.__name__}` doesn't reach this level!!")
 
     def _represent(self):
         """
@@ -200,7 +236,7 @@ class SkipNode(Node):
         -------
         >>> x = SkipNode(10)
         >>> x
-        SkipNode(data:10, next:None)
+        SkipNode(data: 10, height: 1, next: None)
         >>> x._represent()
         10
         >>> type(x._represent())
@@ -216,57 +252,70 @@ class SkipNode(Node):
 class SkipList(Extra):
     """
     A skip list is an awesome linear data structures which consists of a series
-    of **Linked List** objects, each linked list stores a subset of items
-    sorted by increasing values plus one setntinel value denoted by -∞ which is
-    smaller than every possible value that can be inserted. The really
-    interesting part about skip list is that it supports searching for values
-    in time-complexity of **O(log(n))** which is considered faster than most
+    of sorted levels, each level links a subset of items sorted by increasing
+    values plus one setntinel value denoted by -∞ which is smaller than every
+    possible value that can be inserted. Each value is stored once in a tower
+    node that has a forward pointer per level. The really interesting part
+    about skip list is that it supports searching for values in
+    time-complexity of **O(log(n))** which is considered faster than most
     linear data structures.
     """
 
     _basic_node = SkipNode
     __name__ = "extra.SkipList()"
 
-    def __init__(self, iterable=None):
+    def __init__(self, iterable=None, p=0.5, max_level=32, seed=None):
         """
         Initializes a `SkipList()` instance using an optional iterable object
-        in time-complexity of O(n) where **n** is the number of elements inside
-        the given `iterable`.
+        in time-complexity of O(n*log(n)) where **n** is the number of
+        elements inside the given `iterable`. The values are sorted first and
+        the towers are linked one after another without searching, so it
+        takes O(n) when the given values are already sorted.
 
         Parameters
         ----------
         iterable: iterable, optional
             An iterable python object that implements the `__iter__` method.
             For example, `list` and `tuple` are both iterables.
+        p: float, optional
+            The probability of a tower reaching the next level, default 0.5.
+            Smaller values build shorter towers which take less memory at the
+            cost of a slightly longer search.
+        max_level: int, optional
+            The maximum number of levels a tower can reach, default 32.
+        seed: int or float, optional
+            A seed for the random numbers of this instance only. Using the
+            same seed and the same values always builds the same skip list.
 
         Raises
         ------
         TypeError:
-            It can be raised in three cases
+            It can be raised in five cases
                 1. In case the given object isn't iterable.
                 2. If one of the elements in the iterable is an `Extra` object.
                 3. If one of the elements in the iterable is NOT a number.
+                4. If the given `p` isn't a number.
+                5. If the given `max_level` isn't an integer.
         ValueError:
-            If one of the iterable elements is `None`.
+            It can be raised in three cases
+                1. If one of the iterable elements is `None`.
+                2. If the given `p` isn't between zero and one.
+                3. If the given `max_level` is less than one.
 
         Note
         -----
-        Inserting values into different levels in the skip list is completely
-        random. So, running the following example will return different values
-        each time you run it. So, in order to obtain the same result as before
-        you need to set `random.seed(1)` before running any of the previous
-        example.
+        The height of the towers is random. So, running the following example
+        without a `seed` will return a different structure each time you run
+        it. In order to obtain the same result, you need to use the same
+        `seed`.
 
         Examples
         --------
-        >>> import random; random.seed(1)
-        >>> sl = SkipList([10, -5, 7, 9])
+        >>> sl = SkipList([10, -5, 7, 9], seed=10)
         >>> sl
-        ┌────┐                    ┌────┐
-        | -∞ │⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶| 10 │⟶
-        ├────┤ ┌────┐             ├────┤
-        | -∞ │⟶| -5 │⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶| 10 │⟶
-        ├────┤ ├────┤ ┌───┐ ┌───┐ ├────┤
+        ┌────┐ ┌────┐       ┌───┐
+        | -∞ │⟶| -5 │⟶⟶⟶⟶⟶⟶⟶| 9 │⟶⟶⟶⟶⟶⟶⟶⟶
+        ├────┤ ├────┤ ┌───┐ ├───┤ ┌────┐
         | -∞ │⟶| -5 │⟶| 7 │⟶| 9 │⟶| 10 │⟶
         └────┘ └────┘ └───┘ └───┘ └────┘
 
@@ -285,82 +334,102 @@ class SkipList(Extra):
 
         >>> sl_1 = SkipList([1])
         >>> sl_2 = SkipList([1, sl_1])
-        TypeError: Can't create `extra.SkipList()` using `extra.SkipList()`!!
+        TypeError: Can't use `extra.SkipList()` with `extra.SkipList()`!!
         """
-        # NOTE: `_level_lists` is an array of LinkedList() objects
+        if type(p) not in {int, float}:
+            raise TypeError("The probability `p` must be a number!!")
+        elif not 0 < p < 1:
+            raise ValueError("The probability `p` must be between 0 and 1!!")
+        if type(max_level) != int:
+            raise TypeError("The maximum level must be an integer!!")
+        elif max_level < 1:
+            raise ValueError("The maximum level must be at least one!!")
+        self._p = p
+        self._log_p = math.log(p)
+        self._max_level = max_level
+        self._rng = random.Random(seed)
+        self.clear()
         if iterable is None:
-            ll = LinkedList()
-            ll._insert_node(ll._head, self._basic_node(float("-inf")))
-            self._level_lists = [ll]
-            self._num_levels = 1
+            return
         elif not hasattr(iterable, "__iter__"):
             raise TypeError("The given object isn't iterable!!")
-        elif isinstance(iterable, self.__class__):
-            self._level_lists = iterable._level_lists
-            self._num_levels = iterable._num_levels
-        else:
-            ll = LinkedList()
-            ll._insert_node(ll._head, self._basic_node(float("-inf")))
-            self._level_lists = [ll]
-            self._num_levels = 1
-            for item in iterable:
-                self.insert(item)
+        values = list(iterable)
+        for item in values:
+            self._validate_item(item)
+        # NOTE: sorting already-sorted values takes O(n)
+        self.__build(sorted(values))
 
-    # =============================    PRINT     ==============================
-    def __print_node(self, node, zeroth_node, lower_node):
+    def __build(self, values):
         """
-        Prints the given node of the `SkipList()` instance.
+        Fills the empty `SkipList()` instance with the given sorted values in
+        time-complexity of O(n) where **n** is the number of the given values.
+        Every new tower is linked at the end of each level it reaches, so no
+        searching is needed.
 
         Parameters
         ----------
-        node: SkipNode()
-            The SkipNode() to be printed.
-        zeroth_node: SkipNode()
-            The SkipNode() of the lowest LinkedList (zeorth level) attached to
-            the given `node`.
-        lower_node: SkipNode()
-            The SkipNode() which is directly below the `node`.
-
-        Returns
-        -------
-        tuple
-            It returns a tuple of two lists representing the given middle-part
-            and lower-part of the node when printed knowing that each node will
-            be printed in three lines in total.
+        values: list
+            The values to be stored sorted in ascending order. A value that is
+            equal to the one before it is skipped.
 
         Raises
         ------
         AssertionError:
-            This can be raised in the following cases:
-                1. The `node` is not neither `None` nor an instance of \
-                    `SkipNode()`.
-                2. The `zeroth_node` is not neither `None` nor an instance of \
-                    `SkipNode()`.
-                3. The `lower_node` is not neither `None` nor an instance of \
-                    `SkipNode()`.
-        """
-        assert node is None or isinstance(node, self._basic_node)
-        assert zeroth_node is None or isinstance(zeroth_node, self._basic_node)
-        assert lower_node is None or isinstance(lower_node, self._basic_node)
-        middle = []
-        bottom_border = []
-        item = zeroth_node._represent()
-        width = len(item) + 2  # 2: for a space before & after an item
-        if node is not None and zeroth_node.get_data() == node.get_data():
-            bottom_border += ["└"] if lower_node is None else ["├"]
-            bottom_border += ["─"] * width
-            bottom_border += ["┘ "] if lower_node is None else ["┤ "]
-            middle += [f"| {item} │⟶"]
-        else:
-            middle += [f"⟶{'⟶'*width}⟶⟶"]
-            if (
-                lower_node is not None
-                and lower_node.get_data() == zeroth_node.get_data()
-            ):
-                bottom_border += ["┌"] + (["─"] * width) + ["┐ "]
+            If the `SkipList()` instance isn't empty.
+        """
+        assert self.is_empty()
+
+        head = self._head
+        # the last node of every level so far and its position
+        last_nodes = [head]
+        last_positions = [0]
+        pos = 0
+        for value in values:
+            if pos > 0 and last_nodes[0]._data == value:
+                continue
+            height = self._random_height()
+            while len(last_nodes) < height:
+                head._forward.extend([None, 0])
+                last_nodes.append(head)
+                last_positions.append(0)
+            new_node = self._basic_node(value, height)
+            pos += 1
+            last_nodes[0]._next = new_node
+            last_nodes[0] = new_node
+            for level in range(1, height):
+                i = 2 * level - 2
+                last_forward = last_nodes[level]._forward
+                last_forward[i] = new_node
+                last_forward[i + 1] = pos - last_positions[level]
+                last_nodes[level] = new_node
+                last_positions[level] = pos
+        # the last pointer of every level reaches one step past the last node
+        for level in range(1, len(last_nodes)):
+            last_nodes[level]._forward[2 * level - 1] = (
+                pos + 1 - last_positions[level]
+            )
+        self._length = pos
+
+    # =============================    PRINT     ==============================
+    def __print_top_border(self):
+        """
+        Prints out the top border of the `SkipList()` instance.
+
+        Returns:
+        str:
+            A one-line string representing the top-border of the `SkipList()`
+        """
+        height = self.get_height()
+        top_border = []
+        node = self._head
+        while node is not None:
+            width = len(node._represent()) + 2  # 2: for a space before & after
+            if node.get_height() == height:
+                top_border += ["┌"] + (["─"] * width) + ["┐ "]
             else:
-                bottom_border += [" "] + ([" "] * width) + ["  "]
-        return middle, bottom_border
+                top_border += [" "] + ([" "] * width) + ["  "]
+            node = node._next
+        return "".join(top_border)
 
     def __print_level(self, level):
         """
@@ -387,64 +456,34 @@ class SkipList(Extra):
                 2. If the level index is bigger than the `SkipList()` height.
         """
         assert type(level) == int
-        assert level < self._num_levels
+        assert level < self.get_height()
 
-        zeroth_list = self._level_lists[0]
-        curr_list = self._level_lists[level]
         # the following two lists will represent the output of this function
-        bottom_border = []
         middle = []
-        # iterate over two lists in parallel
-        zeroth_node = zeroth_list._head
-        curr_node = curr_list._head
-        lower_node = self._level_lists[level - 1]._head if level > 0 else None
-        while zeroth_node is not None:
-            middle_part, bottom_part = self.__print_node(
-                curr_node, zeroth_node, lower_node
-            )
-            middle += middle_part
-            bottom_border += bottom_part
-            if (curr_node is not None
-                    and zeroth_node.get_data() == curr_node.get_data()):
-                curr_node = curr_node.get_next()
-            if (
-                lower_node is not None
-                and zeroth_node.get_data() == lower_node.get_data()
-            ):
-                lower_node = lower_node.get_next()
-            zeroth_node = zeroth_node.get_next()
-        return "{}\n{}".format("".join(middle), "".join(bottom_border))
-
-    def __print_top_border(self):
-        """
-        Prints out the top border of the `SkipList()` instance.
-
-        Returns:
-        str:
-            A one-line string representing the top-border of the `SkipList()`
-        """
-        lower_list = self._level_lists[0]
-        top_list = self._level_lists[self._num_levels - 1]
-        # the following two lists will represent the output of this function
-        top_border = []
-        # iterate over two lists in parallel
-        lower_node = lower_list._head
-        curr_node = top_list._head
-        while (lower_node is not None):
-            item = lower_node._represent()
+        bottom_border = []
+        # each column of the output is a node of the lowest level
+        node = self._head
+        while node is not None:
+            item = node._represent()
             width = len(item) + 2  # 2: for a space before & after an item
-            if (curr_node is not None
-                    and lower_node.get_data() == curr_node.get_data()):
-                top_border += ["┌"] + (["─"] * width) + ["┐ "]
-                curr_node = curr_node.get_next()
+            height = node.get_height()
+            if height > level:
+                middle += [f"| {item} │⟶"]
+                bottom_border += ["└"] if level == 0 else ["├"]
+                bottom_border += ["─"] * width
+                bottom_border += ["┘ "] if level == 0 else ["┤ "]
             else:
-                top_border += [" "] + ([" "] * width) + ["  "]
-            lower_node = lower_node.get_next()
-        return "{}".format("".join(top_border))
+                middle += [f"⟶{'⟶'*width}⟶⟶"]
+                if height == level:
+                    bottom_border += ["┌"] + (["─"] * width) + ["┐ "]
+                else:
+                    bottom_border += [" "] + ([" "] * width) + ["  "]
+            node = node._next
+        return "{}\n{}".format("".join(middle), "".join(bottom_border))
 
     def __repr__(self):
         """
-        Represents the linked list as a string. The time-complexity of this
+        Represents the skip list as a string. The time-complexity of this
         method is O(n*h) where **n** is the number of nodes in the `SkipList()`
         and **h** is the height of the `SkipList()`.
 
@@ -455,21 +494,18 @@ class SkipList(Extra):
 
         Example
         -------
-        >>> import random; random.seed(1)
-        >>> sl = SkipList([20, 77, 10, 6, 2])
+        >>> sl = SkipList([20, 77, 10, 6, 2], seed=323)
         >>> sl
-        ┌────┐                    ┌────┐
-        | -∞ │⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶| 20 │⟶⟶⟶⟶⟶⟶⟶⟶
-        ├────┤                    ├────┤ ┌────┐
-        | -∞ │⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶| 20 │⟶| 77 │⟶
-        ├────┤ ┌───┐ ┌───┐ ┌────┐ ├────┤ ├────┤
+        ┌────┐ ┌───┐ ┌───┐               ┌────┐
+        | -∞ │⟶| 2 │⟶| 6 │⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶| 77 │⟶
+        ├────┤ ├───┤ ├───┤ ┌────┐ ┌────┐ ├────┤
         | -∞ │⟶| 2 │⟶| 6 │⟶| 10 │⟶| 20 │⟶| 77 │⟶
         └────┘ └───┘ └───┘ └────┘ └────┘ └────┘
         """
         output = [self.__print_top_border()]
         output += [
             self.__print_level(level)
-            for level in range(self._num_levels - 1, -1, -1)
+            for level in range(self.get_height() - 1, -1, -1)
         ]
         return "\n".join(output)
 
@@ -493,8 +529,7 @@ class SkipList(Extra):
         >>> len(sl)
         3
         """
-        n = len(self._level_lists[0])
-        return n - 1 if n > 0 else 0
+        return self._length
 
     def is_empty(self):
         """
@@ -516,14 +551,13 @@ class SkipList(Extra):
         >>> sl.is_empty()
         False
         """
-        return len(self) == 0
+        return self._length == 0
 
     # =============================    HEIGHT    ==============================
     def get_height(self):
         """
-        Gets the height of the `SkipNode()` instance. `SkipNode()` height is
-        the number of levels where each level is a standalone `LinkedList()`
-        object.
+        Gets the height of the `SkipList()` instance. `SkipList()` height is
+        the number of levels which is the height of its tallest tower.
 
         Returns
         -------
@@ -532,12 +566,26 @@ class SkipList(Extra):
 
         Example
         -------
-        >>> import random; random.seed(1)
-        >>> sl = SkipList([20, 77, 10, 6, 2])
+        >>> sl = SkipList([20, 77, 10, 6, 2], seed=323)
         >>> sl.get_height()
-        3
+        2
+        """
+        return len(self._head._forward) // 2 + 1
+
+    def _random_height(self):
         """
-        return self._num_levels
+        Draws the height of a new tower from a geometric distribution using
+        one random number, so the tower reaches every level with probability
+        `p` of reaching the one below it.
+
+        Returns
+        -------
+        int:
+            A positive integer that is at most `max_level`.
+        """
+        # NOTE: 1 - random() is in (0, 1], so the logarithm is always defined
+        height = 1 + int(math.log(1.0 - self._rng.random()) / self._log_p)
+        return min(height, self._max_level)
 
     # =============================   ITERATOR   ==============================
     def __iter__(self):
@@ -560,8 +608,10 @@ class SkipList(Extra):
         2
         3
         """
-        for item in self._level_lists[0][1:]:
-            yield item
+        node = self._head._next
+        while node is not None:
+            yield node._data
+            node = node._next
 
     # =============================    SEARCH    ==============================
     def _validate_item(self, item):
@@ -581,6 +631,8 @@ class SkipList(Extra):
         TypeError:
             If the given item is not a number.
         """
+        if self.TRUSTED:
+            return
         super()._validate_item(item)
         if type(item) not in {int, float}:
             raise TypeError(f"`{self.__name__}` supports only numbers!!")
@@ -644,10 +696,10 @@ class SkipList(Extra):
 
     def _search(self, value):
         """
-        Searches the `SkipList()` for a given value and returns the first node
-        containing that value if found and some other necessary info. If not
-        found, it returns the node whose value is less that the given value and
-        yet bigger than other values.
+        Searches the `SkipList()` for a given value by descending the levels
+        from the top one and returns the last node visited at every level
+        before reaching a node whose value is bigger than or equal to the
+        given value.
 
         Parameters
         ----------
@@ -656,16 +708,14 @@ class SkipList(Extra):
 
         Returns
         -------
-        SkipNode():
-            If the value is found, this object represents the previous node to
-            the found node. If the value isn't found, this object represents
-            the previous node to the last accessed node.
-        SkipNode():
-            If the value is found, this object is the found node. If the value
-            is not found, this object is the last accessed node.
         list:
-            A list of all accessed `SkipNode()` objects sorted in descending
-            manner.
+            A list of `SkipNode()` objects where the i-th one is the last node
+            whose value is less than the given value at the i-th level. So,
+            the given value is found when it is the value of the node that
+            follows the first `SkipNode()` at the lowest level.
+        list:
+            The positions of the previous `SkipNode()` objects where the -∞
+            head is at position zero and the first value is at position one.
 
         Raises:
         -------
@@ -674,42 +724,48 @@ class SkipList(Extra):
 
         Examples
         --------
-        >>> import random; random.seed(1)
-        >>> sl = SkipList([10, -2, 3])
+        >>> sl = SkipList([10, -2, 3], seed=26)
         >>> sl
-        ┌────┐              ┌────┐
-        | -∞ │⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶| 10 │⟶
-        ├────┤ ┌────┐       ├────┤
-        | -∞ │⟶| -2 │⟶⟶⟶⟶⟶⟶⟶| 10 │⟶
-        ├────┤ ├────┤ ┌───┐ ├────┤
+        ┌────┐ ┌────┐
+        | -∞ │⟶| -2 │⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶
+        ├────┤ ├────┤ ┌───┐ ┌────┐
         | -∞ │⟶| -2 │⟶| 3 │⟶| 10 │⟶
         └────┘ └────┘ └───┘ └────┘
-        >>> prev_node, node, last_accessed_nodes = sl._search(3)
-        >>> prev_node
-        SkipNode(data: -2, next: 3)
-        >>> node
-        Node(data: 3, next: 10)
-        >>> last_accessed_nodes
-        [SkipNode(data: -2, next: 10), SkipNode(data: -∞, next: 10)]
-        """
-        # returns the last accessed node when searching a certain value.
+        >>> prev_nodes, positions = sl._search(3)
+        >>> prev_nodes
+        [SkipNode(data: -2, height: 2, next: 3), \
+            SkipNode(data: -2, height: 2, next: 3)]
+        >>> positions
+        [1, 1]
+        """
         assert type(value) in {int, float}
 
-        last_accessed_nodes = []
-        top_list = self._level_lists[self._num_levels - 1]
-        prev_node = None
-        start_node = top_list._head
-        while (start_node.get_down() is not None):
-            prev_node, found_node = search_sorted(prev_node, start_node, value)
-            if found_node.get_data() == value:
-                return prev_node, found_node, last_accessed_nodes
-            last_accessed_nodes.append(found_node)
-            start_node = found_node.get_down()
-            if prev_node is not None:
-                prev_node = prev_node.get_down()
-        prev_node, found_node = search_sorted(prev_node, start_node, value)
-        assert len(last_accessed_nodes) == self._num_levels - 1
-        return prev_node, found_node, last_accessed_nodes[::-1]
+        height = self.get_height()
+        prev_nodes = [None] * height
+        positions = [0] * height
+        node = self._head
+        pos = 0
+        # NOTE: the pointer of the (i)th level is saved at `_forward[2*i-2]`
+        #  and its width is saved right after it.
+        for level in range(height - 1, 0, -1):
+            i = 2 * level - 2
+            forward = node._forward
+            next_node = forward[i]
+            while next_node is not None and next_node._data < value:
+                pos += forward[i + 1]
+                node = next_node
+                forward = node._forward
+                next_node = forward[i]
+            prev_nodes[level] = node
+            positions[level] = pos
+        next_node = node._next
+        while next_node is not None and next_node._data < value:
+            pos += 1
+            node = next_node
+            next_node = node._next
+        prev_nodes[0] = node
+        positions[0] = pos
+        return prev_nodes, positions
 
     def __contains__(self, value):
         """
@@ -728,11 +784,6 @@ class SkipList(Extra):
             `True` if the given value exists in the `SkipList()` instance, and
             `False` otherwise.
 
-        Raises
-        ------
-        ValueError:
-            If the given item is `None`.
-
         Examples
         --------
         >>> sl = SkipList([1, 3, 5])
@@ -745,16 +796,54 @@ class SkipList(Extra):
         """
         if type(value) not in {int, float}:
             return False
-        self._validate_item(value)
-        _, found_node, _ = self._search(value)
-        return found_node.get_data() == value
+        prev_nodes, _ = self._search(value)
+        found_node = prev_nodes[0]._next
+        return found_node is not None and found_node._data == value
+
+    def _get_node(self, idx):
+        """
+        Retrieves the node at the given index by descending the levels from
+        the top one and adding up the widths of the followed pointers.
+
+        Parameters
+        ----------
+        idx: int
+            A non-negative zero-based index within the `SkipList()`
+            boundaries.
+
+        Returns
+        -------
+        SkipNode():
+            The `SkipNode()` object at the given index.
+
+        Raises
+        ------
+        AssertionError:
+            If the given index is out of the `SkipList()` boundaries.
+        """
+        assert 0 <= idx < self._length
+
+        target = idx + 1  # NOTE: +1 to skip -∞
+        node = self._head
+        pos = 0
+        for level in range(self.get_height() - 1, 0, -1):
+            i = 2 * level - 2
+            forward = node._forward
+            while forward[i] is not None and pos + forward[i + 1] <= target:
+                pos += forward[i + 1]
+                node = forward[i]
+                forward = node._forward
+        while pos < target:
+            node = node._next
+            pos += 1
+        return node
 
     def __getitem__(self, idx):
         """
-        Retrieves the element at the given index in time-complexity of O(k)
-        where **k** is the given index. The given index is a zero-based `int`.
-        This method doesn't support negative indexing and doesn't support
-        `slice` objects either.
+        Retrieves the element at the given index in time-complexity of
+        O(log(n)) where **n** is the number of elements in the `SkipList()`.
+        The given index is a zero-based `int` and negative indices count from
+        the greatest value. This method doesn't support `slice` objects.
 
         Parameters
         ----------
@@ -773,9 +862,8 @@ class SkipList(Extra):
             If the given index isn't `int`.
         IndexError:
             This happens in one of the following cases:
-                1. If the given index is negative.
-                2. if the given index is a `slice` object.
-                3. If the given index is out of the `SkipList()` boundaries.
+                1. if the given index is a `slice` object.
+                2. If the given index is out of the `SkipList()` boundaries.
 
         Examples
         --------
@@ -784,10 +872,10 @@ class SkipList(Extra):
         1
         >>> sl[4]
         5
+        >>> sl[-2]
+        4
         >>> sl[10]
         IndexError: Can't find any element at the given index!!
-        >>> sl[-2]
-        IndexError: Negative indexing isn't supported with this functinoality!!
         >>> sl[2:]
         IndexError: Slice indexing isn't supported with this functinoality!!
 
@@ -795,69 +883,248 @@ class SkipList(Extra):
         ----
         The -∞ setntinel value is put in the `SkipList()` as a convention. So,
         it doesn't count as an element of the `SkipList()`. In other words, the
-        zeroths element in the above skip list is `0` not `-∞`.
+        zeroths element in the above skip list is `1` not `-∞`.
         """
-        self._validate_index(idx)
-        # NOTE: idx+1 to skip -∞
-        node = self._level_lists[0].__getitem__(idx + 1)
-        return node
+        self._validate_index(idx, accept_negative=True)
+        if idx < 0:
+            idx += self._length
+        return self._get_node(idx)._data
 
-    # =============================    INSERT    ==============================
-    def _add_extra_level(self):
+    # =============================     RANK     ==============================
+    def index(self, value):
         """
-        Creates a new level at the top of the `SkipList()`, a new level is a
-        new `LinkedList()` instance attached to the `SkipList()`.
+        Returns the index of the given value in the `SkipList()` instance in
+        time-complexity of O(log(n)) where **n** is the number of elements in
+        the `SkipList()`.
+
+        Parameters
+        ----------
+        value: int or float
+            The value to be searched for in the `SkipList()` instance.
 
         Returns
         -------
-        LinkedList():
-            The newly-created `LinkedList()` instance after being attached to
-            the other `LinkedList()` object in the lower level.
-        """
-        top_list = self._level_lists[self._num_levels - 1]
-        new_llist = LinkedList()
-        new_llist._insert_node(new_llist._head,
-                               self._basic_node(float("-inf")))
-        # connect the head of the new linked list to the lower linked list
-        new_llist._head.set_down(top_list._head)
-        # add new linked list to the SkipList
-        self._level_lists.append(new_llist)
-        self._num_levels += 1
-        return new_llist
-
-    def _promote(self, upper_prev_node, curr_node, curr_level):
-        """
-        Promotes a node to the higher level. Promoting is done by copying the
-        node from (i)th level to the (i+1)th level.
+        int:
+            The zero-based index of the given value.
+
+        Raises
+        ------
+        TypeError:
+            If the given `value` isn't a number.
+        ValueError:
+            It can be raised in two cases:
+                1. If the given `value` is `None`.
+                2. If the given `value` doesn't exist in the `SkipList()`.
+
+        Example
+        -------
+        >>> sl = SkipList([4, 3, 1, 5, 2])
+        >>> sl.index(4)
+        3
+        >>> sl.index(10)
+        ValueError: `10` doesn't exist in the `extra.SkipList()`!!
+        """
+        self._validate_item(value)
+        prev_nodes, positions = self._search(value)
+        found_node = prev_nodes[0]._next
+        if found_node is None or found_node._data != value:
+            raise ValueError(
+                f"`{value}` doesn't exist in the `{self.__name__}`!!"
+            )
+        return positions[0]
+
+    def rank(self, value):
+        """
+        Counts the values in the `SkipList()` instance that are smaller than
+        the given value in time-complexity of O(log(n)) where **n** is the
+        number of elements in the `SkipList()`. The given value doesn't have
+        to exist in the instance.
 
         Parameters
         ----------
-        upper_prev_node: SkipNode()
-            The tail of the `LinkedList()` object in the above level.
-        curr_node: SkipNode()
-            The node to be promoted.
-        curr_level: int
-            The current level rank (level of the node before promoting).
+        value: int or float
+            The value to be ranked.
 
         Returns
         -------
-        SkipNode():
-            The `SkipNode()` object after being promoted in the higher level.
+        int:
+            The number of values in the `SkipList()` instance that are smaller
+            than the given value. If the value exists, this is its index.
+
+        Raises
+        ------
+        ValueError:
+            If the given `value` is `None`.
+        TypeError:
+            If the given `value` isn't a number.
+
+        Example
+        -------
+        >>> sl = SkipList([40, 30, 10, 50, 20])
+        >>> sl.rank(40)
+        3
+        >>> sl.rank(35)
+        3
+        >>> sl.rank(100)
+        5
         """
-        assert isinstance(upper_prev_node, self._basic_node)
-        assert isinstance(curr_node, self._basic_node)
-        assert curr_level < self._num_levels
+        self._validate_item(value)
+        _, positions = self._search(value)
+        return positions[0]
 
-        # create new node with the same data as curr_data
-        upper_node = self._basic_node(curr_node.get_data())
-        # connect the upper list to the new node
-        upper_node = self._level_lists[curr_level + 1]._insert_node(
-            upper_prev_node, upper_node
-        )
-        # connect the current list with the upper one
-        upper_node.set_down(curr_node)
-        return upper_node
+    # =============================     RANGE    ==============================
+    def __iter_range(self, lo, hi):
+        """
+        Yields the values of the `SkipList()` instance that lie within the
+        closed interval `[lo, hi]` in ascending order.
+
+        Parameters
+        ----------
+        lo: int or float
+            The lower bound of the interval.
+        hi: int or float
+            The upper bound of the interval.
+
+        Yields
+        ------
+        int or float:
+            The values within the interval in ascending order.
+        """
+        prev_nodes, _ = self._search(lo)
+        node = prev_nodes[0]._next
+        while node is not None and node._data <= hi:
+            yield node._data
+            node = node._next
+
+    def range(self, lo, hi):
+        """
+        Lazily iterates over the values of the `SkipList()` instance that lie
+        within the closed interval `[lo, hi]` in ascending order. The levels
+        are descended once to reach `lo`, then the lowest level is walked, so
+        iterating over the whole range takes O(log(n)+k) time where **n** is
+        the number of elements in the `SkipList()` and **k** is the number of
+        values in the range.
+
+        Parameters
+        ----------
+        lo: int or float
+            The lower bound of the interval.
+        hi: int or float
+            The upper bound of the interval.
+
+        Returns
+        -------
+        generator:
+            A generator of the values within the interval in ascending order.
+            It yields nothing when `lo` is greater than `hi`.
+
+        Raises
+        ------
+        ValueError:
+            If one of the given bounds is `None`.
+        TypeError:
+            If one of the given bounds isn't a number.
+
+        Example
+        -------
+        >>> sl = SkipList([8, 5, 2, 7, 15, 10, 3])
+        >>> list(sl.range(3, 10))
+        [3, 5, 7, 8, 10]
+        >>> list(sl.range(4, 6.5))
+        [5]
 
+        Note
+        ----
+        The `SkipList()` instance shouldn't be modified while iterating over
+        the returned generator.
+        """
+        self._validate_item(lo)
+        self._validate_item(hi)
+        return self.__iter_range(lo, hi)
+
+    # =============================   NEIGHBORS  ==============================
+    def floor(self, value):
+        """
+        Returns the greatest value in the `SkipList()` instance that is less
+        than or equal to the given value in time-complexity of O(log(n)) where
+        **n** is the number of elements in the `SkipList()`.
+
+        Parameters
+        ----------
+        value: int or float
+            The value whose floor is needed.
+
+        Returns
+        -------
+        int or float or None:
+            The floor of the given value, or `None` if all the values in the
+            `SkipList()` instance are greater than the given value.
+
+        Raises
+        ------
+        ValueError:
+            If the given `value` is `None`.
+        TypeError:
+            If the given `value` isn't a number.
+
+        Example
+        -------
+        >>> sl = SkipList([8, 5, 2, 7, 15, 10, 3])
+        >>> sl.floor(6)
+        5
+        >>> sl.floor(7)
+        7
+        >>> sl.floor(1) is None
+        True
+        """
+        self._validate_item(value)
+        prev_nodes, positions = self._search(value)
+        next_node = prev_nodes[0]._next
+        if next_node is not None and next_node._data == value:
+            return next_node._data
+        # NOTE: the previous node is the -∞ head when it's at position zero
+        return prev_nodes[0]._data if positions[0] > 0 else None
+
+    def ceiling(self, value):
+        """
+        Returns the smallest value in the `SkipList()` instance that is greater
+        than or equal to the given value in time-complexity of O(log(n)) where
+        **n** is the number of elements in the `SkipList()`.
+
+        Parameters
+        ----------
+        value: int or float
+            The value whose ceiling is needed.
+
+        Returns
+        -------
+        int or float or None:
+            The ceiling of the given value, or `None` if all the values in the
+            `SkipList()` instance are less than the given value.
+
+        Raises
+        ------
+        ValueError:
+            If the given `value` is `None`.
+        TypeError:
+            If the given `value` isn't a number.
+
+        Example
+        -------
+        >>> sl = SkipList([8, 5, 2, 7, 15, 10, 3])
+        >>> sl.ceiling(6)
+        7
+        >>> sl.ceiling(7)
+        7
+        >>> sl.ceiling(16) is None
+        True
+        """
+        self._validate_item(value)
+        prev_nodes, _ = self._search(value)
+        next_node = prev_nodes[0]._next
+        return next_node._data if next_node is not None else None
+
+    # =============================    INSERT    ==============================
     def insert(self, value):
         """
         Insertd a value to the `SkipList()` instance in time-complexity of
@@ -874,15 +1141,12 @@ class SkipList(Extra):
 
         Example
         -------
-        >>> import random; random.seed(1)
-        >>> sl = SkipList([2, 1, 3, 4, 5])
+        >>> sl = SkipList([2, 1, 3, 4, 5], seed=1463)
         >>> sl.insert(10)
         >>> sl
-        ┌────┐       ┌───┐                   ┌────┐
-        | -∞ │⟶⟶⟶⟶⟶⟶⟶| 2 │⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶| 10 │⟶
-        ├────┤ ┌───┐ ├───┤                   ├────┤
-        | -∞ │⟶| 1 │⟶| 2 │⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶| 10 │⟶
-        ├────┤ ├───┤ ├───┤ ┌───┐ ┌───┐ ┌───┐ ├────┤
+        ┌────┐ ┌───┐             ┌───┐ ┌───┐
+        | -∞ │⟶| 1 │⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶| 4 │⟶| 5 │⟶⟶⟶⟶⟶⟶⟶⟶
+        ├────┤ ├───┤ ┌───┐ ┌───┐ ├───┤ ├───┤ ┌────┐
         | -∞ │⟶| 1 │⟶| 2 │⟶| 3 │⟶| 4 │⟶| 5 │⟶| 10 │⟶
         └────┘ └───┘ └───┘ └───┘ └───┘ └───┘ └────┘
         >>> sl.insert("hi")
@@ -890,63 +1154,49 @@ class SkipList(Extra):
 
         Note
         -----
-        Inserting values into different levels in the skip list is completely
-        random. So, running the previous example will return different values
-        each time you run it. So, in order to obtain the same result as before
-        you need to set `random.seed(1)` before running any of the previous
-        example.
+        The height of the new tower is random. So, running the previous
+        example without a `seed` will return a different structure each time
+        you run it.
         """
         self._validate_item(value)
-        # search for that value
-        _, found_node, last_accessed_nodes = self._search(value)
+        prev_nodes, positions = self._search(value)
+        found_node = prev_nodes[0]._next
         # `value` already exists in our SkipList
-        if found_node.get_data() == value:
+        if found_node is not None and found_node._data == value:
             return
-        # create new_node with the new value
-        new_node = self._basic_node(value)
-        # insert new_node to the 0th linkedlist
-        curr_node = self._level_lists[0]._insert_node(found_node, new_node)
-
-        # promote the new_node if flipping the coin results `Head`
-        curr_level = 0
-        while flip_coin() == "head":
-            if curr_level >= self._num_levels - 1:
-                top_list = self._add_extra_level()
-                upper_prev_node = top_list._head
+        height = self._random_height()
+        # the head is the only node reaching the new levels of the new tower.
+        # These levels are empty, so they reach one step past the last node.
+        head_forward = self._head._forward
+        while len(head_forward) < 2 * height - 2:
+            head_forward.extend([None, self._length + 1])
+            prev_nodes.append(self._head)
+            positions.append(0)
+        new_node = self._basic_node(value, height)
+        new_node._next = found_node
+        prev_nodes[0]._next = new_node
+        new_pos = positions[0] + 1
+        new_forward = new_node._forward
+        for level in range(1, len(prev_nodes)):
+            i = 2 * level - 2
+            prev_forward = prev_nodes[level]._forward
+            if level < height:
+                # split the pointer into two around the new node
+                width = new_pos - positions[level]
+                new_forward[i] = prev_forward[i]
+                new_forward[i + 1] = prev_forward[i + 1] - width + 1
+                prev_forward[i] = new_node
+                prev_forward[i + 1] = width
             else:
-                upper_prev_node = last_accessed_nodes[curr_level]
-            # promote new_node
-            curr_node = self._promote(upper_prev_node, curr_node, curr_level)
-            curr_level += 1
+                # the pointer jumps over the new node
+                prev_forward[i + 1] += 1
+        self._length += 1
 
     # =============================    REMOVE    ==============================
-    def _remove_level(self, level):
-        """
-        Removes a level from the `SkipList()` instance. We need to do so when
-        deleting a value from the `SkipList()` instance which results in a a
-        whole level being empty, so we will need to get rid of this level.
-
-        Parameters
-        ----------
-        level: int
-            The level rank which we want to remove.
-
-        Raises
-        ------
-        AssertionError:
-            This can happen in two cases:
-                1. If the type of the given `level` isn't `int`.
-                2. If the level is less than 1 and greater than the total \
-                    number of levels.
-        """
-        assert type(level) == int and 1 <= level < self._num_levels
-
-        del self._level_lists[level]
-        self._num_levels -= 1
-
     def remove(self, value):
         """
-        Removes node whose value equal to the given value.
+        Removes node whose value equal to the given value in time-complexity of
+        O(log(n)) where **n** is the number of elements in the `SkipList()`.
 
         Parameters
         ----------
@@ -955,8 +1205,7 @@ class SkipList(Extra):
 
         Example
         -------
-        >>> import random; random.seed(1)
-        >>> sl = SkipList([4, 3, 1, 5])
+        >>> sl = SkipList([4, 3, 1, 5], seed=44)
         >>> sl
         ┌────┐             ┌───┐
         | -∞ │⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶| 4 │⟶⟶⟶⟶⟶⟶⟶
@@ -981,31 +1230,33 @@ class SkipList(Extra):
         """
         if type(value) not in {int, float}:
             return
-        # search for that value
-        prev_node, found_node, last_accessed_nodes = self._search(value)
-        # NOTE: len(last_accessed_nodes) can be used to get the level where
-        #  this value was found
-        if found_node.get_data() == value:
-            level = self._num_levels - 1 - len(last_accessed_nodes)
-            while level >= 0:
-                curr_level_list = self._level_lists[level]
-                curr_level_list._remove_node(prev_node, found_node)
-                # check if curr_level_list is empty()
-                if level != 0 and len(curr_level_list) == 1:
-                    self._remove_level(level)
-                level -= 1
-                found_node = found_node.get_down()
-                # update value of prev_node
-                if prev_node is not None and found_node is not None:
-                    prev_node = prev_node.get_down()
-                    next_node = prev_node.get_next()
-                    while next_node.get_data() != found_node.get_data():
-                        prev_node = next_node
-                        next_node = prev_node.get_next()
+        prev_nodes, _ = self._search(value)
+        found_node = prev_nodes[0]._next
+        if found_node is None or found_node._data != value:
+            return
+        prev_nodes[0]._next = found_node._next
+        found_forward = found_node._forward
+        found_height = found_node.get_height()
+        for level in range(1, len(prev_nodes)):
+            i = 2 * level - 2
+            prev_forward = prev_nodes[level]._forward
+            if level < found_height:
+                # merge the two pointers around the removed node
+                prev_forward[i] = found_forward[i]
+                prev_forward[i + 1] += found_forward[i + 1] - 1
+            else:
+                prev_forward[i + 1] -= 1
+        self._length -= 1
+        # get rid of the top levels that became empty
+        head_forward = self._head._forward
+        while head_forward and head_forward[-2] is None:
+            del head_forward[-2:]
 
     def __delitem__(self, idx):
         """
-        Removes node at a given index at the `SkipList()` instance.
+        Removes node at a given index at the `SkipList()` instance in
+        time-complexity of O(log(n)) where **n** is the number of elements in
+        the `SkipList()`. Negative indices count from the greatest value.
 
         Parameters
         ----------
@@ -1019,14 +1270,12 @@ class SkipList(Extra):
             If the given index isn't `int`.
         IndexError:
             This happens in one of the following cases:
-                1. If the given index is negative.
-                2. If the given index is out of the `SkipList()` boundaries.
-                3. if the given index is a `slice` object.
+                1. If the given index is out of the `SkipList()` boundaries.
+                2. if the given index is a `slice` object.
 
         Example
         -------
-        >>> import random; random.seed(1)
-        >>> sl = SkipList([4, 3, 1, 5])
+        >>> sl = SkipList([4, 3, 1, 5], seed=44)
         >>> sl
         ┌────┐             ┌───┐
         | -∞ │⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶| 4 │⟶⟶⟶⟶⟶⟶⟶
@@ -1044,16 +1293,8 @@ class SkipList(Extra):
         └────┘ └───┘ └───┘ └───┘
         >>> del sl[10]
         IndexError: Can't find any element at the given index!!
-
-        Note
-        ----
-        In the previuos example, the top level was deleted when we removed `4`
-        since it was empty after removal.
         """
-        self._validate_index(idx)
-        # NOTE: idx+1 to skip -∞
-        _, node = self._level_lists[0]._get_node(idx + 1)
-        self.remove(node.get_data())
+        self.remove(self[idx])
 
     def clear(self):
         """
@@ -1061,8 +1302,7 @@ class SkipList(Extra):
 
         Example
         -------
-        >>> import random; random.seed(1)
-        >>> sl = SkipList([4, 3, 1, 5])
+        >>> sl = SkipList([4, 3, 1, 5], seed=44)
         >>> sl
         ┌────┐             ┌───┐
         | -∞ │⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶| 4 │⟶⟶⟶⟶⟶⟶⟶
@@ -1079,7 +1319,10 @@ class SkipList(Extra):
         | -∞ │⟶
         └────┘
         """
-        self.__init__()
+        self._head = self._basic_node(float("-inf"))
+        # NOTE: the head grows & shrinks with the tallest tower
+        self._head._forward = []
+        self._length = 0
 
     # =============================     MISC     ==============================
     def to_list(self):
@@ -1095,17 +1338,14 @@ class SkipList(Extra):
 
         Example
         -------
-        >>> import random; random.seed(1)
-        >>> sl = SkipList()
+        >>> sl = SkipList(seed=3)
         >>> sl.insert(20)
         >>> sl.insert(10)
         >>> sl.insert(30)
         >>> sl
-        ┌────┐        ┌────┐
-        | -∞ │⟶⟶⟶⟶⟶⟶⟶⟶| 20 │⟶⟶⟶⟶⟶⟶⟶⟶
-        ├────┤ ┌────┐ ├────┤
-        | -∞ │⟶| 10 │⟶| 20 │⟶⟶⟶⟶⟶⟶⟶⟶
-        ├────┤ ├────┤ ├────┤ ┌────┐
+        ┌────┐ ┌────┐
+        | -∞ │⟶| 10 │⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶
+        ├────┤ ├────┤ ┌────┐ ┌────┐
         | -∞ │⟶| 10 │⟶| 20 │⟶| 30 │⟶
         └────┘ └────┘ └────┘ └────┘
         >>> sl.to_list()
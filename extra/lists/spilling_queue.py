@@ -0,0 +1,237 @@
+"""
+A spilling queue is a `Queue()` whose backlog can grow larger than the memory.
+It keeps a bounded number of its oldest items, which are dequeued next, and of
+its newest items in memory, while the items in between are spilled to
+append-only segment files on disk. The segment files are read back through a
+memory map as the queue gets drained, so the first-in, first-out (FIFO) order
+is preserved. As long as the consumers keep up with the producers, nothing is
+written to disk at all.
+"""
+from extra.lists.queue import Queue
+from extra.lists._spilling_buffer import SpillingBuffer
+
+
+class SpillingQueue(Queue):
+    """
+    A spilling queue is a first-in, first-out (FIFO) queue that keeps its
+    front and its back in memory and spills the items in between to segment
+    files on disk, so that a backlog larger than the memory doesn't have to be
+    dropped. The items have to be picklable.
+    """
+
+    __name__ = "extra.SpillingQueue()"
+
+    def __init__(
+        self,
+        max_capacity=float("inf"),
+        memory_capacity=10_000,
+        segment_size=1 << 22,
+        directory=None,
+        overflow="warn",
+        empty="warn",
+        sentinel=None,
+        timeout=None,
+    ):
+        """
+        Creates a `SpillingQueue()` object and a temporary directory for its
+        segment files!!
+
+        Parameters
+        ----------
+        max_capacity: int
+            It's a positive integer representing the maximum number of elements
+            a `SpillingQueue()` should contain (Default: inf).
+        memory_capacity: int
+            The maximum number of items kept in memory at the front and at the
+            back of the `SpillingQueue()` each (Default: 10000).
+        segment_size: int
+            The number of bytes after which a segment file stops growing and a
+            new one is started (Default: 4 MiB).
+        directory: str, optional
+            The directory in which the temporary directory of the segment
+            files is created. `None` means the default temporary directory
+            (Default: None).
+        overflow: str
+            What `enqueue()` does when the `SpillingQueue()` is full, the same
+            as for `Queue()` (Default: "warn").
+        empty: str
+            What `dequeue()` does when the `SpillingQueue()` is empty, the same
+            as for `Queue()` (Default: "warn").
+        sentinel: object
+            The object returned by `dequeue()` when the `SpillingQueue()` is
+            empty (Default: None).
+        timeout: int or float, optional
+            The maximum number of seconds the `"block"` overflow policy of
+            `enqueue()` waits (Default: None).
+
+        Raises
+        ------
+        TypeError: It can be raised in two cases
+            1. If the type of `max_capacity` isn't `int` or `float`, or the
+            type of `memory_capacity` or `segment_size` isn't `int`.
+            2. If the given `timeout` is neither `None` nor a number.
+        ValueError: It can be raised in three cases
+            1. If the given value of `max_capacity` is less than zero, or the
+            value of `memory_capacity` or `segment_size` is less than one.
+            2. If the given `overflow` or `empty` isn't a known policy.
+            3. If the given `timeout` is negative.
+
+        Example
+        -------
+        >>> q = SpillingQueue(memory_capacity=1000)
+        >>> type(q)
+        <class 'extra.lists.spilling_queue.SpillingQueue'>
+        >>> q._max_capacity
+        inf
+
+        Note
+        ----
+        The segment files are removed when the `SpillingQueue()` is closed or
+        garbage-collected, whichever comes first.
+        """
+        for name, value in [
+            ("Memory capacity", memory_capacity),
+            ("Segment size", segment_size),
+        ]:
+            if type(value) is not int:
+                raise TypeError(
+                    f"{name} of `{self.__name__}` has to be an integer!!"
+                )
+            elif value < 1:
+                raise ValueError(
+                    f"{name} of `{self.__name__}` has to be >= 1!!"
+                )
+        self._memory_capacity = memory_capacity
+        self._segment_size = segment_size
+        self._directory = directory
+        super().__init__(
+            max_capacity, "array", overflow, empty, sentinel, timeout
+        )
+
+    def _create_container(self):
+        """
+        Creates the spilling buffer storing the elements of the instance.
+
+        Returns
+        -------
+        SpillingBuffer:
+            An empty buffer with its own temporary directory.
+        """
+        return SpillingBuffer(
+            self._memory_capacity, self._segment_size, self._directory
+        )
+
+    def close(self):
+        """
+        Removes all the items of the `SpillingQueue()` instance along with
+        its segment files and their directory. The instance can't be used
+        afterwards.
+
+        Example
+        -------
+        >>> q = SpillingQueue()
+        >>> q.enqueue(10)
+        >>> q.close()
+        """
+        self._container.close()
+
+    # =============================    ENQUEUE   ==============================
+    def enqueue(self, item):
+        """
+        Inserts the given `item` to end of the `SpillingQueue()` in amortized
+        constant time. If the back of the queue is full, the items there are
+        appended to a segment file first.
+
+        Parameters
+        ----------
+        item: object
+            The picklable python object to be pushed to the `SpillingQueue()`.
+
+        Raises
+        ------
+        UserWarning:
+            If the `SpillingQueue()` instance was full and its overflow policy
+            is `"warn"`!!
+        OverflowError:
+            If the `SpillingQueue()` instance was full and its overflow policy
+            is either `"raise"` or `"block"` which timed out.
+        ValueError:
+            If the given `item` is `None`.
+        TypeError:
+            If the given `item` is an instance of `Extra`, or it can't be
+            pickled while it has to be spilled.
+
+        Example
+        -------
+        >>> q = SpillingQueue(memory_capacity=1)
+        >>> q.enqueue(1)
+        >>> q.enqueue(2)
+        >>> q.enqueue(3)
+        >>> q
+        ─┬───┬───┬───┬─
+        ⟶│ 3 │ 2 │ 1 │⟶
+        ─┴───┴───┴───┴─
+        """
+        super().enqueue(item)
+
+    # =============================      TOP     ==============================
+    def top(self):
+        """
+        Returns the first item inserted to the `SpillingQueue()` instance,
+        reading it from a segment file if the front of the queue is empty.
+
+        Returns
+        -------
+        object:
+            The `SpillingQueue()` instance's first inserted item.
+
+        Raises
+        ------
+        IndexError:
+            If the `SpillingQueue()` instance is empty!!
+
+        Example
+        -------
+        >>> q = SpillingQueue()
+        >>> q.enqueue(10)
+        >>> q.enqueue(20)
+        >>> q.top()
+        10
+        """
+        return super().top()
+
+    # =============================    DEQUEUE   ==============================
+    def dequeue(self):
+        """
+        Pops the first inserted item from the `SpillingQueue()` in amortized
+        constant time. If the front of the queue is empty, it's refilled from
+        the oldest segment file, or from the back of the queue if nothing was
+        spilled.
+
+        Returns
+        -------
+        object:
+            The `SpillingQueue()` instance's first item or its sentinel if
+            it's empty and its empty policy isn't `"raise"`.
+
+        Raises
+        ------
+        UserWarning:
+            If the `SpillingQueue()` instance is empty and its empty policy is
+            `"warn"`!!
+        IndexError:
+            If the `SpillingQueue()` instance is empty and its empty policy is
+            `"raise"`!!
+
+        Example
+        -------
+        >>> q = SpillingQueue(memory_capacity=1)
+        >>> q.enqueue(10)
+        >>> q.enqueue(20)
+        >>> q.enqueue(30)
+        >>> q.dequeue()
+        10
+        >>> q.dequeue()
+        20
+        """
+        return super().dequeue()
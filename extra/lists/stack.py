@@ -223,6 +223,55 @@ class Stack(Extra):
             item = item.replace("\n", "\\n")
         self._container.append(item)
 
+    def push_many(self, items):
+        """
+        Pushes the given items to the `Stack()`, one after the other, in
+        linear time. The last item will be at the top of the `Stack()`. The
+        items are validated and the capacity is checked once, before any of
+        them is pushed.
+
+        Parameters
+        ----------
+        items: iterable
+            The python objects to be pushed to the `Stack()`.
+
+        Raises
+        ------
+        OverflowError:
+            If the items don't fit in the `Stack()` instance, in which case
+            none of them is pushed!!
+        ValueError:
+            If one of the given items is `None`.
+        TypeError:
+            If one of the given items is an `Extra` object.
+
+        Example
+        -------
+        >>> s = Stack(max_capacity=3)
+        >>> s.push_many([1, 2])
+        >>> s
+        ┌───┬───┬─
+        │ 1 │ 2 │
+        └───┴───┴─
+        >>> s.push_many([3, 4])
+        OverflowError: Stackoverflow! Can't push 2 items into `extra.Stack()` \
+            with room for 1!!
+        """
+        items = list(items)
+        room = self._max_capacity - len(self)
+        if len(items) > room:
+            raise OverflowError(
+                f"Stackoverflow! Can't push {len(items)} items into "
+                + f"`{self.__name__}` with room for {room}!!"
+            )
+        if not self.TRUSTED:
+            for item in items:
+                super()._validate_item(item)
+        self._container.extend(
+            item.replace("\n", "\\n") if type(item) == str else item
+            for item in items
+        )
+
     # =============================     PEEK     ==============================
     def peek(self):
         """
@@ -299,6 +348,65 @@ class Stack(Extra):
         else:
             return self._container.pop()
 
+    def pop_many(self, count):
+        """
+        Pops the given number of the top items from the `Stack()` in linear
+        time.
+
+        Parameters
+        ----------
+        count: int
+            The number of items to be popped.
+
+        Returns
+        -------
+        list:
+            The popped items, the top one first. It holds fewer items than
+            `count` if the `Stack()` instance doesn't have enough of them.
+
+        Raises
+        ------
+        UserWarning:
+            If the `Stack()` instance has fewer items than `count`!!
+        TypeError:
+            If the given `count` isn't an integer.
+        ValueError:
+            If the given `count` is negative.
+
+        Example
+        -------
+        >>> s = Stack()
+        >>> s.push_many([10, 20, 30])
+        >>> s.pop_many(2)
+        [30, 20]
+        >>> s.pop_many(2)
+        UserWarning: Popping 2 items from `extra.Stack()` of only 1 items!!
+        [10]
+        """
+        if type(count) is not int:
+            raise TypeError(
+                f"Number of items to pop from `{self.__name__}` has to be an "
+                + "integer!!"
+            )
+        elif count < 0:
+            raise ValueError(
+                f"Number of items to pop from `{self.__name__}` has to be "
+                + ">= 0!!"
+            )
+        elif count > len(self):
+            warnings.warn(
+                f"Popping {count} items from `{self.__name__}` of only "
+                + f"{len(self)} items!!",
+                UserWarning,
+            )
+            count = len(self)
+        # NOTE: slicing from `-count` would take everything when it's zero
+        start = len(self._container) - count
+        items = self._container[start:]
+        del self._container[start:]
+        items.reverse()
+        return items
+
     def clear(self):
         """
         Removes all objects within the `Stack()` instance in constant time.
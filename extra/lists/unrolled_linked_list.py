@@ -0,0 +1,1696 @@
+"""
+An unrolled linked list is a variation of the linked list where each node
+stores a block of items instead of just one item. Every block has a fixed
+capacity and it is kept at least half full most of the time, which makes the
+unrolled linked list use much less memory than a normal linked list since the
+overhead of creating a node is paid once per block. Also, iterating over the
+items is faster since the items of one block are stored next to each other.
+
+The following is a simple unrolled linked list, with a capacity of four,
+containing the first seven numbers of the Fibonacci series:
+
+.. code-block:: text
+
+    ┌───┬───┬───┬───┐ ┌───┬───┬───┐
+    │ 0 │ 1 │ 1 │ 2 │⟶│ 3 │ 5 │ 8 │⟶
+    └───┴───┴───┴───┘ └───┴───┴───┘
+
+Looking up an item by its index walks over whole blocks instead of single
+nodes, so it takes O(n/b) where **b** is the capacity of the blocks.
+"""
+import operator
+from extra.interface import Extra
+
+
+class UnrolledNode(Extra):
+    """
+    An unrolled node is the basic unit for building unrolled linked lists.
+    It holds a block of items stored in a Python `list` and a reference to
+    the next unrolled node.
+    """
+
+    __name__ = "extra.UnrolledNode()"
+    __slots__ = ("_items", "_next")
+
+    def __init__(self, items):
+        """
+        Creates a `UnrolledNode()` object holding the given block of items.
+
+        Parameters
+        ----------
+        items: list
+            The items stored in the node. The list is used as it is without
+            being copied.
+
+        Raises
+        ------
+        AssertionError:
+            If the given object isn't a `list`.
+        """
+        assert isinstance(items, list)
+        self._items = items
+        self._next = None
+
+    def __repr__(self):
+        """
+        Represents `UnrolledNode()` object as a string.
+
+        Returns
+        -------
+        str:
+            A string representing the `UnrolledNode()` instance.
+
+        Example
+        -------
+        >>> x = UnrolledNode([10, 20])
+        >>> x
+        UnrolledNode(items: [10, 20], next: None)
+        """
+        next_items = None if self._next is None else self._next._items
+        return f"UnrolledNode(items: {self._items}, next: {next_items})"
+
+    def __len__(self):
+        """
+        Returns the number of items in the block of the `UnrolledNode()`.
+
+        Returns
+        -------
+        int:
+            The number of items stored in the node.
+
+        Example
+        -------
+        >>> len(UnrolledNode([10, 20]))
+        2
+        """
+        return len(self._items)
+
+    def get_items(self):
+        """
+        Returns the block of items stored in the `UnrolledNode()`.
+
+        Returns
+        -------
+        list:
+            The items stored in the node.
+
+        Example
+        -------
+        >>> x = UnrolledNode([10, 20])
+        >>> x.get_items()
+        [10, 20]
+        """
+        return self._items
+
+    def get_next(self):
+        """
+        Returns the `UnrolledNode()` that follows the current one.
+
+        Returns
+        -------
+        UnrolledNode() or None:
+            The next node or `None` if the current node is the last one.
+
+        Example
+        -------
+        >>> x = UnrolledNode([10, 20])
+        >>> x.get_next() is None
+        True
+        """
+        return self._next
+
+    def set_next(self, next_node):
+        """
+        Sets the next pointer of the current `UnrolledNode()` to the given
+        node.
+
+        Parameters
+        ----------
+        next_node: UnrolledNode() or None
+            The `UnrolledNode()` that will follow the current one.
+
+        Raises
+        ------
+        TypeError:
+            If the given object isn't an `UnrolledNode()`.
+        """
+        if next_node is None:
+            self._next = None
+        elif not isinstance(next_node, UnrolledNode):
+            raise TypeError(
+                f"Can't set {type(next_node)} as a `{self.__name__}`!!"
+            )
+        else:
+            self._next = next_node
+
+
+class UnrolledLinkedList(Extra):
+    """
+    An unrolled linked list is a linked list whose nodes store blocks of
+    items. It provides the same functionalities of the `LinkedList()` while
+    using less memory and walking over whole blocks when looking for an
+    item by its index.
+    """
+
+    __name__ = "extra.UnrolledLinkedList()"
+
+    def __init__(self, iterable=None, capacity=32):
+        """
+        Initializes an `UnrolledLinkedList()` object instance using an
+        optional iterable object in time-complexity of O(n) where **n** is the
+        number of elements inside the given `iterable`.
+
+        Parameters
+        ----------
+        iterable: any iterable object, optional.
+            An iterable object that implements the `__iter__` method.
+            For example, `list` and `tuple` are both iterables.
+        capacity: int, optional
+            The maximum number of items stored in one block, default 32.
+
+        Raises
+        -------
+        TypeError
+            It can be raised in three cases:
+                1. In case the given object isn't iterable.
+                2. If one of the iterable elements is an `Extra` object.
+                3. If the given capacity isn't an integer.
+        ValueError
+            It can be raised in two cases:
+                1. If one of the iterable elements has `None` as a value.
+                2. If the given capacity is less than two.
+
+        Examples
+        --------
+        >>> ull = UnrolledLinkedList([10, -5, 7, 9], capacity=2)
+        >>> ull
+        ┌────┬────┐ ┌───┬───┐
+        │ 10 │ -5 │⟶│ 7 │ 9 │⟶
+        └────┴────┘ └───┴───┘
+
+        Using an iterable object with `None` as one of its elements will raise
+        `ValueError`
+
+        >>> UnrolledLinkedList([2, None])
+        ValueError: Can't use `None` as an element within \
+            `extra.UnrolledLinkedList()`!!
+
+        Using a non-iterable object will raise `TypeError`
+
+        >>> UnrolledLinkedList(2)
+        TypeError: The given object isn't iterable!!
+        """
+        if type(capacity) != int:
+            raise TypeError("The block capacity must be an integer!!")
+        elif capacity < 2:
+            raise ValueError("The block capacity must be at least two!!")
+        self._capacity = capacity
+        self._head = self._tail = None
+        self._length = 0
+        if iterable is None:
+            return
+        elif not hasattr(iterable, "__iter__"):
+            raise TypeError("The given object isn't iterable!!")
+        for item in iterable:
+            self._validate_item(item)
+            self.__append(item)
+
+    def _create_instance(self):
+        """
+        Returns an `UnrolledLinkedList()` instance with the same capacity.
+
+        Returns
+        -------
+        UnrolledLinkedList()
+            It returns an empty `UnrolledLinkedList()` instance.
+        """
+        return UnrolledLinkedList(capacity=self._capacity)
+
+    def get_capacity(self):
+        """
+        Returns the maximum number of items stored in one block of the
+        `UnrolledLinkedList()` instance.
+
+        Returns
+        -------
+        int:
+            The capacity of the blocks.
+
+        Example
+        -------
+        >>> ull = UnrolledLinkedList(capacity=8)
+        >>> ull.get_capacity()
+        8
+        """
+        return self._capacity
+
+    # =============================     PRINT    ==============================
+    def _print_node(self, node):
+        """
+        Prints the given node of the `UnrolledLinkedList()` instance.
+
+        Parameters
+        ----------
+        node: UnrolledNode()
+            The `UnrolledNode()` object that we want to print.
+
+        Returns
+        -------
+        tuple:
+            It returns a tuple of three strings representing the given node
+            when printed.
+
+        Example
+        -------
+        >>> ull = UnrolledLinkedList([10, 2])
+        >>> lines = ull._print_node(ull._head)
+        >>> print("\\n".join(lines))
+        ┌────┬───┐
+        │ 10 │ 2 │⟶
+        └────┴───┘
+        """
+        assert isinstance(node, UnrolledNode)
+
+        items = [str(item) for item in node.get_items()]
+        widths = [len(item) + 2 for item in items]  # a space before & after
+        top_border = "┌" + "┬".join("─" * width for width in widths) + "┐ "
+        middle = "│" + "│".join(f" {item} " for item in items) + "│⟶"
+        lower_border = "└" + "┴".join("─" * width for width in widths) + "┘ "
+        return top_border, middle, lower_border
+
+    def __repr__(self):
+        """
+        Represents the `UnrolledLinkedList()` instance as a string where each
+        block is drawn as one node.
+
+        Returns
+        -------
+        str:
+            The string-representation of the `UnrolledLinkedList()` instance.
+
+        Example
+        -------
+        >>> ull = UnrolledLinkedList([20, 77, 10, 6, 2], capacity=3)
+        >>> ull
+        ┌────┬────┬────┐ ┌───┬───┐
+        │ 20 │ 77 │ 10 │⟶│ 6 │ 2 │⟶
+        └────┴────┴────┘ └───┴───┘
+        """
+        if self.is_empty():
+            return "┌─\n│\n└─"
+        top_border, middle, lower_border = [], [], []
+        curr_node = self._head
+        while curr_node is not None:
+            top_part, middle_part, lower_part = self._print_node(curr_node)
+            top_border.append(top_part)
+            middle.append(middle_part)
+            lower_border.append(lower_part)
+            curr_node = curr_node.get_next()
+        return "{}\n{}\n{}".format(
+            "".join(top_border), "".join(middle), "".join(lower_border)
+        )
+
+    # =============================    LENGTH    ==============================
+    def __len__(self):
+        """
+        Gets the length of the `UnrolledLinkedList()` in constant time.
+
+        Returns
+        -------
+        int:
+            The length of the `UnrolledLinkedList()` instance. Length is the
+            number of elements in the instance.
+
+        Example
+        -------
+        >>> ull = UnrolledLinkedList([1, 2, 3])
+        >>> len(ull)
+        3
+        """
+        return self._length
+
+    def is_empty(self):
+        """
+        Checks if `UnrolledLinkedList()` instance is empty or not in constant
+        time.
+
+        Returns
+        -------
+        bool:
+            A boolean flag showing if the `UnrolledLinkedList()` instance is
+            empty or not. `True` shows that this instance is empty and `False`
+            shows it's not empty.
+
+        Example
+        -------
+        >>> ull = UnrolledLinkedList()
+        >>> ull.is_empty()
+        True
+        >>> ull.add_front(5)
+        >>> ull.is_empty()
+        False
+        """
+        return self._length == 0
+
+    # =============================   OPERATOR   ==============================
+    def __iter__(self):
+        """
+        Iterates over the `UnrolledLinkedList()` instance and returns a
+        generator in time-complexity of O(n) where **n** is the number of
+        elements in the `UnrolledLinkedList()` instance.
+
+        Returns
+        -------
+        generator:
+            The value of each item in the instance.
+
+        Example
+        -------
+        >>> ull = UnrolledLinkedList([1, 2, 3])
+        >>> for value in ull:
+        ...     print(value, end=',')
+        1,2,3,
+        """
+        curr_node = self._head
+        while curr_node is not None:
+            yield from curr_node.get_items()
+            curr_node = curr_node.get_next()
+
+    def _compare(self, other, op):
+        """
+        Compares two intances of `UnrolledLinkedList()` and returns the index
+        at which two items didn't satisfy the given operator.
+
+        Parameters
+        ----------
+        other: UnrolledLinkedList()
+            The other instance that we want to compare with the current one
+        op: operator.function
+            An operator function that represents ==, >=, <=, !=, <, > operators
+
+        Returns
+        -------
+        int
+            The index at which the given operator wasn't satisfied
+        bool
+            `True` if all elements in both instances are exactly the same.
+            `False` other wise
+
+        Raises
+        ------
+        TypeError:
+            In case one element in the first instance doesn't match the type of
+            the opposing element in the other instance.
+
+        Examples
+        --------
+        >>> import operator
+        >>> ull_1 = UnrolledLinkedList([1, 2, 3])
+        >>> ull_2 = UnrolledLinkedList([1, 3, 2])
+        >>> ull_1._compare(ull_2, operator.eq)
+        (1, False)
+        >>> ull_1._compare(ull_1, operator.le)
+        (3, True)
+        """
+        assert isinstance(other, self.__class__)
+        assert op.__name__ in dir(operator)
+
+        counter = 0
+        all_equal = True
+        for item1, item2 in zip(self, other):
+            try:
+                # NOTE: Don't remove the following if-condition
+                if item1 == item2:
+                    pass
+                else:
+                    all_equal = False
+                    if not op(item1, item2):
+                        break
+            except TypeError:
+                raise TypeError(
+                    f"Inconsist data-types within the two {self.__name__} "
+                    + "instances!!"
+                )
+            counter += 1
+        return counter, all_equal
+
+    def __validate_other(self, other):
+        """
+        Makes sure the given object can be compared to the current instance.
+
+        Parameters
+        ----------
+        other: object
+            The object to be compared to the `UnrolledLinkedList()`.
+
+        Raises
+        ------
+        TypeError:
+            If the other object isn't an `UnrolledLinkedList()` instance.
+        """
+        if not isinstance(other, self.__class__):
+            raise TypeError(
+                f"Can't compare `{self.__name__}` to `{type(other)}`"
+            )
+
+    def __eq__(self, other):
+        """
+        Checks if two `UnrolledLinkedList()` instances are equal to each
+        other. And this happens if, and only if, both instances have the same
+        items in the same order regardless of their block capacities.
+
+        Parameters
+        ----------
+        other: UnrolledLinkedList()
+            The other instance that we want to compare with the current one
+
+        Returns
+        -------
+        bool
+            `True` if both instances are equal, and `False` otherwise.
+
+        Raises
+        ------
+        TypeError:
+            This happens in two cases
+                1. If the other instance isn't an `UnrolledLinkedList()`.
+                2. In case one element in the first instance doesn't match the
+                type of the opposing element in the other instance.
+
+        Examples
+        --------
+        >>> ull_1 = UnrolledLinkedList([1, 2, 3])
+        >>> ull_2 = UnrolledLinkedList([1, 3, 2])
+        >>> ull_1 == ull_2
+        False
+        >>> ull_1 == ull_1
+        True
+        """
+        self.__validate_other(other)
+        if self._length != other._length:
+            return False
+        idx, _ = self._compare(other, operator.eq)
+        return idx == self._length
+
+    def __ne__(self, other):
+        """
+        Checks if two `UnrolledLinkedList()` instances are NOT equal to each
+        other.
+
+        Parameters
+        ----------
+        other: UnrolledLinkedList()
+            The other instance that we want to compare with the current one
+
+        Returns
+        -------
+        bool
+            `True` if both instances are NOT equal, and `False` otherwise.
+
+        Raises
+        ------
+        TypeError:
+            This happens in two cases
+                1. If the other instance isn't an `UnrolledLinkedList()`.
+                2. In case one element in the first instance doesn't match the
+                type of the opposing element in the other instance.
+
+        Examples
+        --------
+        >>> ull_1 = UnrolledLinkedList([1, 2, 3])
+        >>> ull_2 = UnrolledLinkedList([1, 3, 2])
+        >>> ull_1 != ull_2
+        True
+        """
+        return not self.__eq__(other)
+
+    def __lt__(self, other):
+        """
+        Checks if the first `UnrolledLinkedList()` instance is less than the
+        other instance. This happens if all elements in the first instance
+        are equal with at least one element less than the opposing element of
+        the second instance, or the first instance is a prefix of the other.
+
+        Parameters
+        ----------
+        other: UnrolledLinkedList()
+            The other instance that we want to compare with the current one
+
+        Returns
+        -------
+        bool
+            `True` if the first instance is less than the second, and `False`
+            otherwise.
+
+        Raises
+        ------
+        TypeError:
+            This happens in two cases
+                1. If the other instance isn't an `UnrolledLinkedList()`.
+                2. In case one element in the first instance doesn't match the
+                type of the opposing element in the other instance.
+
+        Examples
+        --------
+        >>> ull_1 = UnrolledLinkedList([1, 3, 2])
+        >>> ull_2 = UnrolledLinkedList([1, 3, 3])
+        >>> ull_1 < ull_2
+        True
+        """
+        self.__validate_other(other)
+        idx, all_equal = self._compare(other, operator.lt)
+        if all_equal:
+            return self._length < other._length
+        return idx == self._length
+
+    def __le__(self, other):
+        """
+        Checks if the first `UnrolledLinkedList()` instance is less than or
+        equal to the other instance.
+
+        Parameters
+        ----------
+        other: UnrolledLinkedList()
+            The other instance that we want to compare with the current one
+
+        Returns
+        -------
+        bool
+            `True` if the first instance is less than or equal to the second,
+            and `False` otherwise.
+
+        Raises
+        ------
+        TypeError:
+            This happens in two cases
+                1. If the other instance isn't an `UnrolledLinkedList()`.
+                2. In case one element in the first instance doesn't match the
+                type of the opposing element in the other instance.
+
+        Examples
+        --------
+        >>> ull_1 = UnrolledLinkedList([1, 3, 2])
+        >>> ull_2 = UnrolledLinkedList([1, 3, 2])
+        >>> ull_1 <= ull_2
+        True
+        """
+        self.__validate_other(other)
+        idx, _ = self._compare(other, operator.le)
+        return idx == self._length
+
+    def __gt__(self, other):
+        """
+        Checks if the first `UnrolledLinkedList()` instance is greater than
+        the other instance. This happens if all elements in the first instance
+        are equal with at least one element greater than the opposing element
+        of the second instance, or the other instance is a prefix of the first.
+
+        Parameters
+        ----------
+        other: UnrolledLinkedList()
+            The other instance that we want to compare with the current one
+
+        Returns
+        -------
+        bool
+            `True` if the first instance is greater than the second, and
+            `False` otherwise.
+
+        Raises
+        ------
+        TypeError:
+            This happens in two cases
+                1. If the other instance isn't an `UnrolledLinkedList()`.
+                2. In case one element in the first instance doesn't match the
+                type of the opposing element in the other instance.
+
+        Examples
+        --------
+        >>> ull_1 = UnrolledLinkedList([1, 3, 5])
+        >>> ull_2 = UnrolledLinkedList([1, 3, 2])
+        >>> ull_1 > ull_2
+        True
+        """
+        self.__validate_other(other)
+        idx, all_equal = self._compare(other, operator.gt)
+        if all_equal:
+            return self._length > other._length
+        return idx == self._length
+
+    def __ge__(self, other):
+        """
+        Checks if the first `UnrolledLinkedList()` instance is greater than or
+        equal to the other instance.
+
+        Parameters
+        ----------
+        other: UnrolledLinkedList()
+            The other instance that we want to compare with the current one
+
+        Returns
+        -------
+        bool
+            `True` if the first instance is greater than or equal to the
+            second, and `False` otherwise.
+
+        Raises
+        ------
+        TypeError:
+            This happens in two cases
+                1. If the other instance isn't an `UnrolledLinkedList()`.
+                2. In case one element in the first instance doesn't match the
+                type of the opposing element in the other instance.
+
+        Examples
+        --------
+        >>> ull_1 = UnrolledLinkedList([1, 3, 5])
+        >>> ull_2 = UnrolledLinkedList([1, 3, 2])
+        >>> ull_1 >= ull_2
+        True
+        """
+        self.__validate_other(other)
+        idx, _ = self._compare(other, operator.ge)
+        return idx == other._length
+
+    # =============================    SEARCH    ==============================
+    def __contains__(self, value):
+        """
+        Checks if the given value exists in the `UnrolledLinkedList()`
+        instance in time-complexity of O(n) where **n** is the total number
+        of elements in the `UnrolledLinkedList()` instance.
+
+        Parameters
+        ----------
+        value: Object
+            The value to be searched for in the `UnrolledLinkedList()`.
+
+        Returns
+        -------
+        bool
+            `True` if the given value exists in the `UnrolledLinkedList()`
+            instance, and `False` otherwise.
+
+        Examples
+        --------
+        >>> ull = UnrolledLinkedList([1, 3, 5])
+        >>> 1 in ull
+        True
+        >>> 0 in ull
+        False
+        """
+        if value is None or isinstance(value, Extra):
+            return False
+        curr_node = self._head
+        while curr_node is not None:
+            if value in curr_node.get_items():
+                return True
+            curr_node = curr_node.get_next()
+        return False
+
+    def _get_node(self, idx):
+        """
+        Walks over the blocks of the `UnrolledLinkedList()` looking for the
+        block containing the given index in time-complexity of O(n/b) where
+        **n** is the number of elements and **b** is the blocks' capacity.
+
+        Parameters
+        ----------
+        idx: int
+            A positive index less than the length of the instance.
+
+        Returns
+        -------
+        UnrolledNode() or None:
+            The node before the one containing the given index or `None` if
+            the index is within the first node.
+        UnrolledNode():
+            The node containing the given index.
+        int:
+            The position of the given index within the found node.
+
+        Example
+        -------
+        >>> ull = UnrolledLinkedList([1, 2, 3, 4, 5], capacity=2)
+        >>> ull._get_node(3)
+        (UnrolledNode(items: [1, 2], next: [3, 4]), \
+            UnrolledNode(items: [3, 4], next: [5]), 1)
+        """
+        assert 0 <= idx < self._length
+
+        prev_node = None
+        curr_node = self._head
+        size = len(curr_node.get_items())
+        while idx >= size:
+            idx -= size
+            prev_node = curr_node
+            curr_node = curr_node.get_next()
+            size = len(curr_node.get_items())
+        return prev_node, curr_node, idx
+
+    def _validate_index(self, idx, accept_negative=False, accept_slice=False):
+        """
+        Checks the validity of the given index. It raises the appropriate error
+        when the index isn't valid and it returns nothing if the index is
+        valid.
+
+        Parameters
+        ----------
+        idx: int
+            The index value.
+        accept_negative: bool
+            A flag to enable accepting negative indices, default `False`.
+        accept_slice: bool
+            A flag to enable accepting `slice` objects, default `False`.
+
+        Raises
+        ------
+        TypeError:
+            If the given index isn't `int`.
+        IndexError:
+            This happens in one of the following cases:
+                1. if the given index is a `slice` object while `accept_slice`
+                flag is `False`.
+                2. If the given index is out of the `UnrolledLinkedList()`
+                boundaries.
+                3. If the given index is negative while `accept_negative` flag
+                is `False`.
+
+        Examples
+        --------
+        >>> ull = UnrolledLinkedList([1, 2, 3])
+        >>> ull._validate_index('1')
+        TypeError: Given index must be an integer!!
+        >>> ull._validate_index(-2)
+        IndexError: Negative indexing isn't supported with this functinoality!!
+        """
+        if isinstance(idx, slice):
+            if not accept_slice:
+                raise IndexError(
+                    "Slice indexing isn't supported with this functinoality!!"
+                )
+        elif type(idx) != int:
+            raise TypeError("Given index must be an integer!!")
+        elif idx <= -1 and not accept_negative:
+            raise IndexError(
+                "Negative indexing isn't supported with this functinoality!!"
+            )
+        elif idx < -self._length or idx > self._length:
+            raise IndexError("Given index is out of the boundaries!!")
+
+    def _iter_slice(self, indices):
+        """
+        Yields the values at the given indices while walking over the blocks
+        of the `UnrolledLinkedList()` instance only once. Blocks that don't
+        contain any of the wanted indices are skipped as a whole.
+
+        Parameters
+        ----------
+        indices: range
+            The wanted indices, all of them are within the boundaries.
+
+        Example
+        -------
+        >>> ull = UnrolledLinkedList([1, 2, 3, 4, 5], capacity=2)
+        >>> list(ull._iter_slice(range(4, -1, -2)))
+        [5, 3, 1]
+        """
+        if not indices:
+            return
+        elif indices.step < 0:
+            yield from reversed(list(self._iter_slice(indices[::-1])))
+            return
+        remaining = len(indices)
+        _, curr_node, offset = self._get_node(indices[0])
+        while True:
+            items = curr_node.get_items()
+            if offset < len(items):
+                chunk = items[offset::indices.step][:remaining]
+                yield from chunk
+                remaining -= len(chunk)
+                if remaining == 0:
+                    return
+                offset += len(chunk) * indices.step
+            offset -= len(items)
+            curr_node = curr_node.get_next()
+
+    def __getitem__(self, idx):
+        """
+        Retrieves the element at the given index. The given index could be a
+        zero-based `int` or a `slice` object. This method supports negative
+        indexing as well. This method does that in time-complexity of O(k/b)
+        where **k** is the given index and **b** is the capacity of the
+        blocks.
+
+        Parameters
+        ----------
+        idx: int or slice
+            The index (multiple indices) to be used to retrieve values from the
+            `UnrolledLinkedList()` instance.
+
+        Returns
+        -------
+        object or UnrolledLinkedList():
+            If the given index is an `int`, then it returns the value at that
+            index. If the given index is a `slice` object, then it returns an
+            `UnrolledLinkedList()` instance containing the desired values.
+
+        Raises
+        ------
+        TypeError:
+            If the given index isn't `int`.
+        IndexError:
+            If the given index is out of the `UnrolledLinkedList()`
+            boundaries.
+
+        Examples
+        --------
+        >>> ull = UnrolledLinkedList([1, 2, 3, 4, 5])
+        >>> ull[0]
+        1
+        >>> ull[-2]
+        4
+        >>> ull[::2]
+        ┌───┬───┬───┐
+        │ 1 │ 3 │ 5 │⟶
+        └───┴───┴───┘
+        >>> ull[10]
+        IndexError: Given index is out of the boundaries!!
+        """
+        self._validate_index(idx, accept_negative=True, accept_slice=True)
+        if isinstance(idx, slice):
+            out_list = self._create_instance()
+            for item in self._iter_slice(range(*idx.indices(self._length))):
+                out_list.__append(item)
+            return out_list
+        else:
+            if idx == self._length:
+                raise IndexError("Given index is out of the boundaries!!")
+            if idx <= -1:
+                idx += self._length
+            _, node, offset = self._get_node(idx)
+            return node.get_items()[offset]
+
+    # =============================    INSERT    ==============================
+    def __append(self, item):
+        """
+        Appends the given item to the end of the `UnrolledLinkedList()` in
+        constant time. The tail block is filled up to its capacity before a
+        new block is created.
+
+        Parameters
+        ----------
+        item: object
+            A valid item to be appended.
+        """
+        if self._tail is None:
+            self._head = self._tail = UnrolledNode([item])
+        elif len(self._tail.get_items()) < self._capacity:
+            self._tail.get_items().append(item)
+        else:
+            new_node = UnrolledNode([item])
+            self._tail.set_next(new_node)
+            self._tail = new_node
+        self._length += 1
+
+    def __split_node(self, node):
+        """
+        Moves the second half of the items of the given node to a new node
+        right after it.
+
+        Parameters
+        ----------
+        node: UnrolledNode()
+            The node to be split.
+
+        Returns
+        -------
+        UnrolledNode():
+            The new node holding the second half of the items.
+        """
+        items = node.get_items()
+        half = len(items) // 2
+        new_node = UnrolledNode(items[half:])
+        del items[half:]
+        new_node.set_next(node.get_next())
+        node.set_next(new_node)
+        if node is self._tail:
+            self._tail = new_node
+        return new_node
+
+    def _insert(self, idx, item):
+        """
+        Inserts the given item at the given index. If the block holding this
+        index is full, it gets split into two halves first.
+
+        Parameters
+        ----------
+        idx: int
+            A positive index at which the given item should be inserted.
+        item: object
+            A valid item to be inserted.
+        """
+        assert 0 <= idx <= self._length
+
+        if idx == self._length:
+            self.__append(item)
+            return
+        _, node, offset = self._get_node(idx)
+        if len(node.get_items()) == self._capacity:
+            new_node = self.__split_node(node)
+            if offset > len(node.get_items()):
+                offset -= len(node.get_items())
+                node = new_node
+        node.get_items().insert(offset, item)
+        self._length += 1
+
+    def add_front(self, item):
+        """
+        Adds the given value at the head of the `UnrolledLinkedList()`
+        instance in time-complexity of O(b) where **b** is the capacity of the
+        blocks.
+
+        Parameters
+        ----------
+        item: object
+            The value to be inserted at the `UnrolledLinkedList()` head.
+
+        Raises
+        ------
+        TypeError:
+            If the given item is an instance of `Extra`.
+        ValueError:
+            If the given item is `None`.
+
+        Example
+        -------
+        >>> ull = UnrolledLinkedList([1, 2])
+        >>> ull.add_front(10)
+        >>> ull
+        ┌────┬───┬───┐
+        │ 10 │ 1 │ 2 │⟶
+        └────┴───┴───┘
+        """
+        self._validate_item(item)
+        self._insert(0, item)
+
+    def add_end(self, item):
+        """
+        Adds the given value at the tail of the `UnrolledLinkedList()`
+        instance in constant time.
+
+        Parameters
+        ----------
+        item: object
+            The value to be inserted at the `UnrolledLinkedList()` tail.
+
+        Raises
+        ------
+        TypeError:
+            If the given item is an instance of `Extra`.
+        ValueError:
+            If the given item is `None`.
+
+        Example
+        -------
+        >>> ull = UnrolledLinkedList([1, 2])
+        >>> ull.add_end(10)
+        >>> ull
+        ┌───┬───┬────┐
+        │ 1 │ 2 │ 10 │⟶
+        └───┴───┴────┘
+        """
+        self._validate_item(item)
+        self.__append(item)
+
+    def insert(self, idx, item):
+        """
+        Inserts a value to the `UnrolledLinkedList()` instance at a position
+        defined by the given index in time-complexity of O(k/b + b) where
+        **k** is the given index and **b** is the capacity of the blocks.
+
+        Parameters
+        ----------
+        idx: int
+            An integer pointing to the index at which the given value should be
+            inserted.
+        item: object
+            An object to be inserted.
+
+        Raises
+        ------
+        IndexError:
+            If the given index is either negative or out of the boundaries.
+        TypeError:
+            If the given item is an instance of `Extra`.
+        ValueError:
+            If the given item is `None`.
+
+        Example
+        -------
+        >>> ull = UnrolledLinkedList([1, 2, 3])
+        >>> ull.insert(1, 10)
+        >>> ull
+        ┌───┬────┬───┬───┐
+        │ 1 │ 10 │ 2 │ 3 │⟶
+        └───┴────┴───┴───┘
+        >>> ull.insert(5, 20)
+        IndexError: Given index is out of the boundaries!!
+        """
+        self._validate_index(idx)
+        self._validate_item(item)
+        self._insert(idx, item)
+
+    def extend(self, other):
+        """
+        Extends the current `UnrolledLinkedList()` instance by appending the
+        elements of the other `UnrolledLinkedList()` instance in
+        time-complexity of O(m) where **m** is the number of elements in the
+        other instance.
+
+        Parameters
+        ----------
+        other: UnrolledLinkedList()
+            The `UnrolledLinkedList()` instance whose elements will be
+            appended.
+
+        Raises
+        ------
+        TypeError:
+            If the given object isn't an `UnrolledLinkedList()` instance.
+
+        Example
+        -------
+        >>> ull_1 = UnrolledLinkedList([1, 2])
+        >>> ull_2 = UnrolledLinkedList([3, 4, 5])
+        >>> ull_1.extend(ull_2)
+        >>> ull_1
+        ┌───┬───┬───┬───┬───┐
+        │ 1 │ 2 │ 3 │ 4 │ 5 │⟶
+        └───┴───┴───┴───┴───┘
+        >>> ull_1.extend([6, 7])
+        TypeError: Type Mismatch! Can't extend `extra.UnrolledLinkedList()` \
+            with `<class 'list'>`!!
+        """
+        if not isinstance(other, self.__class__):
+            raise TypeError(
+                "Type Mismatch! "
+                + f"Can't extend `{self.__name__}` with `{type(other)}`!!"
+            )
+        # copying the items first allows extending an instance with itself
+        for item in other.to_list():
+            self.__append(item)
+
+    # =============================      SET     ==============================
+    def __setitem__(self, idx, item):
+        """
+        Replaces the value at the given index in the `UnrolledLinkedList()`
+        instance with the given item. It does that in time-complexity of
+        O(k/b) where **k** is the given index and **b** is the capacity of the
+        blocks.
+
+        Parameters
+        ----------
+        idx: int
+            An integer pointing to the index where the new item should be
+            added.
+        item: object
+            An object to replace the one at the given index.
+
+        Raises
+        ------
+        IndexError:
+            If the given index is either negative or out of the boundaries.
+        TypeError:
+            If the given item is an instance of `Extra`.
+        ValueError:
+            If the given item is `None`.
+
+        Examples
+        --------
+        >>> ull = UnrolledLinkedList([1, 2, 3])
+        >>> ull[0] = 10
+        >>> ull
+        ┌────┬───┬───┐
+        │ 10 │ 2 │ 3 │⟶
+        └────┴───┴───┘
+        >>> ull[3] = 40
+        IndexError: Given index is out of the boundaries!!
+        """
+        self._validate_index(idx)
+        if idx == self._length:
+            raise IndexError("Given index is out of the boundaries!!")
+        self._validate_item(item)
+        _, node, offset = self._get_node(idx)
+        node.get_items()[offset] = item
+
+    # =============================    REMOVE    ==============================
+    def __fix_node(self, prev_node, node):
+        """
+        Keeps the blocks dense after removing items from the given node. An
+        empty node gets unlinked and a node that is less than half full gets
+        merged with the next node if their items fit in one block.
+
+        Parameters
+        ----------
+        prev_node: UnrolledNode() or None
+            The node before the given one or `None` if it's the head.
+        node: UnrolledNode()
+            The node whose items were removed.
+        """
+        items = node.get_items()
+        next_node = node.get_next()
+        if not items:
+            if prev_node is None:
+                self._head = next_node
+            else:
+                prev_node.set_next(next_node)
+            if node is self._tail:
+                self._tail = prev_node
+        elif (
+            next_node is not None
+            and len(items) < self._capacity // 2
+            and len(items) + len(next_node.get_items()) <= self._capacity
+        ):
+            items.extend(next_node.get_items())
+            node.set_next(next_node.get_next())
+            if next_node is self._tail:
+                self._tail = node
+
+    def _remove_idx(self, idx):
+        """
+        Removes the item at the given index.
+
+        Parameters
+        ----------
+        idx: int
+            A positive index less than the length of the instance.
+        """
+        assert 0 <= idx < self._length
+
+        prev_node, node, offset = self._get_node(idx)
+        del node.get_items()[offset]
+        self._length -= 1
+        self.__fix_node(prev_node, node)
+
+    def __delitem__(self, idx):
+        """
+        Deletes the value at the given index. It does that in time-complexity
+        of O(k/b + b) where **k** is the index and **b** is the capacity of
+        the blocks.
+
+        Parameters
+        ----------
+        idx: int
+            An integer pointing to the index where the item should be deleted.
+
+        Raises
+        ------
+        IndexError:
+            If the given index is either negative or out of the boundaries.
+
+        Examples
+        --------
+        >>> ull = UnrolledLinkedList([1, 2, 3])
+        >>> del ull[0]
+        >>> ull
+        ┌───┬───┐
+        │ 2 │ 3 │⟶
+        └───┴───┘
+        >>> del ull[-1]
+        IndexError: Negative indexing isn't supported with this functinoality!!
+        """
+        self._validate_index(idx)
+        if idx == self._length:
+            raise IndexError("Given index is out of the boundaries!!")
+        self._remove_idx(idx)
+
+    def remove_front(self):
+        """
+        Removes the value at the head of the `UnrolledLinkedList()` instance
+        in time-complexity of O(b) where **b** is the capacity of the blocks.
+
+        Example
+        -------
+        >>> ull = UnrolledLinkedList([1, 2, 3])
+        >>> ull.remove_front()
+        >>> ull
+        ┌───┬───┐
+        │ 2 │ 3 │⟶
+        └───┴───┘
+        """
+        if not self.is_empty():
+            self._remove_idx(0)
+
+    def remove_end(self):
+        """
+        Removes the value at the tail of the `UnrolledLinkedList()` instance
+        in time-complexity of O(n/b) where **n** is the number of elements
+        and **b** is the capacity of the blocks.
+
+        Example
+        -------
+        >>> ull = UnrolledLinkedList([1, 2, 3])
+        >>> ull.remove_end()
+        >>> ull
+        ┌───┬───┐
+        │ 1 │ 2 │⟶
+        └───┴───┘
+        """
+        if not self.is_empty():
+            self._remove_idx(self._length - 1)
+
+    def remove(self, value, all=True):
+        """
+        Removes a single value or multiple values (in case of `all` being
+        `True`) equal to the given value from the `UnrolledLinkedList()`
+        instance in time-complexity of O(n) where **n** is the number of
+        elements in the instance.
+
+        Parameters
+        ----------
+        value: object
+            The value to be removed from the `UnrolledLinkedList()` instance.
+        all: bool
+            A flag (default: `True`); if `True`, all occurrences of the given
+            value are remove. If `False`, only the first occurrence is removed.
+
+        Raises
+        ------
+        ValueError:
+            If The given value is `None`.
+        TypeError:
+            This get raised in one of the following cases:
+                1. If the type of the `all` flag isn't boolean.
+                2. If the given value is an instance of `Extra` class.
+
+        Example
+        -------
+        >>> ull = UnrolledLinkedList([1, 2, 3, 2, 2])
+        >>> ull.remove(2, all=False)
+        >>> ull
+        ┌───┬───┬───┬───┐
+        │ 1 │ 3 │ 2 │ 2 │⟶
+        └───┴───┴───┴───┘
+        >>> ull.remove(2)
+        >>> ull
+        ┌───┬───┐
+        │ 1 │ 3 │⟶
+        └───┴───┘
+        """
+        if type(all) != bool:
+            raise TypeError("`all` is a boolean flag (True by default)!!")
+        self._validate_item(value)
+        prev_node = None
+        curr_node = self._head
+        while curr_node is not None:
+            items = curr_node.get_items()
+            next_node = curr_node.get_next()
+            if value in items:
+                old_size = len(items)
+                if all:
+                    items[:] = [item for item in items if item != value]
+                else:
+                    items.remove(value)
+                self._length -= old_size - len(items)
+                self.__fix_node(prev_node, curr_node)
+                if not all:
+                    return
+            if not items:
+                # the node got unlinked
+                curr_node = next_node
+            elif curr_node.get_next() is next_node:
+                prev_node = curr_node
+                curr_node = next_node
+            # else: the next node got merged, so check the same node again
+
+    def clear(self):
+        """
+        Removes all values within the `UnrolledLinkedList()` in constant
+        time.
+
+        Example
+        -------
+        >>> ull = UnrolledLinkedList([1, 2, 3])
+        >>> ull.clear()
+        >>> ull.is_empty()
+        True
+        >>> ull
+        ┌─
+        │
+        └─
+        """
+        self.__init__(capacity=self._capacity)
+
+    # =============================     SPLIT    ==============================
+    def _split(self, idx):
+        """
+        Splits the `UnrolledLinkedList()` instance into two new instances
+        based on the given index by copying whole blocks.
+
+        Parameters
+        ----------
+        idx: int
+            A positive index within the boundaries.
+
+        Returns
+        -------
+        UnrolledLinkedList():
+            The left instance holding the values before the given index.
+        UnrolledLinkedList():
+            The right instance holding the rest of the values.
+        """
+        assert 0 <= idx <= self._length
+
+        left_list = self._create_instance()
+        right_list = self._create_instance()
+        curr_node = self._head
+        while curr_node is not None:
+            items = curr_node.get_items()
+            if idx >= len(items):
+                left_list.__append_block(items[:])
+            elif idx > 0:
+                left_list.__append_block(items[:idx])
+                right_list.__append_block(items[idx:])
+            else:
+                right_list.__append_block(items[:])
+            idx = max(idx - len(items), 0)
+            curr_node = curr_node.get_next()
+        return left_list, right_list
+
+    def __append_block(self, items):
+        """
+        Links a new node holding the given items after the tail.
+
+        Parameters
+        ----------
+        items: list
+            A non-empty list of valid items.
+        """
+        assert items and len(items) <= self._capacity
+
+        new_node = UnrolledNode(items)
+        if self._tail is None:
+            self._head = new_node
+        else:
+            self._tail.set_next(new_node)
+        self._tail = new_node
+        self._length += len(items)
+
+    def split(self, idx):
+        """
+        Splits the `UnrolledLinkedList()` instance into two instances based on
+        the given index in time-complexity of O(n/b + b) where **n** is the
+        number of elements and **b** is the capacity of the blocks. We can
+        consider `idx` as the start index of the second instance after
+        splitting.
+
+        Parameters
+        ----------
+        idx: int
+            A positive integer pointing to the index at which the
+            `UnrolledLinkedList()` instance should be split.
+
+        Returns
+        -------
+        UnrolledLinkedList():
+            The left instance after splitting.
+        UnrolledLinkedList():
+            The right instance after splitting.
+
+        Raises
+        ------
+        TypeError:
+            If the given index isn't `int`.
+        IndexError:
+            If the given index is either negative or out of the boundaries.
+
+        Example
+        -------
+        >>> ull = UnrolledLinkedList([1, 2, 3, 4, 5])
+        >>> left, right = ull.split(2)
+        >>> left
+        ┌───┬───┐
+        │ 1 │ 2 │⟶
+        └───┴───┘
+        >>> right
+        ┌───┬───┬───┐
+        │ 3 │ 4 │ 5 │⟶
+        └───┴───┴───┘
+        """
+        self._validate_index(idx)
+        return self._split(idx)
+
+    # =============================   ROTATION   ==============================
+    def _validate_rotation_distance(self, distance):
+        """
+        Checks the validity of the given rotation distance.
+
+        Parameters
+        ----------
+        distance: int
+            The rotation distance.
+
+        Raises
+        ------
+        TypeError:
+            If the given distance isn't `int`.
+        ValueError:
+            If the given distance is a negative integer.
+        """
+        if type(distance) != int:
+            raise TypeError("Rotation distance has to be an `int`!!")
+        if distance < 0:
+            raise ValueError("Rotation distance has to be >= zero!!")
+
+    def _rotate(self, distance, direction):
+        """
+        Rotates the `UnrolledLinkedList()` instance to the given direction by
+        splitting it and linking the right part before the left one.
+
+        Parameters
+        ----------
+        distance: int
+            The rotation distance.
+        direction: str
+            Either "LEFT" or "RIGHT".
+
+        Returns
+        -------
+        UnrolledLinkedList():
+            The rotated instance.
+        """
+        assert direction in {"RIGHT", "LEFT"}
+
+        distance = distance % self._length if self._length > 0 else 0
+        if direction == "RIGHT" and distance > 0:
+            distance = self._length - distance
+        left_list, right_list = self._split(distance)
+        if left_list.is_empty():
+            return right_list
+        elif right_list.is_empty():
+            return left_list
+        right_list._tail.set_next(left_list._head)
+        right_list._tail = left_list._tail
+        right_list._length += left_list._length
+        return right_list
+
+    def rotate_left(self, distance, inplace=True):
+        """
+        Rotates the values of the `UnrolledLinkedList()` instance to the left
+        by a given distance in time-complexity of O(n/b + b) where **n** is
+        the number of elements and **b** is the capacity of the blocks.
+
+        Parameters
+        ----------
+        distance: int
+            The rotation distance to the left.
+        inplace: bool
+            A flag to determine if the rotation is going to be in-place or not.
+            (default `True`).
+
+        Returns
+        -------
+        UnrolledLinkedList():
+            The rotated instance if `inplace` flag is `False`.
+
+        Raises
+        ------
+        TypeError:
+            If the given distance isn't `int` or `inplace` isn't boolean.
+        ValueError:
+            If the given distance is a negative integer.
+
+        Example
+        -------
+        >>> ull = UnrolledLinkedList([1, 2, 3, 4])
+        >>> ull.rotate_left(1)
+        >>> ull
+        ┌───┬───┬───┐ ┌───┐
+        │ 2 │ 3 │ 4 │⟶│ 1 │⟶
+        └───┴───┴───┘ └───┘
+        """
+        if type(inplace) != bool:
+            raise TypeError("`inplace` is a boolean flag (True by default)!!")
+        self._validate_rotation_distance(distance)
+        rotated = self._rotate(distance, "LEFT")
+        if not inplace:
+            return rotated
+        self._head = rotated._head
+        self._tail = rotated._tail
+
+    def rotate_right(self, distance, inplace=True):
+        """
+        Rotates the values of the `UnrolledLinkedList()` instance to the right
+        by a given distance in time-complexity of O(n/b + b) where **n** is
+        the number of elements and **b** is the capacity of the blocks.
+
+        Parameters
+        ----------
+        distance: int
+            The rotation distance to the right.
+        inplace: bool
+            A flag to determine if the rotation is going to be in-place or not.
+            (default `True`).
+
+        Returns
+        -------
+        UnrolledLinkedList():
+            The rotated instance if `inplace` flag is `False`.
+
+        Raises
+        ------
+        TypeError:
+            If the given distance isn't `int` or `inplace` isn't boolean.
+        ValueError:
+            If the given distance is a negative integer.
+
+        Example
+        -------
+        >>> ull = UnrolledLinkedList([1, 2, 3, 4])
+        >>> ull.rotate_right(1)
+        >>> ull
+        ┌───┐ ┌───┬───┬───┐
+        │ 4 │⟶│ 1 │ 2 │ 3 │⟶
+        └───┘ └───┴───┴───┘
+        """
+        if type(inplace) != bool:
+            raise TypeError("`inplace` is a boolean flag (True by default)!!")
+        self._validate_rotation_distance(distance)
+        rotated = self._rotate(distance, "RIGHT")
+        if not inplace:
+            return rotated
+        self._head = rotated._head
+        self._tail = rotated._tail
+
+    # =============================     MISC     ==============================
+    def reverse(self):
+        """
+        Reverses the whole `UnrolledLinkedList()` instance in time-complexity
+        of O(n) where **n** is the number of elements in the instance.
+
+        Returns
+        -------
+        UnrolledLinkedList():
+            The reversed `UnrolledLinkedList()` instance.
+
+        Example
+        -------
+        >>> ull = UnrolledLinkedList([1, 2, 3, 4])
+        >>> ull.reverse()
+        ┌───┬───┬───┬───┐
+        │ 4 │ 3 │ 2 │ 1 │⟶
+        └───┴───┴───┴───┘
+        """
+        rev = self._create_instance()
+        curr_node = self._head
+        while curr_node is not None:
+            new_node = UnrolledNode(curr_node.get_items()[::-1])
+            new_node.set_next(rev._head)
+            rev._head = new_node
+            if rev._tail is None:
+                rev._tail = new_node
+            curr_node = curr_node.get_next()
+        rev._length = self._length
+        return rev
+
+    def to_list(self):
+        """
+        Converts the `UnrolledLinkedList()` instance to a `list` in
+        time-complexity of O(n) where **n** is the number of elements in the
+        instance.
+
+        Returns
+        -------
+        list:
+            A `list` object containing the same elements as the
+            `UnrolledLinkedList()` instance.
+
+        Example
+        -------
+        >>> ull = UnrolledLinkedList([1, 2, 3])
+        >>> ull.to_list()
+        [1, 2, 3]
+        """
+        out = []
+        curr_node = self._head
+        while curr_node is not None:
+            out.extend(curr_node.get_items())
+            curr_node = curr_node.get_next()
+        return out
+
+    def count(self, value):
+        """
+        Counts the number of occurrence the given value is in the
+        `UnrolledLinkedList()` instance in time-complexity of O(n) where
+        **n** is the number of elements in the instance.
+
+        Parameters
+        ----------
+        value: object
+            The object to count its occurrences
+
+        Returns
+        -------
+        int:
+            The number of times the given value is found in the instance.
+            And 0 if it wasn't found.
+
+        Example
+        -------
+        >>> ull = UnrolledLinkedList([0, 1, 1, 2, 3, 5])
+        >>> ull.count(1)
+        2
+        >>> ull.count(10)
+        0
+        """
+        total_count = 0
+        curr_node = self._head
+        while curr_node is not None:
+            total_count += curr_node.get_items().count(value)
+            curr_node = curr_node.get_next()
+        return total_count
+
+    def copy(self):
+        """
+        Copies the `UnrolledLinkedList()` instance in a shallow-manner in
+        time-complexity of O(n) where **n** is the number of elements.
+
+        Returns
+        -------
+        UnrolledLinkedList():
+            The shallow copy of the original instance.
+
+        Example
+        -------
+        >>> ull = UnrolledLinkedList([10, 20])
+        >>> ull.copy()
+        ┌────┬────┐
+        │ 10 │ 20 │⟶
+        └────┴────┘
+        """
+        copied_list = self._create_instance()
+        curr_node = self._head
+        while curr_node is not None:
+            copied_list.__append_block(curr_node.get_items()[:])
+            curr_node = curr_node.get_next()
+        return copied_list
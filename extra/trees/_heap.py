@@ -1,4 +1,6 @@
+import heapq
 import warnings
+from collections import deque
 from abc import ABC, abstractmethod
 from extra.interface import Extra
 from extra.trees.binary_tree import BinaryTreeNode, BinaryTree
@@ -12,6 +14,7 @@ class HeapNode(BinaryTreeNode):
     """
 
     __name__ = "extra.HeapNode()"
+    __slots__ = ()
 
     def __init__(self, value):
         """
@@ -28,7 +31,7 @@ class HeapNode(BinaryTreeNode):
         ValueError: If the given item is `None`.
         TypeError: If the given item isn't a number.
         """
-        if type(value) not in {int, float}:
+        if not self.TRUSTED and type(value) not in {int, float}:
             raise TypeError(f"`{self.__name__}` contains only numbers!!")
         super().__init__(value)
 
@@ -55,11 +58,26 @@ class Heap(ABC, Extra):
     __name__ = "extra.Heap()"
 
     @abstractmethod
-    def __init__(self):
+    def __init__(self, track_positions=False):
         """
         An abstract method that initializes the `Heap()` abstract class.
+
+        Parameters
+        ----------
+        track_positions: bool
+            A flag to keep a map from every value to its positions within the
+            heap (default: `False`). This map makes searching for a value and
+            removing or updating it cost O(1) and O(log(n)) respectively, in
+            exchange for the memory needed to store it.
+
+        Raises
+        ------
+        TypeError: If `track_positions` isn't a boolean.
         """
+        if type(track_positions) != bool:
+            raise TypeError("`track_positions` is a boolean flag!!")
         self._heap = []
+        self._positions = {} if track_positions else None
 
     def _validate_item(self, item):
         """
@@ -77,22 +95,32 @@ class Heap(ABC, Extra):
         ValueError: If `item` is `None`
         TypeError: If `item` is not a numeric value.
         """
+        if self.TRUSTED:
+            return
         super()._validate_item(item)
         if type(item) not in {int, float}:
             raise TypeError(f"`{self.__name__}` accepts only numbers!!")
 
     @classmethod
-    def heapify(cls, iterable):
+    def heapify(cls, iterable, is_min_heap=True, track_positions=False):
         """
         A class method which converts an iterable object to a heap object in
         time-complexity of O(n) where **n** is the number of elements inside
-        the given `iterable`.
+        the given `iterable`. The values are validated in a single pass, then
+        the heap is built bottom-up by sifting down every internal node
+        starting from the last one (Floyd's method).
 
         Parameters
         ----------
         iterable: iterable
             An iterable python object that implements the `__iter__` method.
             For example, `list` and `tuple` are both iterables.
+        is_min_heap: (default: True)
+            A flag to tell if the heap instance is MinHeap or MaxHeap. `True`
+            shows that the instance is `MinHeap()` and `False` for `MaxHeap()`.
+        track_positions: bool
+            A flag to keep a map from every value to its positions within the
+            heap (default: `False`).
 
         Returns
         -------
@@ -109,11 +137,45 @@ class Heap(ABC, Extra):
         """
         if not hasattr(iterable, "__iter__"):
             raise TypeError("The given object isn't iterable!!")
-        heap = cls()
-        for item in iterable:
-            heap.insert(item)
+        assert type(is_min_heap) == bool
+
+        heap = cls(track_positions=track_positions)
+        items = list(iterable)
+        for item in items:
+            if type(item) not in {int, float}:
+                # raises the appropriate error
+                heap._validate_item(item)
+        heap._heap = items
+        heap._rebuild(is_min_heap)
         return heap
 
+    def _rebuild(self, is_min_heap):
+        """
+        Restores the heap-order property of the whole heap instance in linear
+        time by sifting down every internal node starting from the last one.
+        The positions map, if tracked, is rebuilt from scratch.
+
+        Parameters
+        ----------
+        is_min_heap: bool
+            A flag to tell if the heap instance is MinHeap or MaxHeap. `True`
+            shows that the instance is `MinHeap()` and `False` for `MaxHeap()`.
+        """
+        items = self._heap
+        positions = self._positions
+        # positions are built once the heap is in its final shape
+        self._positions = None
+        for idx in range(len(items) // 2 - 1, -1, -1):
+            self._sift_down(idx, is_min_heap)
+        if positions is not None:
+            positions.clear()
+            for idx, item in enumerate(items):
+                if item in positions:
+                    positions[item].add(idx)
+                else:
+                    positions[item] = {idx}
+            self._positions = positions
+
     # =============================    LENGTH    ==============================
     def __len__(self):
         """
@@ -145,6 +207,8 @@ class Heap(ABC, Extra):
     def _transform(self):
         """
         Converts a list-shaped heap to a binary-tree shaped in linear time.
+        It's only needed for printing; iterating over the heap uses the list
+        directly.
 
         Returns
         -------
@@ -154,16 +218,18 @@ class Heap(ABC, Extra):
         # transform the list-shaped heap to a tree-shaped
         assert not self.is_empty()
 
-        root = self._basic_node(self._heap[0])
-        q = [root]
+        heap = self._heap
+        length = len(heap)
+        root = self._basic_node(heap[0])
+        q = deque([root])
         idx = 1
-        while idx < len(self):
-            parent_node = q.pop(0)
-            parent_node.set_left(self._basic_node(self._heap[idx]))
+        while idx < length:
+            parent_node = q.popleft()
+            parent_node.set_left(self._basic_node(heap[idx]))
             q.append(parent_node.get_left())
             idx += 1
-            if idx < len(self):
-                parent_node.set_right(self._basic_node(self._heap[idx]))
+            if idx < length:
+                parent_node.set_right(self._basic_node(heap[idx]))
                 q.append(parent_node.get_right())
                 idx += 1
         btree = BinaryTree()
@@ -203,8 +269,172 @@ class Heap(ABC, Extra):
         """
         if self.is_empty() or type(num) not in {int, float}:
             return False
+        if self._positions is not None:
+            return num in self._positions
         return num in self._heap
 
+    def _find_idx(self, num):
+        """
+        Searches the heap instance for the given value and returns the index
+        of one of its occurrences. It does that in constant time if positions
+        are tracked and in linear time otherwise.
+
+        Parameters
+        ----------
+        num: int or float
+            The value to be searched for in the heap instance.
+
+        Returns
+        -------
+        int or None:
+            The index of the given value, or `None` if it wasn't found.
+        """
+        if self._positions is not None:
+            indices = self._positions.get(num)
+            return next(iter(indices)) if indices else None
+        try:
+            return self._heap.index(num)
+        except ValueError:
+            return None
+
+    # =============================   POSITIONS  ==============================
+    def _add_position(self, value, idx):
+        """
+        Records that the given value is stored at the given index.
+
+        Parameters
+        ----------
+        value: int or float
+            A value within the heap instance.
+        idx: int
+            The index at which the value is stored.
+        """
+        indices = self._positions.get(value)
+        if indices is None:
+            self._positions[value] = {idx}
+        else:
+            indices.add(idx)
+
+    def _remove_position(self, value, idx):
+        """
+        Forgets that the given value is stored at the given index.
+
+        Parameters
+        ----------
+        value: int or float
+            A value within the heap instance.
+        idx: int
+            The index at which the value was stored.
+        """
+        indices = self._positions[value]
+        indices.discard(idx)
+        if not indices:
+            del self._positions[value]
+
+    def _move_position(self, value, old_idx, new_idx):
+        """
+        Records that the given value moved from `old_idx` to `new_idx`.
+
+        Parameters
+        ----------
+        value: int or float
+            A value within the heap instance.
+        old_idx: int
+            The index at which the value was stored.
+        new_idx: int
+            The index at which the value is stored now.
+        """
+        indices = self._positions[value]
+        indices.discard(old_idx)
+        indices.add(new_idx)
+
+    # =============================     SIFT     ==============================
+    def _sift_up(self, idx, is_min_heap):
+        """
+        Moves the value at the given index up the heap instance till the
+        heap-order property is satisfied in time-complexity of O(log(n)).
+
+        Parameters
+        ----------
+        idx: int
+            The index of the value to be moved up.
+        is_min_heap: bool
+            A flag to tell if the heap instance is MinHeap or MaxHeap. `True`
+            shows that the instance is `MinHeap()` and `False` for `MaxHeap()`.
+        """
+        heap = self._heap
+        tracked = self._positions is not None
+        value = heap[idx]
+        start_idx = idx
+        while idx > 0:
+            parent_idx = (idx - 1) // 2
+            parent = heap[parent_idx]
+            if (is_min_heap and parent > value) or (
+                not is_min_heap and parent < value
+            ):
+                heap[idx] = parent
+                if tracked:
+                    self._move_position(parent, parent_idx, idx)
+                idx = parent_idx
+            else:
+                break
+        heap[idx] = value
+        if tracked and idx != start_idx:
+            self._move_position(value, start_idx, idx)
+
+    def _sift_down(self, idx, is_min_heap):
+        """
+        Moves the value at the given index down the heap instance till the
+        heap-order property is satisfied in time-complexity of O(log(n)).
+
+        Parameters
+        ----------
+        idx: int
+            The index of the value to be moved down.
+        is_min_heap: bool
+            A flag to tell if the heap instance is MinHeap or MaxHeap. `True`
+            shows that the instance is `MinHeap()` and `False` for `MaxHeap()`.
+        """
+        heap = self._heap
+        tracked = self._positions is not None
+        length = len(heap)
+        value = heap[idx]
+        start_idx = idx
+        child_idx = (idx * 2) + 1
+        # NOTE: the loop is duplicated for each heap type to avoid checking
+        # `is_min_heap` at every level.
+        if is_min_heap:
+            while child_idx < length:
+                r_child_idx = child_idx + 1
+                if (r_child_idx < length
+                        and heap[r_child_idx] < heap[child_idx]):
+                    child_idx = r_child_idx
+                child = heap[child_idx]
+                if not child < value:
+                    break
+                heap[idx] = child
+                if tracked:
+                    self._move_position(child, child_idx, idx)
+                idx = child_idx
+                child_idx = (idx * 2) + 1
+        else:
+            while child_idx < length:
+                r_child_idx = child_idx + 1
+                if (r_child_idx < length
+                        and heap[r_child_idx] > heap[child_idx]):
+                    child_idx = r_child_idx
+                child = heap[child_idx]
+                if not child > value:
+                    break
+                heap[idx] = child
+                if tracked:
+                    self._move_position(child, child_idx, idx)
+                idx = child_idx
+                child_idx = (idx * 2) + 1
+        heap[idx] = value
+        if tracked and idx != start_idx:
+            self._move_position(value, start_idx, idx)
+
     # =============================    INSERT    ==============================
     def insert(self, value, is_min_heap=True):
         """
@@ -228,88 +458,101 @@ class Heap(ABC, Extra):
 
         # add the new value
         self._heap.append(value)
+        if self._positions is not None:
+            self._add_position(value, len(self._heap) - 1)
         # swap between parents when needed
-        idx = len(self._heap) - 1
-        while idx != 0:
-            parent_idx = (idx - 1) // 2
-            current = self._heap[idx]
-            parent = self._heap[parent_idx]
-            if (is_min_heap and parent > current) or (
-                not is_min_heap and parent < current
-            ):
-                self._heap[parent_idx], self._heap[idx] = (
-                    self._heap[idx],
-                    self._heap[parent_idx],
-                )
-                idx = parent_idx
-            else:
-                break
+        self._sift_up(len(self._heap) - 1, is_min_heap)
 
-    # =============================    REMOVE    ==============================
-    def __rebalance(self, parent_idx, is_min_heap):
+    # =============================    UPDATE    ==============================
+    def update(self, old_value, new_value, is_min_heap=True):
         """
-        A private method to rebalance the heap instance after removal.
-        Rebalancing is essential for keeping the heap-order property intact.
+        Replaces one occurrence of `old_value` with `new_value` and restores
+        the heap-order property. It does that in time-complexity of O(log(n))
+        when positions are tracked, and O(n) otherwise as the old value has to
+        be searched for first.
 
         Parameters
         ----------
-        parent_idx: int
-            The Index of the node's parent.
-        is_min_heap: bool
+        old_value: int or float
+            The value to be replaced.
+        new_value: int or float
+            The value to replace the old one.
+        is_min_heap: (default: True)
             A flag to tell if the heap instance is MinHeap or MaxHeap. `True`
             shows that the instance is `MinHeap()` and `False` for `MaxHeap()`.
 
         Raises
         ------
-        AssertionError: This can be raised in the following cases:
-            1. If the `parent_index` is an invalid index.
-            2. If the type of the `is_min_heap` flag isn't boolean
+        ValueError: If the given `new_value` is `None`.
+        TypeError: If the given `new_value` is not a numeric value.
+        UserWarning: If the heap instance is empty of if the `old_value` \
+            wasn't found in the instance.
         """
-        assert type(parent_idx) == int and parent_idx >= 0
+        self._validate_item(new_value)
         assert type(is_min_heap) == bool
 
-        last_idx = len(self._heap) - 1
-        while parent_idx < last_idx:
-            parent = self._heap[parent_idx]
-            l_child_idx, r_child_idx = (
-                (parent_idx * 2) + 1, (parent_idx * 2) + 2
+        if self.is_empty():
+            warnings.warn(f"`{self.__name__}` is empty!!", UserWarning)
+            return
+        idx = (
+            self._find_idx(old_value)
+            if type(old_value) in {int, float}
+            else None
+        )
+        if idx is None:
+            warnings.warn(
+                f"Couldn't find `{old_value}` in `{self.__name__}`",
+                UserWarning
             )
-            # get which child is smaller
-            if r_child_idx >= last_idx:
-                if l_child_idx >= last_idx:
-                    break
-                else:
-                    child_idx = l_child_idx
-            else:
-                if is_min_heap:
-                    if self._heap[l_child_idx] < self._heap[r_child_idx]:
-                        child_idx = l_child_idx
-                    else:
-                        child_idx = r_child_idx
-                else:
-                    if self._heap[l_child_idx] > self._heap[r_child_idx]:
-                        child_idx = l_child_idx
-                    else:
-                        child_idx = r_child_idx
-            child = self._heap[child_idx]
-            if ((is_min_heap and parent > child) or
-                    (not is_min_heap and parent < child)):
-                self._heap[parent_idx], self._heap[child_idx] = (
-                    self._heap[child_idx],
-                    self._heap[parent_idx],
-                )
-                parent_idx = child_idx
-            else:
-                break
+            return
+        self._heap[idx] = new_value
+        if self._positions is not None:
+            self._remove_position(old_value, idx)
+            self._add_position(new_value, idx)
+        self._sift_up(idx, is_min_heap)
+        self._sift_down(idx, is_min_heap)
+
+    # =============================    REMOVE    ==============================
+    def _remove_idx(self, idx, is_min_heap):
+        """
+        Removes the value at the given index from the heap instance by moving
+        the last value into its place and restoring the heap-order property.
+        It does that in time-complexity of O(log(n)).
+
+        Parameters
+        ----------
+        idx: int
+            The index of the value to be removed.
+        is_min_heap: bool
+            A flag to tell if the heap instance is MinHeap or MaxHeap. `True`
+            shows that the instance is `MinHeap()` and `False` for `MaxHeap()`.
+        """
+        heap = self._heap
+        tracked = self._positions is not None
+        if tracked:
+            self._remove_position(heap[idx], idx)
+        last_value = heap.pop()
+        last_idx = len(heap)
+        if idx != last_idx:
+            heap[idx] = last_value
+            if tracked:
+                self._move_position(last_value, last_idx, idx)
+            self._sift_up(idx, is_min_heap)
+            self._sift_down(idx, is_min_heap)
 
     def remove(self, del_value, is_min_heap=True):
         """
-        Removes the `del_value` from the heap instance.
+        Removes the `del_value` from the heap instance. It does that in
+        time-complexity of O(log(n)) when positions are tracked, and O(n)
+        otherwise as the value has to be searched for first.
 
         Parameters
         ----------
         del_value: int or float
             The value to be deleted from the heap.
+        is_min_heap: (default: True)
+            A flag to tell if the heap instance is MinHeap or MaxHeap. `True`
+            shows that the instance is `MinHeap()` and `False` for `MaxHeap()`.
 
         Raises
         ------
@@ -331,42 +574,297 @@ class Heap(ABC, Extra):
                 UserWarning
             )
             return
-        try:
-            del_idx = self._heap.index(del_value)
-        except ValueError:
+        del_idx = self._find_idx(del_value)
+        if del_idx is None:
             # del_value wasn't found in the heap
             warnings.warn(
                 f"Couldn't find `{del_value}` in `{self.__name__}`",
                 UserWarning
             )
             return
-        last_idx = len(self._heap) - 1
-        # swap between removed item and last item
-        self._heap[last_idx], self._heap[del_idx] = (
-            self._heap[del_idx],
-            self._heap[last_idx],
-        )
-        # set last item to -inf or inf based on heap type
-        self._heap[last_idx] = float("-inf") if is_min_heap else float("inf")
-        # start swapping when needed
-        self.__rebalance(del_idx, is_min_heap)
-        # remove the (+/-)inf
-        self._heap.pop()
+        self._remove_idx(del_idx, is_min_heap)
+
+    # =============================   PUSH/POP   ==============================
+    def __replace_root(self, value, is_min_heap):
+        """
+        Replaces the root of the heap instance with the given value and sifts
+        it down in time-complexity of O(log(n)).
+
+        Parameters
+        ----------
+        value: int or float
+            The value to be stored at the root.
+        is_min_heap: bool
+            A flag to tell if the heap instance is MinHeap or MaxHeap. `True`
+            shows that the instance is `MinHeap()` and `False` for `MaxHeap()`.
+
+        Returns
+        -------
+        int or float:
+            The value that used to be at the root.
+        """
+        root = self._heap[0]
+        self._heap[0] = value
+        if self._positions is not None:
+            self._remove_position(root, 0)
+            self._add_position(value, 0)
+        self._sift_down(0, is_min_heap)
+        return root
+
+    def pushpop(self, value, is_min_heap=True):
+        """
+        Inserts the given value into the heap instance, then removes and
+        returns the root in a single sift pass of time-complexity O(log(n)).
+        When the given value would become the root itself, it's returned
+        right away without touching the heap.
+
+        Parameters
+        ----------
+        value: int or float
+            The new numeric value that will be inserted.
+        is_min_heap: bool
+            A flag to tell if the heap instance is MinHeap or MaxHeap. `True`
+            shows that the instance is `MinHeap()` and `False` for `MaxHeap()`.
+
+        Returns
+        -------
+        int or float:
+            The value at the root after inserting the given value.
+
+        Raises
+        ------
+        ValueError: If the given `value` is `None`.
+        TypeError: If the given `value` is not a numeric value.
+        """
+        self._validate_item(value)
+        assert type(is_min_heap) == bool
+
+        if self.is_empty():
+            return value
+        root = self._heap[0]
+        if (is_min_heap and value <= root) or (
+            not is_min_heap and value >= root
+        ):
+            return value
+        return self.__replace_root(value, is_min_heap)
+
+    def replace(self, value, is_min_heap=True):
+        """
+        Removes and returns the root of the heap instance, then inserts the
+        given value in a single sift pass of time-complexity O(log(n)). The
+        returned value may be less extreme than the inserted one.
+
+        Parameters
+        ----------
+        value: int or float
+            The new numeric value that will be inserted.
+        is_min_heap: bool
+            A flag to tell if the heap instance is MinHeap or MaxHeap. `True`
+            shows that the instance is `MinHeap()` and `False` for `MaxHeap()`.
+
+        Returns
+        -------
+        int or float:
+            The value that used to be at the root.
+
+        Raises
+        ------
+        ValueError: If the given `value` is `None`.
+        TypeError: If the given `value` is not a numeric value.
+        IndexError: If the heap instance is empty.
+        """
+        self._validate_item(value)
+        assert type(is_min_heap) == bool
+
+        if self.is_empty():
+            raise IndexError("Can't replace the root of an empty Heap!!")
+        return self.__replace_root(value, is_min_heap)
+
+    # =============================    BATCH     ==============================
+    def extend(self, iterable, is_min_heap=True):
+        """
+        Inserts all values of the given iterable into the heap instance. When
+        the batch is large relative to the heap, inserting one value at a
+        time, O(k*log(n+k)), costs more than rebuilding the whole heap,
+        O(n+k), so the values are appended and the heap is rebuilt instead.
+
+        Parameters
+        ----------
+        iterable: iterable
+            An iterable python object that implements the `__iter__` method.
+            For example, `list` and `tuple` are both iterables.
+        is_min_heap: bool
+            A flag to tell if the heap instance is MinHeap or MaxHeap. `True`
+            shows that the instance is `MinHeap()` and `False` for `MaxHeap()`.
+
+        Raises
+        ------
+        TypeError: It can be raised in two cases
+            1. In case the given object isn't iterable.
+            2. If one of the elements in the iterable is NOT a number.
+
+        ValueError: If one of the iterable elements is `None`.
+        """
+        if not hasattr(iterable, "__iter__"):
+            raise TypeError("The given object isn't iterable!!")
+        assert type(is_min_heap) == bool
+
+        items = list(iterable)
+        for item in items:
+            if type(item) not in {int, float}:
+                # raises the appropriate error before changing the heap
+                self._validate_item(item)
+        total = len(self._heap) + len(items)
+        if len(items) * total.bit_length() > total:
+            self._heap.extend(items)
+            self._rebuild(is_min_heap)
+        else:
+            for item in items:
+                Heap.insert(self, item, is_min_heap)
+
+    def merge(self, other, is_min_heap=True):
+        """
+        Melds all values of the `other` heap into the heap instance in
+        time-complexity of O(n+m) where **n** and **m** are the lengths of
+        the two heaps. The `other` heap is left untouched.
+
+        Parameters
+        ----------
+        other: Heap()
+            Another heap instance whose values will be added.
+        is_min_heap: bool
+            A flag to tell if the heap instance is MinHeap or MaxHeap. `True`
+            shows that the instance is `MinHeap()` and `False` for `MaxHeap()`.
+
+        Raises
+        ------
+        TypeError: If `other` isn't a heap instance.
+        """
+        if not isinstance(other, Heap):
+            raise TypeError(
+                f"Can't merge `{self.__name__}` with `{type(other)}`!!"
+            )
+        assert type(is_min_heap) == bool
+
+        self._heap.extend(other._heap)
+        self._rebuild(is_min_heap)
+
+    def __walk_extremes(self, n, is_min_heap):
+        """
+        Collects the `n` most extreme values, smallest for `MinHeap()` and
+        largest for `MaxHeap()`, by walking the heap from the root with a
+        small frontier heap in time-complexity of O(n*log(n)) regardless of
+        the heap's length.
+
+        Parameters
+        ----------
+        n: int
+            The number of values to collect.
+        is_min_heap: bool
+            A flag to tell if the heap instance is MinHeap or MaxHeap. `True`
+            shows that the instance is `MinHeap()` and `False` for `MaxHeap()`.
+
+        Returns
+        -------
+        list:
+            The collected values ordered from the most extreme.
+        """
+        heap = self._heap
+        length = len(heap)
+        sign = 1 if is_min_heap else -1
+        frontier = [(sign * heap[0], 0)]
+        result = []
+        while frontier and len(result) < n:
+            _, idx = heapq.heappop(frontier)
+            result.append(heap[idx])
+            for child_idx in (2 * idx + 1, 2 * idx + 2):
+                if child_idx < length:
+                    heapq.heappush(
+                        frontier, (sign * heap[child_idx], child_idx)
+                    )
+        return result
+
+    def nsmallest(self, n, is_min_heap=True):
+        """
+        Gets the `n` smallest values in the heap instance sorted in ascending
+        order without modifying the heap. It does that in O(n*log(n)) for
+        `MinHeap()` and in O(N*log(n)) for `MaxHeap()` where **N** is the
+        length of the heap.
+
+        Parameters
+        ----------
+        n: int
+            The number of values to get.
+        is_min_heap: bool
+            A flag to tell if the heap instance is MinHeap or MaxHeap. `True`
+            shows that the instance is `MinHeap()` and `False` for `MaxHeap()`.
+
+        Returns
+        -------
+        list:
+            The `n` smallest values in ascending order.
+
+        Raises
+        ------
+        TypeError: If `n` isn't an integer.
+        """
+        if type(n) != int:
+            raise TypeError("`n` must be an integer!!")
+        assert type(is_min_heap) == bool
+
+        if n <= 0 or self.is_empty():
+            return []
+        elif is_min_heap:
+            return self.__walk_extremes(n, is_min_heap=True)
+        return heapq.nsmallest(n, self._heap)
+
+    def nlargest(self, n, is_min_heap=True):
+        """
+        Gets the `n` largest values in the heap instance sorted in descending
+        order without modifying the heap. It does that in O(n*log(n)) for
+        `MaxHeap()` and in O(N*log(n)) for `MinHeap()` where **N** is the
+        length of the heap.
+
+        Parameters
+        ----------
+        n: int
+            The number of values to get.
+        is_min_heap: bool
+            A flag to tell if the heap instance is MinHeap or MaxHeap. `True`
+            shows that the instance is `MinHeap()` and `False` for `MaxHeap()`.
+
+        Returns
+        -------
+        list:
+            The `n` largest values in descending order.
+
+        Raises
+        ------
+        TypeError: If `n` isn't an integer.
+        """
+        if type(n) != int:
+            raise TypeError("`n` must be an integer!!")
+        assert type(is_min_heap) == bool
+
+        if n <= 0 or self.is_empty():
+            return []
+        elif not is_min_heap:
+            return self.__walk_extremes(n, is_min_heap=False)
+        return heapq.nlargest(n, self._heap)
 
     # =============================     ITER     ==============================
     def __iter__(self):
         """
         Iterates over the heap instance and returns a generator of the heap
-        node values in breadth-first manner.
+        node values in breadth-first manner. Values are yielded directly from
+        the underlying list, so no tree nodes are created.
 
         Returns
         -------
         generator:
             The value of each node in the instance.
         """
-        btree = self._transform()
-        for node in btree:
-            yield node
+        yield from self._heap
 
     def to_list(self):
         """
@@ -385,4 +883,4 @@ class Heap(ABC, Extra):
         """
         Removes all nodes within the heap instance in constant time.
         """
-        self.__init__()
+        self.__init__(track_positions=self._positions is not None)
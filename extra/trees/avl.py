@@ -19,6 +19,7 @@ class AVLNode(BSTNode):
     """
 
     __name__ = "extra.AVLNode()"
+    __slots__ = ("_height",)
 
     def __init__(self, value):
         """
@@ -388,6 +389,348 @@ class AVL(BST):
         """
         return super().__contains__(find_val)
 
+    # =============================    SELECT    ==============================
+    def select(self, idx):
+        """
+        Returns the value at the given index of the sorted values of the
+        `AVL()` instance, i.e. the k-th smallest value, in O(h) time where
+        **h** is the height of the instance.
+
+        Parameters
+        ----------
+        idx: int
+            A zero-based index. Negative indices count from the greatest
+            value.
+
+        Returns
+        -------
+        int or float:
+            The value that has exactly `idx` smaller values in the `AVL()`
+            instance.
+
+        Raises
+        ------
+        TypeError:
+            If the given index isn't `int`.
+        IndexError:
+            If the given index is out of the `AVL()` boundaries.
+
+        Example
+        -------
+        >>> avl = AVL([1, 2, 3, 4, 5, 6, 7])
+        >>> avl
+            __4__
+           /     \\
+          2       6
+         / \\    / \\
+        1   3   5   7
+        >>> avl.select(0)
+        1
+        >>> avl.select(3)
+        4
+        >>> avl.select(-1)
+        7
+        """
+        return super().select(idx)
+
+    def __getitem__(self, idx):
+        """
+        Returns the value at the given index of the sorted values of the
+        `AVL()` instance in O(h) time where **h** is the height of the
+        instance. It's the same as `select()`.
+
+        Parameters
+        ----------
+        idx: int
+            A zero-based index. Negative indices count from the greatest
+            value.
+
+        Returns
+        -------
+        int or float:
+            The value that has exactly `idx` smaller values in the `AVL()`
+            instance.
+
+        Raises
+        ------
+        TypeError:
+            If the given index isn't `int`.
+        IndexError:
+            If the given index is out of the `AVL()` boundaries.
+
+        Example
+        -------
+        >>> avl = AVL([1, 2, 3, 4, 5, 6, 7])
+        >>> avl[4]
+        5
+        >>> avl[-2]
+        6
+        """
+        return self.select(idx)
+
+    # =============================     RANK     ==============================
+    def rank(self, value):
+        """
+        Counts the values in the `AVL()` instance that are smaller than the
+        given value in O(h) time where **h** is the height of the instance.
+        The given value doesn't have to exist in the instance.
+
+        Parameters
+        ----------
+        value: int or float
+            The value to be ranked.
+
+        Returns
+        -------
+        int:
+            The number of values in the `AVL()` instance that are smaller than
+            the given value. If the value exists, this is its index in the
+            sorted values of the instance.
+
+        Raises
+        ------
+        ValueError:
+            If the given `value` is `None`.
+        TypeError:
+            If the given `value` is not a numeric value.
+
+        Example
+        -------
+        >>> avl = AVL([1, 2, 3, 4, 5, 6, 7])
+        >>> avl.rank(5)
+        4
+        >>> avl.rank(4.5)
+        4
+        >>> avl.rank(100)
+        7
+        """
+        return super().rank(value)
+
+    # =============================     RANGE    ==============================
+    def range(self, lo, hi):
+        """
+        Lazily iterates over the values of the `AVL()` instance that lie
+        within the closed interval `[lo, hi]` in ascending order. Subtrees
+        that lie completely outside the interval are pruned, so iterating
+        over the whole range takes O(h+k) time where **h** is the height of
+        the instance and **k** is the number of values in the range.
+
+        Parameters
+        ----------
+        lo: int or float
+            The lower bound of the interval.
+        hi: int or float
+            The upper bound of the interval.
+
+        Returns
+        -------
+        generator:
+            A generator of the values within the interval in ascending order.
+            It yields nothing when `lo` is greater than `hi`.
+
+        Raises
+        ------
+        ValueError:
+            If one of the given bounds is `None`.
+        TypeError:
+            If one of the given bounds is not a numeric value.
+
+        Example
+        -------
+        >>> avl = AVL([1, 2, 3, 4, 5, 6, 7])
+        >>> avl
+            __4__
+           /     \\
+          2       6
+         / \\    / \\
+        1   3   5   7
+        >>> list(avl.range(2, 5))
+        [2, 3, 4, 5]
+        >>> list(avl.range(4.5, 100))
+        [5, 6, 7]
+
+        Note
+        ----
+        The `AVL()` instance shouldn't be modified while iterating over the
+        returned generator.
+        """
+        return super().range(lo, hi)
+
+    def count_range(self, lo, hi):
+        """
+        Counts the values of the `AVL()` instance that lie within the closed
+        interval `[lo, hi]` in O(h) time where **h** is the height of the
+        instance, without visiting the values themselves.
+
+        Parameters
+        ----------
+        lo: int or float
+            The lower bound of the interval.
+        hi: int or float
+            The upper bound of the interval.
+
+        Returns
+        -------
+        int:
+            The number of values within the interval. It's zero when `lo` is
+            greater than `hi`.
+
+        Raises
+        ------
+        ValueError:
+            If one of the given bounds is `None`.
+        TypeError:
+            If one of the given bounds is not a numeric value.
+
+        Example
+        -------
+        >>> avl = AVL([1, 2, 3, 4, 5, 6, 7])
+        >>> avl.count_range(2, 5)
+        4
+        >>> avl.count_range(8, 9)
+        0
+        """
+        return super().count_range(lo, hi)
+
+    # =============================   NEIGHBORS  ==============================
+    def floor(self, value):
+        """
+        Returns the greatest value in the `AVL()` instance that is less than
+        or equal to the given value in O(h) time where **h** is the height of
+        the instance.
+
+        Parameters
+        ----------
+        value: int or float
+            The value whose floor is needed.
+
+        Returns
+        -------
+        int or float or None:
+            The floor of the given value, or `None` if all the values in the
+            `AVL()` instance are greater than the given value.
+
+        Raises
+        ------
+        ValueError:
+            If the given `value` is `None`.
+        TypeError:
+            If the given `value` is not a numeric value.
+
+        Example
+        -------
+        >>> avl = AVL([1, 2, 3, 4, 5, 6, 7])
+        >>> avl.floor(4.5)
+        4
+        >>> avl.floor(0) is None
+        True
+        """
+        return super().floor(value)
+
+    def ceiling(self, value):
+        """
+        Returns the smallest value in the `AVL()` instance that is greater
+        than or equal to the given value in O(h) time where **h** is the
+        height of the instance.
+
+        Parameters
+        ----------
+        value: int or float
+            The value whose ceiling is needed.
+
+        Returns
+        -------
+        int or float or None:
+            The ceiling of the given value, or `None` if all the values in the
+            `AVL()` instance are less than the given value.
+
+        Raises
+        ------
+        ValueError:
+            If the given `value` is `None`.
+        TypeError:
+            If the given `value` is not a numeric value.
+
+        Example
+        -------
+        >>> avl = AVL([1, 2, 3, 4, 5, 6, 7])
+        >>> avl.ceiling(4.5)
+        5
+        >>> avl.ceiling(8) is None
+        True
+        """
+        return super().ceiling(value)
+
+    def predecessor(self, value):
+        """
+        Returns the greatest value in the `AVL()` instance that is strictly
+        less than the given value in O(h) time where **h** is the height of
+        the instance. The given value doesn't have to exist in the
+        instance.
+
+        Parameters
+        ----------
+        value: int or float
+            The value whose predecessor is needed.
+
+        Returns
+        -------
+        int or float or None:
+            The predecessor of the given value, or `None` if there is no
+            smaller value in the `AVL()` instance.
+
+        Raises
+        ------
+        ValueError:
+            If the given `value` is `None`.
+        TypeError:
+            If the given `value` is not a numeric value.
+
+        Example
+        -------
+        >>> avl = AVL([1, 2, 3, 4, 5, 6, 7])
+        >>> avl.predecessor(4)
+        3
+        >>> avl.predecessor(1) is None
+        True
+        """
+        return super().predecessor(value)
+
+    def successor(self, value):
+        """
+        Returns the smallest value in the `AVL()` instance that is strictly
+        greater than the given value in O(h) time where **h** is the height
+        of the instance. The given value doesn't have to exist in the
+        instance.
+
+        Parameters
+        ----------
+        value: int or float
+            The value whose successor is needed.
+
+        Returns
+        -------
+        int or float or None:
+            The successor of the given value, or `None` if there is no
+            greater value in the `AVL()` instance.
+
+        Raises
+        ------
+        ValueError:
+            If the given `value` is `None`.
+        TypeError:
+            If the given `value` is not a numeric value.
+
+        Example
+        -------
+        >>> avl = AVL([1, 2, 3, 4, 5, 6, 7])
+        >>> avl.successor(4)
+        5
+        >>> avl.successor(7) is None
+        True
+        """
+        return super().successor(value)
+
     # =============================  INSERTION   ==============================
     def _insert(self, value):
         """
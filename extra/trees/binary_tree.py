@@ -97,6 +97,7 @@ class BinaryTreeNode(TreeNode):
     """
 
     __name__ = "extra.BinaryTreeNode()"
+    __slots__ = ("_left", "_right")
 
     def __init__(self, value):
         """
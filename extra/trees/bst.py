@@ -99,6 +99,7 @@ class BSTNode(BinaryTreeNode):
     """
 
     __name__ = "extra.BSTNode()"
+    __slots__ = ("_parent", "_size")
 
     def __init__(self, value):
         """
@@ -117,10 +118,11 @@ class BSTNode(BinaryTreeNode):
         TypeError:
             If the given item isn't a number.
         """
-        if type(value) not in {int, float}:
+        if not self.TRUSTED and type(value) not in {int, float}:
             raise TypeError(f"`{self.__name__}` contains only numbers!!")
         super().__init__(value)
         self._parent = None
+        self._size = 1
 
     def get_parent(self):
         """
@@ -211,6 +213,7 @@ class BSTNode(BinaryTreeNode):
         self._left = new_node
         if new_node is not None:
             self._left._parent = self
+        self._update_size()
 
     def set_right(self, new_node):
         """
@@ -232,6 +235,39 @@ class BSTNode(BinaryTreeNode):
         self._right = new_node
         if new_node is not None:
             self._right._parent = self
+        self._update_size()
+
+    def get_size(self):
+        """
+        Returns the number of nodes in the subtree whose root is the current
+        `BSTNode()` instance, the instance itself included.
+
+        Returns
+        -------
+        int:
+            The size of the subtree rooted at the current `BSTNode()`.
+
+        Example
+        -------
+        >>> x = BSTNode(10)
+        >>> x.set_left(BSTNode(5))
+        >>> x.set_right(BSTNode(15))
+        >>> x.get_size()
+        3
+        """
+        return self._size
+
+    def _update_size(self):
+        """
+        Recomputes the size of the subtree rooted at the current `BSTNode()`
+        from the sizes of its children in constant time.
+        """
+        size = 1
+        if self._left is not None:
+            size += self._left._size
+        if self._right is not None:
+            size += self._right._size
+        self._size = size
 
     def set_parent(self, new_node):
         """
@@ -376,6 +412,8 @@ class BST(BinaryTree):
         TypeError:
             If `item` is not a numeric value.
         """
+        if self.TRUSTED:
+            return
         super()._validate_item(item)
         if type(item) not in {int, float}:
             raise TypeError(f"`{self.__name__}` accepts only numbers!!")
@@ -425,6 +463,22 @@ class BST(BinaryTree):
         """
         return super().is_empty()
 
+    def _update_sizes(self, start_node):
+        """
+        Recomputes the subtree sizes of the given `start_node` and all of its
+        ancestors up to the root. This must be called after a node is attached
+        to or detached from the tree so that the size augmentation stays
+        correct.
+
+        Parameters
+        ----------
+        start_node: BSTNode() or None
+            A reference to the deepest node whose subtree has changed.
+        """
+        while start_node is not None:
+            start_node._update_size()
+            start_node = start_node.get_parent()
+
     # =============================      MAX     ==============================
     def _get_max_node(self, start_node):
         """
@@ -659,6 +713,525 @@ class BST(BinaryTree):
         found_node = self._search(find_val, self._root)
         return found_node.get_data() == find_val
 
+    # =============================    SELECT    ==============================
+    def _select_node(self, idx):
+        """
+        Finds the node holding the value at the given index of the sorted
+        values of the `BST()` instance using the subtree sizes, which takes
+        O(h) time where **h** is the height of the instance.
+
+        Parameters
+        ----------
+        idx: int
+            A zero-based index. Negative indices count from the greatest
+            value.
+
+        Returns
+        -------
+        BSTNode():
+            The node whose value has exactly `idx` smaller values in the
+            `BST()` instance.
+
+        Raises
+        ------
+        TypeError:
+            If the given index isn't `int`.
+        IndexError:
+            If the given index is out of the `BST()` boundaries.
+        """
+        if type(idx) != int:
+            raise TypeError("Given index must be an integer!!")
+        elif idx < -self._length or idx >= self._length:
+            raise IndexError("Given index is out of the boundaries!!")
+        if idx < 0:
+            idx += self._length
+        curr_node = self._root
+        while True:
+            left_child = curr_node.get_left()
+            left_size = left_child.get_size() if left_child else 0
+            if idx < left_size:
+                curr_node = left_child
+            elif idx == left_size:
+                return curr_node
+            else:
+                idx -= left_size + 1
+                curr_node = curr_node.get_right()
+
+    def select(self, idx):
+        """
+        Returns the value at the given index of the sorted values of the
+        `BST()` instance, i.e. the k-th smallest value, in O(h) time where
+        **h** is the height of the instance.
+
+        Parameters
+        ----------
+        idx: int
+            A zero-based index. Negative indices count from the greatest
+            value.
+
+        Returns
+        -------
+        int or float:
+            The value that has exactly `idx` smaller values in the `BST()`
+            instance.
+
+        Raises
+        ------
+        TypeError:
+            If the given index isn't `int`.
+        IndexError:
+            If the given index is out of the `BST()` boundaries.
+
+        Example
+        -------
+        >>> bst = BST([8, 5, 2, 7, 15, 10, 3])
+        >>> bst
+              __8___
+             /      \\
+          __5       _15
+         /   \\    /
+        2     7   10
+         \\
+          3
+        >>> bst.select(0)
+        2
+        >>> bst.select(3)
+        7
+        >>> bst.select(-1)
+        15
+        >>> bst.select(7)
+        IndexError: Given index is out of the boundaries!!
+        """
+        return self._select_node(idx).get_data()
+
+    def __getitem__(self, idx):
+        """
+        Returns the value at the given index of the sorted values of the
+        `BST()` instance in O(h) time where **h** is the height of the
+        instance. It's the same as `select()`.
+
+        Parameters
+        ----------
+        idx: int
+            A zero-based index. Negative indices count from the greatest
+            value.
+
+        Returns
+        -------
+        int or float:
+            The value that has exactly `idx` smaller values in the `BST()`
+            instance.
+
+        Raises
+        ------
+        TypeError:
+            If the given index isn't `int`.
+        IndexError:
+            If the given index is out of the `BST()` boundaries.
+
+        Example
+        -------
+        >>> bst = BST([8, 5, 2, 7, 15, 10, 3])
+        >>> bst[4]
+        8
+        >>> bst[-2]
+        10
+        """
+        return self.select(idx)
+
+    # =============================     RANK     ==============================
+    def _count_smaller(self, value, or_equal=False):
+        """
+        Counts the values in the `BST()` instance that are smaller than (or
+        equal to) the given value using the subtree sizes in O(h) time where
+        **h** is the height of the instance.
+
+        Parameters
+        ----------
+        value: int or float
+            The value to be compared against.
+        or_equal: bool
+            A flag to count the values that are equal to `value` as well,
+            default `False`.
+
+        Returns
+        -------
+        int:
+            The number of values smaller than (or equal to) `value`.
+        """
+        count = 0
+        curr_node = self._root
+        while curr_node is not None:
+            data = curr_node.get_data()
+            if value < data or (value == data and not or_equal):
+                curr_node = curr_node.get_left()
+            else:
+                left_child = curr_node.get_left()
+                count += 1 + (left_child.get_size() if left_child else 0)
+                curr_node = curr_node.get_right()
+        return count
+
+    def rank(self, value):
+        """
+        Counts the values in the `BST()` instance that are smaller than the
+        given value in O(h) time where **h** is the height of the instance.
+        The given value doesn't have to exist in the instance.
+
+        Parameters
+        ----------
+        value: int or float
+            The value to be ranked.
+
+        Returns
+        -------
+        int:
+            The number of values in the `BST()` instance that are smaller than
+            the given value. If the value exists, this is its index in the
+            sorted values of the instance.
+
+        Raises
+        ------
+        ValueError:
+            If the given `value` is `None`.
+        TypeError:
+            If the given `value` is not a numeric value.
+
+        Example
+        -------
+        >>> bst = BST([8, 5, 2, 7, 15, 10, 3])
+        >>> bst.rank(8)
+        4
+        >>> bst.rank(6)
+        3
+        >>> bst.rank(100)
+        7
+        """
+        self._validate_item(value)
+        return self._count_smaller(value)
+
+    # =============================     RANGE    ==============================
+    def __iter_range(self, lo, hi):
+        """
+        Yields the values of the `BST()` instance that lie within the closed
+        interval `[lo, hi]` in ascending order. Subtrees that lie completely
+        outside the interval are never visited.
+
+        Parameters
+        ----------
+        lo: int or float
+            The lower bound of the interval.
+        hi: int or float
+            The upper bound of the interval.
+
+        Yields
+        ------
+        int or float:
+            The values within the interval in ascending order.
+        """
+        stack = []
+        curr_node = self._root
+        while stack or curr_node is not None:
+            if curr_node is not None:
+                if curr_node.get_data() < lo:
+                    # the whole left subtree is smaller than `lo`
+                    curr_node = curr_node.get_right()
+                else:
+                    stack.append(curr_node)
+                    curr_node = curr_node.get_left()
+            else:
+                curr_node = stack.pop()
+                if curr_node.get_data() > hi:
+                    return
+                yield curr_node.get_data()
+                curr_node = curr_node.get_right()
+
+    def range(self, lo, hi):
+        """
+        Lazily iterates over the values of the `BST()` instance that lie
+        within the closed interval `[lo, hi]` in ascending order. Subtrees
+        that lie completely outside the interval are pruned, so iterating
+        over the whole range takes O(h+k) time where **h** is the height of
+        the instance and **k** is the number of values in the range.
+
+        Parameters
+        ----------
+        lo: int or float
+            The lower bound of the interval.
+        hi: int or float
+            The upper bound of the interval.
+
+        Returns
+        -------
+        generator:
+            A generator of the values within the interval in ascending order.
+            It yields nothing when `lo` is greater than `hi`.
+
+        Raises
+        ------
+        ValueError:
+            If one of the given bounds is `None`.
+        TypeError:
+            If one of the given bounds is not a numeric value.
+
+        Example
+        -------
+        >>> bst = BST([8, 5, 2, 7, 15, 10, 3])
+        >>> bst
+              __8___
+             /      \\
+          __5       _15
+         /   \\    /
+        2     7   10
+         \\
+          3
+        >>> list(bst.range(3, 10))
+        [3, 5, 7, 8, 10]
+        >>> list(bst.range(4, 6.5))
+        [5]
+
+        Note
+        ----
+        The `BST()` instance shouldn't be modified while iterating over the
+        returned generator.
+        """
+        self._validate_item(lo)
+        self._validate_item(hi)
+        return self.__iter_range(lo, hi)
+
+    def count_range(self, lo, hi):
+        """
+        Counts the values of the `BST()` instance that lie within the closed
+        interval `[lo, hi]` in O(h) time where **h** is the height of the
+        instance, without visiting the values themselves.
+
+        Parameters
+        ----------
+        lo: int or float
+            The lower bound of the interval.
+        hi: int or float
+            The upper bound of the interval.
+
+        Returns
+        -------
+        int:
+            The number of values within the interval. It's zero when `lo` is
+            greater than `hi`.
+
+        Raises
+        ------
+        ValueError:
+            If one of the given bounds is `None`.
+        TypeError:
+            If one of the given bounds is not a numeric value.
+
+        Example
+        -------
+        >>> bst = BST([8, 5, 2, 7, 15, 10, 3])
+        >>> bst.count_range(3, 10)
+        5
+        >>> bst.count_range(11, 14)
+        0
+        """
+        self._validate_item(lo)
+        self._validate_item(hi)
+        if lo > hi:
+            return 0
+        return (
+            self._count_smaller(hi, or_equal=True)
+            - self._count_smaller(lo)
+        )
+
+    # =============================   NEIGHBORS  ==============================
+    def _find_neighbor(self, value, is_lower, inclusive):
+        """
+        Finds the node holding the closest value to the given `value` from
+        one side in O(h) time where **h** is the height of the `BST()`
+        instance.
+
+        Parameters
+        ----------
+        value: int or float
+            The value whose neighbor is searched for.
+        is_lower: bool
+            `True` to search for the closest smaller value and `False` to
+            search for the closest greater value.
+        inclusive: bool
+            A flag to accept a value equal to `value` as its own neighbor.
+
+        Returns
+        -------
+        BSTNode() or None:
+            The node holding the neighbor, or `None` if there is no such
+            value in the `BST()` instance.
+        """
+        neighbor = None
+        curr_node = self._root
+        while curr_node is not None:
+            data = curr_node.get_data()
+            if data == value and inclusive:
+                return curr_node
+            elif (data < value) if is_lower else (data > value):
+                neighbor = curr_node
+                curr_node = (
+                    curr_node.get_right() if is_lower
+                    else curr_node.get_left()
+                )
+            else:
+                curr_node = (
+                    curr_node.get_left() if is_lower
+                    else curr_node.get_right()
+                )
+        return neighbor
+
+    def floor(self, value):
+        """
+        Returns the greatest value in the `BST()` instance that is less than
+        or equal to the given value in O(h) time where **h** is the height of
+        the instance.
+
+        Parameters
+        ----------
+        value: int or float
+            The value whose floor is needed.
+
+        Returns
+        -------
+        int or float or None:
+            The floor of the given value, or `None` if all the values in the
+            `BST()` instance are greater than the given value.
+
+        Raises
+        ------
+        ValueError:
+            If the given `value` is `None`.
+        TypeError:
+            If the given `value` is not a numeric value.
+
+        Example
+        -------
+        >>> bst = BST([8, 5, 2, 7, 15, 10, 3])
+        >>> bst.floor(6)
+        5
+        >>> bst.floor(7)
+        7
+        >>> bst.floor(1) is None
+        True
+        """
+        self._validate_item(value)
+        node = self._find_neighbor(value, is_lower=True, inclusive=True)
+        return node.get_data() if node else None
+
+    def ceiling(self, value):
+        """
+        Returns the smallest value in the `BST()` instance that is greater
+        than or equal to the given value in O(h) time where **h** is the
+        height of the instance.
+
+        Parameters
+        ----------
+        value: int or float
+            The value whose ceiling is needed.
+
+        Returns
+        -------
+        int or float or None:
+            The ceiling of the given value, or `None` if all the values in the
+            `BST()` instance are less than the given value.
+
+        Raises
+        ------
+        ValueError:
+            If the given `value` is `None`.
+        TypeError:
+            If the given `value` is not a numeric value.
+
+        Example
+        -------
+        >>> bst = BST([8, 5, 2, 7, 15, 10, 3])
+        >>> bst.ceiling(6)
+        7
+        >>> bst.ceiling(7)
+        7
+        >>> bst.ceiling(16) is None
+        True
+        """
+        self._validate_item(value)
+        node = self._find_neighbor(value, is_lower=False, inclusive=True)
+        return node.get_data() if node else None
+
+    def predecessor(self, value):
+        """
+        Returns the greatest value in the `BST()` instance that is strictly
+        less than the given value in O(h) time where **h** is the height of
+        the instance. The given value doesn't have to exist in the instance.
+
+        Parameters
+        ----------
+        value: int or float
+            The value whose predecessor is needed.
+
+        Returns
+        -------
+        int or float or None:
+            The predecessor of the given value, or `None` if there is no
+            smaller value in the `BST()` instance.
+
+        Raises
+        ------
+        ValueError:
+            If the given `value` is `None`.
+        TypeError:
+            If the given `value` is not a numeric value.
+
+        Example
+        -------
+        >>> bst = BST([8, 5, 2, 7, 15, 10, 3])
+        >>> bst.predecessor(7)
+        5
+        >>> bst.predecessor(2) is None
+        True
+        """
+        self._validate_item(value)
+        node = self._find_neighbor(value, is_lower=True, inclusive=False)
+        return node.get_data() if node else None
+
+    def successor(self, value):
+        """
+        Returns the smallest value in the `BST()` instance that is strictly
+        greater than the given value in O(h) time where **h** is the height
+        of the instance. The given value doesn't have to exist in the
+        instance.
+
+        Parameters
+        ----------
+        value: int or float
+            The value whose successor is needed.
+
+        Returns
+        -------
+        int or float or None:
+            The successor of the given value, or `None` if there is no
+            greater value in the `BST()` instance.
+
+        Raises
+        ------
+        ValueError:
+            If the given `value` is `None`.
+        TypeError:
+            If the given `value` is not a numeric value.
+
+        Example
+        -------
+        >>> bst = BST([8, 5, 2, 7, 15, 10, 3])
+        >>> bst.successor(7)
+        8
+        >>> bst.successor(15) is None
+        True
+        """
+        self._validate_item(value)
+        node = self._find_neighbor(value, is_lower=False, inclusive=False)
+        return node.get_data() if node else None
+
     # =============================    INSERT    ==============================
     def _insert_node(self, start_node, inserted_node):
         """
@@ -702,6 +1275,7 @@ class BST(BinaryTree):
                 return self._insert_node(start_node.get_left(), inserted_node)
             else:
                 start_node.set_left(inserted_node)
+                self._update_sizes(start_node)
                 self._length += 1
                 return inserted_node
         else:
@@ -709,6 +1283,7 @@ class BST(BinaryTree):
                 return self._insert_node(start_node.get_right(), inserted_node)
             else:
                 start_node.set_right(inserted_node)
+                self._update_sizes(start_node)
                 self._length += 1
                 return inserted_node
 
@@ -890,6 +1465,7 @@ class BST(BinaryTree):
                 parent.set_left(replacement)
             else:
                 parent.set_right(replacement)
+            self._update_sizes(parent)
         else:
             if replacement.is_leaf():
                 new_replacement = None
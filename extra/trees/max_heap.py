@@ -28,10 +28,23 @@ class MaxHeap(Heap):
 
     __name__ = "extra.MaxHeap()"
 
-    def __init__(self):
+    def __init__(self, track_positions=False):
         """
         Creates an empty `MaxHeap()` object!!
 
+        Parameters
+        ----------
+        track_positions: bool
+            A flag to keep a map from every value to its positions within the
+            heap (default: `False`). Enabling it makes `__contains__()` run in
+            constant time and `remove()`/`update()` run in O(log(n)) at the
+            cost of the memory needed for the map.
+
+        Raises
+        ------
+        TypeError:
+            If `track_positions` isn't a boolean.
+
         Example
         -------
         >>> max_heap = MaxHeap()
@@ -40,10 +53,10 @@ class MaxHeap(Heap):
         >>> max_heap
         / \\
         """
-        super().__init__()
+        super().__init__(track_positions)
 
     @classmethod
-    def heapify(cls, iterable):
+    def heapify(cls, iterable, track_positions=False):
         """
         A class method which creates a `MaxHeap()` instance using an iterable
         object in time-complexity of O(n) where **n** is the number of elements
@@ -54,6 +67,9 @@ class MaxHeap(Heap):
         iterable: iterable
             An iterable python object that implements the `__iter__` method.
             For example, `list` and `tuple` are both iterables.
+        track_positions: bool
+            A flag to keep a map from every value to its positions within the
+            heap (default: `False`).
 
         Returns
         -------
@@ -96,7 +112,9 @@ class MaxHeap(Heap):
         >>> max_heap_2 = MaxHeap.heapify([1, max_heap_1])
         TypeError: Can't create `extra.MaxHeap()` using `extra.MaxHeap()`!!
         """
-        return super().heapify(iterable)
+        return super().heapify(
+            iterable, is_min_heap=False, track_positions=track_positions
+        )
 
     # =============================    LENGTH    ==============================
     def __len__(self):
@@ -237,7 +255,8 @@ class MaxHeap(Heap):
     def __contains__(self, num):
         """
         Searches the `MaxHeap()` for the given value and returns `True` if the
-        value exists and `False` if not.
+        value exists and `False` if not. It does that in constant time when
+        the instance tracks positions, and in linear time otherwise.
 
         Parameters
         ----------
@@ -307,10 +326,100 @@ class MaxHeap(Heap):
         """
         super().insert(value, is_min_heap=False)
 
+    # =============================    UPDATE    ==============================
+    def update(self, old_value, new_value):
+        """
+        Replaces one occurrence of `old_value` in the `MaxHeap()` instance with
+        `new_value`. It does that in time-complexity of O(log(n)) when the
+        instance tracks positions, and O(n) otherwise.
+
+        Parameters
+        ----------
+        old_value: int or float
+            The value to be replaced.
+        new_value: int or float
+            The value to replace the old one.
+
+        Raises
+        ------
+        ValueError:
+            If the given `new_value` is `None`.
+        TypeError:
+            If the given `new_value` is not a numeric value.
+        UserWarning:
+            If the `MaxHeap()` instance is empty of if the `old_value` wasn't
+            found in the instance.
+
+        Example
+        -------
+        >>> lst = [2, 4, 3, 7, 9, 0, 1]
+        >>> max_heap = MaxHeap.heapify(lst, track_positions=True)
+        >>> max_heap
+            __9__
+           /     \\
+          7       3
+         / \\    / \\
+        2   4   0   1
+        >>> max_heap.update(0, 10)
+        >>> max_heap
+            __10__
+           /      \\
+          7        9
+         / \\     / \\
+        2   4    3   1
+        >>> max_heap.update(50, 5)
+        UserWarning: Couldn't find `50` in `extra.MaxHeap()`!!
+        """
+        super().update(old_value, new_value, is_min_heap=False)
+
+    def increase_key(self, old_value, new_value):
+        """
+        Replaces one occurrence of `old_value` in the `MaxHeap()` instance with
+        `new_value` which can't be less than `old_value`. This is the
+        common operation used by graph algorithms like Dijkstra's and Prim's.
+
+        Parameters
+        ----------
+        old_value: int or float
+            The value to be replaced.
+        new_value: int or float
+            The value to replace the old one.
+
+        Raises
+        ------
+        ValueError:
+            It can be raised in two cases
+                1. If the given `new_value` is `None`.
+                2. If the given `new_value` is less than `old_value`.
+        TypeError:
+            If the given `new_value` is not a numeric value.
+        UserWarning:
+            If the `MaxHeap()` instance is empty of if the `old_value` wasn't
+            found in the instance.
+
+        Example
+        -------
+        >>> lst = [2, 4, 3, 7, 9, 0, 1]
+        >>> max_heap = MaxHeap.heapify(lst, track_positions=True)
+        >>> max_heap.increase_key(2, 10)
+        >>> max_heap.get_max()
+        10
+        >>> max_heap.increase_key(7, 0)
+        ValueError: The new value can't be less than the old one!!
+        """
+        self._validate_item(new_value)
+        if type(old_value) in {int, float} and new_value < old_value:
+            raise ValueError(
+                "The new value can't be less than the old one!!"
+            )
+        self.update(old_value, new_value)
+
     # =============================    REMOVE    ==============================
     def remove(self, del_value):
         """
-        Removes the `del_value` from the `MaxHeap()` instance.
+        Removes the `del_value` from the `MaxHeap()` instance. It does that in
+        time-complexity of O(log(n)) when the instance tracks positions, and
+        O(n) otherwise.
 
         Parameters
         ----------
@@ -404,11 +513,215 @@ class MaxHeap(Heap):
         """
         self.remove(self.get_max())
 
+    # =============================   PUSH/POP   ==============================
+    def pushpop(self, value):
+        """
+        Inserts the given value into the `MaxHeap()` instance, then removes and
+        returns the maximum value in a single sift pass of time-complexity
+        O(log(n)). It's faster than calling `insert()` followed by
+        `remove_max()`.
+
+        Parameters
+        ----------
+        value: int or float
+            The new numeric value that will be inserted.
+
+        Returns
+        -------
+        int or float:
+            The maximum value after inserting the given value.
+
+        Raises
+        ------
+        ValueError:
+            If the given `value` is `None`.
+        TypeError:
+            If the given `value` is not a numeric value.
+
+        Example
+        -------
+        >>> max_heap = MaxHeap.heapify([2, 4, 3, 7, 9, 0, 1])
+        >>> max_heap.pushpop(10)
+        10
+        >>> max_heap.pushpop(5)
+        9
+        >>> max_heap.to_list()
+        [7, 5, 3, 2, 4, 0, 1]
+        """
+        return super().pushpop(value, is_min_heap=False)
+
+    def replace(self, value):
+        """
+        Removes and returns the maximum value of the `MaxHeap()` instance, then
+        inserts the given value in a single sift pass of time-complexity
+        O(log(n)). Unlike `pushpop()`, the root is removed even when
+        the given value is more extreme.
+
+        Parameters
+        ----------
+        value: int or float
+            The new numeric value that will be inserted.
+
+        Returns
+        -------
+        int or float:
+            The maximum value before inserting the given value.
+
+        Raises
+        ------
+        ValueError:
+            If the given `value` is `None`.
+        TypeError:
+            If the given `value` is not a numeric value.
+        IndexError:
+            If the `MaxHeap()` instance is empty.
+
+        Example
+        -------
+        >>> max_heap = MaxHeap.heapify([2, 4, 3, 7, 9, 0, 1])
+        >>> max_heap.replace(5)
+        9
+        >>> max_heap
+            __7__
+           /     \\
+          5       3
+         / \\     / \\
+        2   4   0   1
+        """
+        return super().replace(value, is_min_heap=False)
+
+    # =============================    BATCH     ==============================
+    def extend(self, iterable):
+        """
+        Inserts all values of the given iterable into the `MaxHeap()` instance.
+        Small batches are inserted one by one in O(k*log(n+k)) while large
+        batches are appended and the whole heap is rebuilt in O(n+k) where
+        **k** is the number of the given values.
+
+        Parameters
+        ----------
+        iterable: iterable
+            An iterable python object that implements the `__iter__` method.
+            For example, `list` and `tuple` are both iterables.
+
+        Raises
+        ------
+        TypeError:
+            It can be raised in two cases
+                1. In case the given object isn't iterable.
+                2. If one of the elements in the iterable is NOT a number.
+        ValueError:
+            If one of the iterable elements is `None`.
+
+        Example
+        -------
+        >>> max_heap = MaxHeap.heapify([2, 4, 3, 7, 9, 0, 1])
+        >>> max_heap.extend([8, -2, 6])
+        >>> max_heap
+                 ____9__
+                /       \\
+            ___8__       3
+           /      \\     / \\
+          7        6   0   1
+         / \\      /
+        2   -2   4
+        """
+        super().extend(iterable, is_min_heap=False)
+
+    def merge(self, other):
+        """
+        Melds all values of the `other` heap into the `MaxHeap()` instance in
+        linear time. The `other` heap is left untouched.
+
+        Parameters
+        ----------
+        other: Heap()
+            Another heap instance whose values will be added.
+
+        Raises
+        ------
+        TypeError:
+            If `other` isn't a heap instance.
+
+        Example
+        -------
+        >>> max_heap = MaxHeap.heapify([2, 4, 3, 7, 9, 0, 1])
+        >>> max_heap.merge(MaxHeap.heapify([5, -3, 11]))
+        >>> max_heap
+                 ____11__
+                /        \\
+            ___9__        3
+           /      \\      / \\
+          7        5    0   1
+         / \\      /
+        2   -3   4
+        """
+        super().merge(other, is_min_heap=False)
+
+    def nsmallest(self, n):
+        """
+        Gets the `n` smallest values in the `MaxHeap()` instance sorted in
+        ascending order without modifying the instance. It scans the whole
+        instance in O(N*log(n)) where **N** is the length of the instance.
+
+        Parameters
+        ----------
+        n: int
+            The number of values to get.
+
+        Returns
+        -------
+        list:
+            The `n` smallest values in ascending order.
+
+        Raises
+        ------
+        TypeError:
+            If `n` isn't an integer.
+
+        Example
+        -------
+        >>> max_heap = MaxHeap.heapify([2, 4, 3, 7, 9, 0, 1])
+        >>> max_heap.nsmallest(3)
+        [0, 1, 2]
+        """
+        return super().nsmallest(n, is_min_heap=False)
+
+    def nlargest(self, n):
+        """
+        Gets the `n` largest values in the `MaxHeap()` instance sorted in
+        descending order without modifying the instance. It walks down from the
+        root in O(n*log(n)) regardless of the length of the instance.
+
+        Parameters
+        ----------
+        n: int
+            The number of values to get.
+
+        Returns
+        -------
+        list:
+            The `n` largest values in descending order.
+
+        Raises
+        ------
+        TypeError:
+            If `n` isn't an integer.
+
+        Example
+        -------
+        >>> max_heap = MaxHeap.heapify([2, 4, 3, 7, 9, 0, 1])
+        >>> max_heap.nlargest(3)
+        [9, 7, 4]
+        """
+        return super().nlargest(n, is_min_heap=False)
+
     # =============================     ITER     ==============================
     def __iter__(self):
         """
         Iterates over the `MaxHeap()` instance and returns a generator of the
-        heap node values in breadth-first manner.
+        heap node values in breadth-first manner in linear time. Values are
+        yielded straight from the underlying list without creating any nodes.
 
         Yields
         ------
@@ -475,4 +788,4 @@ class MaxHeap(Heap):
         >>> max_heap.is_empty()
         True
         """
-        super().__init__()
+        super().clear()
@@ -28,10 +28,23 @@ class MinHeap(Heap):
 
     __name__ = "extra.MinHeap()"
 
-    def __init__(self):
+    def __init__(self, track_positions=False):
         """
         Creates an empty `MinHeap()` object!!
 
+        Parameters
+        ----------
+        track_positions: bool
+            A flag to keep a map from every value to its positions within the
+            heap (default: `False`). Enabling it makes `__contains__()` run in
+            constant time and `remove()`/`update()` run in O(log(n)) at the
+            cost of the memory needed for the map.
+
+        Raises
+        ------
+        TypeError:
+            If `track_positions` isn't a boolean.
+
         Example
         -------
         >>> min_heap = MinHeap()
@@ -40,10 +53,10 @@ class MinHeap(Heap):
         >>> min_heap
         / \\
         """
-        super().__init__()
+        super().__init__(track_positions)
 
     @classmethod
-    def heapify(cls, iterable):
+    def heapify(cls, iterable, track_positions=False):
         """
         A class method which creates a `MinHeap()` instance using an iterable
         object in time-complexity of O(n) where **n** is the number of elements
@@ -54,6 +67,9 @@ class MinHeap(Heap):
         iterable: iterable
             An iterable python object that implements the `__iter__` method.
             For example, `list` and `tuple` are both iterables.
+        track_positions: bool
+            A flag to keep a map from every value to its positions within the
+            heap (default: `False`).
 
         Returns
         -------
@@ -95,7 +111,9 @@ class MinHeap(Heap):
         >>> min_heap_2 = MinHeap.heapify([1, min_heap_1])
         TypeError: Can't create `extra.MinHeap()` using `extra.MinHeap()`!!
         """
-        return super().heapify(iterable)
+        return super().heapify(
+            iterable, is_min_heap=True, track_positions=track_positions
+        )
 
     # =============================    LENGTH    ==============================
     def __len__(self):
@@ -235,7 +253,8 @@ class MinHeap(Heap):
     def __contains__(self, num):
         """
         Searches the `MinHeap()` for the given value and returns `True` if the
-        value exists and `False` if not in linear time.
+        value exists and `False` if not. It does that in constant time when
+        the instance tracks positions, and in linear time otherwise.
 
         Parameters
         ----------
@@ -305,10 +324,100 @@ class MinHeap(Heap):
         """
         super().insert(value, is_min_heap=True)
 
+    # =============================    UPDATE    ==============================
+    def update(self, old_value, new_value):
+        """
+        Replaces one occurrence of `old_value` in the `MinHeap()` instance with
+        `new_value`. It does that in time-complexity of O(log(n)) when the
+        instance tracks positions, and O(n) otherwise.
+
+        Parameters
+        ----------
+        old_value: int or float
+            The value to be replaced.
+        new_value: int or float
+            The value to replace the old one.
+
+        Raises
+        ------
+        ValueError:
+            If the given `new_value` is `None`.
+        TypeError:
+            If the given `new_value` is not a numeric value.
+        UserWarning:
+            If the `MinHeap()` instance is empty of if the `old_value` wasn't
+            found in the instance.
+
+        Example
+        -------
+        >>> lst = [2, 4, 3, 7, 9, 0, 1]
+        >>> min_heap = MinHeap.heapify(lst, track_positions=True)
+        >>> min_heap
+            __0__
+           /     \\
+          4       1
+         / \\     / \\
+        7   9    3   2
+        >>> min_heap.update(9, -1)
+        >>> min_heap
+            __-1__
+           /      \\
+          0        1
+         / \\      / \\
+        7   4    3   2
+        >>> min_heap.update(50, 5)
+        UserWarning: Couldn't find `50` in `extra.MinHeap()`!!
+        """
+        super().update(old_value, new_value, is_min_heap=True)
+
+    def decrease_key(self, old_value, new_value):
+        """
+        Replaces one occurrence of `old_value` in the `MinHeap()` instance with
+        `new_value` which can't be greater than `old_value`. This is the
+        common operation used by graph algorithms like Dijkstra's and Prim's.
+
+        Parameters
+        ----------
+        old_value: int or float
+            The value to be replaced.
+        new_value: int or float
+            The value to replace the old one.
+
+        Raises
+        ------
+        ValueError:
+            It can be raised in two cases
+                1. If the given `new_value` is `None`.
+                2. If the given `new_value` is greater than `old_value`.
+        TypeError:
+            If the given `new_value` is not a numeric value.
+        UserWarning:
+            If the `MinHeap()` instance is empty of if the `old_value` wasn't
+            found in the instance.
+
+        Example
+        -------
+        >>> lst = [2, 4, 3, 7, 9, 0, 1]
+        >>> min_heap = MinHeap.heapify(lst, track_positions=True)
+        >>> min_heap.decrease_key(7, -1)
+        >>> min_heap.get_min()
+        -1
+        >>> min_heap.decrease_key(4, 10)
+        ValueError: The new value can't be greater than the old one!!
+        """
+        self._validate_item(new_value)
+        if type(old_value) in {int, float} and new_value > old_value:
+            raise ValueError(
+                "The new value can't be greater than the old one!!"
+            )
+        self.update(old_value, new_value)
+
     # =============================    REMOVE    ==============================
     def remove(self, del_value):
         """
-        Removes the `del_value` from the `MinHeap()` instance.
+        Removes the `del_value` from the `MinHeap()` instance. It does that in
+        time-complexity of O(log(n)) when the instance tracks positions, and
+        O(n) otherwise.
 
         Parameters
         ----------
@@ -402,11 +511,215 @@ class MinHeap(Heap):
         """
         self.remove(self.get_max())
 
+    # =============================   PUSH/POP   ==============================
+    def pushpop(self, value):
+        """
+        Inserts the given value into the `MinHeap()` instance, then removes and
+        returns the minimum value in a single sift pass of time-complexity
+        O(log(n)). It's faster than calling `insert()` followed by
+        `remove_min()`.
+
+        Parameters
+        ----------
+        value: int or float
+            The new numeric value that will be inserted.
+
+        Returns
+        -------
+        int or float:
+            The minimum value after inserting the given value.
+
+        Raises
+        ------
+        ValueError:
+            If the given `value` is `None`.
+        TypeError:
+            If the given `value` is not a numeric value.
+
+        Example
+        -------
+        >>> min_heap = MinHeap.heapify([2, 4, 3, 7, 9, 0, 1])
+        >>> min_heap.pushpop(-1)
+        -1
+        >>> min_heap.pushpop(5)
+        0
+        >>> min_heap.to_list()
+        [1, 4, 2, 7, 9, 3, 5]
+        """
+        return super().pushpop(value, is_min_heap=True)
+
+    def replace(self, value):
+        """
+        Removes and returns the minimum value of the `MinHeap()` instance, then
+        inserts the given value in a single sift pass of time-complexity
+        O(log(n)). Unlike `pushpop()`, the root is removed even when
+        the given value is more extreme.
+
+        Parameters
+        ----------
+        value: int or float
+            The new numeric value that will be inserted.
+
+        Returns
+        -------
+        int or float:
+            The minimum value before inserting the given value.
+
+        Raises
+        ------
+        ValueError:
+            If the given `value` is `None`.
+        TypeError:
+            If the given `value` is not a numeric value.
+        IndexError:
+            If the `MinHeap()` instance is empty.
+
+        Example
+        -------
+        >>> min_heap = MinHeap.heapify([2, 4, 3, 7, 9, 0, 1])
+        >>> min_heap.replace(5)
+        0
+        >>> min_heap
+            __1__
+           /     \\
+          4       2
+         / \\     / \\
+        7   9   3   5
+        """
+        return super().replace(value, is_min_heap=True)
+
+    # =============================    BATCH     ==============================
+    def extend(self, iterable):
+        """
+        Inserts all values of the given iterable into the `MinHeap()` instance.
+        Small batches are inserted one by one in O(k*log(n+k)) while large
+        batches are appended and the whole heap is rebuilt in O(n+k) where
+        **k** is the number of the given values.
+
+        Parameters
+        ----------
+        iterable: iterable
+            An iterable python object that implements the `__iter__` method.
+            For example, `list` and `tuple` are both iterables.
+
+        Raises
+        ------
+        TypeError:
+            It can be raised in two cases
+                1. In case the given object isn't iterable.
+                2. If one of the elements in the iterable is NOT a number.
+        ValueError:
+            If one of the iterable elements is `None`.
+
+        Example
+        -------
+        >>> min_heap = MinHeap.heapify([2, 4, 3, 7, 9, 0, 1])
+        >>> min_heap.extend([8, -2, 6])
+        >>> min_heap
+                ____-2__
+               /        \\
+            __0__        1
+           /     \\      / \\
+          4       6    3   2
+         / \\     /
+        8   7   9
+        """
+        super().extend(iterable, is_min_heap=True)
+
+    def merge(self, other):
+        """
+        Melds all values of the `other` heap into the `MinHeap()` instance in
+        linear time. The `other` heap is left untouched.
+
+        Parameters
+        ----------
+        other: Heap()
+            Another heap instance whose values will be added.
+
+        Raises
+        ------
+        TypeError:
+            If `other` isn't a heap instance.
+
+        Example
+        -------
+        >>> min_heap = MinHeap.heapify([2, 4, 3, 7, 9, 0, 1])
+        >>> min_heap.merge(MinHeap.heapify([5, -3, 11]))
+        >>> min_heap
+                _____-3__
+               /         \\
+            __0___        1
+           /      \\      / \\
+          4       _9    3   2
+         / \\     /
+        7   5   11
+        """
+        super().merge(other, is_min_heap=True)
+
+    def nsmallest(self, n):
+        """
+        Gets the `n` smallest values in the `MinHeap()` instance sorted in
+        ascending order without modifying the instance. It walks down from the
+        root in O(n*log(n)) regardless of the length of the instance.
+
+        Parameters
+        ----------
+        n: int
+            The number of values to get.
+
+        Returns
+        -------
+        list:
+            The `n` smallest values in ascending order.
+
+        Raises
+        ------
+        TypeError:
+            If `n` isn't an integer.
+
+        Example
+        -------
+        >>> min_heap = MinHeap.heapify([2, 4, 3, 7, 9, 0, 1])
+        >>> min_heap.nsmallest(3)
+        [0, 1, 2]
+        """
+        return super().nsmallest(n, is_min_heap=True)
+
+    def nlargest(self, n):
+        """
+        Gets the `n` largest values in the `MinHeap()` instance sorted in
+        descending order without modifying the instance. It scans the whole
+        instance in O(N*log(n)) where **N** is the length of the instance.
+
+        Parameters
+        ----------
+        n: int
+            The number of values to get.
+
+        Returns
+        -------
+        list:
+            The `n` largest values in descending order.
+
+        Raises
+        ------
+        TypeError:
+            If `n` isn't an integer.
+
+        Example
+        -------
+        >>> min_heap = MinHeap.heapify([2, 4, 3, 7, 9, 0, 1])
+        >>> min_heap.nlargest(3)
+        [9, 7, 4]
+        """
+        return super().nlargest(n, is_min_heap=True)
+
     # =============================     ITER     ==============================
     def __iter__(self):
         """
         Iterates over the `MinHeap()` instance and returns a generator of the
-        heap node values in breadth-first manner.
+        heap node values in breadth-first manner in linear time. Values are
+        yielded straight from the underlying list without creating any nodes.
 
         Yields
         ------
@@ -473,4 +786,4 @@ class MinHeap(Heap):
         >>> min_heap.is_empty()
         True
         """
-        super().__init__()
+        super().clear()
@@ -0,0 +1,831 @@
+"""
+A min-max heap is a double-ended heap; a perfect binary tree where the levels
+alternate between **min levels** and **max levels** starting with a min level
+at the root. Each node must satisfy the following property:
+
+1. **Min-Max Order Property**: The value stored at a node on a min level is
+less than or equal to every value stored in its subtree, and the value stored
+at a node on a max level is greater than or equal to every value stored in its
+subtree. As a consequence, the minimum value is always stored at the root and
+the maximum value is stored at one of the root's two children. This makes it
+easy to locate both extremes when `get_min()` or `get_max()` is called.
+
+2. **Perfect Binary Tree Property**: It is a structural property defined in
+terms of the shape of heap itself. A binary tree is perfect if all its levels
+are completely filled. So, given an **n** inserted items, the height of the
+heap should be **log(n)** at most.
+
+This makes `MinMaxHeap()` a good fit for double-ended priority queues, sliding
+medians or keeping the best and worst candidates of a search at once.
+"""
+import heapq
+import warnings
+from extra.trees._heap import Heap
+
+
+class MinMaxHeap(Heap):
+    """
+    A Min-Max heap is a perfect binary tree that stores a collection of nodes
+    where nodes on even levels are less than or equal to their descendants and
+    nodes on odd levels are greater than or equal to their descendants.
+    """
+
+    __name__ = "extra.MinMaxHeap()"
+
+    def __init__(self, track_positions=False):
+        """
+        Creates an empty `MinMaxHeap()` object!!
+
+        Parameters
+        ----------
+        track_positions: bool
+            A flag to keep a map from every value to its positions within the
+            heap (default: `False`). Enabling it makes `__contains__()` run in
+            constant time and `remove()`/`update()` run in O(log(n)) at the
+            cost of the memory needed for the map.
+
+        Raises
+        ------
+        TypeError:
+            If `track_positions` isn't a boolean.
+
+        Example
+        -------
+        >>> min_max_heap = MinMaxHeap()
+        >>> type(min_max_heap)
+        <class 'extra.trees.min_max_heap.MinMaxHeap'>
+        >>> min_max_heap
+        / \\
+        """
+        super().__init__(track_positions)
+
+    @classmethod
+    def heapify(cls, iterable, track_positions=False):
+        """
+        A class method which creates a `MinMaxHeap()` instance using an
+        iterable object in time-complexity of O(n) where **n** is the number
+        of elements inside the given `iterable`.
+
+        Parameters
+        ----------
+        iterable: iterable
+            An iterable python object that implements the `__iter__` method.
+            For example, `list` and `tuple` are both iterables.
+        track_positions: bool
+            A flag to keep a map from every value to its positions within the
+            heap (default: `False`).
+
+        Returns
+        -------
+        MinMaxHeap()
+            It returns a `MinMaxHeap()` instance with input values being
+            inserted.
+
+        Raises
+        ------
+        TypeError:
+            It can be raised in two cases
+                1. In case the given object isn't iterable.
+                2. If one of the elements in the iterable is NOT a number.
+        ValueError:
+            If one of the iterable elements is `None`.
+
+        Examples
+        --------
+        >>> MinMaxHeap.heapify([2, 4, 3, 7, 9, 0, 1])
+            __0__
+           /     \\
+          9       3
+         / \\     / \\
+        7   4   2   1
+
+        Using a non-iterable object will raise `TypeError`
+
+        >>> MinMaxHeap.heapify(2)
+        TypeError: The given object isn't iterable!!
+        """
+        return super().heapify(
+            iterable, is_min_heap=True, track_positions=track_positions
+        )
+
+    # =============================    LENGTH    ==============================
+    def __len__(self):
+        """
+        Gets the length of the `MinMaxHeap()` instance in constant time.
+
+        Returns
+        -------
+        int:
+            The length of the `MinMaxHeap()` instance. Length is the number of
+            tree nodes in the instance.
+
+        Example
+        -------
+        >>> min_max_heap = MinMaxHeap.heapify([2, 4, 3, 7, 9, 0, 1])
+        >>> len(min_max_heap)
+        7
+        """
+        return super().__len__()
+
+    def is_empty(self):
+        """
+        Checks if the `MinMaxHeap()` instance is empty or not in constant
+        time.
+
+        Returns
+        -------
+        bool:
+            A boolean flag showing if the `MinMaxHeap()` instance is empty or
+            not. `True` shows that this instance is empty and `False` shows
+            it's not empty.
+
+        Example
+        --------
+        >>> min_max_heap = MinMaxHeap()
+        >>> min_max_heap.is_empty()
+        True
+        >>> min_max_heap.insert(10)
+        >>> min_max_heap.is_empty()
+        False
+        """
+        return super().is_empty()
+
+    # =============================     PRINT    ==============================
+    def __repr__(self):
+        """
+        Represents the `MinMaxHeap()` instance as a string.
+
+        Returns
+        -------
+        str:
+            The string-representation of the `MinMaxHeap()` instance.
+
+        Example
+        -------
+        >>> min_max_heap = MinMaxHeap.heapify([2, 4, 3, 7, 9, 0, 1])
+        >>> min_max_heap
+            __0__
+           /     \\
+          9       3
+         / \\     / \\
+        7   4   2   1
+        """
+        return super().__repr__()
+
+    # =============================    MIN/MAX   ==============================
+    def __max_idx(self):
+        """
+        Gets the index of the maximum value in the `MinMaxHeap()` instance
+        which is either the root or one of its two children.
+
+        Returns
+        -------
+        int:
+            The index of the maximum value.
+        """
+        heap = self._heap
+        if len(heap) == 1:
+            return 0
+        elif len(heap) == 2 or heap[1] >= heap[2]:
+            return 1
+        return 2
+
+    def get_min(self):
+        """
+        Gets the minimum value in the `MinMaxHeap()` instance in constant
+        time. The minimum value can be found at the root of the instance.
+
+        Returns
+        -------
+        int or float:
+            The minimum numeric value in the `MinMaxHeap()` instance.
+
+        Raises
+        ------
+        IndexError:
+            In case the `MinMaxHeap()` instance is empty.
+
+        Example
+        -------
+        >>> min_max_heap = MinMaxHeap.heapify([2, 4, 3, 7, 9, 0, 1])
+        >>> min_max_heap.get_min()
+        0
+        """
+        if self.is_empty():
+            raise IndexError("Can't get the minimum out of an empty Heap!!")
+        return self._heap[0]
+
+    def get_max(self):
+        """
+        Gets the maximum value in the `MinMaxHeap()` instance in constant
+        time. The maximum value can be found at one of the root's children.
+
+        Returns
+        -------
+        int or float:
+            The maximum numeric value in the `MinMaxHeap()` instance.
+
+        Raises
+        ------
+        IndexError:
+            In case the `MinMaxHeap()` instance is empty.
+
+        Example
+        -------
+        >>> min_max_heap = MinMaxHeap.heapify([2, 4, 3, 7, 9, 0, 1])
+        >>> min_max_heap.get_max()
+        9
+        """
+        if self.is_empty():
+            raise IndexError("Can't get the maximum out of an empty Heap!!")
+        return self._heap[self.__max_idx()]
+
+    # =============================    SEARCH    ==============================
+    def __contains__(self, num):
+        """
+        Searches the `MinMaxHeap()` for the given value and returns `True` if
+        the value exists and `False` if not. It does that in constant time
+        when the instance tracks positions, and in linear time otherwise.
+
+        Parameters
+        ----------
+        find_val: int or float
+            The value to be searched for in the `MinMaxHeap()` instance.
+
+        Returns
+        -------
+        bool:
+            Returns `True` if the value exists in the `MinMaxHeap()` instance
+            and `False` if not.
+
+        Example
+        -------
+        >>> min_max_heap = MinMaxHeap.heapify([2, 4, 3, 7, 9, 0, 1])
+        >>> 9 in min_max_heap
+        True
+        >>> 5 in min_max_heap
+        False
+        """
+        return super().__contains__(num)
+
+    # =============================     SIFT     ==============================
+    @staticmethod
+    def __is_min_level(idx):
+        """
+        Checks if the given index lies on a min level; the root is on level
+        zero and even levels are min levels.
+
+        Parameters
+        ----------
+        idx: int
+            An index within the heap.
+
+        Returns
+        -------
+        bool:
+            `True` if the index lies on a min level and `False` otherwise.
+        """
+        return (idx + 1).bit_length() % 2 == 1
+
+    def __swap(self, idx, other_idx):
+        """
+        Swaps the values stored at the two given indices keeping the
+        positions map up-to-date.
+
+        Parameters
+        ----------
+        idx: int
+            An index within the heap.
+        other_idx: int
+            Another index within the heap.
+        """
+        heap = self._heap
+        value, other_value = heap[idx], heap[other_idx]
+        heap[idx], heap[other_idx] = other_value, value
+        if self._positions is not None and value != other_value:
+            self._move_position(value, idx, other_idx)
+            self._move_position(other_value, other_idx, idx)
+
+    def __bubble_up(self, idx, is_min_level):
+        """
+        Moves the value at the given index up through its grandparents, which
+        lie on the same kind of levels, till the min-max order is satisfied.
+
+        Parameters
+        ----------
+        idx: int
+            The index of the value to be moved.
+        is_min_level: bool
+            `True` if the index lies on a min level and `False` otherwise.
+        """
+        heap = self._heap
+        while idx > 2:
+            grandparent_idx = ((idx - 1) // 2 - 1) // 2
+            if is_min_level:
+                if heap[idx] >= heap[grandparent_idx]:
+                    break
+            elif heap[idx] <= heap[grandparent_idx]:
+                break
+            self.__swap(idx, grandparent_idx)
+            idx = grandparent_idx
+
+    def _sift_up(self, idx, is_min_heap=True):
+        """
+        Moves the value at the given index up the `MinMaxHeap()` instance till
+        the min-max order property is satisfied in time-complexity of
+        O(log(n)). If the value has to swap places with its parent, the
+        parent's value is sifted down into the given index.
+
+        Parameters
+        ----------
+        idx: int
+            The index of the value to be moved.
+        is_min_heap: bool
+            Unused; kept to match the signature of `Heap._sift_up()`.
+        """
+        if idx == 0:
+            return
+        heap = self._heap
+        parent_idx = (idx - 1) // 2
+        is_min_level = self.__is_min_level(idx)
+        if is_min_level:
+            violates_parent = heap[idx] > heap[parent_idx]
+        else:
+            violates_parent = heap[idx] < heap[parent_idx]
+        if violates_parent:
+            self.__swap(idx, parent_idx)
+            self.__bubble_up(parent_idx, not is_min_level)
+            # the parent's old value may be misplaced within this subtree
+            self._sift_down(idx)
+        else:
+            self.__bubble_up(idx, is_min_level)
+
+    def _sift_down(self, idx, is_min_heap=True):
+        """
+        Moves the value at the given index down the `MinMaxHeap()` instance
+        till the min-max order property is satisfied in time-complexity of
+        O(log(n)).
+
+        Parameters
+        ----------
+        idx: int
+            The index of the value to be moved.
+        is_min_heap: bool
+            Unused; kept to match the signature of `Heap._sift_down()`.
+        """
+        heap = self._heap
+        length = len(heap)
+        is_min_level = self.__is_min_level(idx)
+        while 2 * idx + 1 < length:
+            # find the extreme value among children and grandchildren
+            first_child = 2 * idx + 1
+            grandchildren = range(4 * idx + 3, 4 * idx + 7)
+            best_idx = first_child
+            for candidate in [first_child + 1, *grandchildren]:
+                if candidate >= length:
+                    break
+                if is_min_level:
+                    if heap[candidate] < heap[best_idx]:
+                        best_idx = candidate
+                elif heap[candidate] > heap[best_idx]:
+                    best_idx = candidate
+
+            if is_min_level:
+                if heap[best_idx] >= heap[idx]:
+                    break
+            elif heap[best_idx] <= heap[idx]:
+                break
+            self.__swap(idx, best_idx)
+            if best_idx <= first_child + 1:
+                # a child lies on the opposite kind of level; nothing below it
+                # can be misplaced by this swap
+                break
+            parent_idx = (best_idx - 1) // 2
+            if is_min_level:
+                if heap[best_idx] > heap[parent_idx]:
+                    self.__swap(best_idx, parent_idx)
+            elif heap[best_idx] < heap[parent_idx]:
+                self.__swap(best_idx, parent_idx)
+            idx = best_idx
+
+    # =============================    INSERT    ==============================
+    def insert(self, value):
+        """
+        Inserts a numeric value in the `MinMaxHeap()` instance in
+        time-complexity of O(log(n)).
+
+        Parameters
+        ----------
+        value: int or float
+            The new numeric value that will be inserted.
+
+        Raises
+        ------
+        ValueError:
+            If the given `value` is `None`.
+        TypeError:
+            If the given `value` is not a numeric value.
+
+        Example
+        -------
+        >>> min_max_heap = MinMaxHeap.heapify([2, 4, 3, 7, 9, 0, 1])
+        >>> min_max_heap.insert(15)
+        >>> min_max_heap.insert(-1)
+        >>> min_max_heap
+                ___-1__
+               /       \\
+            __15        3
+           /    \\      / \\
+          0      4    2   1
+         / \\
+        9   7
+        """
+        super().insert(value, is_min_heap=True)
+
+    # =============================    UPDATE    ==============================
+    def update(self, old_value, new_value):
+        """
+        Replaces one occurrence of `old_value` in the `MinMaxHeap()` instance
+        with `new_value`. It does that in time-complexity of O(log(n)) when
+        the instance tracks positions, and O(n) otherwise.
+
+        Parameters
+        ----------
+        old_value: int or float
+            The value to be replaced.
+        new_value: int or float
+            The value to replace the old one.
+
+        Raises
+        ------
+        ValueError:
+            If the given `new_value` is `None`.
+        TypeError:
+            If the given `new_value` is not a numeric value.
+        UserWarning:
+            If the `MinMaxHeap()` instance is empty of if the `old_value`
+            wasn't found in the instance.
+
+        Example
+        -------
+        >>> lst = [2, 4, 3, 7, 9, 0, 1]
+        >>> min_max_heap = MinMaxHeap.heapify(lst, track_positions=True)
+        >>> min_max_heap.update(9, -1)
+        >>> min_max_heap
+            __-1__
+           /      \\
+          7        3
+         / \\      / \\
+        0   4    2   1
+        >>> min_max_heap.update(50, 5)
+        UserWarning: Couldn't find `50` in `extra.MinMaxHeap()`!!
+        """
+        super().update(old_value, new_value, is_min_heap=True)
+
+    # =============================    REMOVE    ==============================
+    def remove(self, del_value):
+        """
+        Removes the `del_value` from the `MinMaxHeap()` instance. It does that
+        in time-complexity of O(log(n)) when the instance tracks positions,
+        and O(n) otherwise.
+
+        Parameters
+        ----------
+        del_value: int or float
+            The value to be deleted from the subtree.
+
+        Raises
+        ------
+        UserWarning:
+            If the `MinMaxHeap()` instance is empty of if the value wasn't
+            found in the instance.
+
+        Example
+        -------
+        >>> min_max_heap = MinMaxHeap.heapify([2, 4, 3, 7, 9, 0, 1])
+        >>> min_max_heap.remove(3)
+        >>> min_max_heap
+            __0__
+           /     \\
+          9       2
+         / \\     /
+        7   4   1
+        >>> min_max_heap.remove(50)
+        UserWarning: Couldn't find `50` in `extra.MinMaxHeap()`!!
+        """
+        super().remove(del_value, is_min_heap=True)
+
+    def remove_min(self):
+        """
+        Removes the minimum value from the `MinMaxHeap()` instance, which is
+        the root, in time-complexity of O(log(n)).
+
+        Raises
+        ------
+        UserWarning:
+            If the `MinMaxHeap()` instance is empty.
+
+        Example
+        -------
+        >>> min_max_heap = MinMaxHeap.heapify([2, 4, 3, 7, 9, 0, 1])
+        >>> min_max_heap.remove_min()
+        >>> min_max_heap
+            __1__
+           /     \\
+          9       3
+         / \\     /
+        7   4   2
+        """
+        if self.is_empty():
+            warnings.warn(f"`{self.__name__}` is empty!!", UserWarning)
+            return
+        self._remove_idx(0, is_min_heap=True)
+
+    def remove_max(self):
+        """
+        Removes the maximum value from the `MinMaxHeap()` instance, which is
+        one of the root's children, in time-complexity of O(log(n)).
+
+        Raises
+        ------
+        UserWarning:
+            If the `MinMaxHeap()` instance is empty.
+
+        Example
+        -------
+        >>> min_max_heap = MinMaxHeap.heapify([2, 4, 3, 7, 9, 0, 1])
+        >>> min_max_heap.remove_max()
+        >>> min_max_heap
+            __0__
+           /     \\
+          7       3
+         / \\     /
+        1   4   2
+        """
+        if self.is_empty():
+            warnings.warn(f"`{self.__name__}` is empty!!", UserWarning)
+            return
+        self._remove_idx(self.__max_idx(), is_min_heap=True)
+
+    # =============================   PUSH/POP   ==============================
+    def pushpop(self, value):
+        """
+        Inserts the given value into the `MinMaxHeap()` instance, then removes
+        and returns the minimum value in a single sift pass of time-complexity
+        O(log(n)). It's faster than calling `insert()` followed by
+        `remove_min()`.
+
+        Parameters
+        ----------
+        value: int or float
+            The new numeric value that will be inserted.
+
+        Returns
+        -------
+        int or float:
+            The minimum value after inserting the given value.
+
+        Raises
+        ------
+        ValueError:
+            If the given `value` is `None`.
+        TypeError:
+            If the given `value` is not a numeric value.
+
+        Example
+        -------
+        >>> min_max_heap = MinMaxHeap.heapify([2, 4, 3, 7, 9, 0, 1])
+        >>> min_max_heap.pushpop(-1)
+        -1
+        >>> min_max_heap.pushpop(5)
+        0
+        >>> min_max_heap.to_list()
+        [1, 9, 5, 7, 4, 2, 3]
+        """
+        return super().pushpop(value, is_min_heap=True)
+
+    def replace(self, value):
+        """
+        Removes and returns the minimum value of the `MinMaxHeap()` instance,
+        then inserts the given value in a single sift pass of time-complexity
+        O(log(n)). Unlike `pushpop()`, the root is removed even when
+        the given value is more extreme.
+
+        Parameters
+        ----------
+        value: int or float
+            The new numeric value that will be inserted.
+
+        Returns
+        -------
+        int or float:
+            The minimum value before inserting the given value.
+
+        Raises
+        ------
+        ValueError:
+            If the given `value` is `None`.
+        TypeError:
+            If the given `value` is not a numeric value.
+        IndexError:
+            If the `MinMaxHeap()` instance is empty.
+
+        Example
+        -------
+        >>> min_max_heap = MinMaxHeap.heapify([2, 4, 3, 7, 9, 0, 1])
+        >>> min_max_heap.replace(5)
+        0
+        >>> min_max_heap
+            __1__
+           /     \\
+          9       5
+         / \\     / \\
+        7   4   2   3
+        """
+        return super().replace(value, is_min_heap=True)
+
+    # =============================    BATCH     ==============================
+    def extend(self, iterable):
+        """
+        Inserts all values of the given iterable into the `MinMaxHeap()`
+        instance. Small batches are inserted one by one in O(k*log(n+k)) while
+        large batches are appended and the whole heap is rebuilt in O(n+k)
+        where **k** is the number of the given values.
+
+        Parameters
+        ----------
+        iterable: iterable
+            An iterable python object that implements the `__iter__` method.
+            For example, `list` and `tuple` are both iterables.
+
+        Raises
+        ------
+        TypeError:
+            It can be raised in two cases
+                1. In case the given object isn't iterable.
+                2. If one of the elements in the iterable is NOT a number.
+        ValueError:
+            If one of the iterable elements is `None`.
+
+        Example
+        -------
+        >>> min_max_heap = MinMaxHeap.heapify([2, 4, 3, 7, 9, 0, 1])
+        >>> min_max_heap.extend([8, -2, 6])
+        >>> min_max_heap
+                ____-2__
+               /        \\
+            __9__        3
+           /     \\      / \\
+          0       4    2   1
+         / \\     /
+        8   7   6
+        """
+        super().extend(iterable, is_min_heap=True)
+
+    def merge(self, other):
+        """
+        Melds all values of the `other` heap into the `MinMaxHeap()` instance
+        in linear time. The `other` heap is left untouched.
+
+        Parameters
+        ----------
+        other: Heap()
+            Another heap instance whose values will be added.
+
+        Raises
+        ------
+        TypeError:
+            If `other` isn't a heap instance.
+
+        Example
+        -------
+        >>> min_max_heap = MinMaxHeap.heapify([2, 4, 3, 7, 9, 0, 1])
+        >>> min_max_heap.merge(MinMaxHeap.heapify([5, -3, 11]))
+        >>> min_max_heap
+                _____-3__
+               /         \\
+            __11__        3
+           /      \\      / \\
+          0        4    2   1
+         / \\      /
+        7   5    9
+        """
+        super().merge(other, is_min_heap=True)
+
+    def nsmallest(self, n):
+        """
+        Gets the `n` smallest values in the `MinMaxHeap()` instance sorted in
+        ascending order without modifying the instance. It scans the whole
+        instance in O(N*log(n)) where **N** is the length of the instance.
+
+        Parameters
+        ----------
+        n: int
+            The number of values to get.
+
+        Returns
+        -------
+        list:
+            The `n` smallest values in ascending order.
+
+        Raises
+        ------
+        TypeError:
+            If `n` isn't an integer.
+
+        Example
+        -------
+        >>> min_max_heap = MinMaxHeap.heapify([2, 4, 3, 7, 9, 0, 1])
+        >>> min_max_heap.nsmallest(3)
+        [0, 1, 2]
+        """
+        if type(n) != int:
+            raise TypeError("`n` must be an integer!!")
+        return heapq.nsmallest(n, self._heap)
+
+    def nlargest(self, n):
+        """
+        Gets the `n` largest values in the `MinMaxHeap()` instance sorted in
+        descending order without modifying the instance. It scans the whole
+        instance in O(N*log(n)) where **N** is the length of the instance.
+
+        Parameters
+        ----------
+        n: int
+            The number of values to get.
+
+        Returns
+        -------
+        list:
+            The `n` largest values in descending order.
+
+        Raises
+        ------
+        TypeError:
+            If `n` isn't an integer.
+
+        Example
+        -------
+        >>> min_max_heap = MinMaxHeap.heapify([2, 4, 3, 7, 9, 0, 1])
+        >>> min_max_heap.nlargest(3)
+        [9, 7, 4]
+        """
+        if type(n) != int:
+            raise TypeError("`n` must be an integer!!")
+        return heapq.nlargest(n, self._heap)
+
+    # =============================     ITER     ==============================
+    def __iter__(self):
+        """
+        Iterates over the `MinMaxHeap()` instance and returns a generator of
+        the heap node values in breadth-first manner in linear time. Values are
+        yielded straight from the underlying list without creating any nodes.
+
+        Yields
+        ------
+        int or float:
+            The number stored at each node in the instance.
+
+        Example
+        -------
+        >>> min_max_heap = MinMaxHeap.heapify([2, 4, 3, 7, 9, 0, 1])
+        >>> for value in min_max_heap:
+        ...     print(value, end=',')
+        0,9,3,7,4,2,1,
+        """
+        return super().__iter__()
+
+    def to_list(self):
+        """
+        Converts the `MinMaxHeap()` instance to a `list` where values will be
+        inserted in breadth-first manner.
+
+        Returns
+        -------
+        list:
+            A `list` object containing the same elements as the
+            `MinMaxHeap()` instance.
+
+        Example
+        -------
+        >>> min_max_heap = MinMaxHeap.heapify([2, 4, 3, 7, 9, 0, 1])
+        >>> min_max_heap.to_list()
+        [0, 9, 3, 7, 4, 2, 1]
+        """
+        return super().to_list()
+
+    # =============================     CLEAR    ==============================
+    def clear(self):
+        """
+        Removes all nodes within the `MinMaxHeap()` instance in constant time.
+
+        Example
+        -------
+        >>> min_max_heap = MinMaxHeap.heapify([2, 4, 3, 7, 9, 0, 1])
+        >>> min_max_heap.clear()
+        >>> min_max_heap
+        / \\
+        >>> min_max_heap.is_empty()
+        True
+        """
+        super().clear()
@@ -55,6 +55,7 @@ class RedBlackNode(BSTNode):
     """
 
     __name__ = "extra.RedBlackNode()"
+    __slots__ = ("_color",)
 
     def __init__(self, value, color=Color.RED):
         """
@@ -420,6 +421,352 @@ class RedBlackTree(BST):
         """
         return super().__contains__(find_val)
 
+    # =============================    SELECT    ==============================
+    def select(self, idx):
+        """
+        Returns the value at the given index of the sorted values of the
+        `RedBlackTree()` instance, i.e. the k-th smallest value, in O(h) time
+        where **h** is the height of the instance.
+
+        Parameters
+        ----------
+        idx: int
+            A zero-based index. Negative indices count from the greatest
+            value.
+
+        Returns
+        -------
+        int or float:
+            The value that has exactly `idx` smaller values in the
+            `RedBlackTree()` instance.
+
+        Raises
+        ------
+        TypeError:
+            If the given index isn't `int`.
+        IndexError:
+            If the given index is out of the `RedBlackTree()` boundaries.
+
+        Example
+        -------
+        >>> rbtree = RedBlackTree([13, 8, 17, 1, 11, 15, 25, 6])
+        >>> rbtree
+                   ______13|B______
+                  /                \\
+           _____8|R_             __17|B_
+          /         \\          /       \\
+        1|B_        11|B      15|R      25|R
+            \\
+            6|R
+        >>> rbtree.select(0)
+        1
+        >>> rbtree.select(3)
+        11
+        >>> rbtree.select(-1)
+        25
+        """
+        return super().select(idx)
+
+    def __getitem__(self, idx):
+        """
+        Returns the value at the given index of the sorted values of the
+        `RedBlackTree()` instance in O(h) time where **h** is the height of the
+        instance. It's the same as `select()`.
+
+        Parameters
+        ----------
+        idx: int
+            A zero-based index. Negative indices count from the greatest
+            value.
+
+        Returns
+        -------
+        int or float:
+            The value that has exactly `idx` smaller values in the
+            `RedBlackTree()` instance.
+
+        Raises
+        ------
+        TypeError:
+            If the given index isn't `int`.
+        IndexError:
+            If the given index is out of the `RedBlackTree()` boundaries.
+
+        Example
+        -------
+        >>> rbtree = RedBlackTree([13, 8, 17, 1, 11, 15, 25, 6])
+        >>> rbtree[4]
+        13
+        >>> rbtree[-2]
+        17
+        """
+        return self.select(idx)
+
+    # =============================     RANK     ==============================
+    def rank(self, value):
+        """
+        Counts the values in the `RedBlackTree()` instance that are smaller
+        than the given value in O(h) time where **h** is the height of the
+        instance. The given value doesn't have to exist in the instance.
+
+        Parameters
+        ----------
+        value: int or float
+            The value to be ranked.
+
+        Returns
+        -------
+        int:
+            The number of values in the `RedBlackTree()` instance that are
+            smaller than the given value. If the value exists, this is its
+            index in the sorted values of the instance.
+
+        Raises
+        ------
+        ValueError:
+            If the given `value` is `None`.
+        TypeError:
+            If the given `value` is not a numeric value.
+
+        Example
+        -------
+        >>> rbtree = RedBlackTree([13, 8, 17, 1, 11, 15, 25, 6])
+        >>> rbtree.rank(13)
+        4
+        >>> rbtree.rank(12)
+        4
+        >>> rbtree.rank(100)
+        8
+        """
+        return super().rank(value)
+
+    # =============================     RANGE    ==============================
+    def range(self, lo, hi):
+        """
+        Lazily iterates over the values of the `RedBlackTree()` instance that
+        lie within the closed interval `[lo, hi]` in ascending order. Subtrees
+        that lie completely outside the interval are pruned, so iterating over
+        the whole range takes O(h+k) time where **h** is the height of the
+        instance and **k** is the number of values in the range.
+
+        Parameters
+        ----------
+        lo: int or float
+            The lower bound of the interval.
+        hi: int or float
+            The upper bound of the interval.
+
+        Returns
+        -------
+        generator:
+            A generator of the values within the interval in ascending order.
+            It yields nothing when `lo` is greater than `hi`.
+
+        Raises
+        ------
+        ValueError:
+            If one of the given bounds is `None`.
+        TypeError:
+            If one of the given bounds is not a numeric value.
+
+        Example
+        -------
+        >>> rbtree = RedBlackTree([13, 8, 17, 1, 11, 15, 25, 6])
+        >>> rbtree
+                   ______13|B______
+                  /                \\
+           _____8|R_             __17|B_
+          /         \\          /       \\
+        1|B_        11|B      15|R      25|R
+            \\
+            6|R
+        >>> list(rbtree.range(6, 15))
+        [6, 8, 11, 13, 15]
+        >>> list(rbtree.range(20, 30))
+        [25]
+
+        Note
+        ----
+        The `RedBlackTree()` instance shouldn't be modified while iterating
+        over the returned generator.
+        """
+        return super().range(lo, hi)
+
+    def count_range(self, lo, hi):
+        """
+        Counts the values of the `RedBlackTree()` instance that lie within the
+        closed interval `[lo, hi]` in O(h) time where **h** is the height of
+        the instance, without visiting the values themselves.
+
+        Parameters
+        ----------
+        lo: int or float
+            The lower bound of the interval.
+        hi: int or float
+            The upper bound of the interval.
+
+        Returns
+        -------
+        int:
+            The number of values within the interval. It's zero when `lo` is
+            greater than `hi`.
+
+        Raises
+        ------
+        ValueError:
+            If one of the given bounds is `None`.
+        TypeError:
+            If one of the given bounds is not a numeric value.
+
+        Example
+        -------
+        >>> rbtree = RedBlackTree([13, 8, 17, 1, 11, 15, 25, 6])
+        >>> rbtree.count_range(6, 15)
+        5
+        >>> rbtree.count_range(2, 5)
+        0
+        """
+        return super().count_range(lo, hi)
+
+    # =============================   NEIGHBORS  ==============================
+    def floor(self, value):
+        """
+        Returns the greatest value in the `RedBlackTree()` instance that is
+        less than or equal to the given value in O(h) time where **h** is the
+        height of the instance.
+
+        Parameters
+        ----------
+        value: int or float
+            The value whose floor is needed.
+
+        Returns
+        -------
+        int or float or None:
+            The floor of the given value, or `None` if all the values in the
+            `RedBlackTree()` instance are greater than the given value.
+
+        Raises
+        ------
+        ValueError:
+            If the given `value` is `None`.
+        TypeError:
+            If the given `value` is not a numeric value.
+
+        Example
+        -------
+        >>> rbtree = RedBlackTree([13, 8, 17, 1, 11, 15, 25, 6])
+        >>> rbtree.floor(12)
+        11
+        >>> rbtree.floor(0) is None
+        True
+        """
+        return super().floor(value)
+
+    def ceiling(self, value):
+        """
+        Returns the smallest value in the `RedBlackTree()` instance that is
+        greater than or equal to the given value in O(h) time where **h** is
+        the height of the instance.
+
+        Parameters
+        ----------
+        value: int or float
+            The value whose ceiling is needed.
+
+        Returns
+        -------
+        int or float or None:
+            The ceiling of the given value, or `None` if all the values in the
+            `RedBlackTree()` instance are less than the given value.
+
+        Raises
+        ------
+        ValueError:
+            If the given `value` is `None`.
+        TypeError:
+            If the given `value` is not a numeric value.
+
+        Example
+        -------
+        >>> rbtree = RedBlackTree([13, 8, 17, 1, 11, 15, 25, 6])
+        >>> rbtree.ceiling(12)
+        13
+        >>> rbtree.ceiling(26) is None
+        True
+        """
+        return super().ceiling(value)
+
+    def predecessor(self, value):
+        """
+        Returns the greatest value in the `RedBlackTree()` instance that is
+        strictly less than the given value in O(h) time where **h** is the
+        height of the instance. The given value doesn't have to exist in the
+        instance.
+
+        Parameters
+        ----------
+        value: int or float
+            The value whose predecessor is needed.
+
+        Returns
+        -------
+        int or float or None:
+            The predecessor of the given value, or `None` if there is no
+            smaller value in the `RedBlackTree()` instance.
+
+        Raises
+        ------
+        ValueError:
+            If the given `value` is `None`.
+        TypeError:
+            If the given `value` is not a numeric value.
+
+        Example
+        -------
+        >>> rbtree = RedBlackTree([13, 8, 17, 1, 11, 15, 25, 6])
+        >>> rbtree.predecessor(13)
+        11
+        >>> rbtree.predecessor(1) is None
+        True
+        """
+        return super().predecessor(value)
+
+    def successor(self, value):
+        """
+        Returns the smallest value in the `RedBlackTree()` instance that is
+        strictly greater than the given value in O(h) time where **h** is the
+        height of the instance. The given value doesn't have to exist in the
+        instance.
+
+        Parameters
+        ----------
+        value: int or float
+            The value whose successor is needed.
+
+        Returns
+        -------
+        int or float or None:
+            The successor of the given value, or `None` if there is no
+            greater value in the `RedBlackTree()` instance.
+
+        Raises
+        ------
+        ValueError:
+            If the given `value` is `None`.
+        TypeError:
+            If the given `value` is not a numeric value.
+
+        Example
+        -------
+        >>> rbtree = RedBlackTree([13, 8, 17, 1, 11, 15, 25, 6])
+        >>> rbtree.successor(13)
+        15
+        >>> rbtree.successor(25) is None
+        True
+        """
+        return super().successor(value)
+
     # =============================    RECOLOR   ==============================
     def __recolor_case3(self, start_node):
         """
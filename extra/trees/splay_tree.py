@@ -395,6 +395,392 @@ class SplayTree(BST):
         self._splay(node)
         return node.get_data() == find_val
 
+    # =============================    SELECT    ==============================
+    def select(self, idx):
+        """
+        Returns the value at the given index of the sorted values of the
+        `SplayTree()` instance, i.e. the k-th smallest value, in O(h) time
+        where **h** is the height of the instance. The found node is splayed
+        afterwards.
+
+        Parameters
+        ----------
+        idx: int
+            A zero-based index. Negative indices count from the greatest
+            value.
+
+        Returns
+        -------
+        int or float:
+            The value that has exactly `idx` smaller values in the
+            `SplayTree()` instance.
+
+        Raises
+        ------
+        TypeError:
+            If the given index isn't `int`.
+        IndexError:
+            If the given index is out of the `SplayTree()` boundaries.
+
+        Example
+        -------
+        >>> stree = SplayTree([2, 5, 4, 6, 3])
+        >>> stree
+          3__
+         /   \\
+        2     5
+             / \\
+            4   6
+        >>> stree.select(2)
+        4
+        >>> stree
+            4
+           / \\
+          3   5
+         /     \\
+        2       6
+        >>> stree.select(5)
+        IndexError: Given index is out of the boundaries!!
+
+        Note
+        ----
+        Just like searching, selecting a value changes the structure of the
+        `SplayTree()` instance as the selected node is moved to the root.
+        """
+        node = super()._select_node(idx)
+        self._splay(node)
+        return node.get_data()
+
+    def __getitem__(self, idx):
+        """
+        Returns the value at the given index of the sorted values of the
+        `SplayTree()` instance in O(h) time where **h** is the height of the
+        instance. It's the same as `select()`, so the found node is splayed.
+
+        Parameters
+        ----------
+        idx: int
+            A zero-based index. Negative indices count from the greatest
+            value.
+
+        Returns
+        -------
+        int or float:
+            The value that has exactly `idx` smaller values in the
+            `SplayTree()` instance.
+
+        Raises
+        ------
+        TypeError:
+            If the given index isn't `int`.
+        IndexError:
+            If the given index is out of the `SplayTree()` boundaries.
+
+        Example
+        -------
+        >>> stree = SplayTree([2, 5, 4, 6, 3])
+        >>> stree[0]
+        2
+        >>> stree[-1]
+        6
+        """
+        return self.select(idx)
+
+    # =============================     RANK     ==============================
+    def rank(self, value):
+        """
+        Counts the values in the `SplayTree()` instance that are smaller than
+        the given value in O(h) time where **h** is the height of the
+        instance. The given value doesn't have to exist in the instance. The
+        last accessed node is splayed afterwards.
+
+        Parameters
+        ----------
+        value: int or float
+            The value to be ranked.
+
+        Returns
+        -------
+        int:
+            The number of values in the `SplayTree()` instance that are
+            smaller than the given value. If the value exists, this is its
+            index in the sorted values of the instance.
+
+        Raises
+        ------
+        ValueError:
+            If the given `value` is `None`.
+        TypeError:
+            If the given `value` is not a numeric value.
+
+        Example
+        -------
+        >>> stree = SplayTree([2, 5, 4, 6, 3])
+        >>> stree.rank(5)
+        3
+        >>> stree.rank(4.5)
+        3
+        >>> stree.rank(100)
+        5
+        """
+        super()._validate_item(value)
+        if self.is_empty():
+            return 0
+        node = super()._search(value, self._root)
+        self._splay(node)
+        # after splaying, the values smaller than `value` are the root's left
+        # subtree and, possibly, the root itself
+        left_child = self._root.get_left()
+        rank = left_child.get_size() if left_child else 0
+        return rank + 1 if self._root.get_data() < value else rank
+
+    # =============================     RANGE    ==============================
+    def range(self, lo, hi):
+        """
+        Lazily iterates over the values of the `SplayTree()` instance that lie
+        within the closed interval `[lo, hi]` in ascending order. Subtrees
+        that lie completely outside the interval are pruned, so iterating
+        over the whole range takes O(h+k) time where **h** is the height of
+        the instance and **k** is the number of values in the range.
+
+        Parameters
+        ----------
+        lo: int or float
+            The lower bound of the interval.
+        hi: int or float
+            The upper bound of the interval.
+
+        Returns
+        -------
+        generator:
+            A generator of the values within the interval in ascending order.
+            It yields nothing when `lo` is greater than `hi`.
+
+        Raises
+        ------
+        ValueError:
+            If one of the given bounds is `None`.
+        TypeError:
+            If one of the given bounds is not a numeric value.
+
+        Example
+        -------
+        >>> stree = SplayTree([2, 5, 4, 6, 3])
+        >>> stree
+          3__
+         /   \\
+        2     5
+             / \\
+            4   6
+        >>> list(stree.range(3, 5))
+        [3, 4, 5]
+        >>> list(stree.range(7, 9))
+        []
+
+        Note
+        ----
+        The `SplayTree()` instance shouldn't be modified while iterating over
+        the returned generator.
+        """
+        return super().range(lo, hi)
+
+    def count_range(self, lo, hi):
+        """
+        Counts the values of the `SplayTree()` instance that lie within the
+        closed interval `[lo, hi]` in O(h) time where **h** is the height of
+        the instance, without visiting the values themselves.
+
+        Parameters
+        ----------
+        lo: int or float
+            The lower bound of the interval.
+        hi: int or float
+            The upper bound of the interval.
+
+        Returns
+        -------
+        int:
+            The number of values within the interval. It's zero when `lo` is
+            greater than `hi`.
+
+        Raises
+        ------
+        ValueError:
+            If one of the given bounds is `None`.
+        TypeError:
+            If one of the given bounds is not a numeric value.
+
+        Example
+        -------
+        >>> stree = SplayTree([2, 5, 4, 6, 3])
+        >>> stree.count_range(3, 5)
+        3
+        >>> stree.count_range(7, 9)
+        0
+        """
+        return super().count_range(lo, hi)
+
+    # =============================   NEIGHBORS  ==============================
+    def __splay_closest(self, value):
+        """
+        Splays the last accessed node when searching for the given value, so
+        that neighbor queries keep the amortized cost of splay trees.
+
+        Parameters
+        ----------
+        value: int or float
+            The value that was searched for.
+        """
+        if not self.is_empty():
+            self._splay(super()._search(value, self._root))
+
+    def floor(self, value):
+        """
+        Returns the greatest value in the `SplayTree()` instance that is less
+        than or equal to the given value in O(h) time where **h** is the height
+        of the instance. The last accessed node is splayed afterwards.
+
+        Parameters
+        ----------
+        value: int or float
+            The value whose floor is needed.
+
+        Returns
+        -------
+        int or float or None:
+            The floor of the given value, or `None` if all the values in the
+            `SplayTree()` instance are greater than the given value.
+
+        Raises
+        ------
+        ValueError:
+            If the given `value` is `None`.
+        TypeError:
+            If the given `value` is not a numeric value.
+
+        Example
+        -------
+        >>> stree = SplayTree([2, 5, 4, 6, 3])
+        >>> stree.floor(4.5)
+        4
+        >>> stree.floor(1) is None
+        True
+        """
+        neighbor = super().floor(value)
+        self.__splay_closest(value)
+        return neighbor
+
+    def ceiling(self, value):
+        """
+        Returns the smallest value in the `SplayTree()` instance that is
+        greater than or equal to the given value in O(h) time where **h** is
+        the height of the instance. The last accessed node is splayed
+        afterwards.
+
+        Parameters
+        ----------
+        value: int or float
+            The value whose ceiling is needed.
+
+        Returns
+        -------
+        int or float or None:
+            The ceiling of the given value, or `None` if all the values in the
+            `SplayTree()` instance are less than the given value.
+
+        Raises
+        ------
+        ValueError:
+            If the given `value` is `None`.
+        TypeError:
+            If the given `value` is not a numeric value.
+
+        Example
+        -------
+        >>> stree = SplayTree([2, 5, 4, 6, 3])
+        >>> stree.ceiling(4.5)
+        5
+        >>> stree.ceiling(7) is None
+        True
+        """
+        neighbor = super().ceiling(value)
+        self.__splay_closest(value)
+        return neighbor
+
+    def predecessor(self, value):
+        """
+        Returns the greatest value in the `SplayTree()` instance that is
+        strictly less than the given value in O(h) time where **h** is the
+        height of the instance. The given value doesn't have to exist in the
+        instance. The last accessed node is splayed afterwards.
+
+        Parameters
+        ----------
+        value: int or float
+            The value whose predecessor is needed.
+
+        Returns
+        -------
+        int or float or None:
+            The predecessor of the given value, or `None` if there is no
+            smaller value in the `SplayTree()` instance.
+
+        Raises
+        ------
+        ValueError:
+            If the given `value` is `None`.
+        TypeError:
+            If the given `value` is not a numeric value.
+
+        Example
+        -------
+        >>> stree = SplayTree([2, 5, 4, 6, 3])
+        >>> stree.predecessor(4)
+        3
+        >>> stree.predecessor(2) is None
+        True
+        """
+        neighbor = super().predecessor(value)
+        self.__splay_closest(value)
+        return neighbor
+
+    def successor(self, value):
+        """
+        Returns the smallest value in the `SplayTree()` instance that is
+        strictly greater than the given value in O(h) time where **h** is the
+        height of the instance. The given value doesn't have to exist in the
+        instance. The last accessed node is splayed afterwards.
+
+        Parameters
+        ----------
+        value: int or float
+            The value whose successor is needed.
+
+        Returns
+        -------
+        int or float or None:
+            The successor of the given value, or `None` if there is no
+            greater value in the `SplayTree()` instance.
+
+        Raises
+        ------
+        ValueError:
+            If the given `value` is `None`.
+        TypeError:
+            If the given `value` is not a numeric value.
+
+        Example
+        -------
+        >>> stree = SplayTree([2, 5, 4, 6, 3])
+        >>> stree.successor(4)
+        5
+        >>> stree.successor(6) is None
+        True
+        """
+        neighbor = super().successor(value)
+        self.__splay_closest(value)
+        return neighbor
+
     # =============================    INSERT    ==============================
     def insert(self, value):
         """
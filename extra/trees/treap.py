@@ -47,6 +47,7 @@ class TreapNode(BSTNode):
     """
 
     __name__ = "extra.TreapNode()"
+    __slots__ = ("_priority",)
 
     def __init__(self, data, priority=None):
         """
@@ -69,7 +70,11 @@ class TreapNode(BSTNode):
                 1. If the given data isn't a number.
                 2. If the given priority isn't a number.
         """
-        if priority is not None and type(priority) not in {int, float}:
+        if (
+            not self.TRUSTED
+            and priority is not None
+            and type(priority) not in {int, float}
+        ):
             raise TypeError("Given priority has to be a number!!")
         super().__init__(data)
         self._priority = (
@@ -395,6 +400,352 @@ class Treap(BST):
         """
         return super().__contains__(find_val)
 
+    # =============================    SELECT    ==============================
+    def select(self, idx):
+        """
+        Returns the value at the given index of the sorted values of the
+        `Treap()` instance, i.e. the k-th smallest value, in O(h) time where
+        **h** is the height of the instance.
+
+        Parameters
+        ----------
+        idx: int
+            A zero-based index. Negative indices count from the greatest
+            value.
+
+        Returns
+        -------
+        int or float:
+            The value that has exactly `idx` smaller values in the `Treap()`
+            instance.
+
+        Raises
+        ------
+        TypeError:
+            If the given index isn't `int`.
+        IndexError:
+            If the given index is out of the `Treap()` boundaries.
+
+        Example
+        -------
+        >>> treap = Treap([0, 2, 1, 4, 9, 7, 3], seed=123)
+        >>> treap
+              __4__
+             /     \\
+            2       9
+           / \\    /
+          1   3   7
+         /
+        0
+        >>> treap.select(0)
+        0
+        >>> treap.select(3)
+        3
+        >>> treap.select(-1)
+        9
+        """
+        return super().select(idx)
+
+    def __getitem__(self, idx):
+        """
+        Returns the value at the given index of the sorted values of the
+        `Treap()` instance in O(h) time where **h** is the height of the
+        instance. It's the same as `select()`.
+
+        Parameters
+        ----------
+        idx: int
+            A zero-based index. Negative indices count from the greatest
+            value.
+
+        Returns
+        -------
+        int or float:
+            The value that has exactly `idx` smaller values in the `Treap()`
+            instance.
+
+        Raises
+        ------
+        TypeError:
+            If the given index isn't `int`.
+        IndexError:
+            If the given index is out of the `Treap()` boundaries.
+
+        Example
+        -------
+        >>> treap = Treap([0, 2, 1, 4, 9, 7, 3], seed=123)
+        >>> treap[4]
+        4
+        >>> treap[-2]
+        7
+        """
+        return self.select(idx)
+
+    # =============================     RANK     ==============================
+    def rank(self, value):
+        """
+        Counts the values in the `Treap()` instance that are smaller than the
+        given value in O(h) time where **h** is the height of the instance.
+        The given value doesn't have to exist in the instance.
+
+        Parameters
+        ----------
+        value: int or float
+            The value to be ranked.
+
+        Returns
+        -------
+        int:
+            The number of values in the `Treap()` instance that are smaller
+            than the given value. If the value exists, this is its index in the
+            sorted values of the instance.
+
+        Raises
+        ------
+        ValueError:
+            If the given `value` is `None`.
+        TypeError:
+            If the given `value` is not a numeric value.
+
+        Example
+        -------
+        >>> treap = Treap([0, 2, 1, 4, 9, 7, 3], seed=123)
+        >>> treap.rank(4)
+        4
+        >>> treap.rank(5)
+        5
+        >>> treap.rank(100)
+        7
+        """
+        return super().rank(value)
+
+    # =============================     RANGE    ==============================
+    def range(self, lo, hi):
+        """
+        Lazily iterates over the values of the `Treap()` instance that lie
+        within the closed interval `[lo, hi]` in ascending order. Subtrees
+        that lie completely outside the interval are pruned, so iterating
+        over the whole range takes O(h+k) time where **h** is the height of
+        the instance and **k** is the number of values in the range.
+
+        Parameters
+        ----------
+        lo: int or float
+            The lower bound of the interval.
+        hi: int or float
+            The upper bound of the interval.
+
+        Returns
+        -------
+        generator:
+            A generator of the values within the interval in ascending order.
+            It yields nothing when `lo` is greater than `hi`.
+
+        Raises
+        ------
+        ValueError:
+            If one of the given bounds is `None`.
+        TypeError:
+            If one of the given bounds is not a numeric value.
+
+        Example
+        -------
+        >>> treap = Treap([0, 2, 1, 4, 9, 7, 3], seed=123)
+        >>> treap
+              __4__
+             /     \\
+            2       9
+           / \\    /
+          1   3   7
+         /
+        0
+        >>> list(treap.range(1, 4))
+        [1, 2, 3, 4]
+        >>> list(treap.range(5, 8))
+        [7]
+
+        Note
+        ----
+        The `Treap()` instance shouldn't be modified while iterating over the
+        returned generator.
+        """
+        return super().range(lo, hi)
+
+    def count_range(self, lo, hi):
+        """
+        Counts the values of the `Treap()` instance that lie within the closed
+        interval `[lo, hi]` in O(h) time where **h** is the height of the
+        instance, without visiting the values themselves.
+
+        Parameters
+        ----------
+        lo: int or float
+            The lower bound of the interval.
+        hi: int or float
+            The upper bound of the interval.
+
+        Returns
+        -------
+        int:
+            The number of values within the interval. It's zero when `lo` is
+            greater than `hi`.
+
+        Raises
+        ------
+        ValueError:
+            If one of the given bounds is `None`.
+        TypeError:
+            If one of the given bounds is not a numeric value.
+
+        Example
+        -------
+        >>> treap = Treap([0, 2, 1, 4, 9, 7, 3], seed=123)
+        >>> treap.count_range(1, 4)
+        4
+        >>> treap.count_range(5, 6)
+        0
+        """
+        return super().count_range(lo, hi)
+
+    # =============================   NEIGHBORS  ==============================
+    def floor(self, value):
+        """
+        Returns the greatest value in the `Treap()` instance that is less than
+        or equal to the given value in O(h) time where **h** is the height of
+        the instance.
+
+        Parameters
+        ----------
+        value: int or float
+            The value whose floor is needed.
+
+        Returns
+        -------
+        int or float or None:
+            The floor of the given value, or `None` if all the values in the
+            `Treap()` instance are greater than the given value.
+
+        Raises
+        ------
+        ValueError:
+            If the given `value` is `None`.
+        TypeError:
+            If the given `value` is not a numeric value.
+
+        Example
+        -------
+        >>> treap = Treap([0, 2, 1, 4, 9, 7, 3], seed=123)
+        >>> treap.floor(5)
+        4
+        >>> treap.floor(-1) is None
+        True
+        """
+        return super().floor(value)
+
+    def ceiling(self, value):
+        """
+        Returns the smallest value in the `Treap()` instance that is greater
+        than or equal to the given value in O(h) time where **h** is the
+        height of the instance.
+
+        Parameters
+        ----------
+        value: int or float
+            The value whose ceiling is needed.
+
+        Returns
+        -------
+        int or float or None:
+            The ceiling of the given value, or `None` if all the values in the
+            `Treap()` instance are less than the given value.
+
+        Raises
+        ------
+        ValueError:
+            If the given `value` is `None`.
+        TypeError:
+            If the given `value` is not a numeric value.
+
+        Example
+        -------
+        >>> treap = Treap([0, 2, 1, 4, 9, 7, 3], seed=123)
+        >>> treap.ceiling(5)
+        7
+        >>> treap.ceiling(10) is None
+        True
+        """
+        return super().ceiling(value)
+
+    def predecessor(self, value):
+        """
+        Returns the greatest value in the `Treap()` instance that is strictly
+        less than the given value in O(h) time where **h** is the height of
+        the instance. The given value doesn't have to exist in the
+        instance.
+
+        Parameters
+        ----------
+        value: int or float
+            The value whose predecessor is needed.
+
+        Returns
+        -------
+        int or float or None:
+            The predecessor of the given value, or `None` if there is no
+            smaller value in the `Treap()` instance.
+
+        Raises
+        ------
+        ValueError:
+            If the given `value` is `None`.
+        TypeError:
+            If the given `value` is not a numeric value.
+
+        Example
+        -------
+        >>> treap = Treap([0, 2, 1, 4, 9, 7, 3], seed=123)
+        >>> treap.predecessor(4)
+        3
+        >>> treap.predecessor(0) is None
+        True
+        """
+        return super().predecessor(value)
+
+    def successor(self, value):
+        """
+        Returns the smallest value in the `Treap()` instance that is strictly
+        greater than the given value in O(h) time where **h** is the height
+        of the instance. The given value doesn't have to exist in the
+        instance.
+
+        Parameters
+        ----------
+        value: int or float
+            The value whose successor is needed.
+
+        Returns
+        -------
+        int or float or None:
+            The successor of the given value, or `None` if there is no
+            greater value in the `Treap()` instance.
+
+        Raises
+        ------
+        ValueError:
+            If the given `value` is `None`.
+        TypeError:
+            If the given `value` is not a numeric value.
+
+        Example
+        -------
+        >>> treap = Treap([0, 2, 1, 4, 9, 7, 3], seed=123)
+        >>> treap.successor(4)
+        7
+        >>> treap.successor(9) is None
+        True
+        """
+        return super().successor(value)
+
     # =============================    INSERT    ==============================
     def __validate_priority(self, new_priority):
         """
@@ -410,7 +761,12 @@ class Treap(BST):
         TypeError:
             If the given new priority is not a numeric value.
         """
-        if new_priority is not None and type(new_priority) not in {int, float}:
+        if self.TRUSTED:
+            return
+        elif (
+            new_priority is not None
+            and type(new_priority) not in {int, float}
+        ):
             raise TypeError("Given priority has to be a number!!")
 
     def insert(self, value, priority=None):
@@ -581,6 +937,7 @@ class Treap(BST):
                 parent.set_left(None)
             else:
                 parent.set_right(None)
+            super()._update_sizes(parent)
             # decrement treap length
             self._length -= 1
 
@@ -58,6 +58,7 @@ class TreeNode(Extra):
     """
 
     __name__ = "extra.TreeNode()"
+    __slots__ = ("_data", "_children")
 
     def __init__(self, value):
         """
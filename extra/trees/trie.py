@@ -17,6 +17,7 @@ class TrieNode(TreeNode):
     """
 
     __name__ = "extra.TrieNode()"
+    __slots__ = ("_parent", "_is_word")
 
     def __init__(self, value):
         """
@@ -223,6 +224,8 @@ class Trie(Tree):
         TypeError:
             If the type of the given `word` is not `str`.
         """
+        if self.TRUSTED:
+            return
         super()._validate_item(word)
         if type(word) != str:
             raise TypeError(
@@ -74,6 +74,25 @@ class Helper:
             and Helper.verify_bst_rules(right_child)
         )
 
+    @staticmethod
+    def verify_subtree_sizes(start_node):
+        """
+        Checks that the size stored at each node of a BST equals the number of
+        nodes in the subtree rooted at it.
+        """
+        if start_node is None:
+            return True
+        left_child = start_node.get_left()
+        right_child = start_node.get_right()
+        left_size = left_child.get_size() if left_child else 0
+        right_size = right_child.get_size() if right_child else 0
+        if start_node.get_size() != 1 + left_size + right_size:
+            return False
+        return (
+            Helper.verify_subtree_sizes(left_child)
+            and Helper.verify_subtree_sizes(right_child)
+        )
+
     @staticmethod
     def verify_min_heap(start_node):
         if start_node is None:
@@ -129,20 +148,46 @@ class Helper:
 
     @staticmethod
     def verify_skiplist(skiplist):
+        head = skiplist._head
+        if head.get_data() != float("-inf"):
+            return False
+        if head.get_height() != skiplist.get_height():
+            return False
+        # the top level is never empty unless it's the only one
+        top_level = skiplist.get_height() - 1
+        if top_level > 0 and head.get_next(top_level) is None:
+            return False
+        # every level links exactly the towers reaching it, in order
+        zeroth_level = []
+        curr_node = head.get_next(0)
+        while curr_node is not None:
+            zeroth_level.append(curr_node)
+            curr_node = curr_node.get_next(0)
+        if len(zeroth_level) != len(skiplist):
+            return False
         for level in range(skiplist.get_height()):
-            curr_node = skiplist._level_lists[level]._head
-            if curr_node.get_data() != float("-inf"):
+            expected = [
+                node for node in zeroth_level if node.get_height() > level
+            ]
+            curr_level = []
+            curr_node = head.get_next(level)
+            while curr_node is not None:
+                curr_level.append(curr_node)
+                curr_node = curr_node.get_next(level)
+            if curr_level != expected:
                 return False
-            while curr_node.get_next() is not None:
-                next_node = curr_node.get_next()
-                if curr_node.get_data() >= next_node.get_data():
+            # every pointer's width is the distance between its two nodes
+            # where the -∞ head is at zero and the end is past the last node
+            positions = [0] + [
+                zeroth_level.index(node) + 1 for node in curr_level
+            ] + [len(skiplist) + 1]
+            nodes = [head] + curr_level
+            for node, start, end in zip(nodes, positions, positions[1:]):
+                if node.get_width(level) != end - start:
                     return False
-                if not (
-                    curr_node.get_down() is None
-                    or curr_node.get_down().get_data() == curr_node.get_data()
-                ):
-                    return False
-                curr_node = next_node
+            values = [node.get_data() for node in curr_level]
+            if any(a >= b for a, b in zip(values, values[1:])):
+                return False
         return True
 
 
@@ -0,0 +1,262 @@
+import asyncio
+import pytest
+
+from extra.lists.asynchronous import (
+    AsyncQueue,
+    AsyncDeque,
+    AsyncPriorityQueue,
+)
+
+
+ASYNC_CLASSES = [AsyncQueue, AsyncDeque, AsyncPriorityQueue]
+
+
+def run(coroutine):
+    # NOTE: `asyncio.run()` was added in python 3.7
+    if hasattr(asyncio, "run"):
+        return asyncio.run(coroutine)
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+def test_async_containers_without_waiting(helper):
+    for cls in ASYNC_CLASSES:
+        container = cls(max_capacity=2)
+        with pytest.raises(IndexError):
+            container.get_nowait()
+        with pytest.raises(ValueError):
+            container.put_nowait(None)
+        with pytest.raises(TypeError):
+            container.put_nowait(cls())
+        container.put_nowait(1)
+        container.put_nowait(2)
+        assert len(container) == 2 and container.is_full()
+        with pytest.raises(OverflowError):
+            container.put_nowait(3)
+        assert sorted([container.get_nowait(), container.get_nowait()]) \
+            == [1, 2]
+        container.task_done()
+        container.task_done()
+        with pytest.raises(ValueError):
+            container.task_done()
+    # the block policy would block the whole event loop
+    with pytest.raises(ValueError):
+        AsyncQueue(overflow="block")
+    with pytest.raises(ValueError):
+        AsyncDeque(overflow="block")
+
+
+def test_async_containers_order(helper):
+    async def fill_and_drain(container, priorities=None):
+        for item in range(1, 6):
+            if priorities is None:
+                await container.put(item)
+            else:
+                await container.put(item, priorities[item - 1])
+        return [await container.get() for _ in range(5)]
+
+    assert run(fill_and_drain(AsyncQueue())) == [1, 2, 3, 4, 5]
+    assert run(fill_and_drain(AsyncDeque())) == [1, 2, 3, 4, 5]
+    assert run(
+        fill_and_drain(AsyncPriorityQueue(), [3, 1, 5, 2, 4])
+    ) == [3, 5, 1, 4, 2]
+
+    async def lowest_first():
+        pq = AsyncPriorityQueue()
+        for item, priority in [(1, 3), (2, 1), (3, 5)]:
+            await pq.put(item, priority)
+        return [
+            await pq.get(lowest_priority=True),
+            await pq.get(),
+            await pq.get(lowest_priority=True),
+        ]
+
+    assert run(lowest_first()) == [2, 3, 1]
+
+
+@pytest.mark.parametrize("cls", ASYNC_CLASSES)
+def test_async_containers_with_producers_and_consumers(helper, cls):
+    producers, consumers, per_producer = 4, 3, 250
+
+    async def main():
+        container = cls(max_capacity=5)
+        taken = []
+
+        async def produce(start):
+            for item in range(start, start + per_producer):
+                await container.put(item)
+
+        async def consume():
+            while True:
+                item = await container.get()
+                taken.append(item)
+                container.task_done()
+
+        consumer_tasks = [
+            asyncio.ensure_future(consume()) for _ in range(consumers)
+        ]
+        await asyncio.gather(*(
+            produce(i * per_producer) for i in range(producers)
+        ))
+        await asyncio.wait_for(container.join(), timeout=10)
+        for task in consumer_tasks:
+            task.cancel()
+        await asyncio.gather(*consumer_tasks, return_exceptions=True)
+        return container, taken
+
+    container, taken = run(main())
+    assert container.is_empty()
+    assert sorted(taken) == list(range(producers * per_producer))
+
+
+@pytest.mark.parametrize(
+    "cls, method",
+    [
+        (AsyncQueue, "enqueue"),
+        (AsyncQueue, "enqueue_many"),
+        (AsyncDeque, "append_left"),
+        (AsyncDeque, "append_right_many"),
+        (AsyncPriorityQueue, "enqueue"),
+        (AsyncPriorityQueue, "enqueue_many"),
+    ],
+)
+def test_async_containers_count_every_added_item(cls, method):
+    total = 300
+
+    async def main():
+        container = cls()
+        taken = []
+
+        async def consume():
+            for _ in range(total):
+                taken.append(await container.get())
+                container.task_done()
+
+        consumer = asyncio.ensure_future(consume())
+        add = getattr(container, method)
+        for start in range(0, total, 30):
+            if method.endswith("_many"):
+                add(list(range(start, start + 30)))
+            else:
+                for item in range(start, start + 30):
+                    add(item)
+            await asyncio.sleep(0)
+        # join() returns only after every added item is marked as done
+        await asyncio.wait_for(container.join(), timeout=10)
+        await consumer
+        return container, taken
+
+    container, taken = run(main())
+    assert sorted(taken) == list(range(total))
+    with pytest.raises(ValueError):
+        container.task_done()
+
+
+def test_async_containers_forget_discarded_items():
+    async def main():
+        q = AsyncQueue(max_capacity=2, overflow="drop_oldest")
+        q.enqueue_many([1, 2, 3])
+        q.enqueue(4)
+        assert q._unfinished_tasks == 2
+        for _ in range(2):
+            await q.get()
+            q.task_done()
+        await asyncio.wait_for(q.join(), timeout=1)
+        with pytest.warns(UserWarning):
+            pq = AsyncPriorityQueue(max_capacity=1)
+            await pq.put(1)
+            pq.enqueue(2)
+        assert pq._unfinished_tasks == 1
+        # clear() wakes up join() when only the removed items were left
+        dq = AsyncDeque()
+        await dq.put(1)
+        dq.append_left(2)
+        joiner = asyncio.ensure_future(dq.join())
+        await asyncio.sleep(0)
+        assert await dq.get() == 2
+        dq.task_done()
+        dq.clear()
+        await asyncio.wait_for(joiner, timeout=1)
+
+    run(main())
+
+
+def test_async_containers_wake_up_waiting_coroutines(helper):
+    async def main():
+        q = AsyncQueue(max_capacity=1)
+        getter = asyncio.ensure_future(q.get())
+        await asyncio.sleep(0)
+        assert not getter.done()
+        # enqueue() wakes up the waiting get() as well
+        q.enqueue(10)
+        assert await asyncio.wait_for(getter, timeout=1) == 10
+        # so does clear() for a waiting put()
+        q.put_nowait(20)
+        putter = asyncio.ensure_future(q.put(30))
+        await asyncio.sleep(0)
+        assert not putter.done()
+        q.clear()
+        await asyncio.wait_for(putter, timeout=1)
+        assert q.get_nowait() == 30
+        # a cancelled get() doesn't swallow the next item
+        first = asyncio.ensure_future(q.get())
+        second = asyncio.ensure_future(q.get())
+        await asyncio.sleep(0)
+        first.cancel()
+        await q.put(40)
+        assert await asyncio.wait_for(second, timeout=1) == 40
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(q.get(), timeout=0.01)
+        # join() waits till every put item is marked as done
+        dq = AsyncDeque()
+        await dq.put(1)
+        joiner = asyncio.ensure_future(dq.join())
+        await asyncio.sleep(0)
+        assert not joiner.done()
+        assert dq.pop_left() == 1
+        dq.task_done()
+        await asyncio.wait_for(joiner, timeout=1)
+
+    run(main())
+
+
+def test_async_containers_batch_methods():
+    async def wait_for_batch(container, items):
+        getters = [
+            asyncio.ensure_future(container.get()) for _ in range(len(items))
+        ]
+        await asyncio.sleep(0)
+        container.enqueue_many(items)
+        return await asyncio.gather(*getters)
+
+    q = AsyncQueue()
+    assert sorted(run(wait_for_batch(q, [1, 2, 3]))) == [1, 2, 3]
+    dq = AsyncDeque(max_capacity=3)
+    dq.append_right_many([1, 2])
+    dq.append_left_many([0])
+    assert dq.pop_left_many(2) == [0, 1] and dq.pop_right_many(1) == [2]
+    pq = AsyncPriorityQueue()
+    pq.enqueue_many([10, 20, 30], priorities=[1, 3, 2])
+    assert pq.dequeue_many(3) == [20, 30, 10]
+
+
+def test_async_containers_outside_event_loops():
+    # the containers are created before any event loop runs and they can be
+    # used by the coroutines of one event loop after another
+    async def put_then_join(container):
+        await container.put(1)
+        joiner = asyncio.ensure_future(container.join())
+        await asyncio.sleep(0)
+        assert not joiner.done()
+        assert await container.get() == 1
+        container.task_done()
+        await asyncio.wait_for(joiner, timeout=1)
+
+    for cls in ASYNC_CLASSES:
+        container = cls()
+        run(put_then_join(container))
+        run(put_then_join(container))
+        run(container.join())
@@ -0,0 +1,241 @@
+import threading
+import pytest
+
+from extra.lists.blocking import (
+    BlockingStack,
+    BlockingQueue,
+    BlockingDeque,
+    BlockingPriorityQueue,
+)
+
+
+BLOCKING_CLASSES = [
+    BlockingStack, BlockingQueue, BlockingDeque, BlockingPriorityQueue
+]
+
+
+def test_blocking_containers_without_threads(helper):
+    for cls in BLOCKING_CLASSES:
+        container = cls(max_capacity=2)
+        with pytest.raises(IndexError):
+            container.get(block=False)
+        with pytest.raises(IndexError):
+            container.get(timeout=0.01)
+        with pytest.raises(TypeError):
+            container.get(timeout=helper.get_string())
+        with pytest.raises(ValueError):
+            container.get(timeout=helper.get_neg_float())
+        with pytest.raises(ValueError):
+            container.put(None)
+        container.put(1)
+        container.put(2)
+        assert len(container) == 2 and container.is_full()
+        with pytest.raises(OverflowError):
+            container.put(3, block=False)
+        with pytest.raises(OverflowError):
+            container.put(3, timeout=0.01)
+        assert sorted([container.get(), container.get()]) == [1, 2]
+        assert container.is_empty()
+        container.task_done()
+        container.task_done()
+        with pytest.raises(ValueError):
+            container.task_done()
+        container.join()  # shouldn't block
+        container.put(helper.get_value())
+        container.clear()
+        assert container.is_empty() and container._max_capacity == 2
+
+
+def test_blocking_containers_order():
+    s = BlockingStack()
+    q = BlockingQueue(backend="linked")
+    dq = BlockingDeque()
+    pq = BlockingPriorityQueue()
+    for i in range(10):
+        s.put(i)
+        q.put(i)
+        dq.put(i)
+        pq.put(i, priority=i % 5)
+    assert [s.get() for _ in range(10)] == list(range(9, -1, -1))
+    assert [q.get() for _ in range(10)] == list(range(10))
+    assert [dq.get() for _ in range(10)] == list(range(10))
+    assert pq.get() == 4 and pq.get(lowest_priority=True) == 0
+    assert pq.get() == 9 and pq.get(lowest_priority=True) == 5
+    # the non-blocking methods keep their behavior
+    dq.append_left(1)
+    dq.append_right(2)
+    assert dq.get_left() == 1 and dq.get_right() == 2
+    assert dq.pop_right() == 2 and dq.pop_left() == 1
+    with pytest.warns(UserWarning):
+        assert q.dequeue() is None
+    with pytest.raises(OverflowError):
+        BlockingStack(max_capacity=0).push(1)
+
+
+@pytest.mark.parametrize("cls", BLOCKING_CLASSES)
+def test_blocking_containers_with_producers_and_consumers(cls):
+    container = cls(max_capacity=8)
+    producers, consumers, per_producer = 3, 2, 500
+    consumed = [[] for _ in range(consumers)]
+
+    def produce(start):
+        for item in range(start, start + per_producer):
+            container.put(item)
+
+    def consume(bucket):
+        while True:
+            item = container.get()
+            if item == -1:
+                container.task_done()
+                return
+            bucket.append(item)
+            container.task_done()
+
+    threads = [
+        threading.Thread(target=consume, args=(bucket,))
+        for bucket in consumed
+    ] + [
+        threading.Thread(target=produce, args=(i * per_producer,))
+        for i in range(producers)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads[consumers:]:
+        thread.join()
+    container.join()
+    assert container.is_empty()
+    for _ in range(consumers):
+        container.put(-1)
+    for thread in threads[:consumers]:
+        thread.join()
+    items = sorted(item for bucket in consumed for item in bucket)
+    assert items == list(range(producers * per_producer))
+
+
+@pytest.mark.parametrize(
+    "cls, method",
+    [
+        (BlockingStack, "push"),
+        (BlockingStack, "push_many"),
+        (BlockingQueue, "enqueue"),
+        (BlockingQueue, "enqueue_many"),
+        (BlockingDeque, "append_left"),
+        (BlockingDeque, "append_right_many"),
+        (BlockingPriorityQueue, "enqueue"),
+        (BlockingPriorityQueue, "enqueue_many"),
+    ],
+)
+def test_blocking_containers_count_every_added_item(cls, method):
+    if cls in {BlockingQueue, BlockingDeque}:
+        container = cls(max_capacity=8, overflow="block")
+    else:
+        container = cls()
+    total, taken = 300, []
+
+    def consume():
+        for _ in range(total):
+            taken.append(container.get())
+            container.task_done()
+
+    consumer = threading.Thread(target=consume)
+    consumer.start()
+    add = getattr(container, method)
+    if method.endswith("_many"):
+        for start in range(0, total, 30):
+            add(list(range(start, start + 30)))
+    else:
+        for item in range(total):
+            add(item)
+    # join() returns only after every added item is marked as done
+    container.join()
+    assert sorted(taken) == list(range(total))
+    consumer.join()
+    with pytest.raises(ValueError):
+        container.task_done()
+
+
+def test_blocking_containers_forget_discarded_items():
+    q = BlockingQueue(max_capacity=2, overflow="drop_oldest")
+    q.enqueue_many([1, 2, 3])
+    q.enqueue(4)
+    assert q._unfinished_tasks == 2
+    for _ in range(2):
+        q.get()
+        q.task_done()
+    q.join()
+    with pytest.warns(UserWarning):
+        pq = BlockingPriorityQueue(max_capacity=1)
+        pq.put(1)
+        pq.enqueue(2)
+    assert pq._unfinished_tasks == 1
+    dq = BlockingDeque()
+    dq.put(1)
+    dq.append_left(2)
+    assert dq.get() == 2
+    dq.clear()
+    assert dq._unfinished_tasks == 1
+    dq.task_done()
+    dq.join()
+
+
+def test_blocking_queue_wakes_up_blocked_threads():
+    q = BlockingQueue(max_capacity=1)
+    q.put(1)
+    results = []
+    putter = threading.Thread(target=lambda: results.append(q.put(2)))
+    putter.start()
+    putter.join(timeout=0.05)
+    assert putter.is_alive()  # blocked on the full queue
+    q.clear()
+    putter.join()
+    assert q.get() == 2
+    getter = threading.Thread(target=lambda: results.append(q.get()))
+    getter.start()
+    getter.join(timeout=0.05)
+    assert getter.is_alive()  # blocked on the empty queue
+    q.enqueue(3)
+    getter.join()
+    assert results == [None, 3]
+    # the "block" overflow policy of `enqueue()` shares the same lock
+    q = BlockingQueue(max_capacity=1, overflow="block")
+    q.enqueue(1)
+    enqueuer = threading.Thread(target=q.enqueue, args=(2,))
+    enqueuer.start()
+    assert q.get() == 1
+    enqueuer.join()
+    assert q.get() == 2
+
+
+def test_blocking_containers_batch_methods():
+    s = BlockingStack(max_capacity=3)
+    s.push_many([1, 2, 3])
+    assert s.pop_many(2) == [3, 2]
+    dq = BlockingDeque()
+    dq.append_right_many([1, 2])
+    dq.append_left_many([0])
+    assert dq.pop_left_many(2) == [0, 1] and dq.pop_right_many(1) == [2]
+    pq = BlockingPriorityQueue()
+    pq.enqueue_many([10, 20, 30], priorities=[1, 3, 2])
+    assert pq.dequeue_many(3) == [20, 30, 10]
+    # a batch wakes up all the waiting threads
+    q = BlockingQueue()
+    results = []
+    getters = [
+        threading.Thread(target=lambda: results.append(q.get()))
+        for _ in range(3)
+    ]
+    for getter in getters:
+        getter.start()
+    q.enqueue_many([1, 2, 3])
+    for getter in getters:
+        getter.join()
+    assert sorted(results) == [1, 2, 3]
+    # a batch that fills the queue hands its items over before blocking
+    q = BlockingQueue(max_capacity=2, overflow="block")
+    consumer = threading.Thread(
+        target=lambda: results.extend(q.get() for _ in range(5))
+    )
+    consumer.start()
+    q.enqueue_many([4, 5, 6, 7, 8])
+    consumer.join()
+    assert results[3:] == [4, 5, 6, 7, 8]
@@ -446,3 +446,110 @@ def test_split_method(helper):
     cll.add_end("apple")
     assert cll._length == len(cll) == len(lst) + 2
     assert cll.to_list() == [0] + lst + ["apple"]
+
+
+def test_circular_linked_list_tail_pointer(helper):
+    lst = helper.get_list(length=50)
+    cll = CircularLinkedList()
+    cll.add_end(lst[0])
+    cll.add_front(0)
+    assert cll._tail.get_data() == lst[0]
+    for item in lst[1:]:
+        cll.add_end(item)
+        assert cll._tail.get_next() is cll._head
+        assert cll._tail.get_data() == item
+    assert cll.to_list() == [0] + lst
+    cll.remove_end()
+    assert cll._tail.get_data() == lst[-2]
+    assert cll._tail.get_next() is cll._head
+    cll.extend(CircularLinkedList([10, 20]))
+    assert cll._tail.get_data() == 20
+    assert cll.to_list() == [0] + lst[:-1] + [10, 20]
+    # removing the head of a two-item list keeps the tail on the head
+    cll = CircularLinkedList([1, 2])
+    cll.remove_front()
+    assert cll._tail is cll._head
+    cll.add_end(3)
+    assert cll.to_list() == [2, 3]
+
+
+def test_circular_linked_list_cursor(helper):
+    lst = helper.get_list(length=50)
+    cll = CircularLinkedList(lst)
+    # removing while scanning
+    cursor = cll.iter_cursor()
+    kept = []
+    for i, item in enumerate(lst):
+        assert cursor.get_data() == item
+        if i % 2 == 0:
+            cursor.remove()
+        else:
+            kept.append(item)
+            cursor.advance()
+    assert cll.to_list() == kept
+    assert cll._tail.get_next() is cll._head
+    # the cursor wraps around after the tail
+    assert cursor.get_data() == kept[0]
+    cursor.advance(len(kept))
+    assert cursor.get_data() == kept[0]
+    # editing at the head
+    cll = CircularLinkedList([1, 2, 3])
+    cursor = cll.iter_cursor()
+    cursor.insert_before(0)
+    assert cursor.get_data() == 1
+    assert cll.to_list() == [0, 1, 2, 3]
+    cursor = cll.find(0)
+    cursor.remove()
+    assert cursor.get_data() == 1
+    assert cll.to_list() == [1, 2, 3]
+    cursor.advance(2)
+    cursor.insert_after(4)
+    assert cll._tail.get_data() == 4
+    assert cll.to_list() == [1, 2, 3, 4]
+    for _ in range(4):
+        cursor.remove()
+    assert cll.is_empty() and cursor.is_exhausted()
+    # stale cursor
+    cll.add_end(1)
+    with pytest.raises(RuntimeError):
+        cursor.is_exhausted()
+    # an emptied list gives an exhausted cursor
+    cll = CircularLinkedList([1])
+    cll.remove(1)
+    cursor = cll.iter_cursor()
+    assert cursor.is_exhausted()
+    with pytest.raises(IndexError):
+        cursor.insert_after(2)
+    with pytest.raises(IndexError):
+        cursor.remove()
+    assert cll.is_empty()
+
+
+def test_circular_linked_list_view(helper):
+    lst = helper.get_list(length=30)
+    cll = CircularLinkedList(lst)
+    assert list(cll.view()) == lst
+    assert list(cll.view(3, 20, 4)) == lst[3:20:4]
+    assert list(cll.view(step=-3)) == lst[::-3]
+    with pytest.raises(ValueError):
+        cll.view(step=0)
+
+
+def test_circular_linked_list_sort_and_merge_sorted(helper):
+    lst = helper.get_list(length=100, _type=int)
+    cll = CircularLinkedList(lst)
+    cll.sort()
+    assert cll.to_list() == sorted(lst)
+    assert cll._tail.get_next() is cll._head
+    cll_1 = CircularLinkedList(sorted(lst[:30]))
+    cll_2 = CircularLinkedList(sorted(lst[30:]))
+    cll_1.merge_sorted(cll_2)
+    assert cll_1.to_list() == sorted(lst)
+    assert cll_1._tail.get_next() is cll_1._head
+    assert cll_2.is_empty()
+    # merging into an emptied list
+    cll = CircularLinkedList([1])
+    cll.remove(1)
+    cll.merge_sorted(CircularLinkedList([1, 2]))
+    assert cll.to_list() == [1, 2]
+    assert cll._tail.get_next() is cll._head
@@ -192,3 +192,82 @@ def test_append_methods(helper):
     dq.enqueue(helper.get_string())
     dq.enqueue(helper.get_float())
     dq.enqueue(helper.get_list())
+
+
+def test_deque_with_array_backend(helper):
+    with pytest.raises(ValueError):
+        Deque(backend=helper.get_int())
+    linked_dq = Deque(max_capacity=300)
+    array_dq = Deque(max_capacity=300, backend="array")
+    for _ in range(3000):
+        op = helper.get_pos_int(b=4)
+        if op <= 2 or linked_dq.is_empty():
+            item = helper.get_value()
+            append = "append_left" if op == 1 else "append_right"
+            if linked_dq.is_full():
+                with pytest.warns(UserWarning):
+                    getattr(linked_dq, append)(item)
+                with pytest.warns(UserWarning):
+                    getattr(array_dq, append)(item)
+            else:
+                getattr(linked_dq, append)(item)
+                getattr(array_dq, append)(item)
+        elif op == 3:
+            assert linked_dq.get_left() == array_dq.get_left()
+            assert linked_dq.pop_left() == array_dq.pop_left()
+        else:
+            assert linked_dq.get_right() == array_dq.get_right()
+            assert linked_dq.pop_right() == array_dq.pop_right()
+        assert len(linked_dq) == len(array_dq)
+    assert str(linked_dq) == str(array_dq)
+
+
+def test_deque_overflow_and_empty_policies():
+    for backend in ["linked", "array"]:
+        dq = Deque(3, backend, overflow="drop_oldest", empty="sentinel")
+        for i in range(5):
+            dq.append_right(i)
+        assert list(dq._container) == [2, 3, 4]
+        dq.append_left(1)
+        assert list(dq._container) == [1, 2, 3]
+        dq = Deque(3, backend, overflow="drop_newest", empty="raise")
+        for i in range(5):
+            dq.append_left(i)
+        dq.append_right(5)
+        assert dq.pop_left() == 2 and dq.pop_right() == 0
+        assert dq.pop_left() == 1
+        with pytest.raises(IndexError):
+            dq.pop_left()
+        with pytest.raises(IndexError):
+            dq.pop_right()
+        dq = Deque(1, backend, overflow="raise", empty="sentinel", sentinel=0)
+        dq.append_right(1)
+        with pytest.raises(OverflowError):
+            dq.append_left(2)
+        with pytest.raises(OverflowError):
+            dq.append_right(2)
+        assert dq.pop_right() == 1
+        assert dq.pop_left() == 0 and dq.pop_right() == 0
+
+
+def test_deque_batch_methods(helper):
+    for backend in ["linked", "array"]:
+        dq = Deque(backend=backend)
+        with pytest.raises(ValueError):
+            dq.append_right_many([helper.get_value(), None])
+        assert dq.is_empty()
+        dq.append_right_many([1, 2, 3])
+        dq.append_left_many([0, -1])
+        assert list(dq._container) == [-1, 0, 1, 2, 3]
+        assert dq.pop_left_many(2) == [-1, 0]
+        assert dq.pop_right_many(2) == [3, 2]
+        with pytest.warns(UserWarning):
+            assert dq.pop_left_many(2) == [1]
+        dq = Deque(3, backend, overflow="drop_oldest", empty="raise")
+        dq.append_right_many(range(5))
+        assert list(dq._container) == [2, 3, 4]
+        dq.append_left_many([1, 0])
+        assert list(dq._container) == [0, 1, 2]
+        with pytest.raises(IndexError):
+            dq.pop_right_many(4)
+        assert len(dq) == 3
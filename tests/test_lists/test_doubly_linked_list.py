@@ -555,3 +555,97 @@ def test_split(helper):
     dl.add_end("apple")
     assert dl._length == len(dl) == len(lst) + 2
     assert dl.to_list() == [0] + lst + ["apple"]
+
+
+def test_doubly_linked_list_cursor(helper):
+    lst = helper.get_list(length=50)
+    dll = DoublyLinkedList(lst)
+    # removing while scanning
+    cursor = dll.iter_cursor()
+    kept = []
+    for i, item in enumerate(lst):
+        assert cursor.get_data() == item
+        if i % 2 == 1:
+            cursor.remove()
+        else:
+            kept.append(item)
+            cursor.advance()
+    assert cursor.is_exhausted()
+    assert dll.to_list() == kept
+    assert dll._tail.get_data() == kept[-1]
+    # the backward links stay consistent
+    node, backward = dll._tail, []
+    while node is not None:
+        backward.append(node.get_data())
+        node = node.get_prev()
+    assert backward == kept[::-1]
+    # editing around a found item
+    dll = DoublyLinkedList([1, 2, 3])
+    cursor = dll.find(1)
+    cursor.insert_before(0)
+    cursor.insert_after(5)
+    cursor.remove()
+    assert cursor.get_data() == 5
+    assert dll.to_list() == [0, 5, 2, 3]
+    assert dll._head.get_data() == 0
+    assert dll._head.get_next().get_prev() is dll._head
+    # stale cursor
+    dll.remove_end()
+    with pytest.raises(RuntimeError):
+        cursor.advance()
+    # an emptied list gives an exhausted cursor
+    dll = DoublyLinkedList([1])
+    dll.remove(1)
+    cursor = dll.iter_cursor()
+    assert cursor.is_exhausted()
+    with pytest.raises(IndexError):
+        cursor.insert_after(2)
+    with pytest.raises(IndexError):
+        cursor.remove()
+    assert dll.is_empty()
+
+
+def test_doubly_linked_list_slicing_and_view(helper):
+    lst = helper.get_list(length=60)
+    dll = DoublyLinkedList(lst)
+    slices = [
+        slice(None, None, 7), slice(50, 5, -3), slice(None, None, -1),
+        slice(-5, 2, -4), slice(2, 45, -1), slice(100, -100, -9),
+    ]
+    for s in slices:
+        sliced = dll[s]
+        assert isinstance(sliced, DoublyLinkedList)
+        assert sliced.to_list() == lst[s]
+        if lst[s]:
+            assert sliced._tail.get_data() == lst[s][-1]
+        assert list(dll.view(s.start, s.stop, s.step)) == lst[s]
+    # the view is lazy and detects structural changes
+    view = dll.view(step=-1)
+    assert next(view) == lst[-1]
+    dll.remove_end()
+    with pytest.raises(RuntimeError):
+        next(view)
+
+
+def test_doubly_linked_list_sort_and_merge_sorted(helper):
+    def backward(dll):
+        node, values = dll._tail, []
+        while node is not None:
+            values.append(node.get_data())
+            node = node.get_prev()
+        return values[::-1]
+
+    lst = helper.get_list(length=100, _type=int)
+    dll = DoublyLinkedList(lst)
+    dll.sort(reverse=True)
+    assert dll.to_list() == backward(dll) == sorted(lst, reverse=True)
+    dll_1 = DoublyLinkedList(sorted(lst[:30], key=str))
+    dll_2 = DoublyLinkedList(sorted(lst[30:], key=str))
+    dll_1.merge_sorted(dll_2, key=str)
+    assert dll_1.to_list() == backward(dll_1) == sorted(lst, key=str)
+    assert dll_2.is_empty()
+    # merging into an emptied list
+    dll = DoublyLinkedList([1])
+    dll.remove(1)
+    dll.merge_sorted(DoublyLinkedList([1, 2]))
+    assert dll.to_list() == backward(dll) == [1, 2]
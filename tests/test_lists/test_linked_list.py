@@ -1,6 +1,7 @@
 import pytest
 
 from extra.lists.linked_list import Node, LinkedList
+from extra.lists.doubly_linked_list import DoublyLinkedList
 
 
 def test_not_empty_node(helper):
@@ -454,3 +455,216 @@ def test_split_method(helper):
     ll.add_end("apple")
     assert ll._length == len(ll) == len(lst) + 2
     assert ll.to_list() == [0] + lst + ["apple"]
+
+
+def test_node_classes_use_slots(helper):
+    from extra.lists.doubly_linked_list import DoublyNode
+    from extra.lists.skip_list import SkipNode
+    from extra.lists.priority_queue import PriorityNode
+
+    for node in [
+        Node(helper.get_value()),
+        DoublyNode(helper.get_value()),
+        SkipNode(helper.get_int()),
+        PriorityNode(helper.get_value(), helper.get_int()),
+    ]:
+        assert not hasattr(node, "__dict__")
+        with pytest.raises(AttributeError):
+            node.unknown_attribute = helper.get_value()
+
+    # subclasses without `__slots__` can still add attributes
+    class LabeledNode(Node):
+        pass
+
+    node = LabeledNode(helper.get_value())
+    node.label = "label"
+    assert node.label == "label"
+
+
+def test_linked_list_tail_pointer(helper):
+    def last_node(llist):
+        node = llist._head
+        for _ in range(len(llist) - 1):
+            node = node.get_next()
+        return node
+
+    lst = helper.get_list(length=50)
+    ll = LinkedList()
+    for item in lst:
+        ll.add_end(item)
+        assert ll._tail is last_node(ll)
+    assert ll.to_list() == lst
+    ll.add_front(0)
+    ll.insert(len(ll), 1)
+    assert ll._tail is last_node(ll)
+    assert ll.to_list() == [0] + lst + [1]
+    # removing from both ends
+    ll.remove_end()
+    assert ll._tail is last_node(ll)
+    ll.remove_front()
+    assert ll._tail is last_node(ll)
+    del ll[len(ll) - 1]
+    assert ll._tail is last_node(ll)
+    assert ll.to_list() == lst[:-1]
+    ll.remove(lst[-2])
+    assert ll._tail is last_node(ll)
+    # extending
+    ll.extend(LinkedList([10, 20]))
+    assert ll._tail.get_data() == 20
+    ll.add_end(30)
+    assert ll.to_list()[-3:] == [10, 20, 30]
+    # rotating in-place
+    ll.rotate_left(3)
+    assert ll._tail is last_node(ll)
+    ll.rotate_right(5)
+    assert ll._tail is last_node(ll)
+    # draining the list
+    while not ll.is_empty():
+        ll.remove_front()
+    ll.add_end(5)
+    ll.add_end(6)
+    assert ll.to_list() == [5, 6]
+    assert ll._tail.get_data() == 6
+
+
+def test_linked_list_cursor(helper):
+    lst = helper.get_list(length=50)
+    ll = LinkedList(lst)
+    # removing while scanning
+    cursor = ll.iter_cursor()
+    kept = []
+    for i, item in enumerate(lst):
+        assert cursor.get_data() == item
+        if i % 3 == 0:
+            cursor.remove()
+        else:
+            kept.append(item)
+            cursor.advance()
+    assert cursor.is_exhausted()
+    with pytest.raises(IndexError):
+        cursor.get_data()
+    assert ll.to_list() == kept
+    assert len(ll) == len(kept)
+    # editing around a found item
+    ll = LinkedList([1, 2, 3])
+    cursor = ll.find(2)
+    cursor.insert_before(10)
+    cursor.insert_after(20)
+    cursor.replace(30)
+    assert cursor.get_data() == 30
+    assert ll.to_list() == [1, 10, 30, 20, 3]
+    cursor = ll.iter_cursor()
+    cursor.insert_before(0)
+    assert ll.to_list() == [0, 1, 10, 30, 20, 3]
+    cursor.advance(4)
+    cursor.remove()
+    assert ll._tail.get_data() == 20 and cursor.is_exhausted()
+    ll.add_end(40)
+    assert ll.to_list() == [0, 1, 10, 30, 20, 40]
+    assert ll.find(100) is None
+    assert LinkedList().iter_cursor().is_exhausted()
+    # invalid usage
+    cursor = ll.iter_cursor()
+    with pytest.raises(TypeError):
+        cursor.advance("1")
+    with pytest.raises(ValueError):
+        cursor.advance(-1)
+    with pytest.raises(ValueError):
+        cursor.insert_after(None)
+    with pytest.raises(TypeError):
+        cursor.replace(LinkedList())
+    # stale cursor
+    ll.add_front(-1)
+    with pytest.raises(RuntimeError):
+        cursor.get_data()
+    cursor = ll.iter_cursor()
+    ll.clear()
+    with pytest.raises(RuntimeError):
+        cursor.remove()
+    # an emptied list gives an exhausted cursor
+    ll = LinkedList([1])
+    ll.remove(1)
+    cursor = ll.iter_cursor()
+    assert cursor.is_exhausted()
+    with pytest.raises(IndexError):
+        cursor.insert_after(2)
+    with pytest.raises(IndexError):
+        cursor.remove()
+    assert ll.is_empty()
+
+
+def test_linked_list_slicing_and_view(helper):
+    lst = helper.get_list(length=60)
+    ll = LinkedList(lst)
+    slices = [
+        slice(None, None, 7), slice(5, 50, 3), slice(None, None, -1),
+        slice(-5, 2, -4), slice(40, 10), slice(-100, 100, 9),
+    ]
+    for s in slices:
+        sliced = ll[s]
+        assert isinstance(sliced, LinkedList)
+        assert sliced.to_list() == lst[s]
+        assert len(sliced) == len(lst[s])
+        assert list(ll.view(s.start, s.stop, s.step)) == lst[s]
+    assert list(ll.view()) == lst
+    assert list(LinkedList().view(step=-1)) == []
+    with pytest.raises(TypeError):
+        ll.view("1")
+    with pytest.raises(ValueError):
+        ll.view(step=0)
+    # the view is lazy and detects structural changes
+    view = ll.view(step=2)
+    assert next(view) == lst[0]
+    ll.add_front(0)
+    with pytest.raises(RuntimeError):
+        next(view)
+
+
+def test_linked_list_sort_and_merge_sorted(helper):
+    lst = helper.get_list(length=100, _type=int)
+    ll = LinkedList(lst)
+    head_node = ll._head
+    ll.sort()
+    assert ll.to_list() == sorted(lst)
+    assert ll._tail.get_data() == max(lst)
+    # the nodes are relinked, not created
+    assert head_node in [ll._get_node(i)[1] for i in range(len(ll))]
+    pairs = [(i % 4, i) for i in range(30)]
+    ll = LinkedList(pairs)
+    ll.sort(key=lambda pair: pair[0], reverse=True)
+    assert ll.to_list() == sorted(pairs, key=lambda p: p[0], reverse=True)
+    with pytest.raises(TypeError):
+        ll.sort(key=1)
+    with pytest.raises(TypeError):
+        ll.sort(reverse="yes")
+    # merging
+    ll_1 = LinkedList(sorted(lst[:50]))
+    ll_2 = LinkedList(sorted(lst[50:]))
+    ll_1.merge_sorted(ll_2)
+    assert ll_1.to_list() == sorted(lst)
+    assert len(ll_1) == len(lst)
+    assert ll_2.is_empty()
+    ll_1.add_end(lst[0])
+    assert ll_1.to_list()[-1] == lst[0]
+    ll = LinkedList()
+    ll.merge_sorted(LinkedList([1, 2]))
+    assert ll.to_list() == [1, 2]
+    with pytest.raises(TypeError):
+        ll.merge_sorted([3, 4])
+    with pytest.raises(ValueError):
+        ll.merge_sorted(ll)
+    # a failing comparison keeps every node in the list
+    ll = LinkedList([3, "a", 1, 2])
+    with pytest.raises(TypeError):
+        ll.sort()
+    assert len(ll) == len(ll.to_list()) == 4
+    assert sorted(ll.to_list(), key=str) == [1, 2, 3, "a"]
+    # merging into an emptied list
+    ll = LinkedList([1])
+    ll.remove(1)
+    ll.merge_sorted(LinkedList([1, 2]))
+    assert ll.to_list() == [1, 2]
+    assert ll._tail.get_data() == 2
+    # the nodes of another list type can't be mixed in
+    with pytest.raises(TypeError):
+        ll.merge_sorted(DoublyLinkedList([3, 4]))
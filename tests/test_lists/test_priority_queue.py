@@ -138,3 +138,76 @@ def test_queue_with_known_values():
     assert q.is_empty()
     assert q._max_capacity == 3
     assert q.is_full() is False
+
+
+def test_queue_ties_are_dequeued_in_fifo_order(helper):
+    q = PriorityQueue()
+    for item in range(10):
+        q.enqueue(item, priority=item % 2)
+    # highest priority first, first-inserted first among equal priorities
+    assert [q.dequeue() for _ in range(5)] == [1, 3, 5, 7, 9]
+    for item in range(10, 15):
+        q.enqueue(item, priority=0)
+    assert q._min_priority == q._max_priority == 0
+    assert [q.dequeue(lowest_priority=True) for _ in range(10)] == [
+        0, 2, 4, 6, 8, 10, 11, 12, 13, 14
+    ]
+    assert q.is_empty()
+    assert q._min_priority == float("inf")
+    assert q._max_priority == float("-inf")
+
+
+def test_queue_against_sorted_reference(helper):
+    cap = helper.get_pos_int(a=5, b=50)
+    q = PriorityQueue(max_capacity=cap)
+    reference = []  # (order, item, priority) in insertion order
+    for order in range(500):
+        if reference and helper.get_pos_int(b=3) == 1:
+            lowest = helper.get_pos_int(b=2) == 1
+            if lowest:
+                expected = min(reference, key=lambda x: (x[2], x[0]))
+            else:
+                expected = min(reference, key=lambda x: (-x[2], x[0]))
+            reference.remove(expected)
+            assert q.dequeue(lowest_priority=lowest) == expected[1]
+        else:
+            item, priority = helper.get_value(), helper.get_int(-5, 5)
+            if len(reference) == cap:
+                with pytest.warns(UserWarning):
+                    q.enqueue(item, priority=priority)
+                reference.pop(0)
+            else:
+                q.enqueue(item, priority=priority)
+            reference.append((order, item, priority))
+        assert len(q) == len(reference)
+        if reference:
+            assert q.top() == reference[0][1]
+            assert q._min_priority == min(x[2] for x in reference)
+            assert q._max_priority == max(x[2] for x in reference)
+
+
+def test_queue_batch_methods(helper):
+    q = PriorityQueue()
+    with pytest.raises(ValueError):
+        q.enqueue_many([1, 2], priorities=[1])
+    with pytest.raises(TypeError):
+        q.enqueue_many([1, 2], priorities=[1, helper.get_string()])
+    assert q.is_empty()
+    items = list(range(100))
+    priorities = [helper.get_int(-5, 5) for _ in items]
+    q.enqueue_many(items[:80], priorities[:80])  # rebuilds the heaps
+    q.enqueue_many(items[80:], priorities[80:])  # pushes each item
+    assert q._min_priority == min(priorities)
+    assert q._max_priority == max(priorities)
+    expected = sorted(items, key=lambda x: (-priorities[x], x))
+    assert q.dequeue_many(50) == expected[:50]
+    expected = sorted(expected[50:], key=lambda x: (priorities[x], x))
+    with pytest.warns(UserWarning):
+        assert q.dequeue_many(51, lowest_priority=True) == expected
+    assert q.is_empty()
+    # the first inserted items are dropped when it's full
+    q = PriorityQueue(max_capacity=3)
+    q.enqueue(0, priority=0)
+    with pytest.warns(UserWarning):
+        q.enqueue_many([1, 2, 3], priorities=[1, 2, 3])
+    assert q.dequeue_many(3) == [3, 2, 1]
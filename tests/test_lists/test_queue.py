@@ -1,3 +1,5 @@
+import threading
+import warnings
 import pytest
 
 from extra.lists.queue import Queue
@@ -112,3 +114,180 @@ def test_enqueue_method(helper):
     q.enqueue(helper.get_string())
     q.enqueue(helper.get_float())
     q.enqueue(helper.get_list())
+
+
+def test_queue_with_array_backend(helper):
+    with pytest.raises(ValueError):
+        Queue(backend=helper.get_string())
+    linked_q = Queue(max_capacity=500)
+    array_q = Queue(max_capacity=500, backend="array")
+    assert array_q._backend == "array"
+    for _ in range(3000):
+        if helper.get_pos_int(b=3) > 1:
+            item = helper.get_value()
+            if linked_q.is_full():
+                with pytest.warns(UserWarning):
+                    linked_q.enqueue(item)
+                with pytest.warns(UserWarning):
+                    array_q.enqueue(item)
+            else:
+                linked_q.enqueue(item)
+                array_q.enqueue(item)
+        elif not linked_q.is_empty():
+            assert linked_q.top() == array_q.top()
+            assert linked_q.dequeue() == array_q.dequeue()
+        assert len(linked_q) == len(array_q)
+    assert str(linked_q) == str(array_q)
+    # a bounded ring buffer is allocated once and never resized
+    items = array_q._container._items
+    assert len(items) == 512
+    while not array_q.is_empty():
+        assert array_q.dequeue() == linked_q.dequeue()
+    assert array_q._container._items is items
+    assert items == [None] * 512
+    # an unbounded one shrinks back when drained
+    array_q = Queue(backend="array")
+    for i in range(100):
+        array_q.enqueue(i)
+    while not array_q.is_empty():
+        array_q.dequeue()
+    assert len(array_q._container._items) == 8
+    array_q.clear()
+    assert array_q._backend == "array"
+    assert str(array_q) == str(Queue())
+
+
+def test_queue_overflow_and_empty_policies(helper):
+    with pytest.raises(ValueError):
+        Queue(overflow=helper.get_string())
+    with pytest.raises(ValueError):
+        Queue(empty=helper.get_string())
+    with pytest.raises(TypeError):
+        Queue(overflow="block", timeout=helper.get_string())
+    with pytest.raises(ValueError):
+        Queue(overflow="block", timeout=helper.get_neg_float())
+    for backend in ["linked", "array"]:
+        with warnings.catch_warnings():
+            # none of these policies warns
+            warnings.simplefilter("error")
+            q = Queue(3, backend, overflow="drop_oldest", empty="sentinel")
+            for i in range(5):
+                q.enqueue(i)
+            assert [q.dequeue() for _ in range(4)] == [2, 3, 4, None]
+            q = Queue(3, backend, "drop_newest", "sentinel", sentinel=-1)
+            for i in range(5):
+                q.enqueue(i)
+            assert [q.dequeue() for _ in range(4)] == [0, 1, 2, -1]
+            q = Queue(3, backend, overflow="raise", empty="raise")
+            for i in range(3):
+                q.enqueue(i)
+            with pytest.raises(OverflowError):
+                q.enqueue(3)
+            assert [q.dequeue() for _ in range(3)] == [0, 1, 2]
+            with pytest.raises(IndexError):
+                q.dequeue()
+            q = Queue(0, backend, overflow="drop_oldest", empty="sentinel")
+            q.enqueue(helper.get_value())
+            assert q.is_empty() and q.dequeue() is None
+
+
+def test_queue_blocking_overflow_policy():
+    for backend in ["linked", "array"]:
+        q = Queue(2, backend, overflow="block", timeout=0.01)
+        q.enqueue(1)
+        q.enqueue(2)
+        with pytest.raises(OverflowError):
+            q.enqueue(3)
+        # a consumer thread makes room for the blocked producer
+        q = Queue(2, backend, overflow="block", empty="sentinel")
+        consumed = []
+
+        def consume():
+            while len(consumed) < 100:
+                item = q.dequeue()
+                if item is not None:
+                    consumed.append(item)
+
+        consumer = threading.Thread(target=consume)
+        consumer.start()
+        for i in range(100):
+            q.enqueue(i)
+        consumer.join()
+        assert consumed == list(range(100))
+
+
+def test_queue_batch_methods(helper):
+    for backend in ["linked", "array"]:
+        q = Queue(backend=backend)
+        with pytest.raises(ValueError):
+            q.enqueue_many([helper.get_value(), None])
+        with pytest.raises(TypeError):
+            q.enqueue_many([helper.get_value(), Queue()])
+        assert q.is_empty()  # nothing is enqueued if an item is invalid
+        with pytest.raises(TypeError):
+            q.dequeue_many(helper.get_float())
+        with pytest.raises(ValueError):
+            q.dequeue_many(helper.get_neg_int())
+        items = [helper.get_value() for _ in range(100)]
+        q.enqueue_many(items[:60])
+        q.enqueue_many(iter(items[60:]))
+        assert q.top() == items[0] and len(q) == 100
+        assert q.dequeue_many(0) == []
+        assert q.dequeue_many(40) == items[:40]
+        with pytest.warns(UserWarning):
+            assert q.dequeue_many(100) == items[40:]
+        assert q.is_empty()
+        # the batch methods apply the policies like the single ones
+        q = Queue(3, backend, overflow="raise", empty="raise")
+        q.enqueue_many([1, 2])
+        with pytest.raises(OverflowError):
+            q.enqueue_many([3, 4])
+        with pytest.raises(IndexError):
+            q.dequeue_many(3)
+        assert q.dequeue_many(2) == [1, 2]
+        q = Queue(3, backend, overflow="drop_newest", empty="sentinel")
+        q.enqueue_many(range(5))
+        assert q.dequeue_many(4) == [0, 1, 2]
+        q = Queue(3, backend)
+        q.enqueue(0)
+        with pytest.warns(UserWarning):
+            q.enqueue_many([1, 2, 3])
+        assert q.dequeue_many(3) == [1, 2, 3]
+        with pytest.warns(UserWarning):
+            q.enqueue_many(range(10))
+        assert q.dequeue_many(3) == [7, 8, 9]
+        # the "block" policy inserts as many items as the consumer makes room
+        q = Queue(2, backend, overflow="block", empty="sentinel")
+        consumed = []
+
+        def consume():
+            while len(consumed) < 100:
+                consumed.extend(q.dequeue_many(2))
+
+        consumer = threading.Thread(target=consume)
+        consumer.start()
+        q.enqueue_many(range(100))
+        consumer.join()
+        assert consumed == list(range(100))
+
+
+def test_queue_trusted_mode(monkeypatch):
+    for backend in ["linked", "array"]:
+        trusted_q, q = Queue(backend=backend), Queue(backend=backend)
+        trusted_q.TRUSTED = True
+        with pytest.raises(TypeError):
+            q.enqueue(Queue())
+        with pytest.raises(TypeError):
+            q.enqueue_many([1, Queue()])
+        # only the queue itself is trusted, not the nodes it creates
+        if backend == "linked":
+            with pytest.raises(TypeError):
+                trusted_q.enqueue(Queue())
+        else:
+            trusted_q.enqueue(Queue())
+            trusted_q.enqueue_many([1, Queue()])
+            assert len(trusted_q) == 3
+    monkeypatch.setattr(Queue, "TRUSTED", True)
+    q = Queue(backend="array")
+    q.enqueue(Queue())
+    assert len(q) == 1
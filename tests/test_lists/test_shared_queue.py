@@ -0,0 +1,216 @@
+import pickle
+import multiprocessing
+import pytest
+
+# NOTE: `multiprocessing.shared_memory` was added in python 3.8
+pytest.importorskip("multiprocessing.shared_memory")
+from extra.lists.shared_queue import SharedQueue  # noqa: E402
+
+
+def produce(q, start, stop):
+    for item in range(start, stop):
+        q.put(item)
+    q.close()
+
+
+def consume(q, count, results):
+    total = 0
+    for _ in range(count):
+        total += q.get()
+        q.task_done()
+    results.put(total)
+    q.close()
+
+
+def enqueue(q, start, stop):
+    q.enqueue(start)
+    q.enqueue_many(range(start + 1, stop))
+    q.close()
+
+
+def put_without_closing(q, item):
+    q.put(item)
+    # the queue is dropped without calling close()
+    del q
+
+
+def test_creating_shared_queue(helper):
+    with pytest.raises(TypeError):
+        SharedQueue(helper.get_string())
+    with pytest.raises(ValueError):
+        SharedQueue(float("inf"))
+    with pytest.raises(ValueError):
+        SharedQueue(0)
+    with pytest.raises(ValueError):
+        SharedQueue(helper.get_neg_int())
+    with pytest.raises(ValueError):
+        SharedQueue(10, dtype="str")
+    q = SharedQueue(10, dtype="int")
+    try:
+        assert q._max_capacity == 10
+        assert q.is_empty() and len(q) == 0
+        with pytest.warns(UserWarning):
+            assert q.dequeue() is None
+    finally:
+        q.close()
+        q.unlink()
+
+
+def test_shared_queue_items(helper):
+    q = SharedQueue(3, dtype="int", overflow="raise", empty="raise")
+    try:
+        with pytest.raises(ValueError):
+            q.enqueue(None)
+        with pytest.raises(TypeError):
+            q.enqueue(helper.get_float())
+        with pytest.raises(TypeError):
+            q.put(helper.get_string())
+        with pytest.raises(ValueError):
+            q.put(1 << 63)
+        items = [helper.get_int() for _ in range(3)]
+        for item in items:
+            q.enqueue(item)
+        assert q.is_full() and q.top() == items[0]
+        with pytest.raises(OverflowError):
+            q.enqueue(helper.get_int())
+        with pytest.raises(OverflowError):
+            q.put(helper.get_int(), timeout=0.01)
+        assert [q.dequeue() for _ in range(3)] == items
+        with pytest.raises(IndexError):
+            q.dequeue()
+        with pytest.raises(IndexError):
+            q.get(block=False)
+        # the ring wraps around the end of the shared memory
+        for _ in range(5):
+            q.put(1)
+            q.put(2)
+            assert [q.get(), q.get()] == [1, 2]
+        q.clear()
+        assert q.is_empty()
+    finally:
+        q.close()
+        q.unlink()
+    q = SharedQueue(2, overflow="drop_oldest")
+    try:
+        q.enqueue(1)
+        q.enqueue(2.5)
+        q.enqueue(-3)
+        assert list(q._container) == [-3.0, 2.5]
+        assert q.get() == 2.5 and type(q.get()) is float
+    finally:
+        q.close()
+        q.unlink()
+
+
+def test_shared_queue_pickling(helper):
+    q = SharedQueue(4, dtype="int")
+    try:
+        q.put(1)
+        container = pickle.loads(pickle.dumps(q._container))
+        # the unpickled container attaches to the same shared memory
+        container.append_left(2)
+        assert len(q) == 2 and q.get() == 1 and q.get() == 2
+        container.close()
+    finally:
+        q.close()
+        q.unlink()
+
+
+def test_shared_queue_with_processes(helper):
+    context = multiprocessing.get_context()
+    producers, consumers, per_producer = 3, 2, 400
+    q = SharedQueue(8, dtype="int", context=context)
+    results = context.Queue()
+    try:
+        processes = [
+            context.Process(target=consume, args=(q, 600, results))
+            for _ in range(consumers)
+        ] + [
+            context.Process(
+                target=produce,
+                args=(q, i * per_producer, (i + 1) * per_producer),
+            )
+            for i in range(producers)
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join(timeout=60)
+            assert process.exitcode == 0
+        q.join()
+        total = sum(results.get(timeout=10) for _ in range(consumers))
+        assert total == sum(range(producers * per_producer))
+        assert q.is_empty() and q._unfinished_tasks == 0
+    finally:
+        q.close()
+        q.unlink()
+
+
+def test_shared_queue_joins_enqueued_items(helper):
+    context = multiprocessing.get_context()
+    producers, per_producer = 3, 200
+    q = SharedQueue(8, dtype="int", overflow="block", context=context)
+    results = context.Queue()
+    try:
+        consumer = context.Process(
+            target=consume, args=(q, producers * per_producer, results)
+        )
+        consumer.start()
+        processes = [
+            context.Process(
+                target=enqueue,
+                args=(q, i * per_producer, (i + 1) * per_producer),
+            )
+            for i in range(producers)
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join(timeout=60)
+            assert process.exitcode == 0
+        # join() returns only after the consumer marked every item as done
+        q.join()
+        assert results.get(timeout=10) == sum(range(producers * per_producer))
+        consumer.join(timeout=60)
+        assert consumer.exitcode == 0
+        assert q.is_empty() and q._unfinished_tasks == 0
+        with pytest.raises(ValueError):
+            q.task_done()
+    finally:
+        q.close()
+        q.unlink()
+
+
+def test_shared_queue_with_spawned_processes(capfd):
+    # the spawned processes unpickle their own copy of the queue
+    context = multiprocessing.get_context("spawn")
+    q = SharedQueue(4, dtype="int", context=context)
+    try:
+        process = context.Process(target=put_without_closing, args=(q, 1))
+        process.start()
+        process.join(timeout=60)
+        assert process.exitcode == 0
+        assert q.get(timeout=10) == 1
+    finally:
+        q.close()
+        q.unlink()
+    # the views of the shared memory were released without close()
+    assert "BufferError" not in capfd.readouterr().err
+
+
+def test_shared_queue_batch_methods(helper):
+    q = SharedQueue(5, dtype="int", overflow="raise")
+    try:
+        with pytest.raises(TypeError):
+            q.enqueue_many([helper.get_int(), helper.get_float()])
+        assert q.is_empty()
+        items = [helper.get_int() for _ in range(5)]
+        q.enqueue_many(items)
+        with pytest.raises(OverflowError):
+            q.enqueue_many([helper.get_int()])
+        assert q.dequeue_many(3) == items[:3]
+        q.enqueue_many(items[:3])  # wraps around the end of the ring
+        assert q.dequeue_many(5) == items[3:] + items[:3]
+    finally:
+        q.close()
+        q.unlink()
@@ -1,8 +1,17 @@
 import pytest
-import random
 from extra.lists.skip_list import SkipNode, SkipList
 
 
+def get_level(sl, level):
+    # the values linked at the given level of the skip list
+    values = []
+    node = sl._head.get_next(level)
+    while node is not None:
+        values.append(node.get_data())
+        node = node.get_next(level)
+    return values
+
+
 def test_skip_node(helper):
     # can't be empty
     with pytest.raises(ValueError):
@@ -17,18 +26,35 @@ def test_skip_node(helper):
     val = helper.get_float()
     node = SkipNode(val)
     assert node.get_data() == node._data == val
-    assert node.get_next() == node._next is None
-    assert node.get_down() == node._down is None
+    assert node.get_next() is None
+    assert node.get_height() == 1
+    # towers have one forward pointer per level
+    node = SkipNode(val, height=3)
+    assert node.get_height() == 3
+    next_node = SkipNode(val + 1, height=2)
+    node.set_next(next_node, level=1)
+    assert node.get_next(1) is next_node
+    assert node.get_next(0) is node.get_next(2) is None
+    with pytest.raises(IndexError):
+        node.get_next(3)
+    with pytest.raises(IndexError):
+        node.set_next(next_node, level=-1)
+    with pytest.raises(TypeError):
+        node.set_next(helper.get_value())
+    with pytest.raises(TypeError):
+        SkipNode(val, height=helper.get_float())
+    with pytest.raises(ValueError):
+        SkipNode(val, height=0)
 
 
 def test_empty_skiplist(helper):
     sl = SkipList()
     assert sl.is_empty()
     assert sl.to_list() == [_ for _ in sl] == []
-    assert sl.get_height() == len(sl._level_lists) == 1
-    assert len(sl._level_lists[0]) == 1
-    assert isinstance(sl._level_lists[0]._head, SkipNode)
-    assert sl._level_lists[0]._head.get_data() == float("-inf")
+    assert sl.get_height() == 1
+    assert sl._head.get_next() is None
+    assert isinstance(sl._head, SkipNode)
+    assert sl._head.get_data() == float("-inf")
     assert helper.get_value() not in sl
     assert helper.get_string() not in sl
     assert helper.get_list() not in sl
@@ -61,8 +87,8 @@ def test_skiplist_with_one_element(helper):
     sl.remove(val)
     assert sl.is_empty()
     assert sl.to_list() == [_ for _ in sl] == []
-    assert sl.get_height() == len(sl._level_lists) == 1
-    assert len(sl._level_lists[0]) == 1
+    assert sl.get_height() == 1
+    assert sl._head.get_next() is None
 
 
 def test_skiplist_with_same_value(helper):
@@ -81,8 +107,8 @@ def test_skiplist_with_same_value(helper):
     sl.remove(val)
     assert sl.is_empty()
     assert sl.to_list() == [_ for _ in sl] == []
-    assert sl.get_height() == len(sl._level_lists) == 1
-    assert len(sl._level_lists[0]) == 1
+    assert sl.get_height() == 1
+    assert sl._head.get_next() is None
     # ========== using from_iterable ==========
     val = helper.get_float()
     sl = SkipList([val for _ in range(helper.get_pos_int())])
@@ -96,13 +122,12 @@ def test_skiplist_with_same_value(helper):
     sl.remove(val)
     assert sl.is_empty()
     assert sl.to_list() == [_ for _ in sl] == []
-    assert sl.get_height() == len(sl._level_lists) == 1
-    assert len(sl._level_lists[0]) == 1
+    assert sl.get_height() == 1
+    assert sl._head.get_next() is None
 
 
 def test_skiplist_with_known_values(helper):
-    random.seed(1)
-    sl = SkipList()
+    sl = SkipList(seed=74)
     sl.insert(2)
     sl.insert(2)  # do nothing
     sl.insert(0)
@@ -120,9 +145,9 @@ def test_skiplist_with_known_values(helper):
     assert sl.get_height() == 3
     assert sl.to_list() == [0, 2, 10, 50, 100]
     # check the structure
-    assert len(sl._level_lists[0]) == 6
-    assert len(sl._level_lists[1]) == 3
-    assert len(sl._level_lists[2]) == 2
+    assert get_level(sl, 0) == [0, 2, 10, 50, 100]
+    assert get_level(sl, 1) == [0, 2]
+    assert get_level(sl, 2) == [2]
     assert helper.verify_skiplist(sl)
     # remove an item
     sl.remove(2)
@@ -136,8 +161,8 @@ def test_skiplist_with_known_values(helper):
     assert 20 not in sl
     assert sl.to_list() == [0, 10, 50, 100]
     # check the structure
-    assert len(sl._level_lists[0]) == 5
-    assert len(sl._level_lists[1]) == 2
+    assert get_level(sl, 0) == [0, 10, 50, 100]
+    assert get_level(sl, 1) == [0]
     assert helper.verify_skiplist(sl)
     # clear
     sl.clear()
@@ -156,7 +181,7 @@ def test_skiplist_with_random_numbers(helper):
     assert len(sl) == length
     assert not sl.is_empty()
     assert sl.to_list() == [i for i in range(length)]
-    assert sl.get_height() == len(sl._level_lists)
+    assert helper.verify_skiplist(sl)
     # search
     for i in range(length):
         assert sl[i] == i
@@ -175,7 +200,7 @@ def test_skiplist_with_random_numbers(helper):
     assert len(sl) == length
     assert not sl.is_empty()
     assert sl.to_list() == [i for i in range(length)]
-    assert sl.get_height() == len(sl._level_lists)
+    assert helper.verify_skiplist(sl)
     # search
     for i in range(length):
         assert sl[i] == i
@@ -195,7 +220,7 @@ def test_skiplist_with_from_iterable(helper):
     assert len(sl) == len(_set)
     assert not sl.is_empty()
     assert sl.to_list() == sorted(_set)
-    assert sl.get_height() == len(sl._level_lists)
+    assert helper.verify_skiplist(sl)
     # search
     for i in _set:
         assert i in sl
@@ -206,3 +231,145 @@ def test_skiplist_with_from_iterable(helper):
     assert len(sl) == 0
     assert sl.get_height() == 1
     assert sl.to_list() == []
+
+
+def test_skiplist_parameters(helper):
+    with pytest.raises(TypeError):
+        SkipList(p=helper.get_string())
+    with pytest.raises(ValueError):
+        SkipList(p=0)
+    with pytest.raises(ValueError):
+        SkipList(p=1)
+    with pytest.raises(TypeError):
+        SkipList(max_level=helper.get_float())
+    with pytest.raises(ValueError):
+        SkipList(max_level=0)
+    lst = [helper.get_int() for _ in range(200)]
+    # the same seed builds the same skip list
+    sl = SkipList(lst, seed=123)
+    assert str(sl) == str(SkipList(lst, seed=123))
+    assert helper.verify_skiplist(sl)
+    # the towers never exceed the maximum level
+    sl = SkipList(lst, max_level=1)
+    assert sl.get_height() == 1
+    assert helper.verify_skiplist(sl)
+    sl = SkipList(range(1000), p=0.9, max_level=4, seed=1)
+    assert sl.get_height() == 4
+    assert helper.verify_skiplist(sl)
+    # a smaller `p` builds shorter towers
+    short_sl = SkipList(range(1000), p=0.1, seed=1)
+    tall_sl = SkipList(range(1000), p=0.5, seed=1)
+    assert len(get_level(short_sl, 1)) < len(get_level(tall_sl, 1))
+    assert 400 < len(get_level(tall_sl, 1)) < 600
+    assert short_sl.to_list() == tall_sl.to_list() == list(range(1000))
+
+
+def test_skiplist_random_operations(helper):
+    sl = SkipList(seed=helper.get_int())
+    expected = set()
+    for _ in range(500):
+        value = helper.get_int(a=-100, b=100)
+        if value in expected:
+            sl.remove(value)
+            expected.remove(value)
+        else:
+            sl.insert(value)
+            expected.add(value)
+        assert len(sl) == len(expected)
+    assert sl.to_list() == sorted(expected)
+    assert helper.verify_skiplist(sl)
+    for value in range(-100, 101):
+        assert (value in sl) == (value in expected)
+
+
+def test_skiplist_positional_access(helper):
+    lst = sorted({helper.get_int() for _ in range(300)})
+    sl = SkipList(lst, seed=helper.get_int())
+    assert helper.verify_skiplist(sl)
+    for idx, value in enumerate(lst):
+        assert sl[idx] == value
+        assert sl[idx - len(lst)] == value
+        assert sl.index(value) == idx
+        assert sl.rank(value) == idx
+    assert sl.rank(lst[0] - 1) == 0
+    assert sl.rank(lst[-1] + 1) == len(lst)
+    assert sl.rank(lst[0] + 0.5) == 1
+    with pytest.raises(ValueError):
+        sl.index(lst[-1] + 1)
+    with pytest.raises(TypeError):
+        sl.index(helper.get_string())
+    with pytest.raises(TypeError):
+        sl.rank(helper.get_string())
+    with pytest.raises(ValueError):
+        sl.rank(None)
+    with pytest.raises(IndexError):
+        sl[len(lst)]
+    with pytest.raises(IndexError):
+        sl[-len(lst) - 1]
+    # removing by index keeps the widths right
+    while len(lst) > 0:
+        idx = helper.get_int(a=-len(lst), b=len(lst) - 1)
+        del sl[idx]
+        del lst[idx]
+        assert len(sl) == len(lst)
+        assert sl.to_list() == lst
+        if len(lst) % 20 == 0:
+            assert helper.verify_skiplist(sl)
+            for idx, value in enumerate(lst):
+                assert sl[idx] == value
+    assert sl.get_height() == 1
+
+
+def test_skiplist_range_floor_and_ceiling(helper):
+    lst = sorted({helper.get_int(a=-100, b=100) for _ in range(100)})
+    sl = SkipList(lst)
+    for _ in range(50):
+        lo = helper.get_float(a=-120, b=120)
+        hi = helper.get_float(a=-120, b=120)
+        assert list(sl.range(lo, hi)) == [x for x in lst if lo <= x <= hi]
+        smaller = [x for x in lst if x <= lo]
+        bigger = [x for x in lst if x >= lo]
+        assert sl.floor(lo) == (smaller[-1] if smaller else None)
+        assert sl.ceiling(lo) == (bigger[0] if bigger else None)
+    assert list(sl.range(lst[0], lst[-1])) == lst
+    for value in lst:
+        assert sl.floor(value) == sl.ceiling(value) == value
+    assert sl.floor(lst[0] - 1) is None
+    assert sl.ceiling(lst[-1] + 1) is None
+    assert list(SkipList().range(-1, 1)) == []
+    assert SkipList().floor(0) is None and SkipList().ceiling(0) is None
+    with pytest.raises(TypeError):
+        sl.range(helper.get_string(), 0)
+    with pytest.raises(ValueError):
+        sl.range(0, None)
+    with pytest.raises(TypeError):
+        sl.floor(helper.get_string())
+    with pytest.raises(ValueError):
+        sl.ceiling(None)
+
+
+def test_skiplist_build_from_iterable(helper):
+    lst = [helper.get_int() for _ in range(300)]
+    seed = helper.get_int()
+    sl = SkipList(lst, seed=seed)
+    assert helper.verify_skiplist(sl)
+    assert sl.to_list() == sorted(set(lst))
+    # the towers are drawn in the same order as inserting sorted values
+    inserted_sl = SkipList(seed=seed)
+    for value in sorted(set(lst)):
+        inserted_sl.insert(value)
+    assert str(sl) == str(inserted_sl)
+    # the built skip list keeps working
+    for value in lst[:50]:
+        sl.remove(value)
+    for value in range(50):
+        sl.insert(value)
+    expected = sorted(set(lst) - set(lst[:50]) | set(range(50)))
+    assert sl.to_list() == expected
+    assert helper.verify_skiplist(sl)
+    assert SkipList(sl).to_list() == expected
+    # values are validated before building anything
+    with pytest.raises(TypeError):
+        SkipList(lst + [helper.get_string()])
+    with pytest.raises(ValueError):
+        SkipList(lst + [None])
@@ -0,0 +1,84 @@
+import os
+import threading
+import pytest
+
+from extra.lists.queue import Queue
+from extra.lists.spilling_queue import SpillingQueue
+
+
+def test_creating_spilling_queue(helper):
+    with pytest.raises(TypeError):
+        SpillingQueue(memory_capacity=helper.get_float())
+    with pytest.raises(TypeError):
+        SpillingQueue(segment_size=helper.get_string())
+    with pytest.raises(ValueError):
+        SpillingQueue(memory_capacity=0)
+    with pytest.raises(ValueError):
+        SpillingQueue(segment_size=helper.get_neg_int())
+    with pytest.raises(ValueError):
+        SpillingQueue(helper.get_neg_int())
+    q = SpillingQueue(memory_capacity=helper.get_pos_int())
+    assert isinstance(q, Queue)
+    assert q.is_empty() and len(q) == 0
+    with pytest.warns(UserWarning):
+        assert q.dequeue() is None
+    with pytest.raises(IndexError):
+        q.top()
+    q.close()
+
+
+def test_spilling_queue_keeps_fifo_order(helper, tmp_path):
+    q = SpillingQueue(memory_capacity=5, segment_size=64, directory=tmp_path)
+    directory = q._container._directory
+    items = [helper.get_value() for _ in range(100)]
+    for item in items:
+        q.enqueue(item)
+    assert len(q) == 100
+    # the items in between the front and the back were spilled
+    assert len(os.listdir(directory)) > 1
+    assert list(q._container) == items[::-1]
+    assert q.top() == items[0]
+    assert [q.dequeue() for _ in range(50)] == items[:50]
+    # interleaving both ends while some items are still on disk
+    more_items = [helper.get_value() for _ in range(30)]
+    taken = []
+    for item in more_items:
+        q.enqueue(item)
+        taken.append(q.dequeue())
+    taken += [q.dequeue() for _ in range(len(q))]
+    assert taken == items[50:] + more_items
+    assert q.is_empty() and os.listdir(directory) == []
+    q.close()
+    assert not os.path.exists(directory)
+
+
+def test_spilling_queue_without_spilling(helper):
+    q = SpillingQueue(memory_capacity=10)
+    for _ in range(100):
+        items = [helper.get_int() for _ in range(10)]
+        for item in items:
+            q.enqueue(item)
+        assert [q.dequeue() for _ in range(10)] == items
+    assert q._container._segments.is_empty()
+    q.close()
+
+
+def test_spilling_queue_policies_and_cleanup(helper):
+    q = SpillingQueue(3, memory_capacity=1, overflow="drop_oldest")
+    for item in range(5):
+        q.enqueue(item)
+    assert len(q) == 3 and q.top() == 2
+    q = SpillingQueue(memory_capacity=1)
+    q.enqueue(helper.get_int())
+    with pytest.raises(TypeError):
+        q.enqueue(threading.Lock())
+    for item in range(10):
+        q.enqueue(item)
+    directory = q._container._directory
+    q.clear()
+    assert q.is_empty() and os.listdir(directory) == []
+    for item in range(10):
+        q.enqueue(item)
+    # the segment files are removed once the queue is garbage-collected
+    del q
+    assert not os.path.exists(directory)
@@ -120,3 +120,24 @@ def test_push_method(helper):
     s.push(helper.get_string())
     s.push(helper.get_float())
     s.push(helper.get_list())
+
+
+def test_stack_batch_methods(helper):
+    s = Stack(max_capacity=5)
+    with pytest.raises(ValueError):
+        s.push_many([helper.get_value(), None])
+    with pytest.raises(OverflowError):
+        s.push_many(helper.get_list(length=6))
+    assert s.is_empty()  # nothing is pushed if the batch is rejected
+    s.push_many(["a\nb", 1])
+    s.push_many(iter([2, 3]))
+    assert s.peek() == 3 and len(s) == 4
+    assert s.pop_many(0) == []
+    assert s.pop_many(3) == [3, 2, 1]
+    with pytest.raises(TypeError):
+        s.pop_many(helper.get_float())
+    with pytest.raises(ValueError):
+        s.pop_many(helper.get_neg_int())
+    with pytest.warns(UserWarning):
+        assert s.pop_many(2) == ["a\\nb"]
+    assert s.is_empty()
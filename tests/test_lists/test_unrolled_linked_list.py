@@ -0,0 +1,164 @@
+import pytest
+
+from extra.lists.linked_list import LinkedList
+from extra.lists.unrolled_linked_list import UnrolledNode, UnrolledLinkedList
+
+
+def verify_blocks(ull):
+    # every block is non-empty, within capacity and the tail is the last one
+    total = 0
+    last_node = None
+    node = ull._head
+    while node is not None:
+        assert isinstance(node, UnrolledNode)
+        assert 0 < len(node) <= ull.get_capacity()
+        total += len(node)
+        last_node = node
+        node = node.get_next()
+    assert last_node is ull._tail
+    assert total == len(ull)
+
+
+def test_unrolled_node(helper):
+    items = helper.get_list()
+    node = UnrolledNode(items)
+    assert node.get_items() is items
+    assert len(node) == len(items)
+    assert node.get_next() is None
+    node.set_next(UnrolledNode([helper.get_value()]))
+    assert isinstance(node.get_next(), UnrolledNode)
+    with pytest.raises(TypeError):
+        node.set_next(helper.get_value())
+    with pytest.raises(AttributeError):
+        node.x = 1
+
+
+def test_empty_unrolled_linked_list(helper):
+    EMPTY = "┌─\n│\n└─"
+    ull = UnrolledLinkedList()
+    assert str(ull) == EMPTY
+    assert len(ull) == 0 and ull.is_empty()
+    assert ull.to_list() == [] == list(ull)
+    assert ull == ull.copy() == ull.reverse()
+    assert ull < UnrolledLinkedList([helper.get_value()])
+    assert ull.count(helper.get_value()) == 0
+    assert None not in ull and LinkedList() not in ull
+    left_list, right_list = ull.split(0)
+    assert left_list.is_empty() and right_list.is_empty()
+    assert ull.rotate_left(helper.get_pos_int(), inplace=False) == ull
+    assert ull[0:10] == ull
+    ull.remove_front()  # shouldn't raise any Error
+    ull.remove_end()  # shouldn't raise any Error
+    ull.remove(helper.get_value())
+    with pytest.raises(IndexError):
+        _ = ull[0]
+    with pytest.raises(IndexError):
+        del ull[0]
+    with pytest.raises(IndexError):
+        ull[0] = helper.get_value()
+    with pytest.raises(IndexError):
+        ull.insert(helper.get_pos_int(a=1), helper.get_value())
+    with pytest.raises(ValueError):
+        ull.insert(0, None)
+    with pytest.raises(TypeError):
+        ull.add_end(LinkedList())
+    with pytest.raises(TypeError):
+        ull.rotate_right(helper.get_float())
+    with pytest.raises(ValueError):
+        ull.rotate_left(helper.get_neg_int())
+    with pytest.raises(TypeError):
+        ull.remove(helper.get_value(), all=helper.get_string())
+    with pytest.raises(TypeError):
+        ull.extend(LinkedList())
+    # capacity validation
+    with pytest.raises(TypeError):
+        UnrolledLinkedList(capacity=helper.get_float())
+    with pytest.raises(ValueError):
+        UnrolledLinkedList(capacity=1)
+    with pytest.raises(TypeError):
+        UnrolledLinkedList(2)
+    with pytest.raises(ValueError):
+        UnrolledLinkedList([1, None])
+
+
+def test_unrolled_linked_list_with_known_values():
+    ull = UnrolledLinkedList([10, -5, 7, 9, 3], capacity=2)
+    assert str(ull) == (
+        "┌────┬────┐ ┌───┬───┐ ┌───┐ \n"
+        + "│ 10 │ -5 │⟶│ 7 │ 9 │⟶│ 3 │⟶\n"
+        + "└────┴────┘ └───┴───┘ └───┘ "
+    )
+    ull.insert(1, 0)
+    assert ull.to_list() == [10, 0, -5, 7, 9, 3]
+    verify_blocks(ull)
+    ull.remove(7)
+    assert ull.to_list() == [10, 0, -5, 9, 3]
+    assert ull[-1] == 3 and ull[1:4].to_list() == [0, -5, 9]
+    assert ull[::-2].to_list() == [3, -5, 10]
+    left_list, right_list = ull.split(3)
+    assert left_list.to_list() == [10, 0, -5]
+    assert right_list.to_list() == [9, 3]
+    assert ull.rotate_left(2, inplace=False).to_list() == [-5, 9, 3, 10, 0]
+    assert ull.rotate_right(1, inplace=False).to_list() == [3, 10, 0, -5, 9]
+    assert ull.reverse().to_list() == [3, 9, -5, 0, 10]
+    assert UnrolledLinkedList([1, 2], capacity=2) == UnrolledLinkedList([1, 2])
+
+
+def test_unrolled_linked_list_against_list(helper):
+    lst = helper.get_list(length=300)
+    for capacity in [2, 3, 16]:
+        ull = UnrolledLinkedList(lst, capacity=capacity)
+        expected = lst[:]
+        verify_blocks(ull)
+        for idx in range(len(lst)):
+            assert ull[idx] == expected[idx]
+        # insertions split full blocks
+        for _ in range(100):
+            idx = helper.get_pos_int(b=len(expected))
+            value = helper.get_value()
+            ull.insert(idx, value)
+            expected.insert(idx, value)
+        ull.add_front(1)
+        ull.add_end(2)
+        expected = [1] + expected + [2]
+        verify_blocks(ull)
+        assert ull.to_list() == expected
+        # replacing & removing
+        for _ in range(100):
+            idx = helper.get_pos_int(b=len(expected) - 1)
+            ull[idx] = idx
+            expected[idx] = idx
+            idx = helper.get_pos_int(b=len(expected) - 1)
+            del ull[idx]
+            del expected[idx]
+        ull.remove_front()
+        ull.remove_end()
+        expected = expected[1:-1]
+        verify_blocks(ull)
+        assert ull.to_list() == expected
+        value = expected[len(expected) // 2]
+        ull.remove(value)
+        expected = [item for item in expected if item != value]
+        verify_blocks(ull)
+        assert ull.to_list() == expected
+        assert len(ull) == len(expected)
+        # rotating and splitting
+        ull.rotate_left(123)
+        k = 123 % len(expected)
+        expected = expected[k:] + expected[:k]
+        verify_blocks(ull)
+        assert ull.to_list() == expected
+        left_list, right_list = ull.split(50)
+        verify_blocks(left_list)
+        verify_blocks(right_list)
+        assert left_list.to_list() == expected[:50]
+        assert right_list.to_list() == expected[50:]
+        ull.extend(ull)
+        verify_blocks(ull)
+        assert ull.to_list() == expected + expected
+        # draining the list
+        while not ull.is_empty():
+            ull.remove_front()
+        verify_blocks(ull)
+        ull.add_end(5)
+        assert ull.to_list() == [5]
@@ -1,6 +1,15 @@
 import pytest
 
 from extra.trees.bst import BSTNode, BST
+from extra.trees.avl import AVL
+from extra.trees.red_black_tree import RedBlackTree
+from extra.trees.splay_tree import SplayTree
+from extra.trees.treap import Treap
+
+
+# the whole BST family keeps the subtree sizes and shares the order
+# statistics and the range queries of `BST()`
+BST_CLASSES = [BST, AVL, RedBlackTree, SplayTree, Treap]
 
 
 def test_bst_node(helper):
@@ -244,3 +253,85 @@ def test_bst_big_example(helper):
     test_empty_bst(bst)
     # validate
     test_search_insert_remove_input(helper, bst)
+
+
+@pytest.mark.parametrize("cls", BST_CLASSES)
+def test_bst_select_and_rank(helper, cls):
+    lst = list({helper.get_int() for _ in range(helper.get_pos_int(a=2))})
+    bst = cls(lst)
+    assert helper.verify_subtree_sizes(bst._root)
+    srt = sorted(lst)
+    for idx, value in enumerate(srt):
+        assert bst.select(idx) == value
+        assert bst[idx] == value
+        assert bst[idx - len(srt)] == value
+        assert bst.rank(value) == idx
+    assert bst.rank(srt[0] - 0.5) == 0
+    assert bst.rank(srt[-1] + 0.5) == len(srt)
+    with pytest.raises(IndexError):
+        bst.select(len(srt))
+    with pytest.raises(IndexError):
+        bst[-len(srt) - 1]
+    with pytest.raises(TypeError):
+        bst.select("1")
+    with pytest.raises(TypeError):
+        bst.rank(helper.get_string())
+    if cls is RedBlackTree:
+        # `RedBlackTree().remove()` can't remove arbitrary values yet, so its
+        # sizes are checked on a known example in test_red_black_tree.py
+        return
+    # sizes must be maintained when removing values
+    for value in srt[::2]:
+        bst.remove(value)
+        assert helper.verify_subtree_sizes(bst._root)
+    remaining = bst.inorder_traverse() if bst._root else []
+    assert len(remaining) == len(bst)
+    for idx, value in enumerate(remaining):
+        assert bst[idx] == value
+
+
+@pytest.mark.parametrize("cls", BST_CLASSES)
+def test_bst_range_queries(helper, cls):
+    lst = list({helper.get_int() for _ in range(helper.get_pos_int(a=2))})
+    bst = cls(lst)
+    srt = sorted(lst)
+    for _ in range(20):
+        lo, hi = sorted([helper.get_int(), helper.get_int()])
+        expected = [x for x in srt if lo <= x <= hi]
+        assert list(bst.range(lo, hi)) == expected
+        assert bst.count_range(lo, hi) == len(expected)
+        assert list(bst.range(hi + 1, lo)) == []
+        assert bst.count_range(hi + 1, lo) == 0
+    for value in srt + [helper.get_float() for _ in range(20)]:
+        smaller = [x for x in srt if x < value]
+        greater = [x for x in srt if x > value]
+        exists = value in srt
+        assert bst.predecessor(value) == (smaller[-1] if smaller else None)
+        assert bst.successor(value) == (greater[0] if greater else None)
+        assert bst.floor(value) == (
+            value if exists else (smaller[-1] if smaller else None)
+        )
+        assert bst.ceiling(value) == (
+            value if exists else (greater[0] if greater else None)
+        )
+    # the range is lazy, yet its bounds are validated right away
+    assert next(bst.range(srt[0], srt[-1])) == srt[0]
+    with pytest.raises(TypeError):
+        bst.range(helper.get_string(), 1)
+    with pytest.raises(ValueError):
+        bst.count_range(1, None)
+    with pytest.raises(TypeError):
+        bst.floor(helper.get_list())
+
+
+def test_bst_trusted_mode(monkeypatch):
+    from extra.interface import Extra
+    bst = BST([2, 1, 3])
+    with pytest.raises(TypeError):
+        bst.insert("4")
+    monkeypatch.setattr(Extra, "TRUSTED", True)
+    # valid items behave the same, invalid ones aren't detected anymore
+    bst.insert(4)
+    assert bst.to_list() == [2, 1, 3, 4]
+    assert 4 in bst
+    assert BSTNode("5").get_data() == "5"
@@ -194,7 +194,7 @@ def test_heapify_of_max_heap_big_example(helper):
     assert heap.get_max() == max(lst)
     assert heap.get_min() == min(lst)
     for node, value in zip(
-        heap, [190, 15, 102, 8, 13, 17, 100, 1, 5, 4, 9, 3, 10, 6, 90]
+        heap, [190, 17, 102, 9, 15, 100, 10, 4, 8, 3, 6, 90, 13, 5, 1]
     ):
         assert node == value
     for num in lst:
@@ -233,3 +233,210 @@ def test_insert_remove_max_heap(helper):
     assert heap.get_min() == 14
     assert heap.get_max() == 42
     assert helper.verify_max_heap(heap._transform()._root)
+
+
+def test_heapify_matches_insertion(helper):
+    for HeapClass in [MinHeap, MaxHeap]:
+        lst = helper.get_list(length=helper.get_pos_int(), _type=int)
+        heap = HeapClass.heapify(lst)
+        inserted = HeapClass()
+        for item in lst:
+            inserted.insert(item)
+        assert len(heap) == len(inserted) == len(lst)
+        assert sorted(heap.to_list()) == sorted(inserted.to_list())
+        assert heap.get_min() == inserted.get_min() == min(lst)
+        assert heap.get_max() == inserted.get_max() == max(lst)
+        if HeapClass == MinHeap:
+            assert helper.verify_min_heap(heap._transform()._root)
+        else:
+            assert helper.verify_max_heap(heap._transform()._root)
+        # the given iterable isn't modified
+        assert heap.to_list() is not lst
+    with pytest.raises(ValueError):
+        MinHeap.heapify([1, 2, None])
+    with pytest.raises(TypeError):
+        MaxHeap.heapify([1, helper.get_string()])
+    with pytest.raises(TypeError):
+        MinHeap.heapify([1, MinHeap()])
+    with pytest.raises(TypeError):
+        MaxHeap.heapify(helper.get_int())
+
+
+def verify_positions(heap):
+    positions = {}
+    for idx, value in enumerate(heap._heap):
+        positions.setdefault(value, set()).add(idx)
+    return heap._positions == positions
+
+
+def random_choice(lst, helper):
+    return lst[helper.get_pos_int(a=0, b=len(lst) - 1)]
+
+
+def test_heap_remove_restores_order_upwards(helper):
+    # removing 11 moves the last value (3) below 10, so it has to sift up
+    heap = MinHeap.heapify([0, 10, 1, 11, 12, 2, 3])
+    heap.remove(11)
+    assert helper.verify_min_heap(heap._transform()._root)
+    heap = MaxHeap.heapify([20, 10, 19, 9, 8, 18, 17])
+    heap.remove(9)
+    assert helper.verify_max_heap(heap._transform()._root)
+
+
+def test_heap_with_tracked_positions(helper):
+    with pytest.raises(TypeError):
+        MinHeap(track_positions=helper.get_int())
+    for HeapClass in [MinHeap, MaxHeap]:
+        verify = (
+            helper.verify_min_heap if HeapClass == MinHeap
+            else helper.verify_max_heap
+        )
+        lst = helper.get_list(length=100, _type=int)
+        heap = HeapClass.heapify(lst, track_positions=True)
+        reference = list(lst)
+        assert verify_positions(heap)
+        for _ in range(300):
+            op = helper.get_pos_int(b=3)
+            if op == 1 or not reference:
+                value = helper.get_int(-50, 50)
+                heap.insert(value)
+                reference.append(value)
+            elif op == 2:
+                value = random_choice(reference, helper)
+                heap.remove(value)
+                reference.remove(value)
+            else:
+                old_value = random_choice(reference, helper)
+                new_value = helper.get_int()
+                heap.update(old_value, new_value)
+                reference.remove(old_value)
+                reference.append(new_value)
+            assert len(heap) == len(reference)
+            assert verify_positions(heap)
+            if reference:
+                assert verify(heap._transform()._root)
+                assert heap.get_min() == min(reference)
+                assert heap.get_max() == max(reference)
+                assert reference[0] in heap
+        assert helper.get_int(2000, 3000) not in heap
+        with pytest.warns(UserWarning):
+            heap.remove(helper.get_int(2000, 3000))
+        with pytest.warns(UserWarning):
+            heap.update(helper.get_int(2000, 3000), helper.get_int())
+        with pytest.raises(TypeError):
+            heap.update(reference[0], helper.get_string())
+        # clearing keeps the positions map
+        heap.clear()
+        assert heap.is_empty()
+        assert heap._positions == {}
+
+
+def test_decrease_and_increase_key(helper):
+    min_heap = MinHeap.heapify([2, 4, 3, 7, 9, 0, 1], track_positions=True)
+    min_heap.decrease_key(7, -1)
+    assert min_heap.get_min() == -1
+    assert verify_positions(min_heap)
+    with pytest.raises(ValueError):
+        min_heap.decrease_key(4, 10)
+    with pytest.raises(ValueError):
+        min_heap.decrease_key(4, None)
+    max_heap = MaxHeap.heapify([2, 4, 3, 7, 9, 0, 1])
+    max_heap.increase_key(2, 10)
+    assert max_heap.get_max() == 10
+    assert max_heap._positions is None
+    with pytest.raises(ValueError):
+        max_heap.increase_key(7, 0)
+    with pytest.warns(UserWarning):
+        max_heap.increase_key(50, 100)
+
+
+def test_heap_iteration_is_lazy(helper):
+    for HeapClass in [MinHeap, MaxHeap]:
+        lst = helper.get_list(length=1000, _type=int)
+        heap = HeapClass.heapify(lst)
+        # iteration walks the underlying list without building a tree
+        heap._transform = None
+        iterator = iter(heap)
+        assert next(iterator) == heap.to_list()[0]
+        assert list(heap) == heap.to_list()
+        del heap._transform
+        assert str(heap) == str(heap._transform())
+
+
+def test_heap_pushpop_and_replace(helper):
+    for HeapClass in [MinHeap, MaxHeap]:
+        is_min = HeapClass == MinHeap
+        lst = helper.get_list(length=100, _type=int)
+        heap = HeapClass.heapify(lst, track_positions=True)
+        reference = list(lst)
+        extreme = min if is_min else max
+        for _ in range(100):
+            value = helper.get_int(-100, 100)
+            if helper.get_pos_int(b=2) == 1:
+                expected = extreme(reference + [value])
+                assert heap.pushpop(value) == expected
+                reference.append(value)
+            else:
+                expected = extreme(reference)
+                assert heap.replace(value) == expected
+                reference.append(value)
+            reference.remove(expected)
+            assert sorted(heap.to_list()) == sorted(reference)
+            assert verify_positions(heap)
+        if is_min:
+            assert helper.verify_min_heap(heap._transform()._root)
+        else:
+            assert helper.verify_max_heap(heap._transform()._root)
+        # pushpop on an empty heap gives the value back
+        assert HeapClass().pushpop(5) == 5
+        with pytest.raises(IndexError):
+            HeapClass().replace(5)
+        with pytest.raises(ValueError):
+            heap.pushpop(None)
+        with pytest.raises(TypeError):
+            heap.replace(helper.get_string())
+
+
+def test_heap_extend_and_merge(helper):
+    for HeapClass in [MinHeap, MaxHeap]:
+        verify = (
+            helper.verify_min_heap if HeapClass == MinHeap
+            else helper.verify_max_heap
+        )
+        lst = helper.get_list(length=100, _type=int)
+        # both a small batch (inserted) and a large one (rebuilt)
+        for batch_length in [2, 500]:
+            heap = HeapClass.heapify(lst, track_positions=True)
+            batch = helper.get_list(length=batch_length, _type=int)
+            heap.extend(batch)
+            assert sorted(heap.to_list()) == sorted(lst + batch)
+            assert verify(heap._transform()._root)
+            assert verify_positions(heap)
+        with pytest.raises(TypeError):
+            heap.extend(helper.get_int())
+        with pytest.raises(ValueError):
+            heap.extend([1, None])
+        # the heap is left untouched when the batch is invalid
+        assert verify_positions(heap)
+        other = MinHeap.heapify(helper.get_list(length=50, _type=int))
+        expected = sorted(heap.to_list() + other.to_list())
+        heap.merge(other)
+        assert sorted(heap.to_list()) == expected
+        assert len(other) == 50
+        assert verify(heap._transform()._root)
+        assert verify_positions(heap)
+        with pytest.raises(TypeError):
+            heap.merge(helper.get_list())
+
+
+def test_heap_nsmallest_and_nlargest(helper):
+    for HeapClass in [MinHeap, MaxHeap]:
+        lst = helper.get_list(length=200, _type=int)
+        heap = HeapClass.heapify(lst)
+        for n in [0, 1, 10, 200, 300]:
+            assert heap.nsmallest(n) == sorted(lst)[:n]
+            assert heap.nlargest(n) == sorted(lst, reverse=True)[:n]
+        assert len(heap) == len(lst)
+        assert HeapClass().nsmallest(5) == HeapClass().nlargest(5) == []
+        with pytest.raises(TypeError):
+            heap.nsmallest(helper.get_float())
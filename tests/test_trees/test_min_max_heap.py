@@ -0,0 +1,129 @@
+import pytest
+
+from extra.trees.min_max_heap import MinMaxHeap
+
+
+def verify_min_max_heap(heap):
+    values = heap.to_list()
+    for idx in range(1, len(values)):
+        # every value must respect all of its ancestors
+        ancestor_idx = (idx - 1) // 2
+        while ancestor_idx >= 0:
+            if (ancestor_idx + 1).bit_length() % 2 == 1:
+                if values[ancestor_idx] > values[idx]:
+                    return False
+            elif values[ancestor_idx] < values[idx]:
+                return False
+            if ancestor_idx == 0:
+                break
+            ancestor_idx = (ancestor_idx - 1) // 2
+    return True
+
+
+def verify_positions(heap):
+    positions = {}
+    for idx, value in enumerate(heap._heap):
+        positions.setdefault(value, set()).add(idx)
+    return heap._positions == positions
+
+
+def test_empty_min_max_heap(helper):
+    for heap in [MinMaxHeap(), MinMaxHeap.heapify([])]:
+        assert len(heap) == 0
+        assert heap.is_empty()
+        assert str(heap) == "/ \\"
+        assert heap.to_list() == []
+        assert helper.get_int() not in heap
+        with pytest.raises(IndexError):
+            heap.get_min()
+        with pytest.raises(IndexError):
+            heap.get_max()
+        with pytest.raises(ValueError):
+            heap.insert(None)
+        with pytest.raises(TypeError):
+            heap.insert(helper.get_string())
+        with pytest.warns(UserWarning):
+            heap.remove(helper.get_int())
+        with pytest.warns(UserWarning):
+            heap.remove_min()
+        with pytest.warns(UserWarning):
+            heap.remove_max()
+    with pytest.raises(TypeError):
+        MinMaxHeap(track_positions=helper.get_int())
+    with pytest.raises(ValueError):
+        MinMaxHeap.heapify([1, None])
+    with pytest.raises(TypeError):
+        MinMaxHeap.heapify(helper.get_int())
+
+
+def test_min_max_heap_small_example():
+    heap = MinMaxHeap.heapify([2, 4, 3, 7, 9, 0, 1])
+    assert heap.to_list() == [0, 9, 3, 7, 4, 2, 1]
+    assert list(heap) == heap.to_list()
+    assert heap.get_min() == 0
+    assert heap.get_max() == 9
+    heap.remove_max()
+    assert heap.get_max() == 7
+    heap.remove_min()
+    assert heap.get_min() == 1
+    assert verify_min_max_heap(heap)
+    heap.clear()
+    assert heap.is_empty()
+
+
+def test_min_max_heap_against_reference(helper):
+    for track_positions in [False, True]:
+        lst = helper.get_list(length=100, _type=int)
+        heap = MinMaxHeap.heapify(lst, track_positions=track_positions)
+        reference = list(lst)
+        assert verify_min_max_heap(heap)
+        for _ in range(500):
+            op = helper.get_pos_int(b=5)
+            if op == 1 or not reference:
+                value = helper.get_int(-50, 50)
+                heap.insert(value)
+                reference.append(value)
+            elif op == 2:
+                heap.remove_min()
+                reference.remove(min(reference))
+            elif op == 3:
+                heap.remove_max()
+                reference.remove(max(reference))
+            elif op == 4:
+                value = reference[helper.get_pos_int(b=len(reference)) - 1]
+                heap.remove(value)
+                reference.remove(value)
+            else:
+                old_value = reference[-1]
+                new_value = helper.get_int(-50, 50)
+                heap.update(old_value, new_value)
+                reference[-1] = new_value
+            assert len(heap) == len(reference)
+            assert verify_min_max_heap(heap)
+            if track_positions:
+                assert verify_positions(heap)
+            if reference:
+                assert heap.get_min() == min(reference)
+                assert heap.get_max() == max(reference)
+        assert sorted(heap.to_list()) == sorted(reference)
+
+
+def test_min_max_heap_batch_operations(helper):
+    lst = helper.get_list(length=100, _type=int)
+    heap = MinMaxHeap.heapify(lst, track_positions=True)
+    assert heap.pushpop(min(lst) - 1) == min(lst) - 1
+    assert heap.replace(1000) == min(lst)
+    assert heap.get_max() == 1000
+    batch = helper.get_list(length=300, _type=int)
+    heap.extend(batch)
+    heap.merge(MinMaxHeap.heapify([-1000]))
+    reference = list(lst)
+    reference.remove(min(lst))
+    reference += [1000] + batch + [-1000]
+    assert sorted(heap.to_list()) == sorted(reference)
+    assert verify_min_max_heap(heap)
+    assert verify_positions(heap)
+    assert heap.nsmallest(10) == sorted(reference)[:10]
+    assert heap.nlargest(10) == sorted(reference, reverse=True)[:10]
+    with pytest.raises(TypeError):
+        heap.nlargest(helper.get_string())
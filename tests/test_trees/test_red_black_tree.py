@@ -602,3 +602,12 @@ def test_double_black_right_right_case(helper):
     assert rbtree._root.get_right().get_color() == Color.BLACK
     assert rbtree._root.get_right().get_left() is None
     assert rbtree._root.get_right().get_left() is None
+
+
+def test_red_black_tree_rank_after_removals(helper):
+    rbtree = RedBlackTree([13, 8, 17, 1, 11, 15, 25, 6])
+    for value in [13, 1, 25]:
+        rbtree.remove(value)
+        assert helper.verify_subtree_sizes(rbtree._root)
+    assert rbtree.rank(15) == 3
+    assert [rbtree[idx] for idx in range(len(rbtree))] == [6, 8, 11, 15, 17]
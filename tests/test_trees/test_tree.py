@@ -109,3 +109,28 @@ def test_invalid_path(helper):
     val = helper.get_string()
     with pytest.raises(ValueError):
         Tree.from_path(val)
+
+
+def test_tree_node_classes_use_slots(helper):
+    from extra.trees.binary_tree import BinaryTreeNode
+    from extra.trees.bst import BSTNode
+    from extra.trees.avl import AVLNode
+    from extra.trees.red_black_tree import RedBlackNode
+    from extra.trees.treap import TreapNode
+    from extra.trees.trie import TrieNode
+    from extra.trees._heap import HeapNode
+
+    value = helper.get_int()
+    for node in [
+        TreeNode(value),
+        BinaryTreeNode(value),
+        BSTNode(value),
+        AVLNode(value),
+        RedBlackNode(value),
+        TreapNode(value),
+        TrieNode(helper.get_string()),
+        HeapNode(value),
+    ]:
+        assert not hasattr(node, "__dict__")
+        with pytest.raises(AttributeError):
+            node.unknown_attribute = helper.get_value()